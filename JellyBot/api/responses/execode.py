@@ -1,8 +1,11 @@
+from extutils import safe_cast
 from flags import Execode
 from JellyBot.api.static import param, result
 from JellyBot.api.responses.mixin import (
-    SerializeErrorMixin, SerializeResultOnSuccessMixin, RequireSenderMixin, SerializeResultExtraMixin
+    SerializeErrorMixin, SerializePageOnSuccessMixin, RequireSenderMixin, SerializeResultExtraMixin
 )
+from JellyBot.systemconfig import Pagination
+from mongodb.exceptions import InvalidPageTokenError
 from mongodb.factory import ExecodeManager
 
 from ._base import BaseApiResponse
@@ -41,12 +44,20 @@ class ExecodeCompleteApiResponse(SerializeErrorMixin, SerializeResultExtraMixin,
 
 
 class ExecodeListApiResponse(
-        RequireSenderMixin, SerializeErrorMixin, SerializeResultOnSuccessMixin, BaseApiResponse):
+        RequireSenderMixin, SerializeErrorMixin, SerializePageOnSuccessMixin, BaseApiResponse):
     def __init__(self, param_dict, sender_oid):
         super().__init__(param_dict, sender_oid)
 
+        limit = safe_cast(param_dict.get(param.Execode.COUNT), int) or Pagination.PageSize
+        self._limit = max(1, min(limit, Pagination.MaxPageSize))
+        self._page_token = param_dict.get(param.Execode.PAGE_TOKEN)
+
     def process_pass(self):
-        self._result = list(ExecodeManager.get_queued_execodes(self._sender_oid))
+        try:
+            self._result = ExecodeManager.get_queued_execodes_page(
+                self._sender_oid, limit=self._limit, page_token=self._page_token, with_count=True)
+        except InvalidPageTokenError:
+            self._err[result.Pagination.PAGE_TOKEN] = self._page_token
 
     def pre_process(self):
         super().pre_process()
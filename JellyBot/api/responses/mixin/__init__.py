@@ -3,5 +3,7 @@ from .common import (
     HandleChannelRegisterOidMixin, HandleChannelMixin, HandlePlatformMixin,
     RequireSenderMixin, RequireSenderAutoRegisterMixin, HandleChannelOidMixin
 )
-from .serialize import SerializeErrorMixin, SerializeResultOnSuccessMixin, SerializeResultExtraMixin
+from .serialize import (
+    SerializeErrorMixin, SerializeResultOnSuccessMixin, SerializeResultExtraMixin, SerializePageOnSuccessMixin
+)
 from .perm import RequirePermissionMixin
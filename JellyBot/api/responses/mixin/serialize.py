@@ -23,3 +23,15 @@ class SerializeResultExtraMixin(BaseMixin, ABC):
         d = super().serialize_extra()
         d[result.RESULT] = self._result
         return d
+
+
+class SerializePageOnSuccessMixin(BaseMixin, ABC):
+    """``self._result`` should be a :class:`KeysetPage`."""
+
+    def serialize_success(self) -> dict:
+        d = super().serialize_success()
+        d[result.RESULT] = self._result.data
+        d[result.Pagination.NEXT_PAGE_TOKEN] = self._result.next_token
+        d[result.Pagination.TOTAL_COUNT] = self._result.total_count
+        d[result.Pagination.COUNT_IS_EXACT] = self._result.count_is_exact
+        return d
@@ -11,6 +11,7 @@ class Common:
 
     COUNT = "count"
     KEYWORD = "w"
+    PAGE_TOKEN = "page"
 
 
 class Validation:
@@ -74,6 +75,8 @@ class Execode:
     USER_OID = Common.USER_OID
     API_TOKEN = Common.API_TOKEN
     ACTION_TYPE_ID = "type"
+    COUNT = Common.COUNT
+    PAGE_TOKEN = Common.PAGE_TOKEN
 
 
 class Message:
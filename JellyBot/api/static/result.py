@@ -79,6 +79,15 @@ class DataQuery:
     KEYWORD = "keyword"
 
 
+class Pagination:
+    """Keys for the paginated response."""
+
+    PAGE_TOKEN = "page"
+    NEXT_PAGE_TOKEN = "next"
+    TOTAL_COUNT = "total"
+    COUNT_IS_EXACT = "totalExact"
+
+
 class Service:
     """Keys for the extra service related response."""
 
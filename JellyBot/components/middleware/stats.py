@@ -31,15 +31,18 @@ class APIStatisticsCollector(MiddlewareMixin):
             path_params = request.POST
 
         if collect:
-            rec_result = APIStatisticsManager.record_stats(
-                api_action, get_root_oid(request), dict_response, dict_params, success, path_params,
-                request.path_info, request.get_full_path_info()
-            )
-
-            if settings.DEBUG and not rec_result.success:
-                if rec_result.exception is None:
-                    raise RuntimeError(f"Stats not recorded. Result: {repr(rec_result.serialize())}")
-                else:
-                    raise rec_result.exception
+            args = (api_action, get_root_oid(request), dict_response, dict_params, success, path_params,
+                    request.path_info, request.get_full_path_info())
+
+            if settings.DEBUG:
+                rec_result = APIStatisticsManager.record_stats(*args)
+
+                if not rec_result.success:
+                    if rec_result.exception is None:
+                        raise RuntimeError(f"Stats not recorded. Result: {repr(rec_result.serialize())}")
+                    else:
+                        raise rec_result.exception
+            else:
+                APIStatisticsManager.record_stats_async(*args)
 
         return response
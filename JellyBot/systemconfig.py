@@ -34,6 +34,10 @@ class PlatformConfig(ABC):
     max_content_length: int = NotImplementedError
     max_content_lines: int = NotImplementedError
 
+    user_name_requests_per_second: float = NotImplementedError
+    """Max rate of the user name requests sent by the user existence check."""
+    user_name_requests_burst: int = NotImplementedError
+
 
 class LineApi(PlatformConfig):
     """Plaform configuration of LINE."""
@@ -42,6 +46,9 @@ class LineApi(PlatformConfig):
     max_content_length = System.MaxSendContentLength
     max_content_lines = System.MaxSendContentLines
 
+    user_name_requests_per_second = 10
+    user_name_requests_burst = 20
+
 
 class Discord(PlatformConfig):
     """Plaform configuration of Discord."""
@@ -50,6 +57,9 @@ class Discord(PlatformConfig):
     max_content_length = System.MaxSendContentLength
     max_content_lines = System.MaxSendContentLines
 
+    user_name_requests_per_second = 5
+    user_name_requests_burst = 10
+
 
 class Website:
     """Website configuration."""
@@ -73,6 +83,22 @@ class Website:
 
         DefaultPeriodCount = 3
 
+    class NavBar:
+        """Navigation bar configuration on website."""
+
+        CacheSize = 1000
+
+    class ExtraContent:
+        """Extra content page configuration on website."""
+
+        PageCacheSize = 500
+        PageCacheExpirySeconds = 600  # 10 mins
+
+    class Latency:
+        """Message handling latency page configuration on website."""
+
+        DefaultHoursWithin = 24
+
 
 class AutoReply:
     """
@@ -88,6 +114,11 @@ class AutoReply:
     CaseInsensitive = True
     BypassMultilineCDThresholdSeconds = 20
 
+    KeywordCacheSize = 1000
+    KeywordCacheExpirySeconds = 300  # 5 mins
+    KeywordVersionCacheSeconds = 5
+    """Seconds to cache the keyword version of a channel, which is shared across the processes."""
+
 
 class Database:
     """Database configuration."""
@@ -95,9 +126,72 @@ class Database:
     ExecodeExpirySeconds = 86400  # 24 Hrs
     CacheExpirySeconds = 172800  # 2 Days
     ExtraContentExpirySeconds = 2073600  # 30 Days
+    ExtraContentCacheSize = 500
+    ExtraContentCacheExpirySeconds = 3600  # 1 Hr
 
     BackupIntervalSeconds = 86400  # 24 Hrs
 
+    IndexVerifyWorkers = 4
+    """Max count of the collections verifying their indexes concurrently on startup."""
+
+    class ClientProfile:
+        """
+        Options of the MongoDB client of each profile. The options are passed to :class:`pymongo.MongoClient`.
+
+        Options here take precedence over the same options in the connection string (`MONGO_URL`).
+        """
+
+        HotPath = {
+            "maxPoolSize": 100,
+            "minPoolSize": 10,
+            "maxIdleTimeMS": 300000,  # 5 mins
+            "waitQueueTimeoutMS": 5000,
+            "connectTimeoutMS": 3000,
+            "socketTimeoutMS": 30000,
+            "serverSelectionTimeoutMS": 5000,
+            "retryWrites": True
+        }
+        """Profile for the message handling. Short timeouts to fail fast instead of holding the reply."""
+
+        Analytics = {
+            "maxPoolSize": 10,
+            "minPoolSize": 0,
+            "maxIdleTimeMS": 60000,  # 1 min
+            "connectTimeoutMS": 5000,
+            "socketTimeoutMS": 120000,  # 2 mins
+            "readPreference": "secondaryPreferred",
+            "compressors": "zlib",
+            "zlibCompressionLevel": 6
+        }
+        """
+        Profile for the long aggregations such as the stats pages.
+
+        The small pool caps the connections the aggregations could take.
+        Reads go to the secondaries if available. Results are large, so the wire compression is enabled.
+        """
+
+    class Telemetry:
+        """Configuration for the buffered writes of the telemetry data (message records, usage stats)."""
+
+        BufferCapacity = 10000
+        """Max count of the buffered documents. The oldest document will be dropped if the buffer is full."""
+        BatchSize = 500
+        FlushIntervalSeconds = 1
+        HealthLogIntervalSeconds = 600  # 10 mins
+
+        WriteConcern = {"w": 1, "j": False}
+        """Write concern of the telemetry inserts. Set ``{"w": 0}`` to skip waiting for the acknowledgement."""
+
+    class UserIntegration:
+        """Configuration for the user data integration."""
+
+        BatchSize = 500
+        BatchRetryCount = 3
+        BatchRetryBackoffSeconds = 0.5
+        AliasCacheExpirySeconds = 10
+        JobLeaseSeconds = 300  # 5 mins
+        """Seconds that a process holds an integration job without making any progress."""
+
     class PopularityConfig:
         """Configuration specifically for auto-reply tag popularity score."""
 
@@ -108,6 +202,8 @@ class Database:
         AppearanceFunctionCoeff = 1.4
         AppearanceEquivalentWHr = 5
 
+        ReconcileIntervalSeconds = 3600  # 1 Hr
+
         TimeCoeffA = 2 * TimeDiffIntersectHr
         TimeCoeffB = -1 / TimeFunctionCoeff
         AppearanceCoeffA = 1 / math.pow(AppearanceIntersect, AppearanceFunctionCoeff - 1)
@@ -117,6 +213,22 @@ class Database:
 
         MaxContentCharacter = 3000
 
+        MaxKeywordsPerMessage = 300
+        MaxSearchKeywords = 10
+        KeywordBackfillLeaseSeconds = 300  # 5 mins
+        """Seconds that a process holds the backfill of the keyword index without making any progress."""
+
+        LeaderboardWindowHours = (24, 168)
+        LeaderboardCacheSize = 1000
+        LeaderboardReconcileIntervalSeconds = 3600  # 1 Hr
+
+    class MessageTrace:
+        """Configuration for the sampled traces of the message handling."""
+
+        ExpirySeconds = 604800  # 7 Days
+        MaxAnalyzeCount = 5000
+        """Max count of the latest traces used to calculate the latency percentiles."""
+
 
 class DataQuery:
     """Data query configuration."""
@@ -124,7 +236,37 @@ class DataQuery:
     TagPopularitySearchCount = 10
 
     UserNameCacheSize = 3000
+    """Max count of the user names cached in the process."""
+    UserNameLocalCacheSeconds = 300  # 5 mins
+    """Seconds to keep a user name in the process before reading it again from the shared cache."""
     UserNameExpirationSeconds = 129600  # 1.5 Days
+    """User names older than this will be refreshed in the background."""
+    UserNameSharedCacheExpirySeconds = 2592000  # 30 Days
+    UserNameCacheFlushSize = 100
+    UserNameCacheFlushIntervalSeconds = 1
+
+
+class UserExistenceCheck:
+    """Configuration of the user existence check running in the background."""
+
+    BatchSize = 50
+    RecheckIntervalSeconds = 604800  # 7 Days
+
+    IdleSeconds = 600  # 10 mins
+    """Seconds to wait for the next batch if there are no connections to be checked."""
+
+    ErrorBackoffSeconds = 30
+    """Seconds to wait before retrying after the 1st failed batch. Doubled on each consecutive failure."""
+
+
+class Pagination:
+    """Keyset pagination configuration."""
+
+    PageSize = 60
+    MaxPageSize = 200
+
+    CountCap = 1000
+    """Counting stops at this count. The total count will be shown as a lower bound if it reaches this count."""
 
 
 class ChannelConfig:
@@ -157,11 +299,17 @@ class Bot:
     RandomChoiceSplitter = "  "
     RandomChoiceWeightSplitter = " "
     RandomChoiceOptionLimit = 20
-    RandomChoiceCountLimit = 1000
+    RandomChoiceCountLimit = 1000000
+    """Max count of picking an option in a single command. Picking takes the same time regardless of the count."""
 
     CaseInsensitive = True
     CaseInsensitivePrefix = True
 
+    TextHandlerMaxWorkers = 4
+
+    TraceSampleRate = 0.05
+    """Rate of the handled messages to have the latency of each stage traced and recorded."""
+
     class AutoReply:
         """Auto-reply configuration for controls via the bot only."""
 
@@ -191,6 +339,9 @@ class Bot:
         MaxNotifyRangeSeconds = 14400
         MessageFrequencyRangeMin = 1440  # 1 Day
 
+        KeywordCacheSize = 1000
+        KeywordCacheExpirySeconds = 300  # 5 mins
+
     class RemoteControl:
         """Remote control configuration for controls via the bot ony."""
 
@@ -204,3 +355,10 @@ class ExtraService:
         """Sticker configuration for extra service only."""
 
         MaxStickerTempFileLifeSeconds = 86400  # 1 Day
+        MaxCacheSizeMB = 512
+
+        MetadataCacheSize = 500
+        MetadataCacheExpirySeconds = 3600  # 1 Hr
+
+        ConversionMaxWorkers = 2
+        ConversionMaxPending = 8
@@ -1,2 +1,3 @@
-from .main import get_root_oid, get_post_keys, load_server, get_channel_data, get_profile_data, get_limit
+from .main import get_root_oid, get_post_keys, load_server, get_channel_data, get_profile_data, get_limit, \
+    get_next_page_query
 from .msg import msg_for_newly_created_account
@@ -8,10 +8,12 @@ from bson import ObjectId
 from extutils import safe_cast
 from flags import Platform
 from mongodb.factory import RootUserManager, ChannelManager, ProfileManager
+from mongodb.utils import KeysetPage
 from JellyBot.keys import Session, ParamDictPrefix
 from JellyBot.api.static.param import Common
 
-__all__ = ("get_root_oid", "get_post_keys", "get_channel_data", "get_profile_data", "get_limit", "load_server",)
+__all__ = ("get_root_oid", "get_post_keys", "get_channel_data", "get_profile_data", "get_limit", "get_next_page_query",
+           "load_server",)
 
 
 def get_root_oid(request) -> Optional[ObjectId]:
@@ -74,6 +76,16 @@ def get_limit(param_dict, max_: Optional[int] = None):
         return max_
 
 
+def get_next_page_query(param_dict, page: KeysetPage) -> Optional[str]:
+    if not page.has_next:
+        return None
+
+    qd = param_dict.copy()
+    qd[Common.PAGE_TOKEN] = page.next_token
+
+    return qd.urlencode()
+
+
 # Obtained and modified from https://stackoverflow.com/a/57897422
 def load_server():
     apps.app_configs = OrderedDict()
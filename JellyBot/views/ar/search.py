@@ -2,9 +2,12 @@ from django.views.generic.base import View, TemplateResponseMixin
 from django.utils.translation import gettext_lazy as _
 
 from extutils import safe_cast
+from mongodb.exceptions import InvalidPageTokenError
 from mongodb.factory import AutoReplyManager, ProfileManager
 from mongodb.helper import IdentitySearcher
-from JellyBot.utils import get_root_oid
+from JellyBot.api.static import param
+from JellyBot.systemconfig import Pagination
+from JellyBot.utils import get_root_oid, get_next_page_query
 from JellyBot.components.mixin import LoginRequiredMixin, ChannelOidRequiredMixin
 from JellyBot.views.render import render_template
 
@@ -18,11 +21,18 @@ class AutoReplySearchChannelView(LoginRequiredMixin, ChannelOidRequiredMixin, Te
         channel_data = self.get_channel_data(*args, **kwargs)
         channel_name = channel_data.model.get_channel_name(get_root_oid(request))
 
-        module_list = list(AutoReplyManager.get_conn_list(
-            channel_data.model.id, keyword, active_only=not include_inactive))
+        def get_page(page_token):
+            return AutoReplyManager.get_conn_page(
+                channel_data.model.id, keyword, active_only=not include_inactive,
+                limit=Pagination.PageSize, page_token=page_token, with_count=True)
+
+        try:
+            module_page = get_page(request.GET.get(param.Common.PAGE_TOKEN))
+        except InvalidPageTokenError:
+            module_page = get_page(None)
 
         uids = []
-        for module in module_list:
+        for module in module_page:
             uids.append(module.creator_oid)
             if not module.active and module.remover_oid:
                 uids.append(module.remover_oid)
@@ -34,7 +44,10 @@ class AutoReplySearchChannelView(LoginRequiredMixin, ChannelOidRequiredMixin, Te
             {
                 "channel_name": channel_name,
                 "channel_oid": channel_data.model.id,
-                "module_list": module_list,
+                "module_list": module_page.data,
+                "module_count": module_page.total_count,
+                "module_count_exact": module_page.count_is_exact,
+                "next_page_query": get_next_page_query(request.GET, module_page),
                 "username_dict": username_dict,
                 "include_inactive": include_inactive,
                 "keyword": keyword or ""
@@ -1,21 +1,114 @@
+import hashlib
+from datetime import datetime
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from cachetools import TTLCache
+from django.contrib.messages import get_messages
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import gettext_lazy as _, get_language
 from django.views import View
-from django.utils.translation import gettext_lazy as _
 
+from bot.system import get_boot_dt
+from extutils.dt import now_utc_aware
+from JellyBot import keys
+from JellyBot.systemconfig import Website
 from JellyBot.views import render_template, WebsiteErrorView
 from flags import WebsiteError
 from mongodb.factory import ExtraContentManager
 
 
+class _CachedPage(NamedTuple):
+    content: bytes
+    content_type: str
+    etag: str
+    last_modified: datetime
+    expires_on: datetime
+
+
+_page_cache: "TTLCache[tuple, _CachedPage]" = TTLCache(
+    maxsize=Website.ExtraContent.PageCacheSize, ttl=Website.ExtraContent.PageCacheExpirySeconds)
+_page_cache_lock = Lock()
+
+
+def _get_cache_key(request, page_id):
+    # Rendered page varies by the navigation bar, the language and the timezone of the expiry
+    return (page_id, request.get_host(), keys.Cookies.USER_TOKEN in request.COOKIES,
+            get_language(), timezone.get_current_timezone_name())
+
+
+def _get_cached_page(cache_key) -> Optional[_CachedPage]:
+    with _page_cache_lock:
+        page = _page_cache.get(cache_key)
+
+        if page and page.expires_on <= now_utc_aware():
+            del _page_cache[cache_key]
+            page = None
+
+    return page
+
+
+def _cache_page(cache_key, response: HttpResponse, page_content) -> _CachedPage:
+    page = _CachedPage(
+        content=response.content,
+        content_type=response["Content-Type"],
+        etag=quote_etag(hashlib.md5(response.content).hexdigest()),
+        # Templates may be changed on reboot
+        last_modified=max(dt for dt in (page_content.timestamp, get_boot_dt()) if dt),
+        expires_on=page_content.expires_on
+    )
+
+    with _page_cache_lock:
+        _page_cache[cache_key] = page
+
+    return page
+
+
+def _to_response(request, page: _CachedPage) -> HttpResponse:
+    last_modified = int(page.last_modified.timestamp())
+
+    response = get_conditional_response(request, etag=page.etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(page.content, content_type=page.content_type)
+
+    response["ETag"] = page.etag
+    response["Last-Modified"] = http_date(last_modified)
+
+    # Only cached in the browser because the page contains the navigation bar of the user
+    patch_cache_control(response, private=True,
+                        max_age=max(int((page.expires_on - now_utc_aware()).total_seconds()), 0))
+    patch_vary_headers(response, ("Cookie", "Accept-Language"))
+
+    return response
+
+
 class ExtraContentView(View):
     # noinspection PyUnusedLocal, PyMethodMayBeStatic
     def get(self, request, page_id, *args, **kwargs):
+        # Pages containing the messages to the user should not be cached or be replaced by the cached page
+        cacheable = not get_messages(request)
+        cache_key = _get_cache_key(request, page_id)
+
+        if cacheable:
+            page = _get_cached_page(cache_key)
+            if page:
+                return _to_response(request, page)
+
         page_content = ExtraContentManager.get_content(page_id)
         d = {"page_id": page_id}
         if page_content:
             title = page_content.title if page_content.title != ExtraContentManager.DefaultTitle else page_id
-            return render_template(request, _("Extra Content - {}").format(title), "exctnt.html", {
-                "content": page_content.content_html,
+            response = render_template(request, _("Extra Content - {}").format(title), "exctnt.html", {
+                "content": ExtraContentManager.get_content_html(page_content),
                 "expiry": page_content.expires_on
             }, nav_param=d)
+
+            if not cacheable:
+                return response
+
+            return _to_response(request, _cache_page(cache_key, response, page_content))
         else:
             return WebsiteErrorView.website_error(request, WebsiteError.EXTRA_CONTENT_NOT_FOUND, d, nav_param=d)
@@ -0,0 +1,33 @@
+"""View for the message handling latency."""
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+from django.views.generic.base import TemplateResponseMixin
+
+from JellyBot.components.mixin import LoginRequiredMixin
+from JellyBot.systemconfig import Bot, Website
+from JellyBot.views import render_template
+from extutils import safe_cast
+from mongodb.factory import MessageTraceManager
+from mongodb.utils import get_telemetry_health
+
+
+class MessageLatencyView(LoginRequiredMixin, TemplateResponseMixin, View):
+    """View of the page to see the latency percentiles of each message handling stage and text handler."""
+
+    # noinspection PyUnusedLocal
+    def get(self, request, *args, **kwargs):
+        """
+        Page to view the message handling latency.
+
+        There is an optional keyword ``hours_within`` for limiting the time range of the traces.
+        """
+        hours_within = safe_cast(request.GET.get("hours_within"), int) or Website.Latency.DefaultHoursWithin
+
+        ctxt = {
+            "hr_range": hours_within,
+            "sample_rate": Bot.TraceSampleRate,
+            "latency_data": MessageTraceManager.get_latency_percentiles(hours_within=hours_within),
+            "telemetry_health": get_telemetry_health()
+        }
+
+        return render_template(self.request, _("Message Handling Latency"), "info/latency/main.html", ctxt)
@@ -1,3 +1,4 @@
+from bson import ObjectId
 from django.utils.translation import gettext_lazy as _
 from django.views import View
 from django.views.generic.base import TemplateResponseMixin
@@ -7,10 +8,10 @@ from JellyBot.views import render_template, WebsiteErrorView
 from JellyBot.utils import get_root_oid, get_limit
 from JellyBot.systemconfig import Website
 
+from extutils.utils import safe_cast
 from flags import WebsiteError
-from models import ChannelProfileConnectionModel
 from mongodb.helper import MessageStatsDataProcessor
-from mongodb.factory import ProfileManager
+from mongodb.factory.prof_base import UserProfileManager
 
 
 class RecentMessagesView(ChannelOidRequiredMixin, LoginRequiredMixin, TemplateResponseMixin, View):
@@ -20,8 +21,7 @@ class RecentMessagesView(ChannelOidRequiredMixin, LoginRequiredMixin, TemplateRe
 
         # Check if the user is in the channel
         root_oid = get_root_oid(request)
-        profs = ProfileManager.get_user_profiles(channel_data.model.id, root_oid)
-        if not profs or profs == ChannelProfileConnectionModel.ProfileOids.none_obj():
+        if not UserProfileManager.is_user_in_channel(channel_data.model.id, root_oid):
             return WebsiteErrorView.website_error(
                 request, WebsiteError.NOT_IN_THE_CHANNEL, {"channel_oid": channel_data.oid_org}, nav_param=kwargs)
 
@@ -29,13 +29,15 @@ class RecentMessagesView(ChannelOidRequiredMixin, LoginRequiredMixin, TemplateRe
         channel_name = channel_data.model.get_channel_name(root_oid)
 
         limit = get_limit(request.GET, Website.RecentActivity.MaxMessageCount)
+        before_oid = safe_cast(request.GET.get("before"), ObjectId)
 
         ctxt = {
             "channel_name": channel_name,
             "channel_data": channel_data.model,
             "recent_msg_limit": limit or "",
             "recent_msg_limit_max": Website.RecentActivity.MaxMessageCount,
-            "recent_msg_data": MessageStatsDataProcessor.get_recent_messages(channel_data.model, limit=limit)
+            "recent_msg_data": MessageStatsDataProcessor.get_recent_messages(
+                channel_data.model, limit=limit, before_oid=before_oid)
         }
 
         return render_template(
@@ -6,6 +6,7 @@ from .profile import ProfileInfoView
 from .msgstats import ChannelMessageStatsView
 from .botstats import ChannelBotUsageStatsView
 from .recent import RecentMessagesView
+from .latency import MessageLatencyView
 
 
 urlpatterns = [
@@ -16,4 +17,5 @@ urlpatterns = [
     path('channel/<str:channel_oid>/recent/message', RecentMessagesView.as_view(), name="info.channel.recent.message"),
     path('chcoll/<str:chcoll_oid>/', ChannelCollectionInfoView.as_view(), name="info.chcoll"),
     path('profile/<str:profile_oid>/', ProfileInfoView.as_view(), name="info.profile"),
+    path('latency/', MessageLatencyView.as_view(), name="info.latency"),
 ]
@@ -1,15 +1,88 @@
+from threading import Lock
+from typing import Tuple
+
+from cachetools import LRUCache
 from django.urls import reverse, NoReverseMatch
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_lazy as _, get_language
 
 from JellyBot import keys
 from JellyBot.components.navbar import (
     nav_items_factory, NavItemsHolder, NavEntry, NavDropdown, NavHeader, NavDivider, NavHidden
 )
+from JellyBot.systemconfig import Website
+
+_nav_cache = LRUCache(maxsize=Website.NavBar.CacheSize)
+_nav_cache_lock = Lock()
+
+_precompiled_langs = set()
+_precompile_lock = Lock()
+
+
+def _get_cache_key(current_path, logged_in, lang, nav_param):
+    return current_path, logged_in, lang, tuple(sorted((k, str(v)) for k, v in nav_param.items()))
+
+
+def _render_nav(current_path, logged_in, lang, nav_param) -> Tuple[str, str]:
+    nav = construct_nav(current_path, logged_in, nav_param)
+    fragments = (nav.to_html(), nav.to_bread())
+
+    with _nav_cache_lock:
+        _nav_cache[_get_cache_key(current_path, logged_in, lang, nav_param)] = fragments
+
+    return fragments
+
+
+def _collect_links(nav):
+    for item in nav:
+        if isinstance(item, NavDropdown):
+            yield from (sub_item.link for sub_item in item.items if getattr(sub_item, "link", None))
+
+        if item.link:
+            yield item.link
+
 
+def _precompile_nav(lang):
+    with _precompile_lock:
+        if lang in _precompiled_langs:
+            return
 
-def construct_nav(request, nav_param):
+        for logged_in in (False, True):
+            for link in set(_collect_links(construct_nav(None, logged_in, {}))):
+                _render_nav(link, logged_in, lang, {})
+
+        _precompiled_langs.add(lang)
+
+
+def get_nav_fragments(request, nav_param) -> Tuple[str, str]:
+    """
+    Get the rendered HTML of the navigation bar and the breadcrumb for ``request``.
+
+    The rendered fragments are cached by the path, the logged-in flag, the active language and ``nav_param``.
+
+    The fragments of all the pages which do not need ``nav_param`` will be precompiled
+    on the first call in each language.
+
+    :param request: request of the page to be rendered
+    :param nav_param: parameters to construct the links of the hidden navigation items
+    :return: HTML of the navigation bar and the breadcrumb
+    """
     current_path = request.path
+    logged_in = keys.Cookies.USER_TOKEN in request.COOKIES
+    lang = get_language()
 
+    if lang not in _precompiled_langs:
+        _precompile_nav(lang)
+
+    with _nav_cache_lock:
+        fragments = _nav_cache.get(_get_cache_key(current_path, logged_in, lang, nav_param))
+
+    if fragments is None:
+        fragments = _render_nav(current_path, logged_in, lang, nav_param)
+
+    return fragments
+
+
+def construct_nav(current_path, logged_in, nav_param):
     nav = NavItemsHolder()
 
     # Construct Home Page item
@@ -32,7 +105,7 @@ def construct_nav(request, nav_param):
     # Collect items to Nav Bar
     nav.add_item(home_item)
 
-    if keys.Cookies.USER_TOKEN in request.COOKIES:
+    if logged_in:
         nav.add_item(_construct_my_account(current_path, home_item, nav_param))
     else:
         nav.add_item(login_item)
@@ -140,6 +213,9 @@ def _construct_info(current_path, parent, nav_param):
 
     info_parent.add_item(nav_items_factory(
         NavEntry, current_path, label=_("Channel"), link=reverse("info.channel.search"), parent=info_parent))
+    info_parent.add_item(nav_items_factory(
+        NavEntry, current_path, label=_("Message Handling Latency"), link=reverse("info.latency"),
+        parent=info_parent))
 
     # Hidden Items
     _attach_item(info_parent, NavHidden, current_path,
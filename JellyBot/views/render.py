@@ -5,7 +5,7 @@ from django.utils import timezone
 
 from bot.system import get_boot_dt
 from JellyBot import keys
-from JellyBot.views.nav import construct_nav
+from JellyBot.views.nav import get_nav_fragments
 from JellyBot.api.static import result, param
 from JellyBot.utils import get_root_oid
 from extutils.flags import is_flag_class, is_flag_single, is_flag_double
@@ -23,9 +23,7 @@ def render_template(request, title, template_name, context=None, content_type=No
     context["title"] = title
 
     # Append navigation bar items
-    nav = construct_nav(request, nav_param)
-    context["nav_bar_html"] = nav.to_html()
-    context["nav_bread"] = nav.to_bread()
+    context["nav_bar_html"], context["nav_bread"] = get_nav_fragments(request, nav_param)
     context["static_keys_result"] = result
     context["static_keys_param"] = param
 
@@ -3,15 +3,26 @@ from django.utils.translation import gettext_lazy as _
 from django.views import View
 from django.views.generic.base import TemplateResponseMixin
 
-from JellyBot.utils import get_root_oid
+from JellyBot.api.static import param
+from JellyBot.systemconfig import Pagination
+from JellyBot.utils import get_root_oid, get_next_page_query
 from JellyBot.components.mixin import LoginRequiredMixin
 from JellyBot.views import render_template
+from mongodb.exceptions import InvalidPageTokenError
 from mongodb.factory import ShortUrlDataManager
 
 
 class ShortUrlMainView(LoginRequiredMixin, TemplateResponseMixin, View):
     # noinspection PyUnusedLocal
     def get(self, request, *args, **kwargs):
+        root_oid = get_root_oid(request)
+
+        try:
+            records = ShortUrlDataManager.get_user_record_page(
+                root_oid, limit=Pagination.PageSize, page_token=request.GET.get(param.Common.PAGE_TOKEN))
+        except InvalidPageTokenError:
+            records = ShortUrlDataManager.get_user_record_page(root_oid, limit=Pagination.PageSize)
+
         return render_template(
             self.request, _("Short URL Service"), "services/shorturl/main.html",
-            {"records": ShortUrlDataManager.get_user_record(get_root_oid(request))})
+            {"records": records, "next_page_query": get_next_page_query(request.GET, records)})
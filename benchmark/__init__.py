@@ -0,0 +1,9 @@
+"""
+Performance benchmarks of the bot.
+
+Benchmarks are **NOT** tests. Each benchmark is executed as a module. For example::
+
+    py -m benchmark.apng2gif
+
+Environment variables for executing the bot are still required.
+"""
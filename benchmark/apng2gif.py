@@ -0,0 +1,50 @@
+"""
+Benchmark of the APNG to GIF conversion.
+
+Measures the time spent per sticker and the peak RSS using the APNG files in a directory (``tests/res`` by default)::
+
+    py -m benchmark.apng2gif [APNG_DIRECTORY] [REPEAT]
+"""
+import glob
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+from extutils.imgproc.apng2gif import convert, convert_in_pool
+
+from .utils import get_peak_rss_mb, measure
+
+DEFAULT_CORPUS_DIR = os.path.join("tests", "res")
+
+
+def main(corpus_dir: str = DEFAULT_CORPUS_DIR, repeat: int = 5):
+    """
+    Execute the benchmark on every ``.apng`` file in ``corpus_dir``.
+
+    :param corpus_dir: directory containing the APNG files
+    :param repeat: count of the conversions to measure per file
+    """
+    apng_paths = sorted(glob.glob(os.path.join(corpus_dir, "*.apng")))
+    if not apng_paths:
+        print(f"No APNG file found in <{corpus_dir}>.")
+        sys.exit(1)
+
+    with TemporaryDirectory() as temp_dir:
+        for apng_path in apng_paths:
+            with open(apng_path, "rb") as f:
+                apng_bin = f.read()
+
+            out_path = os.path.join(temp_dir, f"{os.path.splitext(os.path.basename(apng_path))[0]}.gif")
+
+            print(f"--- {apng_path} ({len(apng_bin) / 1024:.1f} KB)")
+            print(measure("In-process", lambda: convert(apng_bin, out_path, zip_frames=False),
+                          repeat=repeat))
+            print(measure("Process pool", lambda: convert_in_pool(apng_bin, out_path, zip_frames=False),
+                          repeat=repeat, warmup=1))
+
+    print(f"Peak RSS (main process): {get_peak_rss_mb()} MB")
+    print(f"Peak RSS (including pool workers): {get_peak_rss_mb(include_children=True)} MB")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *map(int, sys.argv[2:3]))
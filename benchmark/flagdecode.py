@@ -0,0 +1,69 @@
+"""
+Benchmark of casting the flags and decoding the models containing a lot of flags.
+
+Documents are generated in the form returned from the database, which stores the flags as their codes::
+
+    py -m benchmark.flagdecode [DOC_COUNT]
+"""
+import random
+import sys
+
+import bson
+
+from extutils.mongo import get_codec_options
+from flags import APICommand, AutoReplyContentType, BotFeature, Execode, MessageType, PermissionLevel, Platform
+from models import Model
+from models.field import (
+    APICommandField, AutoReplyContentTypeField, BotFeatureField, ExecodeField, MessageTypeField,
+    PermissionLevelField, PlatformField
+)
+
+from .utils import measure
+
+
+class _FlagModel(Model):
+    WITH_OID = False
+
+    ApiCommand = APICommandField("c")
+    ContentType = AutoReplyContentTypeField("ct")
+    Feature = BotFeatureField("f")
+    ActionType = ExecodeField("a")
+    MessageType = MessageTypeField("mt")
+    PermissionLevel = PermissionLevelField("pl")
+    Platform = PlatformField("p")
+
+
+_FLAG_TYPES = {
+    "c": APICommand, "ct": AutoReplyContentType, "f": BotFeature, "a": Execode,
+    "mt": MessageType, "pl": PermissionLevel, "p": Platform
+}
+
+
+def main(doc_count: int = 10000):
+    """
+    Execute the benchmark on ``doc_count`` documents.
+
+    :param doc_count: count of the documents to be decoded
+    """
+    rnd = random.Random(42)
+
+    # noinspection PyTypeChecker
+    docs = [{key: rnd.choice(list(flag_type)).code for key, flag_type in _FLAG_TYPES.items()}
+            for _ in range(doc_count)]
+    # noinspection PyTypeChecker
+    names = [rnd.choice(list(BotFeature)).name for _ in range(doc_count)]
+
+    print(f"--- {doc_count} documents / {len(_FLAG_TYPES)} flags per document")
+    print(measure("Cast code", lambda: [BotFeature.cast(doc["f"]) for doc in docs]))
+    print(measure("Cast code string", lambda: [BotFeature.cast(str(doc["f"])) for doc in docs]))
+    print(measure("Cast name", lambda: [BotFeature.cast(name) for name in names]))
+    print(measure("Model decode", lambda: [_FlagModel.cast_model(doc) for doc in docs]))
+
+    models = [_FlagModel.cast_model(doc) for doc in docs]
+    print(measure("Get codec options", get_codec_options, repeat=1000))
+    print(measure("BSON encode", lambda: [bson.encode(model.to_json(), codec_options=get_codec_options())
+                                          for model in models]))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,69 @@
+"""
+Benchmark of the message count leaderboard.
+
+Compares getting the rank of a user by sorting the message counts of all members,
+which is what the ranking did after aggregating the message records,
+against getting the rank from the maintained leaderboard::
+
+    py -m benchmark.leaderboard [MEMBER_COUNT] [MESSAGE_COUNT]
+
+Note that the aggregation of the message records is **NOT** included in the sorting measurement.
+"""
+import random
+import sys
+from collections import Counter
+
+from extutils.leaderboard import RollingLeaderboard
+
+from .utils import measure
+
+WINDOWS = (24, 168)
+
+
+def main(member_count: int = 50000, message_count: int = 500000):
+    """
+    Execute the benchmark on ``message_count`` messages randomly sent by ``member_count`` members in 7 days.
+
+    :param member_count: count of the members
+    :param message_count: count of the messages
+    """
+    rnd = random.Random(42)
+    now_bucket = 7 * 24
+
+    # Few members send most of the messages
+    messages = [(int(member_count * rnd.random() ** 3), now_bucket - rnd.randrange(168))
+                for _ in range(message_count)]
+
+    board = RollingLeaderboard(WINDOWS)
+    print(measure("Leaderboard - Add all messages",
+                  lambda: [board.add(member, bucket) for member, bucket in messages]))
+    print(measure("Leaderboard - Reset with all messages",
+                  lambda: board.reset(((member, bucket, 1) for member, bucket in messages), now_bucket)))
+
+    counts = Counter(member for member, _ in messages)
+    targets = [rnd.choice(list(counts)) for _ in range(100)]
+    target_iter = iter(targets * 10)
+
+    def rank_by_sort():
+        target = next(target_iter)
+        for idx, (member, _) in enumerate(sorted(counts.items(), key=lambda item: item[1], reverse=True), start=1):
+            if member == target:
+                return idx
+
+        return -1
+
+    print(f"--- {len(counts)} members with messages / {message_count} messages")
+    print(measure("Sort all members", rank_by_sort, repeat=20))
+
+    target_iter = iter(targets * 1000)
+    print(measure("Leaderboard - Rank in 7 days", lambda: board.get_rank(next(target_iter), 168, now_bucket),
+                  repeat=10000))
+    print(measure("Leaderboard - Rank in 1 day", lambda: board.get_rank(next(target_iter), 24, now_bucket),
+                  repeat=10000))
+
+    print(measure("Leaderboard - Expire 1 hour",
+                  lambda: board.get_rank(0, 168, now_bucket + 1)))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
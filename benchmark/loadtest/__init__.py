@@ -0,0 +1,32 @@
+"""
+Load test of the message handling and the stats against a MongoDB server.
+
+Synthesizes the channels, members, message records, bot usage records, auto-reply modules and timers,
+then measures handling the generated text messages with ``handle_message_main()``
+and getting the data for the stats pages::
+
+    py -m benchmark.loadtest [OUTPUT_JSON] [MESSAGE_COUNT] [CONCURRENCY]
+
+Compare the results of 2 runs (for example, of 2 commits)::
+
+    py -m benchmark.loadtest compare BASE_JSON HEAD_JSON [THRESHOLD_PCT]
+
+Exits with 1 if any latency or query count of ``HEAD_JSON`` regressed more than ``THRESHOLD_PCT`` percent.
+
+``MONGO_DB`` must be set in the environment variables to use a single database,
+which is **cleared** before the data is synthesized. Use a dedicated database on a local ``mongod``.
+
+Query counts are collected by a command listener of ``pymongo``,
+so these also include the writes flushed in the background during the measurement.
+"""
+from pymongo import monitoring
+
+from .querycount import QueryCounter
+
+__all__ = ("QUERY_COUNTER",)
+
+QUERY_COUNTER = QueryCounter()
+
+# Listeners only apply to the clients created after the registration,
+# so this must be done before `mongodb.factory` creates the clients on import
+monitoring.register(QUERY_COUNTER)
@@ -0,0 +1,56 @@
+"""Entry point of the load test. Check the documentation of the package for the usage."""
+import json
+import os
+import sys
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "JellyBot.settings")
+django.setup()
+
+# Handlers and views require Django to be set up
+# pylint: disable=wrong-import-position
+from .runner import compare, run  # noqa: E402
+from .seed import LoadTestConfig  # noqa: E402
+
+
+def main(args):
+    """
+    Execute the load test or compare the results of the load tests according to ``args``.
+
+    :param args: command line arguments
+    :return: exit code
+    """
+    if args and args[0] == "compare":
+        with open(args[1], encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args[2], encoding="utf-8") as f:
+            head = json.load(f)
+
+        regressions = compare(base, head, threshold_pct=float(args[3]) if len(args) > 3 else 10.0)
+        if regressions:
+            print(f"{len(regressions)} regressions found: {', '.join(regressions)}")
+            return 1
+
+        return 0
+
+    output_path = args[0] if args else "loadtest.json"
+
+    config = LoadTestConfig()
+    if len(args) > 1:
+        config.messages = int(args[1])
+    if len(args) > 2:
+        config.concurrency = int(args[2])
+
+    result = run(config)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+    print(f"Result saved to {output_path}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""Command listener counting the commands sent to MongoDB."""
+from collections import Counter
+from threading import Lock
+from typing import Dict
+
+from pymongo import monitoring
+
+__all__ = ("QueryCounter",)
+
+
+class QueryCounter(monitoring.CommandListener):
+    """Command listener counting the commands sent to MongoDB by the command name."""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        with self._lock:
+            self._counts[event.command_name] += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        pass
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Get a copy of the command counts.
+
+        :return: command name to the count of the commands sent
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def count_since(self, snapshot: Dict[str, int]) -> Dict[str, int]:
+        """
+        Get the count of the commands sent since ``snapshot`` was taken.
+
+        :param snapshot: command counts from `snapshot()`
+        :return: command name to the count of the commands sent since `snapshot`
+        """
+        return {name: count - snapshot.get(name, 0) for name, count in self.snapshot().items()
+                if count > snapshot.get(name, 0)}
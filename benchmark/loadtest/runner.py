@@ -0,0 +1,329 @@
+"""Execute the load test and compare its results."""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+import platform
+import random
+import subprocess
+import time
+from threading import Lock
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from django.utils.timezone import get_current_timezone
+
+from extutils.dt import now_utc_aware
+from flags import ChannelType
+from models import RootUserModel
+from mongodb.factory import MONGO_CLIENT, SINGLE_DB_NAME, wait_indexes_ready
+from mongodb.helper import MessageStatsDataProcessor
+from msghandle import handle_message_main, HandlingFunctionBox
+from msghandle.models import TextMessageEventObject
+from JellyBot.views.info.botstats import get_bot_stats_data_package
+from JellyBot.views.info.msgstats import get_msg_stats_data_package
+
+from benchmark.utils import BenchmarkResult
+
+from . import QUERY_COUNTER
+from .seed import LoadTestConfig, SeededChannel, seed_data
+
+__all__ = ("GeneratedMessage", "PhaseResult", "generate_messages", "run", "compare",)
+
+MESSAGE_KIND_WEIGHTS: Tuple[Tuple[str, int], ...] = (
+    ("chatter", 70),
+    ("auto_reply", 15),
+    ("timer", 5),
+    ("command", 5),
+    ("calculator", 5),
+)
+"""Kinds of the generated messages and the weights of picking them."""
+
+COMMANDS = ("JC ping", "JC rdm A  B  C", "JC tmr l")
+"""Commands to be sent. These commands do not modify any data."""
+
+_COMPARED_METRICS = ("p50_ms", "p99_ms", "queries_per_op")
+
+
+class GeneratedMessage(NamedTuple):
+    """A text message to be handled in the load test."""
+
+    kind: str
+    channel: SeededChannel
+    user: RootUserModel
+    text: str
+
+
+class PhaseResult:
+    """Result of a phase of the load test."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.overall = BenchmarkResult(name)
+        self.by_kind: Dict[str, BenchmarkResult] = {}
+        self.elapsed = 0.0
+        self.queries: Dict[str, int] = {}
+
+        self._lock = Lock()
+
+    def add(self, kind: Optional[str], duration: float):
+        """
+        Add the duration of an operation.
+
+        :param kind: kind of the operation, `None` to only add it to the overall result
+        :param duration: duration of the operation in seconds
+        """
+        with self._lock:
+            self.overall.durations.append(duration)
+
+            if kind:
+                self.by_kind.setdefault(kind, BenchmarkResult(kind)).durations.append(duration)
+
+    @staticmethod
+    def _latency_json(result: BenchmarkResult) -> dict:
+        return {
+            "count": result.count,
+            "mean_ms": result.mean * 1000,
+            "p50_ms": result.percentile(50) * 1000,
+            "p99_ms": result.percentile(99) * 1000,
+            "max_ms": max(result.durations, default=0.0) * 1000,
+        }
+
+    def to_json(self) -> dict:
+        """
+        Get the JSON-serializable result of this phase.
+
+        :return: JSON-serializable result
+        """
+        count = self.overall.count
+
+        return {
+            **self._latency_json(self.overall),
+            "throughput_per_sec": count / self.elapsed if self.elapsed else 0.0,
+            "queries_per_op": sum(self.queries.values()) / count if count else 0.0,
+            "queries_per_op_by_command": {name: num / count for name, num in sorted(self.queries.items())}
+            if count else {},
+            "kinds": {kind: self._latency_json(result) for kind, result in sorted(self.by_kind.items())},
+        }
+
+    def __str__(self):
+        data = self.to_json()
+
+        return f"{self.overall} / {data['throughput_per_sec']:.1f} ops/sec / " \
+               f"{data['queries_per_op']:.2f} queries/op"
+
+
+def _clear_database():
+    # Delete the documents instead of dropping the database to keep the indexes
+    wait_indexes_ready()
+
+    database = MONGO_CLIENT.get_database(SINGLE_DB_NAME)
+    for collection_name in database.list_collection_names():
+        database.get_collection(collection_name).delete_many({})
+
+
+def _get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def generate_messages(channels: List[SeededChannel], count: int, rnd: random.Random) -> List[GeneratedMessage]:
+    """
+    Generate ``count`` text messages sent to ``channels``.
+
+    :param channels: channels to send the messages
+    :param count: count of the messages to generate
+    :param rnd: random generator to generate the messages
+    :return: generated messages
+    """
+    kinds, weights = zip(*MESSAGE_KIND_WEIGHTS)
+    messages = []
+
+    for kind in rnd.choices(kinds, weights, k=count):
+        channel = rnd.choice(channels)
+        user = channel.members[int(len(channel.members) * rnd.random() ** 3)]
+
+        if kind == "auto_reply" and channel.ar_keywords:
+            text = rnd.choice(channel.ar_keywords)
+        elif kind == "timer" and channel.timer_keywords:
+            text = rnd.choice(channel.timer_keywords)
+        elif kind == "command":
+            text = rnd.choice(COMMANDS)
+        elif kind == "calculator":
+            text = f"{rnd.randint(1, 999)}*{rnd.randint(1, 999)}+{rnd.randint(1, 99)}="
+        else:
+            kind = "chatter"
+            text = f"Message {rnd.getrandbits(32):08x} in {channel.model.id}"
+
+        messages.append(GeneratedMessage(kind, channel, user, text))
+
+    return messages
+
+
+def _handle(message: GeneratedMessage):
+    # Event construction is included as it queries the database on the platform webhooks
+    event = TextMessageEventObject(None, message.text, message.channel.model, message.user,
+                                   ChannelType.GROUP_PUB_TEXT, is_test_event=True)
+    handle_message_main(event)
+
+
+def run_messages(channels: List[SeededChannel], config: LoadTestConfig, rnd: random.Random) -> PhaseResult:
+    """
+    Measure handling the generated text messages with ``handle_message_main()``.
+
+    :param channels: channels to send the messages
+    :param config: configuration of the load test
+    :param rnd: random generator to generate the messages
+    :return: result of handling the messages
+    """
+    HandlingFunctionBox.load()
+
+    for message in generate_messages(channels, config.warmup_messages, rnd):
+        _handle(message)
+
+    result = PhaseResult("handle_message_main")
+
+    def handle_measured(message: GeneratedMessage):
+        start = time.perf_counter()
+        _handle(message)
+        result.add(message.kind, time.perf_counter() - start)
+
+    messages = generate_messages(channels, config.messages, rnd)
+
+    snapshot = QUERY_COUNTER.snapshot()
+    start = time.perf_counter()
+
+    if config.concurrency > 1:
+        with ThreadPoolExecutor(max_workers=config.concurrency, thread_name_prefix="LoadTest") as executor:
+            list(executor.map(handle_measured, messages))
+    else:
+        for message in messages:
+            handle_measured(message)
+
+    result.elapsed = time.perf_counter() - start
+    result.queries = QUERY_COUNTER.count_since(snapshot)
+
+    return result
+
+
+def run_stats(channels: List[SeededChannel], config: LoadTestConfig, rnd: random.Random) -> List[PhaseResult]:
+    """
+    Measure getting the data of the stats pages.
+
+    :param channels: channels to get the stats
+    :param config: configuration of the load test
+    :param rnd: random generator to pick the channels
+    :return: result of getting each kind of the stats
+    """
+    tzinfo = get_current_timezone()
+    targets: Dict[str, Callable[[SeededChannel], object]] = {
+        "msg_stats_package": lambda channel: get_msg_stats_data_package(channel.model, tzinfo, False),
+        "bot_stats_package": lambda channel: get_bot_stats_data_package(channel.model, None, tzinfo),
+        "recent_messages": lambda channel: MessageStatsDataProcessor.get_recent_messages(channel.model, tz=tzinfo),
+    }
+    picked = rnd.sample(channels, min(config.stats_channels, len(channels)))
+
+    results = []
+    for name, target in targets.items():
+        result = PhaseResult(name)
+
+        snapshot = QUERY_COUNTER.snapshot()
+        phase_start = time.perf_counter()
+
+        for _ in range(config.stats_repeat):
+            for channel in picked:
+                start = time.perf_counter()
+                target(channel)
+                result.add(None, time.perf_counter() - start)
+
+        result.elapsed = time.perf_counter() - phase_start
+        result.queries = QUERY_COUNTER.count_since(snapshot)
+
+        results.append(result)
+
+    return results
+
+
+def run(config: LoadTestConfig) -> dict:
+    """
+    Execute the load test.
+
+    The data in the single database will be cleared.
+
+    :param config: configuration of the load test
+    :return: JSON-serializable result of the load test
+    :raises ValueError: if the single database is not activated
+    """
+    if not SINGLE_DB_NAME:
+        raise ValueError("Set `MONGO_DB` in the environment variables to use a single database for the load test.")
+
+    rnd = random.Random(config.seed)
+
+    _clear_database()
+
+    seed_start = time.perf_counter()
+    channels = seed_data(config, rnd)
+    seed_secs = time.perf_counter() - seed_start
+    print(f"Data synthesized in {seed_secs:.3f} secs.")
+
+    phases = [run_messages(channels, config, rnd)]
+    print(phases[0])
+    for kind, kind_result in sorted(phases[0].by_kind.items()):
+        print(f"  {kind_result}")
+
+    for stats_result in run_stats(channels, config, rnd):
+        print(stats_result)
+        phases.append(stats_result)
+
+    return {
+        "commit": _get_commit(),
+        "created_at": now_utc_aware().isoformat(),
+        "python": platform.python_version(),
+        "config": asdict(config),
+        "seed_secs": seed_secs,
+        "phases": {phase.name: phase.to_json() for phase in phases},
+    }
+
+
+def compare(base: dict, head: dict, *, threshold_pct: float = 10.0) -> List[str]:
+    """
+    Compare the load test result ``head`` against ``base`` and print the differences.
+
+    Lower values are better for all the compared metrics.
+
+    :param base: result of the load test to compare against
+    :param head: result of the load test to be compared
+    :param threshold_pct: percentage of the increase to be considered as a regression
+    :return: regressed metrics in the format of `phase.metric`
+    """
+    print(f"Base: {base.get('commit')} ({base.get('created_at')})")
+    print(f"Head: {head.get('commit')} ({head.get('created_at')})")
+
+    if base.get("config") != head.get("config"):
+        print("Configurations of the results are different, the results may not be comparable.")
+
+    regressions = []
+
+    for phase_name, head_phase in head["phases"].items():
+        base_phase = base["phases"].get(phase_name)
+        if not base_phase:
+            print(f"{phase_name}: not found in base")
+            continue
+
+        print(f"{phase_name}:")
+
+        for metric in _COMPARED_METRICS:
+            base_value = base_phase[metric]
+            head_value = head_phase[metric]
+            if base_value:
+                diff_pct = (head_value - base_value) / base_value * 100
+            else:
+                diff_pct = float("inf") if head_value else 0.0
+
+            regressed = diff_pct > threshold_pct
+            if regressed:
+                regressions.append(f"{phase_name}.{metric}")
+
+            print(f"  {metric}: {base_value:.3f} -> {head_value:.3f} ({diff_pct:+.1f}%)"
+                  f"{' <- REGRESSED' if regressed else ''}")
+
+    return regressions
@@ -0,0 +1,162 @@
+"""Synthesize the data of the load test."""
+from dataclasses import dataclass, field
+from datetime import timedelta
+import random
+from typing import List
+
+from bson import ObjectId
+
+from extutils.dt import now_utc_aware
+from flags import AutoReplyContentType, BotFeature, MessageType, Platform
+from models import (
+    AutoReplyContentModel, BotFeatureUsageModel, ChannelModel, MessageRecordModel, RootUserModel, set_uname_cache
+)
+from mongodb.factory import (
+    AutoReplyManager, BotFeatureUsageDataManager, ChannelManager, MessageKeywordIndexManager,
+    MessageRecordStatisticsManager, ProfileManager, RootUserManager, TimerManager
+)
+
+__all__ = ("LoadTestConfig", "SeededChannel", "seed_data",)
+
+_SYLLABLES = ("ka", "ri", "mo", "te", "su", "na", "lo", "vi", "ha", "ze", "po", "qu", "ren", "jel", "ly")
+
+_MEDIA_TYPES = (MessageType.IMAGE, MessageType.LINE_STICKER)
+
+
+@dataclass
+class LoadTestConfig:
+    """Configuration of the load test. The data synthesized is determined by these values."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    channels: int = 20
+    members_per_channel: int = 30
+    records_per_channel: int = 5000
+    bot_usages_per_channel: int = 500
+    ar_modules_per_channel: int = 50
+    timers_per_channel: int = 5
+    record_days: int = 30
+
+    messages: int = 2000
+    warmup_messages: int = 100
+    concurrency: int = 1
+
+    stats_channels: int = 5
+    stats_repeat: int = 3
+
+    seed: int = 42
+
+
+@dataclass
+class SeededChannel:
+    """A synthesized channel and what could be triggered in it."""
+
+    model: ChannelModel
+    members: List[RootUserModel] = field(default_factory=list)
+    ar_keywords: List[str] = field(default_factory=list)
+    timer_keywords: List[str] = field(default_factory=list)
+
+
+def _random_sentence(rnd: random.Random, vocabulary: List[str]) -> str:
+    return " ".join(rnd.choice(vocabulary) for _ in range(rnd.randint(1, 8)))
+
+
+def _seed_members(config: LoadTestConfig) -> List[RootUserModel]:
+    # Members are drawn from a shared pool, so some of the members are in multiple channels
+    pool_size = max(config.members_per_channel, config.channels * config.members_per_channel // 2)
+    members = []
+
+    for idx in range(pool_size):
+        model = RootUserManager.register_onplat(Platform.LINE, f"LoadTest-User-{config.seed}-{idx}").model
+
+        # Cache the names to avoid fetching them from the platform
+        for onplat_oid in model.on_plat_oids:
+            set_uname_cache(onplat_oid, f"Member {idx}")
+
+        members.append(model)
+
+    return members
+
+
+def _seed_records(channel: SeededChannel, config: LoadTestConfig, rnd: random.Random, vocabulary: List[str]):
+    now = now_utc_aware()
+    members = channel.members
+
+    records = []
+    for _ in range(config.records_per_channel):
+        timestamp = now - timedelta(seconds=rnd.uniform(0, config.record_days * 86400))
+        # Few members send most of the messages
+        sender = members[int(len(members) * rnd.random() ** 3)]
+
+        if rnd.random() < 0.9:
+            msg_type, content = MessageType.TEXT, _random_sentence(rnd, vocabulary)
+        else:
+            msg_type, content = rnd.choice(_MEDIA_TYPES), None
+
+        records.append(MessageRecordModel(
+            Id=ObjectId.from_datetime(timestamp), ChannelOid=channel.model.id, UserRootOid=sender.id,
+            MessageType=msg_type, MessageContent=content, ProcessTimeSecs=rnd.uniform(0.01, 0.5)))
+
+    MessageRecordStatisticsManager.insert_many(records)
+    MessageKeywordIndexManager.index_messages(records)
+
+    features = [feature for feature in BotFeature if feature != BotFeature.UNDEFINED]
+    BotFeatureUsageDataManager.insert_many([
+        BotFeatureUsageModel(
+            Id=ObjectId.from_datetime(now - timedelta(seconds=rnd.uniform(0, config.record_days * 86400))),
+            Feature=rnd.choice(features), ChannelOid=channel.model.id, SenderRootOid=rnd.choice(members).id)
+        for _ in range(config.bot_usages_per_channel)
+    ])
+
+
+def _seed_triggers(channel: SeededChannel, config: LoadTestConfig, rnd: random.Random, vocabulary: List[str]):
+    for idx in range(config.ar_modules_per_channel):
+        keyword = f"{rnd.choice(vocabulary)} ar{idx}"
+
+        result = AutoReplyManager.add_conn(
+            Keyword=AutoReplyContentModel(Content=keyword, ContentType=AutoReplyContentType.TEXT),
+            Responses=[AutoReplyContentModel(Content=_random_sentence(rnd, vocabulary),
+                                             ContentType=AutoReplyContentType.TEXT)],
+            ChannelOid=channel.model.id, CreatorOid=rnd.choice(channel.members).id)
+        if result.outcome.is_success:
+            channel.ar_keywords.append(keyword)
+
+    now = now_utc_aware()
+    for idx in range(config.timers_per_channel):
+        keyword = f"{rnd.choice(vocabulary)} tmr{idx}"
+
+        outcome = TimerManager.add_new_timer(
+            channel.model.id, keyword, f"Timer {idx}", now + timedelta(hours=rnd.uniform(-24, 240)),
+            countup=rnd.random() < 0.2)
+        if outcome.is_success:
+            channel.timer_keywords.append(keyword)
+
+
+def seed_data(config: LoadTestConfig, rnd: random.Random) -> List[SeededChannel]:
+    """
+    Synthesize the data of the load test.
+
+    The data in the database should be cleared before calling this.
+
+    :param config: configuration of the load test
+    :param rnd: random generator to synthesize the data
+    :return: synthesized channels
+    """
+    vocabulary = ["".join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(1, 3))) for _ in range(2000)]
+    members = _seed_members(config)
+
+    channels = []
+    for idx in range(config.channels):
+        model = ChannelManager.ensure_register(
+            Platform.LINE, f"LoadTest-Channel-{config.seed}-{idx}", default_name=f"Channel {idx}").model
+        channel = SeededChannel(model, members=rnd.sample(members, config.members_per_channel))
+
+        for member in channel.members:
+            ProfileManager.register_new_default(model.id, member.id)
+
+        _seed_records(channel, config, rnd, vocabulary)
+        _seed_triggers(channel, config, rnd, vocabulary)
+
+        channels.append(channel)
+
+    return channels
@@ -0,0 +1,36 @@
+"""
+Benchmark of picking the options multiple times in the random command.
+
+Compares counting the options picked by ``random.choices()``, which is what the command did,
+against drawing the counts from the multinomial distribution::
+
+    py -m benchmark.rdm [OPTION_COUNT]
+"""
+import random
+import sys
+from collections import Counter
+
+from extutils.sampling import multinomial
+
+from .utils import measure
+
+
+def main(option_count: int = 20):
+    """
+    Execute the benchmark picking ``option_count`` weighted options for different times.
+
+    :param option_count: count of the options
+    """
+    rnd = random.Random(42)
+
+    options = [f"Option {idx}" for idx in range(option_count)]
+    weights = [rnd.uniform(0.1, 10) for _ in range(option_count)]
+
+    for count in (1000, 100000, 1000000):
+        print(f"--- {option_count} options / {count} picks")
+        print(measure("Choices + tally", lambda k=count: Counter(rnd.choices(options, weights, k=k)), repeat=5))
+        print(measure("Multinomial", lambda k=count: multinomial(k, weights, rnd), repeat=1000))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
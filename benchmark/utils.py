@@ -0,0 +1,99 @@
+"""Utilities shared across the benchmarks."""
+from dataclasses import dataclass, field
+import statistics
+import sys
+import time
+from typing import Callable, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+__all__ = ("get_peak_rss_mb", "BenchmarkResult", "measure",)
+
+
+def get_peak_rss_mb(*, include_children: bool = False) -> Optional[float]:
+    """
+    Get the peak resident set size of the current process in MB.
+
+    Returns ``None`` if the peak RSS is not available on the current platform.
+
+    :param include_children: also include the peak RSS of the terminated child processes (for example, pool workers)
+    :return: peak RSS in MB if available
+    """
+    if not resource:
+        return None
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        usage = max(usage, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+    # `ru_maxrss` is in bytes on macOS and in KB on Linux
+    return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of a benchmark. Unit of the durations is seconds."""
+
+    name: str
+    durations: List[float] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """
+        Get the count of the measured executions.
+
+        :return: count of the measured executions
+        """
+        return len(self.durations)
+
+    @property
+    def mean(self) -> float:
+        """
+        Get the mean duration of the executions.
+
+        :return: mean duration
+        """
+        return statistics.mean(self.durations) if self.durations else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        Get the duration at the given percentile using the nearest-rank method.
+
+        :param pct: percentile to get (0~100)
+        :return: duration at the percentile
+        """
+        if not self.durations:
+            return 0.0
+
+        ordered = sorted(self.durations)
+        return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+    def __str__(self):
+        return f"{self.name}: {self.count} runs / mean {self.mean * 1000:.3f} ms / " \
+               f"p50 {self.percentile(50) * 1000:.3f} ms / p99 {self.percentile(99) * 1000:.3f} ms"
+
+
+def measure(name: str, fn: Callable[[], None], *, repeat: int = 1, warmup: int = 0) -> BenchmarkResult:
+    """
+    Execute ``fn`` for ``warmup + repeat`` times and measure the duration of the last ``repeat`` executions.
+
+    :param name: name of the benchmark
+    :param fn: function to be measured
+    :param repeat: count of the measured executions
+    :param warmup: count of the executions before measuring
+    :return: benchmark result
+    """
+    for _ in range(warmup):
+        fn()
+
+    result = BenchmarkResult(name)
+
+    for _ in range(repeat):
+        _start = time.perf_counter()
+        fn()
+        result.durations.append(time.perf_counter() - _start)
+
+    return result
@@ -11,6 +11,9 @@ from JellyBot.systemconfig import System
 from bot.user import perform_existence_check
 from bot.system import record_boot_dt
 from extutils.ddns import activate_ddns_update
+from extutils.startup import STARTUP_PROFILER
+from mongodb.factory import wait_indexes_ready
+from mongodb.helper import UserDataIntegrationHelper
 from msghandle import HandlingFunctionBox
 
 __all__ = ["signal_discord_ready", "signal_django_ready"]
@@ -23,12 +26,14 @@ _ready = {
 
 def signal_django_ready():
     """Signal that Django application is ready."""
+    STARTUP_PROFILER.mark("Django ready")
     _ready["Discord"] = True
     _check_all_ready()
 
 
 def signal_discord_ready():
     """Signal that called when the Discord bot is ready."""
+    STARTUP_PROFILER.mark("Discord ready")
     _ready["Django"] = True
     _check_all_ready()
 
@@ -39,10 +44,21 @@ def _check_all_ready():
 
 
 def on_system_fully_ready():
-    """Code to execute when the system is fully prepared (Discord bot and Django application ready)."""
-    HandlingFunctionBox.load()
+    """
+    Code to execute when the system is fully prepared (Discord bot and Django application ready).
+
+    The startup report will be logged and the deferred startup tasks will start afterward.
+    """
+    with STARTUP_PROFILER.measure("Phase", "Index verification"):
+        wait_indexes_ready()
+    with STARTUP_PROFILER.measure("Phase", "Handling functions loading"):
+        HandlingFunctionBox.load()
+
     record_boot_dt()
+    UserDataIntegrationHelper.resume_incomplete_async()
 
     if settings.PRODUCTION:
         perform_existence_check(set_name_to_cache=True)
         activate_ddns_update(System.DDNSUpdateIntervalSeconds)
+
+    STARTUP_PROFILER.mark_ready()
@@ -1,97 +1,251 @@
 """Functions to perform actions related to user identity."""
-from concurrent.futures.thread import ThreadPoolExecutor
-from threading import Thread
-from typing import Dict, List
+from datetime import timedelta
+from threading import Thread, Event
+from typing import Callable, Dict, List, Optional, Type
 
 from bson import ObjectId
 
+from JellyBot.systemconfig import UserExistenceCheck, PlatformConfig, LineApi, Discord
+from flags import Platform
 from mongodb.factory import RootUserManager, ProfileManager, ChannelManager
 from models import ChannelProfileConnectionModel, OnPlatformUserModel, ChannelModel, set_uname_cache
-from extutils.timing import exec_timing_result
+from extutils.dt import now_utc_aware
 from extutils.emailutils import MailSender
 from extutils.logger import SYSTEM
+from extutils.ratelimit import TokenBucket
 
+__all__ = ("UserExistenceChecker", "perform_existence_check",)
 
-def _perform_existence_check(set_name_to_cache: bool):
-    list_prof_conn = list(ProfileManager.get_available_connections())
+NameGetter = Callable[[OnPlatformUserModel, ChannelModel], Optional[str]]
+"""Function to get the user name of an on-platform identity from the platform. Returns ``None`` if not found."""
 
-    def _fn():
-        marked_unavailable = 0
 
-        dict_onplat_oids = RootUserManager.get_root_to_onplat_dict()
-        dict_onplat_data = RootUserManager.get_onplat_data_dict()
-        dict_channel = ChannelManager.get_channel_dict([p.channel_oid for p in list_prof_conn], accessbible_only=True)
+# pylint: disable=import-outside-toplevel
+
+
+def _get_line_user_name(model_onplat: OnPlatformUserModel, model_channel: ChannelModel) -> Optional[str]:
+    from extline import LineApiWrapper
+
+    return LineApiWrapper.get_user_name_safe(model_onplat.token, channel_model=model_channel)
 
-        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="ExstCheck") as executor:
-            futures = [
-                executor.submit(_check_on_prof_conn, d, set_name_to_cache, dict_onplat_oids, dict_onplat_data,
-                                dict_channel)
-                for d in list_prof_conn
-            ]
 
-            for completed in futures:
-                ret = completed.result()
-                if ret:
-                    marked_unavailable += 1
+# noinspection PyUnusedLocal
+def _get_discord_user_name(model_onplat: OnPlatformUserModel, model_channel: ChannelModel) -> Optional[str]:
+    # pylint: disable=unused-argument
+    from extdiscord.core import DiscordClientWrapper
 
-        SYSTEM.logger.info("Marked %s connections unavailable.", marked_unavailable)
+    return DiscordClientWrapper.get_user_name_safe(model_onplat.token)
 
-    SYSTEM.logger.info("Performing user channel existence check on %d connections...", len(list_prof_conn))
 
-    result = exec_timing_result(_fn)
+# pylint: enable=import-outside-toplevel
 
-    SYSTEM.logger.info("User channel existence check completed in %.2f ms.", result.execution_ms)
 
+_platform_name_getters: Dict[Platform, NameGetter] = {
+    Platform.LINE: _get_line_user_name,
+    Platform.DISCORD: _get_discord_user_name
+}
+
+_platform_configs: Dict[Platform, Type[PlatformConfig]] = {
+    Platform.LINE: LineApi,
+    Platform.DISCORD: Discord
+}
+
+
+class UserExistenceChecker:
+    """
+    Checker to check if the users of the channel profile connections still exist in the channel.
+
+    Available connections are checked in batches, starting from the connections never checked,
+    then the connections checked least recently. Connections checked within ``recheck_interval`` are skipped.
+
+    The time of the check is recorded on each connection,
+    so the check continues from where it stopped instead of starting over after a restart.
+
+    Each user name request to the platform takes a token from the rate limiter of the platform
+    to prevent the check from competing with the message handling for the platform API.
+
+    User names found are stored to the user name cache.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+
+    def __init__(self, name_getters: Dict[Platform, NameGetter], rate_limiters: Dict[Platform, TokenBucket], *,
+                 batch_size: int = UserExistenceCheck.BatchSize,
+                 recheck_interval: timedelta = timedelta(seconds=UserExistenceCheck.RecheckIntervalSeconds),
+                 idle_seconds: float = UserExistenceCheck.IdleSeconds,
+                 error_backoff_seconds: float = UserExistenceCheck.ErrorBackoffSeconds,
+                 set_name_to_cache: bool = True):
+        """
+        Create a checker which checks the user existence in batches.
+
+        :param name_getters: functions to get the user name from each platform
+        :param rate_limiters: rate limiters of the user name requests to each platform
+        :param batch_size: count of the connections to be checked in a batch
+        :param recheck_interval: min interval between 2 checks of a connection
+        :param idle_seconds: seconds to wait for the next batch if there are no connections to be checked
+        :param error_backoff_seconds: seconds to wait before retrying after the 1st failed batch,
+            doubled on each consecutive failure and capped at `idle_seconds`
+        :param set_name_to_cache: if the user name should be set to the user name cache
+        """
+        self._name_getters = name_getters
+        self._rate_limiters = rate_limiters
+        self._batch_size = batch_size
+        self._recheck_interval = recheck_interval
+        self._idle_seconds = idle_seconds
+        self._error_backoff_seconds = error_backoff_seconds
+        self._set_name_to_cache = set_name_to_cache
+
+        self._stop_event = Event()
+
+    def _get_name(self, model_onplat: OnPlatformUserModel, model_channel: ChannelModel) -> Optional[str]:
+        name_getter = self._name_getters.get(model_onplat.platform)
+        if not name_getter:
+            return None
+
+        rate_limiter = self._rate_limiters.get(model_onplat.platform)
+        if rate_limiter:
+            rate_limiter.acquire()
+
+        return name_getter(model_onplat, model_channel)
+
+    def _check_on_prof_conn(
+            self,
+            prof_conn: ChannelProfileConnectionModel,
+            dict_onplat_oids: Dict[ObjectId, List[ObjectId]],
+            dict_onplat_data: Dict[ObjectId, OnPlatformUserModel],
+            dict_channel: Dict[ObjectId, ChannelModel]) -> bool:
+        """Return ``True`` if marked unavailable. Otherwise ``False``."""
+        oid_user = prof_conn.user_oid
+        list_onplat_oids = dict_onplat_oids.get(oid_user)
+        if not list_onplat_oids:
+            return False
+
+        model_channel = dict_channel.get(prof_conn.channel_oid)
+        if not model_channel:
+            return False
+
+        attempts = 0
+        attempts_allowed = len(list_onplat_oids)
+
+        for oid_onplat in list_onplat_oids:
+            model_onplat = dict_onplat_data.get(oid_onplat)
+            if not model_onplat:
+                MailSender.send_email_async(
+                    f"Missing OnPlatform data of data ID: {oid_onplat}<br>"
+                    f"Root User ID: {prof_conn.user_oid}",
+                    subject="Missing OnPlatform Data in Root User Model"
+                )
+                continue
+
+            name = self._get_name(model_onplat, model_channel)
+
+            if name:
+                if self._set_name_to_cache:
+                    set_uname_cache(model_onplat.id, name)
+
+                break
+
+            attempts += 1
+
+        if attempts >= attempts_allowed:
+            ProfileManager.mark_unavailable(model_channel.id, oid_user)
+
+        return attempts >= attempts_allowed
+
+    def check_batch(self) -> int:
+        """
+        Check a batch of the connections and record the time of the check.
+
+        :return: count of the connections marked unavailable, `-1` if there are no connections to be checked
+        """
+        now = now_utc_aware()
+
+        list_prof_conn = ProfileManager.get_connections_to_check(now - self._recheck_interval, self._batch_size)
+        if not list_prof_conn:
+            return -1
+
+        dict_onplat_oids = RootUserManager.get_root_to_onplat_dict(list({p.user_oid for p in list_prof_conn}))
+        onplat_oids = [oid for oids in dict_onplat_oids.values() for oid in oids]
+        dict_onplat_data = RootUserManager.get_onplat_data_dict(onplat_oids) if onplat_oids else {}
+        dict_channel = ChannelManager.get_channel_dict(list({p.channel_oid for p in list_prof_conn}),
+                                                       accessbible_only=True)
+
+        marked_unavailable = sum(
+            self._check_on_prof_conn(prof_conn, dict_onplat_oids, dict_onplat_data, dict_channel)
+            for prof_conn in list_prof_conn
+        )
+
+        ProfileManager.mark_existence_checked([prof_conn.id for prof_conn in list_prof_conn], now)
+
+        return marked_unavailable
+
+    def run(self):
+        """
+        Keep checking the connections until ``stop()`` is called.
+
+        A failed batch is logged and retried after a backoff, so an error does not stop the check.
+        """
+        checked_batches = 0
+        marked_unavailable = 0
+        failures = 0
 
-def _check_on_prof_conn(
-        prof_conn: ChannelProfileConnectionModel,
-        set_name_to_cache: bool,
-        dict_onplat_oids: Dict[ObjectId, List[ObjectId]],
-        dict_onplat_data: Dict[ObjectId, OnPlatformUserModel],
-        dict_channel: Dict[ObjectId, ChannelModel]) -> bool:
-    """Return ``True`` if marked unavailable. Otherwise ``False``."""
-    oid_user = prof_conn.user_oid
-    list_onplat_oids = dict_onplat_oids.get(oid_user)
-    if not list_onplat_oids:
-        return False
+        while not self._stop_event.is_set():
+            try:
+                result = self.check_batch()
+            except Exception:  # pylint: disable=broad-except
+                failures += 1
+                backoff = min(self._error_backoff_seconds * 2 ** (failures - 1), self._idle_seconds)
 
-    model_channel = dict_channel.get(prof_conn.channel_oid)
-    if not model_channel:
-        return False
+                SYSTEM.logger.exception("User existence check failed (%d consecutive). Retrying in %.0f secs.",
+                                        failures, backoff)
+                self._stop_event.wait(backoff)
+                continue
 
-    attempts = 0
-    attempts_allowed = len(list_onplat_oids)
+            failures = 0
 
-    for oid_onplat in list_onplat_oids:
-        model_onplat = dict_onplat_data.get(oid_onplat)
-        if not model_onplat:
-            MailSender.send_email_async(
-                f"Missing OnPlatform data of data ID: {oid_onplat}<br>"
-                f"Root User ID: {prof_conn.user_oid}",
-                subject="Missing OnPlatform Data in Root User Model"
-            )
-            continue
+            if result >= 0:
+                checked_batches += 1
+                marked_unavailable += result
+                continue
 
-        name = model_onplat.get_name(model_channel)
+            if checked_batches:
+                SYSTEM.logger.info("User existence check completed on %d batches. Marked %d connections unavailable.",
+                                   checked_batches, marked_unavailable)
+                checked_batches = 0
+                marked_unavailable = 0
 
-        if name:
-            if set_name_to_cache:
-                set_uname_cache(model_onplat.id, name)
+            self._stop_event.wait(self._idle_seconds)
 
-            break
+    def start(self) -> Thread:
+        """
+        Start checking the connections in a daemon thread.
 
-        attempts += 1
+        :return: started thread which checks the connections
+        """
+        thread = Thread(target=self.run, name="ExstCheck", daemon=True)
+        thread.start()
 
-    if attempts >= attempts_allowed:
-        ProfileManager.mark_unavailable_async(model_channel.id, oid_user)
+        return thread
 
-    return attempts >= attempts_allowed
+    def stop(self):
+        """Stop checking the connections after the current batch."""
+        self._stop_event.set()
 
 
-def perform_existence_check(set_name_to_cache: bool):
+def perform_existence_check(set_name_to_cache: bool) -> UserExistenceChecker:
     """
-    Perform user existence check and set the user name to the cache **asynchronously**.
+    Start the user existence check and set the user name to the cache **asynchronously**.
 
     :param set_name_to_cache: if the user name should be set to the user name cache
+    :return: started user existence checker
     """
-    Thread(target=_perform_existence_check, args=(set_name_to_cache,)).start()
+    checker = UserExistenceChecker(
+        _platform_name_getters,
+        {platform: TokenBucket(config.user_name_requests_per_second, config.user_name_requests_burst)
+         for platform, config in _platform_configs.items()},
+        set_name_to_cache=set_name_to_cache
+    )
+    checker.start()
+
+    return checker
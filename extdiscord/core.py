@@ -16,8 +16,10 @@ from extdiscord.handle import handle_discord_main
 from extdiscord.logger import DISCORD
 from extutils.checker import arg_type_ensure
 from extutils.emailutils import MailSender
+from extutils.tracing import span
 from flags import Platform
 from mongodb.factory import ChannelManager, ChannelCollectionManager, RootUserManager, ProfileManager
+from msghandle import MESSAGE_TRACER
 from msghandle.models import MessageEventObjectFactory
 
 from .token_ import discord_token
@@ -54,9 +56,14 @@ class DiscordClient(Client):
                 or BotConflictionPreventer.prioritized_bot_exists(message.guild):
             return
 
-        await handle_discord_main(MessageEventObjectFactory.from_discord(message)) \
-            .to_platform(Platform.DISCORD) \
-            .send_discord(message.channel)
+        with MESSAGE_TRACER.trace("Discord"):
+            with span("event_construct"):
+                bot_event = MessageEventObjectFactory.from_discord(message)
+
+            handled = handle_discord_main(bot_event)
+
+            with span("send"):
+                await handled.to_platform(Platform.DISCORD).send_discord(message.channel)
 
     # noinspection PyMethodMayBeStatic
     async def on_private_channel_delete(self, channel: Union[DMChannel, GroupChannel]):
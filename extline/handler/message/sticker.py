@@ -1,11 +1,17 @@
 """This module contains the function to handle sticker message event."""
 from flags import Platform
-from msghandle import handle_message_main
+from extutils.tracing import span
+from msghandle import handle_message_main, MESSAGE_TRACER
 from msghandle.models import MessageEventObjectFactory
 
 
 def handle_sticker(_, event, destination):
     """Method to be called to handle sticker message event."""
-    bot_event = MessageEventObjectFactory.from_line(event, destination)
+    with MESSAGE_TRACER.trace("LINE"):
+        with span("event_construct"):
+            bot_event = MessageEventObjectFactory.from_line(event, destination)
 
-    handle_message_main(bot_event).to_platform(Platform.LINE).send_line(event.reply_token)
+        handled = handle_message_main(bot_event)
+
+        with span("send"):
+            handled.to_platform(Platform.LINE).send_line(event.reply_token)
@@ -1,4 +1,5 @@
 """This module contains various wrappers of the required objects for the LINE bot webhook."""
+from functools import partial
 import os
 import sys
 from typing import List, Union, Optional
@@ -10,7 +11,7 @@ from linebot.models import TextSendMessage, SendMessage, Profile, ImageMessage
 
 from flags import ChannelType
 from models import ChannelModel
-from extutils.imgproc import ImageContentProcessor
+from extutils.imgproc import ImageContentProcessor, LazyImageBinary
 from extutils.logger import SYSTEM
 
 __all__ = ("LineApiUtils", "LineApiWrapper",)
@@ -26,8 +27,13 @@ _line_api = LineBotApi(line_token)
 class _LineApiWrapper:
     """LINE API wrapper class."""
 
-    def __init__(self):
-        self._core = _line_api
+    def __init__(self, core: Optional[LineBotApi] = None):
+        """
+        Wrap the LINE API client ``core``.
+
+        :param core: LINE API client to be used. Uses the client of the bot if not given
+        """
+        self._core = core or _line_api
 
     def reply_text(self, reply_token, messages: Union[str, List[str]]):
         """
@@ -130,7 +136,25 @@ class _LineApiWrapper:
         :param message: the image message to get the content
         :return: a base64 string representing the image in `message`
         """
-        return ImageContentProcessor.binary_img_to_base64_str(self._core.get_message_content(str(message.id)).content)
+        return ImageContentProcessor.binary_img_to_base64_str(self.get_image_binary(message))
+
+    def get_image_binary(self, message: ImageMessage) -> bytes:
+        """
+        Get the raw bytes of the image in ``message``.
+
+        :param message: the image message to get the content
+        :return: raw bytes of the image in `message`
+        """
+        return b"".join(self._core.get_message_content(str(message.id)).iter_content())
+
+    def get_image_lazy(self, message: ImageMessage) -> LazyImageBinary:
+        """
+        Get a handle of the image in ``message`` which fetches the image on the first access only.
+
+        :param message: the image message to get the content
+        :return: lazy handle of the image in `message`
+        """
+        return LazyImageBinary(partial(self.get_image_binary, message))
 
 
 class LineApiUtils:
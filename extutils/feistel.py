@@ -0,0 +1,70 @@
+"""Module of the keyed bijective scramble of the integers."""
+import hashlib
+
+__all__ = ("FeistelPermutation",)
+
+
+class FeistelPermutation:
+    """
+    Keyed permutation over the integers in ``[0, domain_size)`` using a balanced Feistel network.
+
+    The Feistel network permutes the integers in the smallest domain of an even bit count covering ``domain_size``.
+    Results falling outside of ``[0, domain_size)`` are permuted again (cycle-walking),
+    so the permutation is always a bijection over ``[0, domain_size)``.
+
+    >>> perm = FeistelPermutation(1000, 7)
+    >>> sorted(perm.permute(x) for x in range(1000)) == list(range(1000))
+    True
+
+    :raises ValueError: `domain_size` is not positive
+    """
+
+    def __init__(self, domain_size: int, key: int, *, rounds: int = 4):
+        if domain_size <= 0:
+            raise ValueError(f"`domain_size` must be positive. ({domain_size})")
+
+        self._domain_size = domain_size
+        self._key = key.to_bytes(16, "big", signed=True)
+        self._rounds = rounds
+
+        self._half_bits = max((domain_size - 1).bit_length() + 1, 2) // 2
+        self._half_mask = (1 << self._half_bits) - 1
+
+    @property
+    def domain_size(self) -> int:
+        """
+        Size of the domain of this permutation.
+
+        :return: size of the domain
+        """
+        return self._domain_size
+
+    def _round(self, round_num: int, value: int) -> int:
+        digest = hashlib.blake2b(f"{round_num}:{value}".encode(), digest_size=8, key=self._key).digest()
+
+        return int.from_bytes(digest, "big") & self._half_mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self._half_bits, value & self._half_mask
+
+        for round_num in range(self._rounds):
+            left, right = right, left ^ self._round(round_num, right)
+
+        return (left << self._half_bits) | right
+
+    def permute(self, value: int) -> int:
+        """
+        Get the permuted value of ``value``.
+
+        :param value: value to be permuted
+        :return: permuted value in `[0, domain_size)`
+        :raises ValueError: `value` is not in `[0, domain_size)`
+        """
+        if not 0 <= value < self._domain_size:
+            raise ValueError(f"`value` must be in [0, {self._domain_size}). ({value})")
+
+        value = self._encrypt(value)
+        while value >= self._domain_size:
+            value = self._encrypt(value)
+
+        return value
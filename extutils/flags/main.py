@@ -1,6 +1,6 @@
 """Main ``Flag`` implementations."""
 from enum import Enum
-from typing import Union
+from typing import Dict, Set, Union
 
 from .mongo import register_encoder
 
@@ -18,6 +18,10 @@ class DuplicatedCodeError(Exception):
         super().__init__(f"Duplicated flag code: {code}")
 
 
+_flag_codes: Dict[type, Set[int]] = {}
+_flag_lookups: Dict[type, "_FlagLookup"] = {}
+
+
 def is_flag_instance(inst):
     """
     Check if the instance ``inst`` is a ``Flag``.
@@ -91,10 +95,11 @@ class FlagCodeMixin(FlagMixin):
         return obj
 
     def __init__(self, code: int):
-        # noinspection PyTypeChecker
-        if code in [v.code for v in self.__class__]:
+        codes = _flag_codes.setdefault(self.__class__, set())
+        if code in codes:
             raise DuplicatedCodeError(code)
 
+        codes.add(code)
         self._code = code
 
     def __int__(self):
@@ -297,9 +302,56 @@ class FlagPrefixedDoubleMixin(FlagDoubleMixin):
         return f"<{self.__class__.__name__}.{self.name}: {self.code_str} ({self._key} - {self._desc})>"
 
 
+class _FlagLookup:
+    """
+    Lookup tables of the members of a flag class for casting.
+
+    The result of a lookup is identical to the 1st member which equals to the item to be casted.
+    """
+
+    def __init__(self, flag_cls):
+        self.by_code: Dict[int, FlagCodeMixin] = {}
+        # Non-numeric strings which the members equal to, including `code_str` of `FlagDoubleMixin` and `name`
+        self.by_str: Dict[str, FlagCodeMixin] = {}
+
+        # noinspection PyTypeChecker
+        for member in flag_cls:
+            self.by_code.setdefault(member.code, member)
+
+            if isinstance(member, FlagDoubleMixin):
+                self.by_str.setdefault(member.code_str, member)
+            self.by_str.setdefault(member.name, member)
+
+    def get(self, item: Union[str, int]):
+        """
+        Get the member which ``item`` is casted to.
+
+        :param item: `code` or `name` of the member
+        :return: member casted from `item`, `None` if not found
+        """
+        # Exact type check on purpose, like the callers - `bool` (subclass of `int`) should not be casted by its code
+        if type(item) is int:  # pylint: disable=unidiomatic-typecheck
+            return self.by_code.get(item)
+
+        member = self.by_str.get(item)
+        if member is None and item.isnumeric():
+            member = self.by_code.get(int(item))
+
+        return member
+
+
 class FlagEnumMixin:
     """Mixin for some extend enum functionality."""
 
+    @classmethod
+    def _get_lookup(cls) -> _FlagLookup:
+        # Built on the 1st call because the members are not completely created in `__init__`
+        lookup = _flag_lookups.get(cls)
+        if lookup is None:
+            lookup = _flag_lookups[cls] = _FlagLookup(cls)
+
+        return lookup
+
     @classmethod
     def cast(cls, item: Union[str, int], *, silent_fail=False):
         """
@@ -321,10 +373,9 @@ class FlagEnumMixin:
         if not type(item) in (str, int):
             raise TypeError(f"Source type ({type(item)}) for casting not handled.")
 
-        # noinspection PyTypeChecker
-        for i in list(cls):
-            if i == item:
-                return i
+        member = cls._get_lookup().get(item)
+        if member is not None:
+            return member
 
         if silent_fail:
             return None
@@ -339,15 +390,14 @@ class FlagEnumMixin:
         :param item: item to check the membership
         :return: if `item` is the member of this `FlagEnumMixin`
         """
-        if not type(item) in (str, int, cls):
-            return False
+        # Exact type checks on purpose - `bool` and the subclasses of `str` are never considered as the members
+        if type(item) is cls:  # pylint: disable=unidiomatic-typecheck
+            return True
 
-        # noinspection PyTypeChecker
-        for i in list(cls):
-            if i == item:
-                return True
+        if not type(item) in (str, int):
+            return False
 
-        return False
+        return cls._get_lookup().get(item) is not None
 
 
 class FlagCodeEnum(FlagCodeMixin, FlagEnumMixin, Enum):
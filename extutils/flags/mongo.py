@@ -8,10 +8,17 @@ def register_encoder(cls):
     """
     Register the flag type encoder ``cls``.
 
+    Registering the same ``cls`` more than once does nothing.
+
     The final :class:`CodecOptions` to be used on ``pymongo`` can be acquired by calling ``get_codec_options()``.
 
     :param cls: flag enocder class to be registered
     """
+    if cls in _registered_classes:
+        return
+
+    _registered_classes.add(cls)
+
     cls_encoder = type(f"Flag{cls.__name__}Encoder",
                        (TypeEncoder,),
                        {"transform_python": lambda self, value: value.code,
@@ -21,6 +28,7 @@ def register_encoder(cls):
 
 
 type_registry: list = []
+_registered_classes: set = set()
 
 
 def get_codec_options() -> CodecOptions:
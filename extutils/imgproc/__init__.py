@@ -1,3 +1,4 @@
 """Module of various image operations, including interacting with imgur API and converting apng to gif."""
 from .utils import ImageContentProcessor, ImageValidator
 from .imgur import ImgurClient
+from .lazy import LazyImageBinary
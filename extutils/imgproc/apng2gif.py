@@ -1,21 +1,33 @@
 """Module to convert ``apng`` to ``gif``."""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import io
 from dataclasses import dataclass, field
 from fractions import Fraction
 import os
+from threading import BoundedSemaphore, Lock
 import time
 from typing import Any, Tuple, List, Optional
 from zipfile import ZipFile
 
+import numpy as np
 from PIL import Image
 
+from JellyBot.systemconfig import ExtraService
+
 from .apng2png import extract_frames
 
-__all__ = ("convert", "ConvertResult", "ConvertOpResult",)
+__all__ = ("convert", "convert_in_pool", "ConvertResult", "ConvertOpResult", "CONVERSION_PARAMS_KEY",)
 
 _IDX_CLR_BACKGROUND = 255
 _IDX_CLR_TRANSPARENT = 255
 
+_ALPHA_TRANSPARENT_THRESHOLD = 128
+_PALETTE_COLORS = 255
+
+CONVERSION_PARAMS_KEY = f"a{_ALPHA_TRANSPARENT_THRESHOLD}-c{_PALETTE_COLORS}-octree"
+"""Key representing the parameters of the conversion. Converted images are reusable if this key is the same."""
+
 
 class ConvertOpResult:
     """Result of an operation during the conversion."""
@@ -185,14 +197,18 @@ def _process_frame_transparent(image_byte: bytes):
 
     Copied and modified from ``apng2gif``.
 
+    The alpha thresholding is done on the whole pixel buffer at once instead of evaluating it pixel by pixel.
+
     :param image_byte: byte data of an image/frame
     """
     image = Image.open(io.BytesIO(image_byte))
-    alpha = image.getchannel("A")
-    # Convert the image into P mode but only use 255 colors in the palette out of 256
-    image = image.convert("RGB").convert("P", palette=Image.ADAPTIVE, colors=255)
-    # Set all alpha < 128 to value 255, 0 otherwise
-    image.paste(_IDX_CLR_TRANSPARENT, Image.eval(alpha, lambda a: 255 if a <= 128 else 0))
+    transparent_mask = np.asarray(image.getchannel("A")) <= _ALPHA_TRANSPARENT_THRESHOLD
+    # Quantize the image into P mode but only use 255 colors in the palette out of 256
+    image = image.convert("RGB").quantize(colors=_PALETTE_COLORS, method=Image.FASTOCTREE)
+    # Point all pixels with alpha <= threshold to the transparent color index
+    color_indices = np.array(image, dtype=np.uint8)
+    color_indices[transparent_mask] = _IDX_CLR_TRANSPARENT
+    image.frombytes(color_indices.tobytes())
     return image
 
 
@@ -276,3 +292,70 @@ def convert(apng_bin: bytes, output_path: str, *, zip_frames: bool = True) -> Co
         _make_gif(result, frame_data, out_path)
 
     return result
+
+
+class _ConversionPool:
+    """Bounded process pool to execute the conversions."""
+
+    _pool: Optional[ProcessPoolExecutor] = None
+    _lock = Lock()
+    _slots = BoundedSemaphore(ExtraService.Sticker.ConversionMaxWorkers + ExtraService.Sticker.ConversionMaxPending)
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        with cls._lock:
+            if not cls._pool:
+                cls._pool = ProcessPoolExecutor(max_workers=ExtraService.Sticker.ConversionMaxWorkers)
+
+            return cls._pool
+
+    @classmethod
+    def _reset_pool(cls, broken_pool: ProcessPoolExecutor):
+        with cls._lock:
+            if cls._pool is broken_pool:
+                cls._pool = None
+
+        broken_pool.shutdown(wait=False)
+
+    @classmethod
+    def convert(cls, apng_bin: bytes, output_path: str, zip_frames: bool) -> ConvertResult:
+        """
+        Run the APNG to GIF conversion in the pool and wait for its result.
+
+        Falls back to run the conversion in the current process if the pool is broken.
+        The pool will be re-created on the next call.
+        """
+        with cls._slots:
+            pool = cls._get_pool()
+
+            try:
+                return pool.submit(convert, apng_bin, output_path, zip_frames=zip_frames).result()
+            except BrokenProcessPool:
+                cls._reset_pool(pool)
+
+        return convert(apng_bin, output_path, zip_frames=zip_frames)
+
+
+def convert_in_pool(apng_bin: bytes, output_path: str, *, zip_frames: bool = True) -> ConvertResult:
+    """
+    Same as ``convert()``, but the conversion is executed in a bounded process pool.
+
+    The caller blocks until the conversion completes.
+    If the pending conversions are more than the pool could take,
+    the caller also blocks until a slot of the pool is available.
+
+    The size of the pool is controlled by :class:`ExtraService.Sticker.ConversionMaxWorkers`
+    and the count of the pending conversions is controlled by :class:`ExtraService.Sticker.ConversionMaxPending`.
+
+    If the pool is broken (for example, a worker process is killed), the pool will be re-created on the next call
+    and the conversion will be executed in the current process instead.
+
+    :param apng_bin: binary data of an apng
+    :param output_path: path for the processed gif
+    :param zip_frames: to zip the extracted frames
+    :return: result of the conversion
+    """
+    # Worker processes may not share the same working directory
+    out_path = output_path if os.path.isabs(output_path) else os.path.join(os.getcwd(), output_path)
+
+    return _ConversionPool.convert(apng_bin, out_path, zip_frames)
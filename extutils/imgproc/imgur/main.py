@@ -1,6 +1,7 @@
 """Main implementations to interact with imgur API."""
 import os
 import sys
+from typing import Union, BinaryIO
 
 import requests
 
@@ -20,22 +21,28 @@ class ImgurClient:
     """Imgur API wrapper."""
 
     @staticmethod
-    def upload_image(content: str, type_: str, title: str = None, description: str = None) -> ImgurUploadResponse:
+    def upload_image(content: Union[str, bytes, BinaryIO], type_: str, title: str = None, description: str = None) \
+            -> ImgurUploadResponse:
         """
         Upload an image to Imgur.
 
         API Reference: https://apidocs.imgur.com/?version=latest#c85c9dfc-7487-4de2-9ecd-66f727cf3139
 
-        :param content: image content based on the `type_`
-        :param type_: "URL" or "base64"
+        If ``type_`` is ``file``, ``content`` will be streamed as a multipart file upload.
+
+        :param content: image content based on the `type_`. The raw bytes or a binary stream if `type_` is "file"
+        :param type_: "URL", "base64" or "file"
         :param title: image title
         :param description: image description
         :return: response body of the upload result wrapped as `ImgurUploadResponse`
         """
-        data = {
-            "image": content,
-            "type": type_
-        }
+        data = {"type": type_}
+        files = None
+
+        if type_ == "file":
+            files = {"image": content}
+        else:
+            data["image"] = content
 
         if title:
             data["title"] = title
@@ -46,7 +53,8 @@ class ImgurClient:
         response = requests.post(
             ImgurEndpoints.get_upload_url(),
             headers={"Authorization": f"Client-ID {IMGUR_CLIENT_ID}"},
-            data=data
+            data=data,
+            files=files
         )
 
         return ImgurUploadResponse(response.json())
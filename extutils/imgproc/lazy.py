@@ -0,0 +1,70 @@
+"""Module of the lazily fetched image content."""
+import io
+from threading import Lock
+from typing import Callable, BinaryIO, Optional
+
+__all__ = ("LazyImageBinary",)
+
+
+class LazyImageBinary:
+    """
+    Handle of an image binary which will be fetched on the first access only.
+
+    The fetched bytes will be kept in the handle, so the image will only be fetched once
+    no matter how many times the content is accessed, even if it is accessed concurrently.
+
+    >>> img = LazyImageBinary(lambda: b"image")
+    >>> img.fetched
+    False
+    >>> img.content
+    b'image'
+    >>> img.fetched
+    True
+    """
+
+    def __init__(self, fetcher: Callable[[], bytes]):
+        """
+        Create an image binary which is fetched by ``fetcher`` on its first access.
+
+        :param fetcher: function to fetch the raw bytes of the image
+        """
+        self._fetcher = fetcher
+        self._content: Optional[bytes] = None
+        self._lock = Lock()
+
+    @property
+    def fetched(self) -> bool:
+        """
+        Check if the image is already fetched.
+
+        :return: if the image is already fetched
+        """
+        return self._content is not None
+
+    @property
+    def content(self) -> bytes:
+        """
+        Get the raw bytes of the image. Fetch the image if it is not yet fetched.
+
+        :return: raw bytes of the image
+        """
+        if self._content is None:
+            with self._lock:
+                if self._content is None:
+                    self._content = self._fetcher()
+
+        return self._content
+
+    def open(self) -> BinaryIO:
+        """
+        Open the image as a binary stream. Fetch the image if it is not yet fetched.
+
+        :return: binary stream of the image
+        """
+        return io.BytesIO(self.content)
+
+    def __repr__(self):
+        if self.fetched:
+            return f"<LazyImageBinary - {len(self._content)} bytes>"
+
+        return "<LazyImageBinary - Not fetched>"
@@ -0,0 +1,220 @@
+"""Module of the leaderboard counting the occurrences of the keys in the rolling windows."""
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, Hashable, Iterable, Tuple
+
+__all__ = ("RollingLeaderboard",)
+
+
+class _CountDistribution:
+    """
+    Sparse Fenwick tree storing how many keys have each count.
+
+    Both updating and querying take ``O(log MaxCount)``.
+    """
+
+    MaxCountBits = 32
+
+    def __init__(self):
+        self._tree: Dict[int, int] = defaultdict(int)
+        self.total = 0
+
+    def add(self, count: int, delta: int):
+        """Add ``delta`` keys with ``count``. ``count`` must be positive."""
+        self.total += delta
+
+        idx = count
+        while idx < (1 << self.MaxCountBits):
+            self._tree[idx] += delta
+            idx += idx & -idx
+
+    def count_le(self, count: int) -> int:
+        """Get how many keys have the count less than or equal to ``count``."""
+        ret = 0
+
+        idx = count
+        while idx > 0:
+            ret += self._tree.get(idx, 0)
+            idx -= idx & -idx
+
+        return ret
+
+
+class _Window:
+    def __init__(self, length: int):
+        self.length = length
+        self.first_bucket = None  # First bucket included in this window
+        self.counts: Dict[Hashable, int] = {}
+        self.dist = _CountDistribution()
+
+    def change(self, key: Hashable, delta: int):
+        """Change the count of ``key`` in this window by ``delta``."""
+        prev = self.counts.get(key, 0)
+        curr = prev + delta
+
+        if prev > 0:
+            self.dist.add(prev, -1)
+        if curr > 0:
+            self.dist.add(curr, 1)
+            self.counts[key] = curr
+        else:
+            self.counts.pop(key, None)
+
+
+class RollingLeaderboard:
+    """
+    Leaderboard counting the occurrences of the keys in the rolling windows of several lengths.
+
+    Time is split into the integer buckets (for example, the hours since the epoch).
+    A window of length ``n`` contains the latest ``n`` buckets including the current bucket.
+
+    Adding an occurrence and getting the rank of a key both take ``O(log MaxCount)``
+    regardless the count of the keys. Expiring a bucket takes ``O(K log MaxCount)``
+    where ``K`` is the count of the keys in the bucket.
+
+    >>> board = RollingLeaderboard([1, 2])
+    >>> board.add("A", 0, 3)
+    >>> board.add("B", 1, 2)
+    >>> board.get_rank("B", 2, 1)
+    (2, 2)
+    >>> board.get_rank("B", 1, 1)
+    (1, 1)
+    """
+
+    def __init__(self, window_lengths: Iterable[int]):
+        """
+        Create a leaderboard with a rolling window for each of ``window_lengths``.
+
+        :param window_lengths: lengths of the windows in buckets
+        """
+        self._windows: Dict[int, _Window] = {length: _Window(length) for length in window_lengths}
+        self._max_length = max(self._windows)
+        self._buckets: Dict[int, Dict[Hashable, int]] = {}
+        self._current_bucket = None
+        self._lock = Lock()
+
+    @property
+    def window_lengths(self) -> Tuple[int, ...]:
+        """
+        Lengths of the windows of this leaderboard.
+
+        :return: lengths of the windows
+        """
+        return tuple(self._windows)
+
+    def _advance(self, bucket: int):
+        if self._current_bucket is not None and bucket <= self._current_bucket:
+            return
+
+        for window in self._windows.values():
+            new_first = bucket - window.length + 1
+
+            if window.first_bucket is not None:
+                for expired in [b for b in self._buckets if window.first_bucket <= b < new_first]:
+                    for key, count in self._buckets[expired].items():
+                        window.change(key, -count)
+
+            window.first_bucket = new_first
+
+        for expired in [b for b in self._buckets if b <= bucket - self._max_length]:
+            del self._buckets[expired]
+
+        self._current_bucket = bucket
+
+    def add(self, key: Hashable, bucket: int, count: int = 1):
+        """
+        Add ``count`` occurrences of ``key`` to ``bucket``.
+
+        Occurrences older than the longest window are ignored.
+
+        :param key: key of the occurrences
+        :param bucket: bucket of the occurrences
+        :param count: count of the occurrences
+        """
+        with self._lock:
+            self._advance(bucket)
+
+            if bucket <= self._current_bucket - self._max_length:
+                return
+
+            bucket_counts = self._buckets.setdefault(bucket, {})
+            bucket_counts[key] = bucket_counts.get(key, 0) + count
+
+            for window in self._windows.values():
+                if bucket >= window.first_bucket:
+                    window.change(key, count)
+
+    def get_rank(self, key: Hashable, window_length: int, current_bucket: int) -> Tuple[int, int]:
+        """
+        Get the rank of ``key`` in the window of ``window_length`` ending at ``current_bucket``.
+
+        Keys having the same count share the same rank.
+
+        The 1st element of the returned tuple is the rank of ``key``, ``-1`` if ``key`` is not in the window.
+
+        The 2nd element of the returned tuple is the count of the keys in the window.
+
+        :param key: key to get the rank
+        :param window_length: length of the window
+        :param current_bucket: current bucket
+        :return: rank of `key` and the count of the keys in the window
+        :raises KeyError: no window of `window_length` in this leaderboard
+        """
+        with self._lock:
+            self._advance(current_bucket)
+
+            window = self._windows[window_length]
+
+            count = window.counts.get(key, 0)
+            total = window.dist.total
+
+            if not count:
+                return -1, total
+
+            return total - window.dist.count_le(count) + 1, total
+
+    def get_count(self, key: Hashable, window_length: int, current_bucket: int) -> int:
+        """
+        Get the count of ``key`` in the window of ``window_length`` ending at ``current_bucket``.
+
+        :param key: key to get the count
+        :param window_length: length of the window
+        :param current_bucket: current bucket
+        :return: count of `key` in the window
+        :raises KeyError: no window of `window_length` in this leaderboard
+        """
+        with self._lock:
+            self._advance(current_bucket)
+
+            return self._windows[window_length].counts.get(key, 0)
+
+    def reset(self, entries: Iterable[Tuple[Hashable, int, int]], current_bucket: int):
+        """
+        Replace all occurrences with ``entries``.
+
+        Each element of ``entries`` is a tuple of the key, the bucket and the count of the occurrences.
+
+        :param entries: occurrences to be loaded
+        :param current_bucket: current bucket
+        """
+        windows = {length: _Window(length) for length in self._windows}
+        buckets: Dict[int, Dict[Hashable, int]] = {}
+
+        for window in windows.values():
+            window.first_bucket = current_bucket - window.length + 1
+
+        for key, bucket, count in entries:
+            if not current_bucket - self._max_length < bucket <= current_bucket:
+                continue
+
+            bucket_counts = buckets.setdefault(bucket, {})
+            bucket_counts[key] = bucket_counts.get(key, 0) + count
+
+            for window in windows.values():
+                if bucket >= window.first_bucket:
+                    window.change(key, count)
+
+        with self._lock:
+            self._windows = windows
+            self._buckets = buckets
+            self._current_bucket = current_bucket
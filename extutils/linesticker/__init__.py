@@ -1,5 +1,5 @@
 """Module for various operations on LINE stickers."""
 from .exception import MetadataNotFoundError
-from .tempfile import LineStickerTempStorageManager
+from .cache import LineStickerCacheManager
 from .flag import LineStickerType, LineStickerLanguage
 from .main import LineStickerUtils, LineAnimatedStickerDownloadResult, LineStickerMetadata
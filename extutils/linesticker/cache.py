@@ -0,0 +1,345 @@
+"""
+Caches for :class:`extline.linesticker.LineStickerUtils`.
+
+The stickers are stored in a persistent, size-bounded disk cache.
+The cache directory is ``jellybot-line-sticker`` under the system temporary directory by default.
+Set ``STICKER_CACHE_DIR`` in the environment variables to use the other directory.
+
+The sticker package metadata is cached in memory.
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import tempfile
+from threading import Lock
+import time
+from typing import Any, BinaryIO, Callable, Dict, Generator, Iterable, Optional, Union
+from weakref import WeakValueDictionary
+
+from cachetools import TTLCache
+
+from extutils.imgproc import apng2gif
+from JellyBot.systemconfig import ExtraService
+
+__all__ = ("LineStickerCacheManager", "LineStickerMetadataCache",)
+
+
+class LineStickerCacheManager:
+    """
+    Class to manage the sticker files stored in the disk cache.
+
+    Every cached file is addressed by a key which consists of the sticker package/sticker ID
+    and the conversion parameters (if any), so the path of an entry can be determined without any network request.
+
+    Entries are evicted in least recently used order once the total size of the cache exceeds
+    :class:`ExtraService.Sticker.MaxCacheSizeMB`, or once an entry was not used for
+    :class:`ExtraService.Sticker.MaxStickerTempFileLifeSeconds` seconds.
+
+    The cache survives restarts. Entries already in the cache directory will be indexed on the first access
+    using the last modification time as the last usage time.
+    """
+
+    _DIR: str = os.environ.get("STICKER_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "jellybot-line-sticker")
+
+    _ENTRIES: "OrderedDict[str, int]" = OrderedDict()  # Path to file size, least recently used first
+    _LAST_USED: Dict[str, float] = {}
+    _TOTAL_SIZE: int = 0
+
+    _INDEXED: bool = False
+
+    _LOCK = Lock()
+    _KEY_LOCKS: "WeakValueDictionary[str, Lock]" = WeakValueDictionary()
+
+    @classmethod
+    def _ensure_indexed(cls):
+        # Must be called with `cls._LOCK` acquired
+        if cls._INDEXED:
+            return
+
+        os.makedirs(cls._DIR, exist_ok=True)
+
+        files = [(entry.stat().st_mtime, str(entry), entry.stat().st_size)
+                 for entry in Path(cls._DIR).iterdir() if entry.is_file() and not entry.name.startswith("tmp-")]
+        for last_used, path, size in sorted(files):
+            cls._ENTRIES[path] = size
+            cls._LAST_USED[path] = last_used
+            cls._TOTAL_SIZE += size
+
+        cls._INDEXED = True
+
+    @classmethod
+    def _remove_entry(cls, path: str):
+        # Must be called with `cls._LOCK` acquired
+        cls._TOTAL_SIZE -= cls._ENTRIES.pop(path, 0)
+        cls._LAST_USED.pop(path, None)
+
+        try:
+            os.remove(path)
+        except OSError:
+            # File already removed or being used (Windows)
+            pass
+
+    @classmethod
+    def _evict(cls):
+        # Must be called with `cls._LOCK` acquired
+        max_size = ExtraService.Sticker.MaxCacheSizeMB * 1024 * 1024
+        expiry = time.time() - ExtraService.Sticker.MaxStickerTempFileLifeSeconds
+
+        # Always keep the most recently used entry, which could be just generated and about to be used
+        while len(cls._ENTRIES) > 1:
+            path = next(iter(cls._ENTRIES))
+
+            if cls._TOTAL_SIZE <= max_size and cls._LAST_USED[path] >= expiry:
+                break
+
+            cls._remove_entry(path)
+
+    @classmethod
+    def get_path(cls, file_name: str) -> str:
+        """
+        Get the path of the cache entry named ``file_name``.
+
+        The entry may not exist. Use ``is_cached()`` to check it.
+
+        :param file_name: file name of the cache entry
+        :return: path of the cache entry
+        """
+        return os.path.join(cls._DIR, file_name)
+
+    @classmethod
+    def get_static_path(cls, sticker_id: Union[str, int]) -> str:
+        """
+        Get the path of the cache entry of the static sticker.
+
+        :param sticker_id: sticker ID
+        :return: path of the cache entry
+        """
+        return cls.get_path(f"static-{int(sticker_id)}.png")
+
+    @classmethod
+    def get_animated_path(cls, pack_id: Union[str, int], sticker_id: Union[str, int]) -> str:
+        """
+        Get the path of the cache entry of the animated sticker converted to gif.
+
+        :param pack_id: sticker package ID
+        :param sticker_id: sticker ID
+        :return: path of the cache entry
+        """
+        return cls.get_path(f"animated-{int(pack_id)}-{int(sticker_id)}-{apng2gif.CONVERSION_PARAMS_KEY}.gif")
+
+    @classmethod
+    def get_pack_path(cls, pack_id: Union[str, int]) -> str:
+        """
+        Get the path of the cache entry of the sticker package zip.
+
+        :param pack_id: sticker package ID
+        :return: path of the cache entry
+        """
+        return cls.get_path(f"pack-{int(pack_id)}-{apng2gif.CONVERSION_PARAMS_KEY}.zip")
+
+    @staticmethod
+    def get_frames_path(gif_path: str) -> str:
+        """
+        Get the path of the frame zip generated along with the gif at ``gif_path``.
+
+        :param gif_path: path of the converted gif
+        :return: path of the frame zip
+        """
+        # Naming follows the frame zip output of `apng2gif.convert()`
+        return f"{os.path.splitext(gif_path)[0]}-frames.zip"
+
+    @classmethod
+    def get_temp_path(cls, extension: str) -> str:
+        """
+        Get a unique temporary path in the cache directory for storing a file under construction.
+
+        Move the file to its actual path using ``put()``.
+
+        :param extension: file extension of the temporary file
+        :return: temporary path in the cache directory
+        """
+        with cls._LOCK:
+            cls._ensure_indexed()
+
+        return os.path.join(cls._DIR, f"tmp-{os.getpid()}-{time.time_ns()}.{extension}")
+
+    @classmethod
+    def is_cached(cls, path: str) -> bool:
+        """
+        Check if the file at ``path`` is cached. Also mark the entry as recently used if it is cached.
+
+        :param path: path of the cache entry
+        :return: if the file at `path` is cached
+        """
+        with cls._LOCK:
+            cls._ensure_indexed()
+            cls._evict()
+
+            if path not in cls._ENTRIES:
+                return False
+
+            if not os.path.exists(path):
+                # Removed by the other process sharing the same cache directory
+                cls._remove_entry(path)
+                return False
+
+            cls._ENTRIES.move_to_end(path)
+            cls._LAST_USED[path] = time.time()
+
+        try:
+            # Persist the usage for the ordering after restart
+            os.utime(path)
+        except OSError:
+            pass
+
+        return True
+
+    @classmethod
+    def put(cls, path: str, source_path: Optional[str] = None):
+        """
+        Record the file at ``path`` as a cache entry, then evict the entries if needed.
+
+        If ``source_path`` is given, the file at ``source_path`` will be atomically moved to ``path`` first,
+        so the other processes sharing the cache directory never see an incomplete file.
+
+        :param path: path of the cache entry
+        :param source_path: path of the file to be moved to `path`
+        """
+        if source_path:
+            os.replace(source_path, path)
+
+        with cls._LOCK:
+            cls._ensure_indexed()
+
+            cls._TOTAL_SIZE -= cls._ENTRIES.pop(path, 0)
+
+            size = os.path.getsize(path)
+            cls._ENTRIES[path] = size
+            cls._LAST_USED[path] = time.time()
+            cls._TOTAL_SIZE += size
+
+            cls._evict()
+
+    @classmethod
+    def open_entry(cls, path: str, generate: Callable[[], bool]) -> Optional[BinaryIO]:
+        """
+        Open the cache entry at ``path`` as a :class:`BinaryIO` stream.
+
+        If the entry is not cached, ``generate`` will be called to generate the entry first.
+
+        :param path: path of the cache entry
+        :param generate: function to generate the entry, which returns if the generation succeeded
+        :return: `BinaryIO` stream of the entry, `None` if the generation failed
+        """
+        if not cls.is_cached(path) and not generate():
+            return None
+
+        return open(path, "rb")
+
+    @classmethod
+    @contextmanager
+    def lock(cls, path: str) -> Generator[None, None, None]:
+        """
+        Lock the cache entry at ``path`` so that the entry is only being generated once at a time.
+
+        Concurrent callers for the same entry wait until the generation completes,
+        then should check ``is_cached()`` again to use the generated entry.
+
+        :param path: path of the cache entry to lock
+        """
+        with cls._LOCK:
+            key_lock = cls._KEY_LOCKS.get(path)
+            if not key_lock:
+                key_lock = cls._KEY_LOCKS[path] = Lock()
+
+        with key_lock:
+            yield
+
+    @classmethod
+    @contextmanager
+    def generate(cls, path: str, extension: str, *, dependents: Iterable[str] = ()) \
+            -> Generator[Optional[str], None, None]:
+        """
+        Lock the cache entry at ``path`` and yield a temporary path to generate the entry at.
+
+        Yields ``None`` if the entry and all of its ``dependents`` are already cached.
+
+        Once the block exits, the file at the temporary path will be moved to ``path`` as the cache entry.
+        Nothing will be cached if the file was not generated.
+
+        >>> with LineStickerCacheManager.generate(path, "png") as temp_path:
+        >>>     if not temp_path:
+        >>>         return  # Already cached
+        >>>
+        >>>     # Generate the file at `temp_path`
+
+        :param path: path of the cache entry
+        :param extension: file extension of the temporary file
+        :param dependents: paths of the other cache entries generated along with the entry
+        """
+        with cls.lock(path):
+            if cls.is_cached(path) and all(cls.is_cached(dependent) for dependent in dependents):
+                yield None
+                return
+
+            temp_path = cls.get_temp_path(extension)
+
+            yield temp_path
+
+            if os.path.exists(temp_path):
+                cls.put(path, temp_path)
+
+    @classmethod
+    def clear(cls):
+        """Remove all the cached files, including the files which are not indexed."""
+        with cls._LOCK:
+            if os.path.exists(cls._DIR):
+                for file_path in Path(cls._DIR).iterdir():
+                    if file_path.is_file():
+                        file_path.unlink()
+
+            cls._ENTRIES.clear()
+            cls._LAST_USED.clear()
+            cls._TOTAL_SIZE = 0
+            cls._INDEXED = False
+
+
+class LineStickerMetadataCache:
+    """
+    In-memory cache of the sticker package metadata.
+
+    The metadata will be cached for :class:`ExtraService.Sticker.MetadataCacheExpirySeconds` seconds.
+    """
+
+    _CACHE: "TTLCache[str, Any]" = TTLCache(maxsize=ExtraService.Sticker.MetadataCacheSize,
+                                            ttl=ExtraService.Sticker.MetadataCacheExpirySeconds)
+    _LOCK = Lock()
+
+    @classmethod
+    def get(cls, pack_id: Union[str, int]) -> Optional[Any]:
+        """
+        Get the cached metadata of the sticker package.
+
+        :param pack_id: sticker package ID
+        :return: cached metadata if any
+        """
+        with cls._LOCK:
+            return cls._CACHE.get(str(pack_id))
+
+    @classmethod
+    def put(cls, pack_id: Union[str, int], pack_meta: Any):
+        """
+        Cache the metadata of the sticker package.
+
+        :param pack_id: sticker package ID
+        :param pack_meta: metadata to be cached
+        """
+        with cls._LOCK:
+            cls._CACHE[str(pack_id)] = pack_meta
+
+    @classmethod
+    def clear(cls):
+        """Remove all the cached metadata."""
+        with cls._LOCK:
+            cls._CACHE.clear()
@@ -1,12 +1,8 @@
 """Module of the LINE sticker utilities."""
-import atexit
 import re
 from abc import ABC
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path
 import os
-import shutil
-import tempfile
 import time
 from typing import Optional, BinaryIO, Union, List, Tuple
 from zipfile import ZipFile
@@ -16,16 +12,13 @@ import requests
 from extutils.imgproc import apng2gif
 from mixin import ClearableMixin
 
-from .flag import LineStickerLanguage, LineStickerType
+from .flag import LineStickerLanguage
 from .exception import MetadataNotFoundError
-from .tempfile import LineStickerTempStorageManager
+from .cache import LineStickerCacheManager, LineStickerMetadataCache
 
 __all__ = ("LineStickerUtils", "LineAnimatedStickerDownloadResult",
            "LineStickerMetadata")
 
-_temp_dir = tempfile.mkdtemp(prefix="jellybot-line-")  # Temporary directory for LINE stickers
-atexit.register(shutil.rmtree, _temp_dir)  # Clear temporary directory on exit
-
 
 # region For sticker downloading
 
@@ -293,7 +286,8 @@ class LineStickerMetadata:
         if not localized_str_ret:
             default = localized_object.get(LineStickerLanguage.default().key)  # pylint: disable=no-member
             if not default:
-                return localized_object.popitem()[1]
+                # Not using `popitem()` because the metadata could be cached and shared
+                return next(reversed(localized_object.values()))
 
             return default
 
@@ -555,15 +549,9 @@ class LineStickerPackDownloader:
         :param pack_id: sticker package ID to be downloaded
         :return: binary stream of the sticker package zip file
         """
-        sticker_pack_path = os.path.join(_temp_dir, f"{pack_id}.zip")
-
-        if not os.path.exists(sticker_pack_path):
-            result = LineStickerPackDownloader.download_pack(pack_id)
-
-            if not result.succeed:
-                return None
-
-        return open(sticker_pack_path, "rb")
+        return LineStickerCacheManager.open_entry(
+            LineStickerCacheManager.get_pack_path(pack_id),
+            lambda: LineStickerPackDownloader.download_pack(pack_id).succeed)
 
     @staticmethod
     def download_pack(pack_id: Union[str, int]) -> LineStickerPackDownloadResult:
@@ -579,14 +567,13 @@ class LineStickerPackDownloader:
         if not pack_meta:
             return pack_dl_result
 
-        zip_path = os.path.join(_temp_dir, f"{pack_id}.zip")
-        if os.path.exists(zip_path):
-            pack_dl_result.set_exists()
-            return pack_dl_result
-
-        sticker_to_zip = LineStickerPackDownloader._download_stickers(pack_dl_result, pack_id)
+        with LineStickerCacheManager.generate(LineStickerCacheManager.get_pack_path(pack_id), "zip") as temp_path:
+            if not temp_path:
+                pack_dl_result.set_exists()
+                return pack_dl_result
 
-        LineStickerPackDownloader._zip_stickers(pack_dl_result, sticker_to_zip, zip_path)
+            sticker_to_zip = LineStickerPackDownloader._download_stickers(pack_dl_result, pack_id)
+            LineStickerPackDownloader._zip_stickers(pack_dl_result, sticker_to_zip, temp_path)
 
         return pack_dl_result
 
@@ -599,9 +586,8 @@ class LineStickerUtils(ClearableMixin):
 
     @classmethod
     def clear(cls):
-        for file_path in Path(_temp_dir).iterdir():
-            if file_path.is_file():
-                file_path.unlink()
+        LineStickerCacheManager.clear()
+        LineStickerMetadataCache.clear()
 
     @staticmethod
     def is_sticker_exists(sticker_id: Union[int, str]) -> bool:
@@ -669,16 +655,26 @@ class LineStickerUtils(ClearableMixin):
         """
         Get the sticker package metadata.
 
+        The metadata will be cached for :class:`ExtraService.Sticker.MetadataCacheExpirySeconds` seconds.
+        Unavailable sticker packages will not be cached.
+
         :param pack_id: sticker package ID
         :return: packed metadata object
         :raises MetadataNotFoundError: request to get the metadata does not return 200
         """
-        pack_meta = requests.get(LineStickerUtils.get_meta_url(pack_id))
+        pack_meta = LineStickerMetadataCache.get(pack_id)
+        if pack_meta:
+            return pack_meta
+
+        response = requests.get(LineStickerUtils.get_meta_url(pack_id))
 
-        if not pack_meta.ok:
+        if not response.ok:
             raise MetadataNotFoundError(pack_id)
 
-        return LineStickerMetadata(pack_meta.json())
+        pack_meta = LineStickerMetadata(response.json())
+        LineStickerMetadataCache.put(pack_id, pack_meta)
+
+        return pack_meta
 
     @staticmethod
     def get_pack_meta_from_url(url: str) -> Optional[LineStickerMetadata]:
@@ -708,15 +704,6 @@ class LineStickerUtils(ClearableMixin):
 
         return None
 
-    @staticmethod
-    def _prepare_output(output_path: str, sticker_id: int, sticker_type: LineStickerType):
-        if not output_path:
-            output_path = os.path.join(_temp_dir, f"{sticker_id}.{sticker_type.to_extension()}")
-
-            LineStickerTempStorageManager.create_file(output_path)
-
-        return output_path
-
     @staticmethod
     def get_downloaded_sticker(sticker_id: Union[str, int]) -> Optional[BinaryIO]:
         """
@@ -736,15 +723,9 @@ class LineStickerUtils(ClearableMixin):
         :param sticker_id: sticker ID
         :return: `BinaryIO` stream if found / downloaded
         """
-        sticker_path = os.path.join(_temp_dir, f"{sticker_id}.png")
-
-        if not os.path.exists(sticker_path):
-            result = LineStickerUtils.download_sticker(sticker_id, sticker_path)
-
-            if not result.succeed:
-                return None
-
-        return open(sticker_path, "rb")
+        return LineStickerCacheManager.open_entry(
+            LineStickerCacheManager.get_static_path(sticker_id),
+            lambda: LineStickerUtils.download_sticker(sticker_id).succeed)
 
     @staticmethod
     def get_downloaded_animated(pack_id: Union[str, int], sticker_id: Union[str, int], *, with_frames: bool = True) \
@@ -768,15 +749,9 @@ class LineStickerUtils(ClearableMixin):
         :param with_frames: if the extracted frames should be preserved if file not ready
         :return: `BinaryIO` stream if found / downloaded
         """
-        sticker_path = os.path.join(_temp_dir, f"{sticker_id}.gif")
-
-        if not os.path.exists(sticker_path):
-            result = LineStickerUtils.download_apng_as_gif(pack_id, sticker_id, with_frames=with_frames)
-
-            if not result.succeed:
-                return None
-
-        return open(sticker_path, "rb")
+        return LineStickerCacheManager.open_entry(
+            LineStickerCacheManager.get_animated_path(pack_id, sticker_id),
+            lambda: LineStickerUtils.download_apng_as_gif(pack_id, sticker_id, with_frames=with_frames).succeed)
 
     @staticmethod
     def get_downloaded_apng_frames(pack_id: Union[str, int], sticker_id: Union[str, int]) -> Optional[BinaryIO]:
@@ -798,15 +773,9 @@ class LineStickerUtils(ClearableMixin):
         :param sticker_id: sticker ID
         :return: `BinaryIO` stream if found / downloaded
         """
-        zip_path = os.path.join(_temp_dir, f"{sticker_id}-frames.zip")
-
-        if not os.path.exists(zip_path):
-            result = LineStickerUtils.download_apng_as_gif(pack_id, sticker_id)
-
-            if not result.available or not result.conversion_result.succeed:
-                return None
-
-        return open(zip_path, "rb")
+        return LineStickerCacheManager.open_entry(
+            LineStickerCacheManager.get_frames_path(LineStickerCacheManager.get_animated_path(pack_id, sticker_id)),
+            lambda: LineStickerUtils.download_apng_as_gif(pack_id, sticker_id).succeed)
 
     @staticmethod
     def get_downloaded_sticker_pack(pack_id: Union[str, int]) -> Optional[BinaryIO]:
@@ -840,8 +809,7 @@ class LineStickerUtils(ClearableMixin):
 
         If ``output_path`` is not specified:
 
-        - The file will be automatically removed
-        after :class:`ExtraService.Sticker.MaxStickerTempFileLifeSeconds` seconds
+        - The file will be stored in the sticker cache and evicted by :class:`LineStickerCacheManager`
 
         - Can be acquired using ``get_downloaded_animated()``
 
@@ -850,6 +818,8 @@ class LineStickerUtils(ClearableMixin):
         If there's a file already at ``output_path``, then it's considered as the sticker is downloaded,
         regardless its actual content.
 
+        If the sticker is already cached, it will be returned without any network request.
+
         Returned :class:`LineAnimatedStickerDownloadResult` will indicate if this situation occurred.
 
         :param pack_id: sticker package ID
@@ -860,22 +830,68 @@ class LineStickerUtils(ClearableMixin):
         """
         result = LineAnimatedStickerDownloadResult(int(sticker_id))
 
-        output_path = LineStickerUtils._prepare_output(output_path, sticker_id, LineStickerType.ANIMATED)
+        if output_path:
+            response = LineStickerUtils._fetch_sticker(result, LineStickerUtils.get_apng_url(pack_id, sticker_id))
+            if not response:
+                return result
+
+            # Check if the file exists
+            if os.path.exists(output_path) \
+                    and (not with_frames or os.path.exists(LineStickerCacheManager.get_frames_path(output_path))):
+                result.set_already_exists()
+                return result
+
+            LineStickerUtils._convert_apng(result, response, output_path, with_frames)
 
-        # Check if the sticker exists
-        response = requests.get(LineStickerUtils.get_apng_url(pack_id, sticker_id))
-        if not response.ok:
             return result
 
-        result.set_available()
+        cache_path = LineStickerCacheManager.get_animated_path(pack_id, sticker_id)
+        frames_path = LineStickerCacheManager.get_frames_path(cache_path)
 
-        # Check if the file exists
-        frame_zip_path = f"{os.path.splitext(output_path)[0]}-frames.zip"
+        with LineStickerCacheManager.generate(cache_path, "gif", dependents=[frames_path] if with_frames else []) \
+                as temp_path:
+            # Entries are cached only if the sticker is available
+            if not temp_path:
+                result.set_available()
+                result.set_already_exists()
+                return result
 
-        if os.path.exists(output_path) and (not with_frames or os.path.exists(frame_zip_path)):
-            result.set_already_exists()
-            return result
+            response = LineStickerUtils._fetch_sticker(result, LineStickerUtils.get_apng_url(pack_id, sticker_id))
+            if not response:
+                return result
 
+            LineStickerUtils._convert_apng(result, response, temp_path, with_frames)
+
+            if result.conversion_result.succeed:
+                if with_frames and result.conversion_result.frame_zipping.success:
+                    LineStickerCacheManager.put(frames_path, LineStickerCacheManager.get_frames_path(temp_path))
+            else:
+                for path in (temp_path, LineStickerCacheManager.get_frames_path(temp_path)):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+        return result
+
+    @staticmethod
+    def _fetch_sticker(result: LineStickerDownloadResultBase, url: str) -> Optional[requests.Response]:
+        """
+        Send the request to get the sticker at ``url``. Returns ``None`` if the sticker is not available.
+
+        :param result: download result to be updated
+        :param url: URL of the sticker
+        :return: response of the request if the sticker is available
+        """
+        response = requests.get(url)
+        if not response.ok:
+            return None
+
+        result.set_available()
+
+        return response
+
+    @staticmethod
+    def _convert_apng(result: LineAnimatedStickerDownloadResult, response: requests.Response,
+                      output_path: str, with_frames: bool):
         # Download the sticker
         _start = time.time()
         apng_bin = response.content
@@ -883,9 +899,7 @@ class LineStickerUtils(ClearableMixin):
         result.set_downloaded(time.time() - _start)
 
         # Convert apng to gif
-        result.set_conversion_result(apng2gif.convert(apng_bin, output_path, zip_frames=with_frames))
-
-        return result
+        result.set_conversion_result(apng2gif.convert_in_pool(apng_bin, output_path, zip_frames=with_frames))
 
     @staticmethod
     def download_sticker(sticker_id: Union[str, int], output_path: Optional[str] = None) -> LineStickerDownloadResult:
@@ -902,8 +916,7 @@ class LineStickerUtils(ClearableMixin):
 
         If ``output_path`` is not specified:
 
-        - The file will be automatically removed
-        after :class:`ExtraService.Sticker.MaxStickerTempFileLifeSeconds` seconds
+        - The file will be stored in the sticker cache and evicted by :class:`LineStickerCacheManager`
 
         - Can be acquired using ``get_downloaded_sticker()``
 
@@ -912,6 +925,8 @@ class LineStickerUtils(ClearableMixin):
         If there's a file already at ``output_path``, then it's considered as the sticker is downloaded,
         regardless its actual content.
 
+        If the sticker is already cached, it will be returned without any network request.
+
         Returned :class:`LineStickerDownloadResult` will indicate if this situation occurred.
 
         :param sticker_id: sticker ID
@@ -920,20 +935,35 @@ class LineStickerUtils(ClearableMixin):
         """
         result = LineStickerDownloadResult(int(sticker_id))
 
-        output_path = LineStickerUtils._prepare_output(output_path, sticker_id, LineStickerType.STATIC)
+        if output_path:
+            response = LineStickerUtils._fetch_sticker(result, LineStickerUtils.get_sticker_url(sticker_id))
+            if not response:
+                return result
 
-        # Check if the sticker exists
-        response = requests.get(LineStickerUtils.get_sticker_url(sticker_id))
-        if not response.ok:
-            return result
+            # Check if the file exists
+            if os.path.exists(output_path):
+                result.set_already_exists()
+                return result
 
-        result.set_available()
+            LineStickerUtils._save_static(result, response, output_path)
 
-        # Check if the file exists
-        if os.path.exists(output_path):
-            result.set_already_exists()
             return result
 
+        with LineStickerCacheManager.generate(LineStickerCacheManager.get_static_path(sticker_id), "png") as temp_path:
+            # Entries are cached only if the sticker is available
+            if not temp_path:
+                result.set_available()
+                result.set_already_exists()
+                return result
+
+            response = LineStickerUtils._fetch_sticker(result, LineStickerUtils.get_sticker_url(sticker_id))
+            if response:
+                LineStickerUtils._save_static(result, response, temp_path)
+
+        return result
+
+    @staticmethod
+    def _save_static(result: LineStickerDownloadResult, response: requests.Response, output_path: str):
         # Download the sticker
         _start = time.time()
         png_bin = response.content
@@ -944,8 +974,6 @@ class LineStickerUtils(ClearableMixin):
         with open(output_path, "wb") as f:
             f.write(png_bin)
 
-        return result
-
     @staticmethod
     def download_sticker_pack(pack_id: Union[str, int]) -> LineStickerPackDownloadResult:
         """
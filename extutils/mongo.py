@@ -1,4 +1,6 @@
 """Implementations to bridge the utilities and MongoDB."""
+from functools import lru_cache
+
 from bson import CodecOptions
 from bson.codec_options import TypeRegistry
 
@@ -6,6 +8,11 @@ from .color import ColorMongoEncoder
 from .flags import type_registry as tr_flags
 
 
+@lru_cache(maxsize=1)
+def _build_codec_options(flag_count: int) -> CodecOptions:
+    return CodecOptions(type_registry=TypeRegistry(tr_flags[:flag_count] + [ColorMongoEncoder()]))
+
+
 def get_codec_options() -> CodecOptions:
     """
     Get the :class:`CodecOptions` to be used for ``pymongo``.
@@ -16,9 +23,9 @@ def get_codec_options() -> CodecOptions:
 
     - ``extutils.flag`` - All types of flags
 
+    The :class:`CodecOptions` is built once and reused
+    until any flag class is defined afterwards.
+
     :return: `CodecOptions` to be used for ``pymongo``.
     """
-    type_registry = tr_flags
-    type_registry.append(ColorMongoEncoder())
-
-    return CodecOptions(type_registry=TypeRegistry(type_registry))
+    return _build_codec_options(len(tr_flags))
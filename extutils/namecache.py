@@ -0,0 +1,313 @@
+"""
+Module of the tiered name cache.
+
+:class:`TieredNameCache` keeps a small in-process tier in front of a :class:`NameCacheBackend`,
+which could be shared across the processes.
+"""
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set
+
+from cachetools import TTLCache
+
+from extutils.dt import now_utc_aware
+from extutils.logger import SYSTEM
+
+__all__ = ("NameCacheEntry", "CachedName", "NameCacheBackend", "MemoryNameCacheBackend", "TieredNameCache",)
+
+
+class NameCacheEntry(NamedTuple):
+    """Name stored in the cache."""
+
+    name: str
+    updated_at: datetime
+
+
+class CachedName(NamedTuple):
+    """Name returned from the cache."""
+
+    name: str
+    stale: bool
+
+
+class NameCacheBackend(ABC):
+    """Storage of the cached names. Implementations should be thread-safe."""
+
+    @abstractmethod
+    def get_names(self, keys: List[Hashable]) -> Dict[Hashable, NameCacheEntry]:
+        """
+        Get the cached names of ``keys``. Keys not cached are not included in the returned result.
+
+        :param keys: keys of the names to get
+        :return: `dict` which key is the key of the name and value is the cached name
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set_names(self, entries: Dict[Hashable, NameCacheEntry]):
+        """
+        Store ``entries`` to the cache.
+
+        :param entries: `dict` which key is the key of the name and value is the name to be cached
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self):
+        """Clear all cached names."""
+        raise NotImplementedError()
+
+
+class MemoryNameCacheBackend(NameCacheBackend):
+    """Backend storing the names in the memory of the current process."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Create an in-memory backend which expires the names after ``ttl`` seconds.
+
+        :param maxsize: max count of the names to be stored
+        :param ttl: seconds to store a name
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+
+    def get_names(self, keys: List[Hashable]) -> Dict[Hashable, NameCacheEntry]:
+        with self._lock:
+            return {key: self._cache[key] for key in keys if key in self._cache}
+
+    def set_names(self, entries: Dict[Hashable, NameCacheEntry]):
+        with self._lock:
+            self._cache.update(entries)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+class TieredNameCache:
+    """
+    Name cache with a small in-process tier in front of a :class:`NameCacheBackend`.
+
+    - Names missed in the in-process tier are read from the backend in a single batch.
+
+    - Names set are stored in the in-process tier immediately.
+      The writes to the backend are buffered and flushed in a single batch
+      every ``flush_interval`` seconds or once ``flush_size`` names are buffered.
+
+    - Names older than ``stale_seconds`` are still returned, but marked as stale.
+      Call ``refresh_async()`` to update the stale names in the background.
+
+    If ``synchronous`` is ``True``, the writes and the refreshes are performed on the calling thread instead.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+
+    def __init__(self, backend: NameCacheBackend, *, local_size: int, local_ttl: float, stale_seconds: float,
+                 flush_size: int = 100, flush_interval: float = 1, refresh_workers: int = 2,
+                 synchronous: bool = False):
+        """
+        Create a cache with an in-process tier in front of ``backend``.
+
+        :param backend: backend of the cache
+        :param local_size: max count of the names in the in-process tier
+        :param local_ttl: seconds to keep a name in the in-process tier
+        :param stale_seconds: seconds since the name was updated to consider it stale
+        :param flush_size: count of the buffered names to flush the buffer immediately
+        :param flush_interval: seconds between the flushes of the buffered names
+        :param refresh_workers: count of the threads to refresh the stale names
+        :param synchronous: if the writes and the refreshes should be performed on the calling thread
+        """
+        self._backend = backend
+        self._stale_delta = timedelta(seconds=stale_seconds)
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._synchronous = synchronous
+
+        self._local: TTLCache = TTLCache(maxsize=local_size, ttl=local_ttl)
+        self._local_lock = Lock()
+
+        self._pending: Dict[Hashable, NameCacheEntry] = {}
+        self._pending_lock = Lock()
+        self._flush_event = Event()
+        self._flusher: Optional[Thread] = None
+
+        self._refreshing: Set[Hashable] = set()
+        self._refreshing_lock = Lock()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="NameRefresh")
+
+    @property
+    def backend(self) -> NameCacheBackend:
+        """
+        Backend of this cache.
+
+        :return: backend of this cache
+        """
+        return self._backend
+
+    def set_backend(self, backend: NameCacheBackend):
+        """
+        Replace the backend of this cache with ``backend``.
+
+        The buffered names are flushed to the original backend and the in-process tier is cleared.
+
+        :param backend: new backend of this cache
+        """
+        self.flush()
+
+        with self._local_lock:
+            self._backend = backend
+            self._local.clear()
+
+    def _to_cached_name(self, entry: NameCacheEntry, now: datetime) -> CachedName:
+        return CachedName(name=entry.name, stale=now - entry.updated_at > self._stale_delta)
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, CachedName]:
+        """
+        Get the cached names of ``keys``. Keys not cached are not included in the returned result.
+
+        :param keys: keys of the names to get
+        :return: `dict` which key is the key of the name and value is the cached name
+        """
+        entries = {}
+        missing = []
+
+        with self._local_lock:
+            backend = self._backend
+
+            for key in keys:
+                entry = self._local.get(key)
+                if entry:
+                    entries[key] = entry
+                else:
+                    missing.append(key)
+
+        if missing:
+            fetched = backend.get_names(missing)
+
+            with self._local_lock:
+                self._local.update(fetched)
+
+            entries.update(fetched)
+
+        now = now_utc_aware()
+
+        return {key: self._to_cached_name(entry, now) for key, entry in entries.items()}
+
+    def get(self, key: Hashable) -> Optional[CachedName]:
+        """
+        Get the cached name of ``key``.
+
+        :param key: key of the name to get
+        :return: cached name if found, `None` otherwise
+        """
+        return self.get_many([key]).get(key)
+
+    def set_many(self, names: Dict[Hashable, str]):
+        """
+        Store ``names`` to the cache.
+
+        :param names: `dict` which key is the key of the name and value is the name
+        """
+        now = now_utc_aware(for_mongo=True)
+        entries = {key: NameCacheEntry(name=name, updated_at=now) for key, name in names.items()}
+
+        with self._local_lock:
+            self._local.update(entries)
+
+        with self._pending_lock:
+            self._pending.update(entries)
+            flush_now = len(self._pending) >= self._flush_size
+
+        if self._synchronous:
+            self.flush()
+            return
+
+        if flush_now:
+            self._flush_event.set()
+
+        self._ensure_flusher()
+
+    def set(self, key: Hashable, name: str):
+        """
+        Store the ``name`` of ``key`` to the cache.
+
+        :param key: key of the name
+        :param name: name to be stored
+        """
+        self.set_many({key: name})
+
+    def flush(self):
+        """Write the buffered names to the backend."""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {}
+
+        if pending:
+            self._backend.set_names(pending)
+
+    def _ensure_flusher(self):
+        if self._flusher:
+            return
+
+        with self._pending_lock:
+            if not self._flusher:
+                self._flusher = Thread(target=self._flush_loop, name="NameCacheFlush", daemon=True)
+                self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            self._flush_event.wait(self._flush_interval)
+            self._flush_event.clear()
+
+            try:
+                self.flush()
+            except Exception as ex:  # pylint: disable=broad-except
+                SYSTEM.logger.warning("Failed to flush the name cache: %s", ex)
+
+    def refresh_async(self, key: Hashable, fetch: Callable[[], Optional[str]]) -> bool:
+        """
+        Refresh the name of ``key`` by calling ``fetch`` in the background.
+
+        The name will not be updated if ``fetch`` returns ``None``.
+
+        Does nothing if the name of ``key`` is being refreshed.
+
+        :param key: key of the name to refresh
+        :param fetch: function to get the up-to-date name
+        :return: if the refresh is started
+        """
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return False
+
+            self._refreshing.add(key)
+
+        def _refresh():
+            try:
+                name = fetch()
+                if name:
+                    self.set(key, name)
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        if self._synchronous:
+            _refresh()
+        else:
+            self._refresh_executor.submit(_refresh)
+
+        return True
+
+    def clear(self):
+        """Clear the names in all tiers and the buffer."""
+        with self._pending_lock:
+            self._pending.clear()
+
+        with self._local_lock:
+            self._local.clear()
+            backend = self._backend
+
+        backend.clear()
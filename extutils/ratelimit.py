@@ -0,0 +1,77 @@
+"""Module of the rate limiter."""
+import time
+from threading import Lock
+from typing import Callable
+
+__all__ = ("TokenBucket",)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    The bucket starts full. Tokens are refilled at ``rate`` tokens per second up to ``capacity``.
+
+    >>> bucket = TokenBucket(2, 5)  # 2 requests per second with the burst of 5 requests
+    >>> bucket.acquire()  # Blocks until a token is available
+    """
+
+    def __init__(self, rate: float, capacity: float, *,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Create a token bucket which starts full.
+
+        :param rate: tokens to be refilled per second
+        :param capacity: max count of the tokens in the bucket
+        :param clock: function returning the current time in seconds
+        :param sleep: function to sleep for the given seconds
+        :raises ValueError: if `rate` or `capacity` is not positive
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"Rate ({rate}) and capacity ({capacity}) must be positive.")
+
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+
+        self._tokens = capacity
+        self._last_refill = clock()
+        self._lock = Lock()
+
+    def _try_take(self, tokens: float) -> float:
+        """Take ``tokens`` if available and return ``0``. Otherwise, return the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+
+            return (tokens - self._tokens) / self._rate
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Take ``tokens`` from the bucket without blocking.
+
+        :param tokens: count of the tokens to take
+        :return: if the tokens are taken
+        """
+        return self._try_take(tokens) == 0
+
+    def acquire(self, tokens: float = 1):
+        """
+        Take ``tokens`` from the bucket. Blocks until the tokens are available.
+
+        :param tokens: count of the tokens to take
+        :raises ValueError: if `tokens` exceeds the capacity
+        """
+        if tokens > self._capacity:
+            raise ValueError(f"Tokens to acquire ({tokens}) exceeds the capacity ({self._capacity}).")
+
+        wait_secs = self._try_take(tokens)
+        while wait_secs > 0:
+            self._sleep(wait_secs)
+            wait_secs = self._try_take(tokens)
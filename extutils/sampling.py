@@ -0,0 +1,143 @@
+"""
+Module of the random sampling.
+
+The sampling functions take a :class:`random.Random` to draw from,
+so the results could be reproduced by seeding the generator.
+"""
+import math
+import random
+from typing import List, Sequence
+
+__all__ = ("binomial", "multinomial",)
+
+_rnd_default = random.Random()
+
+
+def _binomial_geometric(n: int, p: float, rnd: random.Random) -> int:
+    # Locate the successes by jumping over the geometrically distributed failures
+    log_q = math.log(1.0 - p)
+    if not log_q:  # `p` too small to have any success
+        return 0
+
+    successes = 0
+    trial = 0
+    while True:
+        # `1.0 - random()` is in (0, 1], which prevents `log(0)`
+        trial += math.floor(math.log(1.0 - rnd.random()) / log_q) + 1
+        if trial > n:
+            return successes
+        successes += 1
+
+
+def _binomial_btrs(n: int, p: float, rnd: random.Random) -> int:
+    # BTRS (transformed rejection with squeeze), `p` must not be greater than 0.5
+    # pylint: disable=too-many-locals
+    spq = math.sqrt(n * p * (1.0 - p))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    vr = 0.92 - 4.2 / b
+
+    alpha = (2.83 + 5.1 / b) * spq
+    lpq = math.log(p / (1.0 - p))
+    m = math.floor((n + 1) * p)
+    h = math.lgamma(m + 1) + math.lgamma(n - m + 1)
+
+    while True:
+        u = rnd.random() - 0.5
+        us = 0.5 - abs(u)
+        if not us:
+            continue
+
+        k = math.floor((2.0 * a / us + b) * u + c)
+        if k < 0 or k > n:
+            continue
+
+        v = rnd.random()
+        if us >= 0.07 and v <= vr:
+            return k
+
+        v *= alpha / (a / (us * us) + b)
+        if v and math.log(v) <= h - math.lgamma(k + 1) - math.lgamma(n - k + 1) + (k - m) * lpq:
+            return k
+
+
+def binomial(n: int, p: float, rnd: random.Random = _rnd_default) -> int:
+    """
+    Draw the count of successes in ``n`` independent trials with the success probability ``p``.
+
+    The expected time is constant regardless of ``n``.
+
+    - If ``n * p < 10``, the successes are located by jumping over the geometrically distributed failures.
+
+    - Otherwise, the count is drawn using BTRS (transformed rejection with squeeze)
+      from W. Hormann, "The generation of binomial random variates" (1993).
+
+    :param n: count of the trials
+    :param p: success probability of a single trial
+    :param rnd: random generator to draw from
+    :return: count of the successes
+    :raises ValueError: if `n` is negative or `p` is not in [0, 1]
+    """
+    if n < 0:
+        raise ValueError(f"Count of the trials ({n}) must not be negative.")
+    if not 0.0 <= p <= 1.0:
+        raise ValueError(f"Success probability ({p}) must be in [0, 1].")
+
+    if p == 0.0 or n == 0:
+        return 0
+    if p == 1.0:
+        return n
+    if p > 0.5:
+        return n - binomial(n, 1.0 - p, rnd)
+
+    if n * p < 10.0:
+        return _binomial_geometric(n, p, rnd)
+
+    return _binomial_btrs(n, p, rnd)
+
+
+def multinomial(n: int, weights: Sequence[float], rnd: random.Random = _rnd_default) -> List[int]:
+    """
+    Draw how many times each option is picked in ``n`` independent picks.
+
+    The probability of picking an option is proportional to its weight in ``weights``.
+
+    This has the same distribution as counting the results of ``random.choices(options, weights, k=n)``,
+    but the time and the memory needed depend on the count of the options only, instead of ``n``.
+
+    :param n: count of the picks
+    :param weights: weights of the options
+    :param rnd: random generator to draw from
+    :return: count of the picks of each option in the same order as `weights`
+    :raises ValueError: if `n` is negative, any weight is negative or not finite, or the weights sum to 0
+    """
+    if n < 0:
+        raise ValueError(f"Count of the picks ({n}) must not be negative.")
+    if any(not math.isfinite(weight) or weight < 0 for weight in weights):
+        raise ValueError("Weights must be non-negative and finite.")
+
+    # `weights_remaining[i]` is the sum of the weights starting from the `i`-th option.
+    # Summing backward makes the weight of an option equal to the remaining sum
+    # if all the options after it have zero weight, so these options will never be picked.
+    weights_remaining = [0.0] * (len(weights) + 1)
+    for idx in range(len(weights) - 1, -1, -1):
+        weights_remaining[idx] = weights[idx] + weights_remaining[idx + 1]
+
+    if weights and weights_remaining[0] <= 0:
+        raise ValueError("Weights must not sum to 0.")
+
+    counts = []
+    picks_remaining = n
+
+    # Each count follows a binomial distribution conditioned on the counts already drawn
+    for idx, weight in enumerate(weights):
+        if not picks_remaining or not weight:
+            count = 0
+        else:
+            count = binomial(picks_remaining, min(1.0, weight / weights_remaining[idx]), rnd)
+
+        counts.append(count)
+        picks_remaining -= count
+
+    return counts
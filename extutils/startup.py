@@ -0,0 +1,223 @@
+"""
+Module to profile the startup of the application.
+
+The time of each step during the startup is recorded to :class:`StartupProfiler` by its category.
+Tasks not required for the system to work could be deferred until the system is ready.
+
+Once the system is ready, a report of the startup will be logged.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock, Thread
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from extutils.logger import SYSTEM
+
+__all__ = ("StartupRecord", "StartupProfiler", "STARTUP_PROFILER",)
+
+_MILESTONE = "Milestone"
+
+
+@dataclass
+class StartupRecord:
+    """Time spent on a step of the startup. Unit of the duration is seconds."""
+
+    category: str
+    name: str
+    duration: float
+
+
+class StartupProfiler:
+    """
+    Profiler recording the time spent on each step of the startup.
+
+    >>> profiler = StartupProfiler()
+    >>> with profiler.measure("Collection", "user.root"):
+    >>>     pass  # Step to be measured
+    >>> profiler.defer("Field check", lambda: None)  # Executed after `mark_ready()`
+    >>> profiler.mark_ready()
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter, synchronous: bool = False):
+        """
+        Start profiling the startup from now.
+
+        :param clock: function returning the current time in seconds
+        :param synchronous: if the deferred tasks should be executed on the thread calling ``mark_ready()``
+        """
+        self._clock = clock
+        self._synchronous = synchronous
+        self._started_at = clock()
+        self._ready_at: Optional[float] = None
+
+        self._records: List[StartupRecord] = []
+        self._deferred: List[Tuple[str, Callable[[], None]]] = []
+        self._lock = Lock()
+
+    @property
+    def records(self) -> List[StartupRecord]:
+        """
+        Get a copy of the recorded steps in the order of completion.
+
+        :return: recorded steps
+        """
+        with self._lock:
+            return list(self._records)
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Check if the system is marked ready.
+
+        :return: if `mark_ready()` was called
+        """
+        return self._ready_at is not None
+
+    @property
+    def seconds_to_ready(self) -> Optional[float]:
+        """
+        Get the seconds from the creation of this profiler to the system being marked ready.
+
+        :return: seconds to ready, `None` if the system is not ready yet
+        """
+        if self._ready_at is None:
+            return None
+
+        return self._ready_at - self._started_at
+
+    def record(self, category: str, name: str, duration: float):
+        """
+        Record a step of the startup.
+
+        :param category: category of the step
+        :param name: name of the step
+        :param duration: seconds spent on the step
+        """
+        with self._lock:
+            self._records.append(StartupRecord(category, name, duration))
+
+    def mark(self, name: str):
+        """
+        Record the time from the creation of this profiler to now as a milestone of the startup.
+
+        Milestones are listed separately in the report instead of being counted as steps.
+
+        :param name: name of the milestone
+        """
+        self.record(_MILESTONE, name, self._clock() - self._started_at)
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        """
+        Measure and record the time spent on the code block in the ``with`` statement.
+
+        The time is recorded even if an exception is raised.
+
+        :param category: category of the step
+        :param name: name of the step
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(category, name, self._clock() - start)
+
+    def defer(self, name: str, task: Callable[[], None]):
+        """
+        Execute ``task`` after the system is ready.
+
+        If the system is already ready, ``task`` will be executed immediately in the background.
+
+        :param name: name of the task
+        :param task: task to be executed
+        """
+        with self._lock:
+            if self._ready_at is None:
+                self._deferred.append((name, task))
+                return
+
+        self._run_tasks([(name, task)])
+
+    def _run_deferred(self, tasks: List[Tuple[str, Callable[[], None]]]):
+        start = self._clock()
+
+        for name, task in tasks:
+            try:
+                with self.measure("Deferred", name):
+                    task()
+            except Exception as ex:  # pylint: disable=broad-except
+                SYSTEM.logger.warning("Deferred startup task `%s` failed: %s", name, ex)
+
+        if tasks:
+            SYSTEM.logger.info("%d deferred startup tasks completed in %.3f secs.", len(tasks), self._clock() - start)
+
+    def _run_tasks(self, tasks: List[Tuple[str, Callable[[], None]]]):
+        if self._synchronous:
+            self._run_deferred(tasks)
+        else:
+            Thread(target=self._run_deferred, args=(tasks,), name="StartupDeferred", daemon=True).start()
+
+    def mark_ready(self) -> float:
+        """
+        Mark the system ready, log the startup report and start executing the deferred tasks.
+
+        Subsequent calls only return the seconds to ready.
+
+        :return: seconds from the creation of this profiler to the system being ready
+        """
+        with self._lock:
+            if self._ready_at is not None:
+                return self._ready_at - self._started_at
+
+            self._ready_at = self._clock()
+            tasks, self._deferred = self._deferred, []
+
+        SYSTEM.logger.info(self.get_report())
+
+        self._run_tasks(tasks)
+
+        return self._ready_at - self._started_at
+
+    def get_report(self, *, slowest: int = 10) -> str:
+        """
+        Get the report of the startup.
+
+        The report includes the total time spent on each category and the slowest steps.
+
+        Note that the total time of a category could exceed the time to ready if the steps were executed concurrently.
+
+        :param slowest: count of the slowest steps to be included
+        :return: startup report
+        """
+        records = self.records
+        milestones = [rec for rec in records if rec.category == _MILESTONE]
+        steps = [rec for rec in records if rec.category != _MILESTONE]
+
+        totals: Dict[str, List[float]] = defaultdict(list)
+        for rec in steps:
+            totals[rec.category].append(rec.duration)
+
+        lines = ["Startup report"]
+
+        seconds_to_ready = self.seconds_to_ready
+        if seconds_to_ready is not None:
+            lines.append(f"Ready in {seconds_to_ready:.3f} secs")
+
+        if milestones:
+            lines.append("- Milestones")
+            lines.extend(f"  {rec.name}: {rec.duration:.3f} secs" for rec in milestones)
+
+        lines.append("- Categories")
+        lines.extend(f"  {category}: {sum(durations):.3f} secs / {len(durations)} steps"
+                     for category, durations in totals.items())
+
+        lines.append(f"- Slowest {slowest} steps")
+        lines.extend(f"  [{rec.category}] {rec.name}: {rec.duration:.3f} secs"
+                     for rec in sorted(steps, key=lambda rec: rec.duration, reverse=True)[:slowest])
+
+        return "\n".join(lines)
+
+
+STARTUP_PROFILER = StartupProfiler()
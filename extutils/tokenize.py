@@ -0,0 +1,53 @@
+"""Module to tokenize the text for searching."""
+import logging
+from typing import Set
+
+import jieba
+
+__all__ = ("tokenize_for_search", "MAX_KEYWORD_LENGTH")
+
+MAX_KEYWORD_LENGTH = 20
+"""Max length of a single keyword. Longer tokens will be truncated."""
+
+jieba.setLogLevel(logging.WARNING)
+
+
+def _is_keyword(token: str) -> bool:
+    # Punctuations and whitespaces only are not searchable
+    return any(c.isalnum() for c in token)
+
+
+def tokenize_for_search(text: str, *, with_suffixes: bool = False, max_count: int = 0) -> Set[str]:
+    """
+    Tokenize ``text`` into lowercased keywords.
+
+    If ``with_suffixes`` is ``True``, every suffix of each keyword will also be included,
+    so that any part of a keyword can be found by matching the prefix of the returned keywords.
+
+    >>> sorted(tokenize_for_search("Hello, World!"))
+    ['hello', 'world']
+    >>> sorted(tokenize_for_search("ABC", with_suffixes=True))
+    ['abc', 'bc', 'c']
+
+    :param text: text to be tokenized
+    :param with_suffixes: if the suffixes of the keywords should be included
+    :param max_count: max count of the returned keywords. No limit if this is `0`
+    :return: set of the keywords in `text`
+    """
+    ret = {}  # Using `dict` to keep the order of the keywords
+
+    for token in jieba.cut_for_search(text.lower()):
+        token = token.strip()[:MAX_KEYWORD_LENGTH]
+
+        if not _is_keyword(token):
+            continue
+
+        if with_suffixes:
+            ret.update((suffix, None) for idx in range(len(token)) if _is_keyword(suffix := token[idx:]))
+        else:
+            ret[token] = None
+
+        if max_count and len(ret) >= max_count:
+            return set(list(ret)[:max_count])
+
+    return set(ret)
@@ -0,0 +1,255 @@
+"""
+Module of the lightweight span tracing.
+
+A trace is started by :meth:`Tracer.trace()` and sampled by the sample rate of the tracer.
+Spans opened by :func:`span()` are recorded to the active trace if it was sampled, or ignored otherwise,
+so the instrumented code costs almost nothing if the trace was not sampled.
+
+The active trace is stored in a :class:`ContextVar`, so it follows the ``asyncio`` tasks automatically.
+Use :func:`wrap_context()` to carry it to the functions executed in the other threads, such as the thread pools.
+"""
+import contextvars
+import math
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from extutils.logger import SYSTEM
+
+__all__ = ("SpanRecord", "Trace", "Tracer", "span", "tag", "wrap_context", "percentile",)
+
+# `None` if no trace was started, `(None, None)` if the trace was started but not sampled,
+# `(trace, name of the current span)` otherwise
+_context: contextvars.ContextVar[Optional[Tuple[Optional["Trace"], Optional[str]]]] = \
+    contextvars.ContextVar("trace_context", default=None)
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """
+    A finished span. Unit of the time is milliseconds.
+
+    ``parent`` is the name of the enclosing span, ``None`` if the span is directly under the trace.
+
+    ``start_ms`` is the time from the start of the trace to the start of the span.
+    """
+
+    name: str
+    parent: Optional[str]
+    start_ms: float
+    duration_ms: float
+
+
+class Trace:
+    """A sampled trace holding the spans recorded during it. Spans could be recorded from any thread."""
+
+    def __init__(self, name: str, clock: Callable[[], float] = time.perf_counter):
+        """
+        Start a trace named ``name`` from now.
+
+        :param name: name of the trace
+        :param clock: function returning the current time in seconds
+        """
+        self.name = name
+        self.tags: Dict[str, Any] = {}
+        self.duration_ms: Optional[float] = None
+
+        self._clock = clock
+        self._started_at = clock()
+        self._spans: List[SpanRecord] = []
+        self._lock = Lock()
+
+    @property
+    def spans(self) -> List[SpanRecord]:
+        """
+        Get a copy of the spans recorded in the order of completion.
+
+        :return: recorded spans
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def now_ms(self) -> float:
+        """
+        Get the milliseconds since the start of this trace.
+
+        :return: milliseconds since the start of this trace
+        """
+        return (self._clock() - self._started_at) * 1000
+
+    def add_span(self, name: str, parent: Optional[str], start_ms: float, end_ms: float):
+        """
+        Record a span to this trace.
+
+        :param name: name of the span
+        :param parent: name of the enclosing span
+        :param start_ms: milliseconds from the start of this trace to the start of the span
+        :param end_ms: milliseconds from the start of this trace to the end of the span
+        """
+        with self._lock:
+            self._spans.append(SpanRecord(name, parent, start_ms, end_ms - start_ms))
+
+    def finish(self) -> float:
+        """
+        Mark this trace finished.
+
+        :return: duration of this trace in milliseconds
+        """
+        self.duration_ms = self.now_ms()
+
+        return self.duration_ms
+
+
+class Tracer:
+    """
+    Tracer starting the traces and passing the sampled ones to ``on_finished`` after they finished.
+
+    >>> tracer = Tracer(sample_rate=0.1, on_finished=print)
+    >>> with tracer.trace("message"):
+    >>>     with span("handle"):
+    >>>         pass  # Stage to be traced
+    """
+
+    def __init__(self, *, sample_rate: float, on_finished: Optional[Callable[[Trace], None]] = None,
+                 clock: Callable[[], float] = time.perf_counter, rnd: Optional[random.Random] = None):
+        """
+        Create a tracer sampling ``sample_rate`` of the traces.
+
+        :param sample_rate: rate of the traces to be sampled, from 0 to 1
+        :param on_finished: function to be called with the sampled traces after they finished
+        :param clock: function returning the current time in seconds
+        :param rnd: random generator deciding if a trace should be sampled
+        """
+        self.sample_rate = sample_rate
+
+        self._on_finished = on_finished
+        self._clock = clock
+        self._rnd = rnd or random.Random()
+
+    def set_on_finished(self, on_finished: Optional[Callable[[Trace], None]]):
+        """
+        Set the function to be called with the sampled traces after they finished.
+
+        :param on_finished: function to be called with the sampled traces
+        """
+        self._on_finished = on_finished
+
+    @contextmanager
+    def trace(self, name: str):
+        """
+        Start a trace for the code block in the ``with`` statement.
+
+        If a trace is already active, a span named ``name`` is opened in it instead.
+
+        Yields the started trace, or ``None`` if the trace is not sampled.
+
+        :param name: name of the trace
+        """
+        ctx = _context.get()
+        if ctx is not None:
+            with span(name):
+                yield ctx[0]
+            return
+
+        trace = Trace(name, self._clock) if self._rnd.random() < self.sample_rate else None
+
+        token = _context.set((trace, None))
+        try:
+            yield trace
+        finally:
+            _context.reset(token)
+
+            if trace:
+                trace.finish()
+                self._emit(trace)
+
+    def _emit(self, trace: Trace):
+        if not self._on_finished:
+            return
+
+        try:
+            self._on_finished(trace)
+        except Exception as ex:  # pylint: disable=broad-except
+            SYSTEM.logger.warning("Failed to process the finished trace `%s`: %s", trace.name, ex)
+
+
+@contextmanager
+def span(name: str):
+    """
+    Record the code block in the ``with`` statement as a span of the active trace.
+
+    Nothing is recorded if there is no active trace or the active trace is not sampled.
+
+    The span is recorded even if an exception is raised.
+
+    :param name: name of the span
+    """
+    ctx = _context.get()
+    if not ctx or not ctx[0]:
+        yield
+        return
+
+    trace, parent = ctx
+    start_ms = trace.now_ms()
+
+    token = _context.set((trace, name))
+    try:
+        yield
+    finally:
+        _context.reset(token)
+        trace.add_span(name, parent, start_ms, trace.now_ms())
+
+
+def tag(key: str, value: Any):
+    """
+    Attach ``value`` to the active trace as ``key``.
+
+    Nothing happens if there is no active trace or the active trace is not sampled.
+
+    :param key: key of the tag
+    :param value: value of the tag
+    """
+    ctx = _context.get()
+    if ctx and ctx[0]:
+        ctx[0].tags[key] = value
+
+
+def wrap_context(fn: Callable) -> Callable:
+    """
+    Bind ``fn`` to a copy of the current context, so the active trace is kept when ``fn`` is executed in other threads.
+
+    A context cannot be entered by multiple threads at once, so wrap ``fn`` again for each submission:
+
+    >>> executor.submit(wrap_context(fn), *args)
+
+    :param fn: function to be bound
+    :return: function executing `fn` in the copied context
+    """
+    return partial(contextvars.copy_context().run, fn)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Get the ``pct``-th percentile of ``values`` using the linear interpolation between the closest ranks.
+
+    ``values`` must be sorted in ascending order.
+
+    :param values: sorted values
+    :param pct: percentile to get, from 0 to 100
+    :return: `pct`-th percentile of `values`
+    :raises ValueError: if `values` is empty or `pct` is not in [0, 100]
+    """
+    if not values:
+        raise ValueError("Values to get the percentile must not be empty.")
+    if not 0 <= pct <= 100:
+        raise ValueError(f"Percentile ({pct}) must be in [0, 100].")
+
+    pos = (len(values) - 1) * pct / 100
+    lower = math.floor(pos)
+    upper = min(lower + 1, len(values) - 1)
+
+    return values[lower] + (values[upper] - values[lower]) * (pos - lower)
@@ -7,3 +7,4 @@ class ImageContentType(FlagSingleEnum):
 
     URL = 0, "url"
     BASE64 = 1, "base64"
+    FILE = 2, "file"
@@ -6,7 +6,7 @@ from ._base import Model
 # noinspection PyUnresolvedReferences
 from .ar import (
     AutoReplyModuleModel, AutoReplyContentModel, AutoReplyModuleTagModel, AutoReplyModuleExecodeModel,
-    AutoReplyTagPopularityScore, UniqueKeywordCountResult
+    AutoReplyTagPopularityScore, AutoReplyTagPopularityModel, AutoReplyKeywordVersionModel, UniqueKeywordCountResult
 )
 # noinspection PyUnresolvedReferences
 from .channel import ChannelModel, ChannelConfigModel, ChannelCollectionModel
@@ -22,7 +22,7 @@ from .prof import (
 # noinspection PyUnresolvedReferences
 from .rpdata import PendingRepairDataModel
 # noinspection PyUnresolvedReferences
-from .shorturl import ShortUrlRecordModel
+from .shorturl import ShortUrlRecordModel, ShortUrlCodeCounterModel
 # noinspection PyUnresolvedReferences
 from .stats import (
     # result base
@@ -30,15 +30,22 @@ from .stats import (
     # bot feature usage
     BotFeatureUsageResult, BotFeatureHourlyAvgResult, BotFeaturePerUserUsageResult,
     # models
-    APIStatisticModel, MessageRecordModel, BotFeatureUsageModel,
+    APIStatisticModel, MessageRecordModel, MessageKeywordModel, MessageKeywordBackfillModel, BotFeatureUsageModel,
+    MessageTraceModel, MessageTraceSpanModel,
     # messages
     MemberMessageCountEntry, MemberMessageCountResult, HourlyIntervalAverageMessageResult, DailyMessageResult,
     MemberMessageByCategoryEntry, MemberMessageByCategoryResult, MemberDailyMessageResult, MeanMessageResultGenerator,
-    CountBeforeTimeResult
+    CountBeforeTimeResult,
+    # message latency
+    LatencyPercentileEntry, MessageLatencyResult
 )
 # noinspection PyUnresolvedReferences
 from .timer import TimerModel, TimerListResult
 # noinspection PyUnresolvedReferences
-from .user import APIUserModel, OnPlatformUserModel, RootUserModel, RootUserConfigModel, set_uname_cache
+from .user import (
+    APIUserModel, OnPlatformUserModel, RootUserModel, RootUserConfigModel, set_uname_cache,
+    UserIntegrationJobModel, UserIntegrationProgressModel, UserNameCacheModel, set_uname_cache_backend,
+    get_uname_cache_batch
+)
 # noinspection PyUnresolvedReferences
 from .rmc import RemoteControlEntryModel
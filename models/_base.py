@@ -516,7 +516,8 @@ class Model(MutableMapping, abc.ABC):
         return cls(**init_dict, from_db=True)
 
     @classmethod
-    def replace_uid(cls, col, old: ObjectId, new: ObjectId, session: ClientSession) -> List[str]:
+    def replace_uid(cls, col, old: ObjectId, new: ObjectId, session: Optional[ClientSession] = None, *,
+                    extra_filter: Optional[dict] = None) -> List[str]:
         """
         Replace the values of the fields which are marked storing the uids.
 
@@ -524,19 +525,45 @@ class Model(MutableMapping, abc.ABC):
         :param old: old value to be replaced
         :param new: new value to replace
         :param session: MongoDB client session
+        :param extra_filter: only replace the values in the documents matching this filter if given
 
         :return: name of the fields that was failed to complete the replacement if any
         """
         failed_names = []
 
-        for k in cls.model_field_keys():
-            fd: BaseField = getattr(cls, k, None)
-            if fd and fd.stores_uid:
-                result = fd.replace_uid(col, old, new, session)
-                if not result:
-                    failed_names.append(fd.__class__.__qualname__)
+        for fd in cls.uid_fields():
+            result = fd.replace_uid(col, old, new, session, extra_filter=extra_filter)
+            if not result:
+                failed_names.append(fd.__class__.__qualname__)
 
         return failed_names
 
+    @classmethod
+    def uid_fields(cls) -> List[BaseField]:
+        """
+        Get the fields which are marked storing the uids.
+
+        :return: list of the fields storing the uids
+        """
+        return [fd for k in cls.model_field_keys() if (fd := getattr(cls, k, None)) and fd.stores_uid]
+
+    @classmethod
+    def get_uid_filter(cls, uid: ObjectId) -> Optional[dict]:
+        """
+        Get the filter to find the documents storing ``uid`` in any of the fields storing the uids.
+
+        :param uid: UID to be found
+        :return: filter to find the documents storing `uid`. `None` if no field is storing the uids
+        """
+        filters = [fd.get_uid_filter(uid) for fd in cls.uid_fields()]
+
+        if not filters:
+            return None
+
+        if len(filters) == 1:
+            return filters[0]
+
+        return {"$or": filters}
+
     def __repr__(self):
         return f"<{self.__class__.__qualname__}: {self._dict_}>"
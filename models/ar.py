@@ -17,11 +17,12 @@ from extutils.utils import enumerate_ranking
 from ._base import Model
 from .field import (
     ObjectIDField, TextField, AutoReplyContentTypeField, ModelField, ModelArrayField,
-    BooleanField, IntegerField, ArrayField, DateTimeField, ColorField, ModelDefaultValueExt
+    BooleanField, IntegerField, FloatField, ArrayField, DateTimeField, ColorField, ModelDefaultValueExt
 )
 
 __all__ = ["AutoReplyContentModel", "AutoReplyModuleModel", "AutoReplyModuleExecodeModel", "AutoReplyModuleTagModel",
-           "AutoReplyTagPopularityScore", "UniqueKeywordCountEntry", "UniqueKeywordCountResult"]
+           "AutoReplyTagPopularityScore", "AutoReplyTagPopularityModel", "AutoReplyKeywordVersionModel",
+           "UniqueKeywordCountEntry", "UniqueKeywordCountResult"]
 
 
 @lru_cache(maxsize=1000)
@@ -194,6 +195,7 @@ class AutoReplyModuleTagModel(Model):
 @dataclass
 class AutoReplyTagPopularityScore:
     KEY_W_AVG_TIME_DIFF = "w_atd"
+    KEY_W_TIME_DIFF_SUM = "w_tds"
     KEY_W_APPEARANCE = "w_app"
     KEY_APPEARANCE = "app"
     SCORE = "sc"
@@ -215,6 +217,30 @@ class AutoReplyTagPopularityScore:
         )
 
 
+class AutoReplyTagPopularityModel(Model):
+    """
+    Materialized popularity score of an auto-reply tag. ``Id`` is the OID of the tag.
+
+    The fields are the same as the ones parsed by ``AutoReplyTagPopularityScore``.
+    """
+
+    WeightedAvgTimeDiff = FloatField(AutoReplyTagPopularityScore.KEY_W_AVG_TIME_DIFF)
+    WeightedTimeDiffSum = FloatField(AutoReplyTagPopularityScore.KEY_W_TIME_DIFF_SUM)
+    WeightedAppearances = FloatField(AutoReplyTagPopularityScore.KEY_W_APPEARANCE)
+    Appearances = IntegerField(AutoReplyTagPopularityScore.KEY_APPEARANCE, positive_only=True)
+    Score = FloatField(AutoReplyTagPopularityScore.SCORE)
+
+
+class AutoReplyKeywordVersionModel(Model):
+    """
+    Version of the auto-reply keywords of a channel. ``Id`` is the OID of the channel.
+
+    ``Version`` is increased whenever any module of the channel is added or re-activated.
+    """
+
+    Version = IntegerField("v", positive_only=True)
+
+
 @dataclass
 class UniqueKeywordCountEntry:
     word: str
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from bson import ObjectId
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
@@ -35,8 +37,13 @@ class ChannelNameField(DictionaryField):
     def replace_uid_implemented(self) -> bool:
         return True
 
-    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId, session: ClientSession) -> bool:
-        return collection_inst.update_many({}, {"$rename": {f"n.{old}": f"n.{new}"}}, session=session).acknowledged
+    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId,
+                    session: Optional[ClientSession] = None, *, extra_filter: Optional[dict] = None) -> bool:
+        return collection_inst.update_many(
+            extra_filter or {}, {"$rename": {f"{self.key}.{old}": f"{self.key}.{new}"}}, session=session).acknowledged
+
+    def get_uid_filter(self, uid: ObjectId) -> dict:
+        return {f"{self.key}.{uid}": {"$exists": True}}
 
 
 class ChannelModel(Model):
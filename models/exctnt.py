@@ -35,6 +35,11 @@ class ExtraContentModel(Model):
 
 
 class ExtraContentHTMLTransformer:
+    @staticmethod
+    def is_language_independent(model: ExtraContentModel) -> bool:
+        # Auto-reply search result is rendered with the translated module card template
+        return model.type in (ExtraContentType.PURE_TEXT, ExtraContentType.EXTRA_MESSAGE)
+
     @staticmethod
     def transform(model: ExtraContentModel) -> str:
         if model.type == ExtraContentType.PURE_TEXT:
@@ -1,7 +1,7 @@
 import abc
 from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Tuple, Type, Any, final, Dict, TypeVar
+from typing import Tuple, Type, Any, final, Dict, TypeVar, Optional
 
 from bson import ObjectId
 from pymongo.client_session import ClientSession
@@ -183,17 +183,29 @@ class BaseField(abc.ABC):
         """The value should be overrided if `replace_uid()` is implemented."""
         return False
 
-    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId, session: ClientSession) -> bool:
+    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId,
+                    session: Optional[ClientSession] = None, *, extra_filter: Optional[dict] = None) -> bool:
         """
         Replace the field content if this field is marked as storing the UID. (``stores_uid`` is ``True``)
 
         Actions that should be reversed (basically all actions) if the replacement failed
         should pass ``session`` to the database command so that the reversal is achievable.
 
+        Only the documents which also match ``extra_filter`` will be replaced if given.
+
         :return: action acknowledged
         """
         raise RuntimeError(f"uid_replace function called but not implemented. ({self.__class__.__qualname__})")
 
+    def get_uid_filter(self, uid: ObjectId) -> dict:
+        """
+        Get the filter to find the documents storing ``uid`` in this field.
+
+        :param uid: UID to be found
+        :return: filter to find the documents storing `uid`
+        """
+        return {self.key: uid}
+
     @property
     @abc.abstractmethod
     def expected_types(self) -> Tuple[type]:
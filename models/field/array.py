@@ -1,5 +1,6 @@
 import math
 from collections import abc
+from typing import Optional
 
 from bson import ObjectId
 from pymongo.client_session import ClientSession
@@ -134,11 +135,12 @@ class ArrayField(BaseField):
     def replace_uid_implemented(self) -> bool:
         return True
 
-    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId, session: ClientSession) -> bool:
-        ack_push = collection_inst.update_many(
-            {self.key: {"$in": [old]}}, {"$push": {self.key: new}}, session=session).acknowledged
-        ack_pull = collection_inst.update_many(
-            {self.key: {"$in": [old]}}, {"$pull": {self.key: old}}, session=session).acknowledged
+    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId,
+                    session: Optional[ClientSession] = None, *, extra_filter: Optional[dict] = None) -> bool:
+        filter_ = {self.key: {"$in": [old]}, **(extra_filter or {})}
+
+        ack_push = collection_inst.update_many(filter_, {"$push": {self.key: new}}, session=session).acknowledged
+        ack_pull = collection_inst.update_many(filter_, {"$pull": {self.key: old}}, session=session).acknowledged
         return ack_pull and ack_push
 
 
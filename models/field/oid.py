@@ -1,6 +1,6 @@
 import struct
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 from bson import ObjectId
 from pymongo.client_session import ClientSession
@@ -63,5 +63,7 @@ class ObjectIDField(BaseField):
     def replace_uid_implemented(self) -> bool:
         return True
 
-    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId, session: ClientSession) -> bool:
-        return collection_inst.update_many({self.key: old}, {"$set": {self.key: new}}, session=session).acknowledged
+    def replace_uid(self, collection_inst: Collection, old: ObjectId, new: ObjectId,
+                    session: Optional[ClientSession] = None, *, extra_filter: Optional[dict] = None) -> bool:
+        return collection_inst.update_many(
+            {self.key: old, **(extra_filter or {})}, {"$set": {self.key: new}}, session=session).acknowledged
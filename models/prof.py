@@ -6,7 +6,8 @@ from bson import ObjectId
 from flags import ProfilePermission, ProfilePermissionDefault, PermissionLevel
 from models import Model, ChannelModel, ModelDefaultValueExt
 from models.field import (
-    ObjectIDField, TextField, ColorField, DictionaryField, BooleanField, ArrayField, IntegerField, PermissionLevelField
+    ObjectIDField, TextField, ColorField, DictionaryField, BooleanField, ArrayField, IntegerField,
+    PermissionLevelField, DateTimeField
 )
 
 
@@ -85,6 +86,8 @@ class ChannelProfileConnectionModel(Model):
     UserOid = ObjectIDField("u", default=ModelDefaultValueExt.Required, stores_uid=True)
     # `ProfileOids` will be empty list if the user is not in the channel
     ProfileOids = ArrayField("p", ObjectId, default=ModelDefaultValueExt.Required)
+    # Last time that the user existence of this connection was checked
+    ExistenceCheckedAt = DateTimeField("ec", default=ModelDefaultValueExt.Optional)
 
     @property
     def available(self):
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from models import ModelDefaultValueExt, Model
 from models.field import (
-    TextField, UrlField, ArrayField, ObjectIDField, BooleanField
+    TextField, UrlField, ArrayField, ObjectIDField, BooleanField, IntegerField
 )
 from strres.models import ShortUrl
 
@@ -41,3 +41,20 @@ class ShortUrlRecordModel(Model):
             return ShortUrl.SERVICE_NOT_AVAILABLE
 
         return f"{root_url}/{self.code}"
+
+
+class ShortUrlCodeCounterModel(Model):
+    """
+    Model for the counter allocating the short URL codes.
+
+    ``Next`` is the sequence number of the next code to be reserved.
+
+    ``MinLength`` is the code length of the sequence number ``0``.
+
+    ``ScrambleKey`` is the key for scrambling the sequence numbers to codes.
+    """
+
+    Key = TextField("k", default=ModelDefaultValueExt.Required, must_have_content=True)
+    Next = IntegerField("n", positive_only=True)
+    MinLength = IntegerField("l", default=ModelDefaultValueExt.Required, positive_only=True)
+    ScrambleKey = IntegerField("sk", default=ModelDefaultValueExt.Required)
@@ -1,9 +1,13 @@
 """Implementations of the data/result models related to stats."""
 from .base import DailyResult, HourlyResult
 from .bot import BotFeatureUsageResult, BotFeatureHourlyAvgResult, BotFeaturePerUserUsageResult
-from .model import APIStatisticModel, MessageRecordModel, BotFeatureUsageModel
+from .model import (
+    APIStatisticModel, MessageRecordModel, MessageKeywordModel, MessageKeywordBackfillModel, BotFeatureUsageModel,
+    MessageTraceModel, MessageTraceSpanModel
+)
 from .msg import (
     MemberMessageCountEntry, MemberMessageCountResult, HourlyIntervalAverageMessageResult, DailyMessageResult,
     MemberMessageByCategoryEntry, MemberMessageByCategoryResult, MemberDailyMessageResult, MeanMessageResultGenerator,
     CountBeforeTimeResult
 )
+from .trace import LatencyPercentileEntry, MessageLatencyResult
@@ -3,7 +3,7 @@ from extutils.dt import localtime
 from models import Model, ModelDefaultValueExt
 from models.field import (
     BooleanField, DictionaryField, APICommandField, DateTimeField, TextField, ObjectIDField,
-    MessageTypeField, BotFeatureField, FloatField
+    MessageTypeField, BotFeatureField, FloatField, IntegerField, ModelArrayField
 )
 
 
@@ -43,6 +43,37 @@ class MessageRecordModel(Model):
         return localtime(self.id.generation_time)
 
 
+class MessageKeywordModel(Model):
+    """
+    Model of a keyword appeared in the messages of a channel.
+
+    This works as the index for searching the channels by their messages.
+    """
+
+    Keyword = TextField("kw", default=ModelDefaultValueExt.Required, must_have_content=True, allow_none=False)
+    ChannelOid = ObjectIDField("ch", default=ModelDefaultValueExt.Required)
+    Count = IntegerField("c", positive_only=True)
+    LastUsed = DateTimeField("lt", default=ModelDefaultValueExt.Required)
+
+
+class MessageKeywordBackfillModel(Model):
+    """
+    Model of the progress of indexing the keywords of the messages recorded before the keyword index exists.
+
+    Messages which ID is less than ``EndOid`` are indexed in the ascending order of their ID.
+    ``LastOid`` is the ID of the last message indexed, ``None`` if nothing was indexed yet.
+
+    ``Owner`` is the ID of the process backfilling the index until ``LeaseUntil``.
+    """
+
+    Key = TextField("k", default=ModelDefaultValueExt.Required, must_have_content=True)
+    EndOid = ObjectIDField("e", default=ModelDefaultValueExt.Required)
+    LastOid = ObjectIDField("l", default=ModelDefaultValueExt.Optional, allow_none=True)
+    Completed = BooleanField("d")
+    Owner = ObjectIDField("o", default=ModelDefaultValueExt.Optional, allow_none=True)
+    LeaseUntil = DateTimeField("ls", default=ModelDefaultValueExt.Optional, allow_none=True)
+
+
 class BotFeatureUsageModel(Model):
     """Model of a single bot feature usage."""
 
@@ -50,4 +81,26 @@ class BotFeatureUsageModel(Model):
     ChannelOid = ObjectIDField("ch", default=ModelDefaultValueExt.Required)
     SenderRootOid = ObjectIDField("u", default=ModelDefaultValueExt.Required, stores_uid=True)
 
+
+class MessageTraceSpanModel(Model):
+    """Model of a span in a sampled trace of the message handling. Unit of the time is milliseconds."""
+
+    WITH_OID = False
+
+    Name = TextField("n", default=ModelDefaultValueExt.Required, must_have_content=True, allow_none=False)
+    Parent = TextField("p", default=ModelDefaultValueExt.Optional, allow_none=True)
+    StartMs = FloatField("s", default=ModelDefaultValueExt.Required)
+    DurationMs = FloatField("d", default=ModelDefaultValueExt.Required)
+
+
+class MessageTraceModel(Model):
+    """Model of a sampled trace of the message handling. Unit of the time is milliseconds."""
+
+    Name = TextField("n", default=ModelDefaultValueExt.Required, must_have_content=True, allow_none=False)
+    ChannelOid = ObjectIDField("ch", default=ModelDefaultValueExt.Optional, allow_none=True)
+    MessageType = MessageTypeField("t", default=ModelDefaultValueExt.Optional)
+    DurationMs = FloatField("d", default=ModelDefaultValueExt.Required)
+    Spans = ModelArrayField("sp", MessageTraceSpanModel)
+    Timestamp = DateTimeField("e", default=ModelDefaultValueExt.Required)
+
 # endregion
@@ -0,0 +1,97 @@
+"""Result model objects for the message handling latency."""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+from extutils.tracing import percentile
+
+from .model import MessageTraceModel
+
+__all__ = ("LatencyPercentileEntry", "MessageLatencyResult",)
+
+
+# Fine for result objects to have 2 or less public methods
+# pylint: disable=too-few-public-methods
+
+
+@dataclass
+class LatencyPercentileEntry:
+    """Latency percentiles of a stage. Unit of the time is milliseconds."""
+
+    name: str
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+    @staticmethod
+    def from_durations(name: str, durations: List[float]) -> "LatencyPercentileEntry":
+        """
+        Create an entry from ``durations`` of the stage ``name``.
+
+        :param name: name of the stage
+        :param durations: durations of the stage in milliseconds
+        :return: entry of the stage
+        """
+        durations = sorted(durations)
+
+        return LatencyPercentileEntry(
+            name=name, count=len(durations),
+            p50=percentile(durations, 50), p90=percentile(durations, 90), p99=percentile(durations, 99),
+            max=durations[-1]
+        )
+
+
+class MessageLatencyResult:
+    """
+    Latency percentiles of the message handling calculated from the sampled traces.
+
+    --------
+
+    **Fields**
+
+    ``trace_count`` (``int``)
+        Count of the traces used for the calculation.
+
+    ``traces`` (``List[LatencyPercentileEntry]``)
+        Percentiles of the whole traces, grouped by the trace name (for example, the platform).
+
+    ``stages`` (``List[LatencyPercentileEntry]``)
+        Percentiles of each stage except the text handlers.
+
+    ``handlers`` (``List[LatencyPercentileEntry]``)
+        Percentiles of each text handler. The name of the entry is the name of the handler.
+
+    All entries are sorted by the 99th percentile (DESC).
+    """
+
+    HANDLER_PREFIX = "handler."
+    """Prefix of the name of the spans recording the execution of a text handler."""
+
+    def __init__(self, traces: Iterable[MessageTraceModel]):
+        trace_durations: Dict[str, List[float]] = defaultdict(list)
+        stage_durations: Dict[str, List[float]] = defaultdict(list)
+        handler_durations: Dict[str, List[float]] = defaultdict(list)
+
+        self.trace_count = 0
+
+        for trace in traces:
+            self.trace_count += 1
+            trace_durations[trace.name].append(trace.duration_ms)
+
+            for span in trace.spans:
+                if span.name.startswith(self.HANDLER_PREFIX):
+                    handler_durations[span.name[len(self.HANDLER_PREFIX):]].append(span.duration_ms)
+                else:
+                    stage_durations[span.name].append(span.duration_ms)
+
+        self.traces = self._to_entries(trace_durations)
+        self.stages = self._to_entries(stage_durations)
+        self.handlers = self._to_entries(handler_durations)
+
+    @staticmethod
+    def _to_entries(durations: Dict[str, List[float]]) -> List[LatencyPercentileEntry]:
+        return sorted((LatencyPercentileEntry.from_durations(name, durations_)
+                       for name, durations_ in durations.items()),
+                      key=lambda entry: entry.p99, reverse=True)
@@ -10,18 +10,22 @@ and another main user data connects that :class:`OnPlatformUserModel`.
 Besides any user identity or platform-specific controls, all accesses should
 use the ID of :class:`RootUserModel` as UID.
 """
-from typing import Optional
+from typing import Optional, Dict, Iterable
 
 from bson import ObjectId
-from cachetools import TTLCache
 
+from env_var import is_testing
 from models.exceptions import FieldKeyNotExistError
 from extutils.locales import DEFAULT_LOCALE, DEFAULT_LANGUAGE, LocaleInfo
+from extutils.namecache import TieredNameCache, MemoryNameCacheBackend, NameCacheBackend, CachedName
 from JellyBot.systemconfig import DataQuery
 from flags import ModelValidityCheckResult, Platform
 
 from ._base import Model
-from .field import PlatformField, TextField, ArrayField, ObjectIDField, ModelField, ModelDefaultValueExt
+from .field import (
+    PlatformField, TextField, ArrayField, ObjectIDField, ModelField, ModelDefaultValueExt, ModelArrayField,
+    IntegerField, BooleanField, DateTimeField
+)
 
 
 class RootUserConfigModel(Model):
@@ -117,20 +121,109 @@ class APIUserModel(Model):
                       allow_none=False, must_have_content=True)
 
 
-_user_name_cache_ = TTLCache(maxsize=DataQuery.UserNameCacheSize, ttl=DataQuery.UserNameExpirationSeconds)
+class UserIntegrationProgressModel(Model):
+    """
+    Progress of the user data integration on a single collection.
+
+    This should be placed in the field ``Progress`` of :class:`UserIntegrationJobModel`.
+
+    ``CollectionName`` is the planned full name (``<database>.<collection>``) of the collection.
+    ``FailedCount`` is the count of the documents in the batch which failed to be migrated and is pending a retry.
+    """
+
+    WITH_OID = False
+
+    CollectionName = TextField("c", default=ModelDefaultValueExt.Required, must_have_content=True)
+    LastOid = ObjectIDField("l", default=ModelDefaultValueExt.Optional, allow_none=True, readonly=False)
+    Count = IntegerField("n", positive_only=True)
+    FailedCount = IntegerField("f", positive_only=True)
+    Completed = BooleanField("d", default=False)
+
+
+class UserIntegrationJobModel(Model):
+    """
+    Model of a user data integration job.
+
+    The UIDs stored in the other collections will be replaced from ``SourceOid`` to ``DestinationOid`` in batches.
+    ``Progress`` records the progress of each collection, so the job can be resumed if it was interrupted.
+    ``Owner`` is the ID of the process running the job until ``LeaseUntil``.
+    """
+
+    SourceOid = ObjectIDField("src", default=ModelDefaultValueExt.Required)
+    DestinationOid = ObjectIDField("dst", default=ModelDefaultValueExt.Required)
+    Progress = ModelArrayField("p", UserIntegrationProgressModel, default=ModelDefaultValueExt.Required)
+    Completed = BooleanField("d", default=False)
+    CompletedAt = DateTimeField("dt", default=ModelDefaultValueExt.Optional)
+    Owner = ObjectIDField("o", default=ModelDefaultValueExt.Optional, allow_none=True)
+    LeaseUntil = DateTimeField("ls", default=ModelDefaultValueExt.Optional, allow_none=True)
+
+    def get_progress_report(self) -> str:
+        """
+        Get the report of the integration progress of each collection.
+
+        :return: integration progress report
+        """
+        lines = [f"User data integration: {self.source_oid} -> {self.destination_oid}"]
+
+        for progress in self.progress:
+            status = "Completed" if progress.completed else "In progress"
+            lines.append(f"{progress.collection_name}: {status} - {progress.count} migrated, "
+                         f"{progress.failed_count} failed (last: {progress.last_oid})")
+
+        return "\n".join(lines)
+
+
+class UserNameCacheModel(Model):
+    """Model of the user name cache entry shared across the processes. ``Id`` is the on-platform identity OID."""
+
+    Name = TextField("n", default=ModelDefaultValueExt.Required)
+    UpdatedAt = DateTimeField("u", default=ModelDefaultValueExt.Required)
+
+
+# Backend is replaced with the shared one by `set_uname_cache_backend()`
+_user_name_cache_ = TieredNameCache(
+    MemoryNameCacheBackend(maxsize=DataQuery.UserNameCacheSize, ttl=DataQuery.UserNameSharedCacheExpirySeconds),
+    local_size=DataQuery.UserNameCacheSize, local_ttl=DataQuery.UserNameLocalCacheSeconds,
+    stale_seconds=DataQuery.UserNameExpirationSeconds,
+    flush_size=DataQuery.UserNameCacheFlushSize, flush_interval=DataQuery.UserNameCacheFlushIntervalSeconds,
+    synchronous=is_testing()
+)
+
+
+def set_uname_cache_backend(backend: NameCacheBackend):
+    """
+    Set the backend of the user name cache.
+
+    The user names will be stored in the memory of the current process if the backend is not set.
+
+    :param backend: backend of the user name cache
+    """
+    _user_name_cache_.set_backend(backend)
 
 
 def set_uname_cache(onplat_oid: ObjectId, name: str):
     """
     Set the user name ``name`` of ``onplat_oid`` to the cache.
 
-    The cache data will expire the data once the size reaches ``DataQuery.UserNameCacheSize`` or
-    ``DataQuery.UserNameExpirationSeconds`` seconds passed from the time the name was being stored.
+    The user name will be considered stale and refreshed on the next ``OnPlatformUserModel.get_name()`` call
+    once ``DataQuery.UserNameExpirationSeconds`` seconds passed from the time the name was being stored.
 
     :param onplat_oid: OID of the on-platform identity (not the root OID)
     :param name: name of the user
     """
-    _user_name_cache_[onplat_oid] = name
+    _user_name_cache_.set(onplat_oid, name)
+
+
+def get_uname_cache_batch(onplat_oids: Iterable[ObjectId]) -> Dict[ObjectId, CachedName]:
+    """
+    Get the cached user names of ``onplat_oids`` by reading the cache backend at most once.
+
+    Users whose name is not cached will not be included in the returned result.
+
+    :param onplat_oids: OIDs of the on-platform identity (not the root OID)
+    :return: `dict` which key is the on-platform identity OID and value is the cached user name
+    """
+    return _user_name_cache_.get_many(onplat_oids)
 
 
 def clear_uname_cache():
@@ -164,9 +257,19 @@ class OnPlatformUserModel(Model):
         """
         # Checking `get_oid()` because the model might be constructed in the code (no ID) and
         # call `get_name()` afterward without storing it to the database
-        if not self.get_oid() or self.id in _user_name_cache_:
-            return _user_name_cache_.get(self.id)
+        if not self.get_oid():
+            return None
+
+        cached = _user_name_cache_.get(self.id)
+        if cached:
+            if cached.stale:
+                _user_name_cache_.refresh_async(self.id, lambda: self._fetch_name(channel_model))
 
+            return cached.name
+
+        return self._fetch_name(channel_model)
+
+    def _fetch_name(self, channel_model=None) -> Optional[str]:
         name = None
 
         # Get the user name according to the platform
@@ -202,6 +305,18 @@ class OnPlatformUserModel(Model):
 
         return name
 
+    def get_cached_name(self) -> Optional[str]:
+        """
+        Get the user name from the cache only. Returns ``None`` if not cached.
+
+        Unlike ``get_name()``, this never calls the platform API.
+
+        :return: cached user name if exists, `None` otherwise
+        """
+        cached = _user_name_cache_.get(self.id)
+
+        return cached.name if cached else None
+
     def get_name_str(self, channel_model=None) -> str:
         """
         Get the user name by calling ``get_name()``. Returns ``<TOKEN> (<PLATFORM>)`` if unavailable.
@@ -1,2 +1,3 @@
 from .execode import ExecodeCollationError, NoCompleteActionError
+from .page import InvalidPageTokenError
 from .sys import MongoURLNotFoundError
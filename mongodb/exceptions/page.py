@@ -0,0 +1,8 @@
+"""Exceptions related to the pagination."""
+
+
+class InvalidPageTokenError(ValueError):
+    """Raised if the page token cannot be decoded or it does not match the sort of the query."""
+
+    def __init__(self, token: str):
+        super().__init__(f"Invalid page token: {token}")
@@ -1,20 +1,23 @@
 """Various managers controlling different collections."""
 from typing import List, Type
 
-from .factory import MONGO_CLIENT, new_mongo_session
+from .factory import MONGO_CLIENT, new_mongo_session, ClientProfile, get_mongo_client, use_client_profile
 from .rpdata import PendingRepairDataManager
 from .channel import ChannelManager, ChannelCollectionManager
 from .prof_main import ProfileManager
 from .ar_conn import AutoReplyManager
-from .user import RootUserManager
-from .stats import APIStatisticsManager, MessageRecordStatisticsManager, BotFeatureUsageDataManager
+from .user import RootUserManager, UserIntegrationJobManager
+from .stats import (
+    APIStatisticsManager, MessageRecordStatisticsManager, MessageKeywordIndexManager, MessageKeywordBackfillManager,
+    BotFeatureUsageDataManager, MessageTraceManager
+)
 from .execode import ExecodeManager
 from .exctnt import ExtraContentManager
 from .shorturl import ShortUrlDataManager
 from .timer import TimerManager
 from .rmc import RemoteControlManager
 
-from ._base import BaseCollection
+from ._base import BaseCollection, wait_indexes_ready
 from ._dbctrl import SINGLE_DB_NAME, is_test_db, get_single_db_name
 
 from .mixin import GenerateTokenMixin, ControlExtensionMixin
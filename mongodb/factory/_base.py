@@ -1,50 +1,191 @@
 """Base class for all factorial classes."""
 import os
 from abc import ABC
-from threading import Thread
-from typing import final
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock, Thread
+from typing import final, Dict, List, Optional
 
 from django.conf import settings
 from pymongo.collection import Collection
+from pymongo.operations import IndexModel
 
 from JellyBot.systemconfig import Database
+from env_var import is_testing
 from extutils.mongo import get_codec_options
+from extutils.startup import STARTUP_PROFILER
 from mixin import ClearableMixin
 from models.utils import ModelFieldChecker
 from mongodb.utils import backup_collection
+from mongodb.utils.logger import logger
 from mongodb.factory import MONGO_CLIENT
 
+from .factory import ClientProfile, get_mongo_client, get_active_client_profile
+
 from ._dbctrl import SINGLE_DB_NAME
 from .mixin import ControlExtensionMixin
 
-__all__ = ("BaseCollection",)
+__all__ = ("BaseCollection", "wait_indexes_ready",)
+
+_index_executor = ThreadPoolExecutor(max_workers=Database.IndexVerifyWorkers, thread_name_prefix="IndexVerify")
+_index_futures: List[Future] = []
+_index_futures_lock = Lock()
+
+_INDEX_DOC_IGNORED_KEYS = ("key", "name")
+
+
+def _index_matches(index_info: Optional[dict], index_doc: dict) -> bool:
+    """Check if the existing index ``index_info`` from ``index_information()`` matches the spec ``index_doc``."""
+    if not index_info or list(index_info["key"]) != list(index_doc["key"].items()):
+        return False
+
+    return all(index_info.get(key) == value for key, value in index_doc.items() if key not in _INDEX_DOC_IGNORED_KEYS)
+
+
+def wait_indexes_ready(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until the indexes of all the initialized collections are verified.
+
+    :param timeout: max seconds to wait, `None` to wait indefinitely
+    :return: if all the indexes are verified before timeout
+    """
+    with _index_futures_lock:
+        futures = list(_index_futures)
+
+    _, not_done = wait(futures, timeout=timeout)
+
+    return not not_done
 
 
 class BaseCollection(ControlExtensionMixin, ClearableMixin, Collection, ABC):
-    """Base class for a collection instance."""
+    """
+    Base class for a collection instance.
+
+    Indexes to be created in ``build_indexes()`` are collected first,
+    then verified against the existing indexes in the background.
+    Only the indexes missing or different will be created.
+    Call ``wait_indexes_ready()`` to wait until the indexes of all collections are verified.
+
+    The collection is accessed using the client of ``client_profile``.
+    Reads in the methods decorated with ``use_client_profile()`` use the client of the decorated profile instead.
+    """
+
+    client_profile: ClientProfile = ClientProfile.DEFAULT
+
+    _index_specs: Optional[List[IndexModel]] = None
 
     def __init__(self):
-        self._db = MONGO_CLIENT.get_database(self.get_db_name())
+        with STARTUP_PROFILER.measure("Collection", type(self).__name__.lstrip("_")):
+            self._db = get_mongo_client(self.client_profile).get_database(self.get_db_name())
+            self._profile_collections: Dict[ClientProfile, Collection] = {}
+
+            super().__init__(self._db, self.get_col_name(), codec_options=get_codec_options())
+
+            self.get_model_cls()  # Dummy call to check if `model_class` has been defined
+
+            self._index_specs = []
+            self.build_indexes()
+            index_specs, self._index_specs = self._index_specs, None
 
-        super().__init__(self._db, self.get_col_name(), codec_options=get_codec_options())
+            if is_testing():
+                self._verify_indexes(index_specs)
+            else:
+                with _index_futures_lock:
+                    _index_futures.append(_index_executor.submit(self._verify_indexes, index_specs))
 
-        self.get_model_cls()  # Dummy call to check if `model_class` has been defined
+            self.on_init()
+            Thread(target=self.on_init_async).start()
 
-        self.build_indexes()
+    def create_index(self, keys, session=None, **kwargs):
+        # Collect the indexes to be verified later if called in `build_indexes()`
+        if self._index_specs is not None:
+            index_model = IndexModel(keys, **kwargs)
+            self._index_specs.append(index_model)
 
-        self.on_init()
-        Thread(target=self.on_init_async).start()
+            return index_model.document["name"]
+
+        return super().create_index(keys, session=session, **kwargs)
+
+    def get_profile_collection(self, profile: ClientProfile) -> Collection:
+        """
+        Get this collection accessed using the client of ``profile``.
+
+        :param profile: client profile to access this collection
+        :return: this collection accessed using the client of the profile
+        """
+        if profile == self.client_profile:
+            return self
+
+        collection = self._profile_collections.get(profile)
+        if collection is None:
+            collection = get_mongo_client(profile).get_database(self.get_db_name()).get_collection(
+                self.get_col_name(), codec_options=self.codec_options)
+            self._profile_collections[profile] = collection
+
+        return collection
+
+    def _get_read_collection(self) -> Optional[Collection]:
+        """Get the collection of the active client profile. Returns ``None`` if it is this collection."""
+        profile = get_active_client_profile()
+        if profile is None:
+            return None
+
+        collection = self.get_profile_collection(profile)
+
+        return None if collection is self else collection
+
+    def find(self, *args, **kwargs):
+        collection = self._get_read_collection()
+        if collection is not None:
+            return collection.find(*args, **kwargs)
+
+        return super().find(*args, **kwargs)
+
+    def aggregate(self, pipeline, session=None, **kwargs):
+        collection = self._get_read_collection()
+        if collection is not None:
+            return collection.aggregate(pipeline, session=session, **kwargs)
+
+        return super().aggregate(pipeline, session=session, **kwargs)
+
+    def count_documents(self, filter, session=None, **kwargs):  # pylint: disable=redefined-builtin
+        collection = self._get_read_collection()
+        if collection is not None:
+            return collection.count_documents(filter, session=session, **kwargs)
+
+        return super().count_documents(filter, session=session, **kwargs)
+
+    def _verify_indexes(self, index_specs: List[IndexModel]):
+        if not index_specs:
+            return
+
+        with STARTUP_PROFILER.measure("Index", self.full_name):
+            try:
+                existing = self.index_information()
+
+                missing = [index_model for index_model in index_specs
+                           if not _index_matches(existing.get(index_model.document["name"]), index_model.document)]
+                if missing:
+                    self.create_indexes(missing)
+            except Exception as ex:
+                logger.logger.error(f"Failed to verify the indexes of `{self.full_name}`. Error: {ex} ({type(ex)})")
+                raise
 
     @final
     def on_init(self):
-        """Method to be executed after all initializations completed."""
+        """
+        Method to be executed after all initializations completed.
+
+        Checks not required for the system to work are deferred until the system is ready.
+        """
         if not os.environ.get("NO_FIELD_CHECK") and not os.environ.get("TEST"):
-            ModelFieldChecker.check_async(self)
+            STARTUP_PROFILER.defer(f"Field check of {self.full_name}", lambda: ModelFieldChecker.check(self))
 
         if settings.PRODUCTION:
-            backup_collection(
-                MONGO_CLIENT, self.get_db_name(), self.get_col_name(),
-                SINGLE_DB_NAME is not None, Database.BackupIntervalSeconds)
+            STARTUP_PROFILER.defer(
+                f"Backup of {self.full_name}",
+                lambda: backup_collection(
+                    MONGO_CLIENT, self.get_db_name(), self.get_col_name(),
+                    SINGLE_DB_NAME is not None, Database.BackupIntervalSeconds))
 
     def on_init_async(self):
         """Hook method to be called asychronously on the initialization of this class."""
@@ -1,12 +1,18 @@
 """Data managers for the collection of auto-reply modules."""
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Tuple, Optional, List, Generator
+from threading import Thread, Lock
+from typing import Tuple, Optional, List, Generator, Dict, Iterable, FrozenSet
 
 import math
 import pymongo
 from bson import ObjectId
+from cachetools import TTLCache
+from pymongo import UpdateOne
 
-from JellyBot.systemconfig import AutoReply, Database, DataQuery, Bot
+from env_var import is_testing
+from JellyBot.systemconfig import AutoReply, Database, DataQuery, Bot, Pagination
 from extutils.utils import enumerate_ranking
 from extutils.checker import arg_type_ensure
 from extutils.color import ColorFactory
@@ -14,8 +20,8 @@ from extutils.dt import now_utc_aware
 from flags import ProfilePermission, AutoReplyContentType
 from mixin import ClearableMixin
 from models import (
-    AutoReplyModuleModel, AutoReplyModuleTagModel, AutoReplyTagPopularityScore, OID_KEY,
-    AutoReplyContentModel, UniqueKeywordCountResult
+    AutoReplyModuleModel, AutoReplyModuleTagModel, AutoReplyTagPopularityScore, AutoReplyTagPopularityModel,
+    OID_KEY, AutoReplyContentModel, UniqueKeywordCountResult
 )
 from models.exceptions import ModelConstructionError, ModelKeyNotExistError
 from models.utils import AutoReplyValidator
@@ -24,13 +30,16 @@ from mongodb.factory.results import (
     AutoReplyModuleAddResult, AutoReplyModuleTagGetResult
 )
 from mongodb.utils import (
-    ExtendedCursor, case_insensitive_collation
+    ExtendedCursor, KeysetPage, case_insensitive_collation, collation_fold
 )
 from mongodb.factory import ProfileManager
 
 from ._base import BaseCollection
+from .ar_kwver import AutoReplyKeywordVersionManager
+from .factory import ClientProfile, use_client_profile
 
-__all__ = ("AutoReplyManager", "AutoReplyModuleManager", "AutoReplyModuleTagManager",)
+__all__ = ("AutoReplyManager", "AutoReplyModuleManager", "AutoReplyModuleTagManager",
+           "AutoReplyTagPopularityManager",)
 
 DB_NAME = "ar"
 
@@ -38,12 +47,20 @@ DB_NAME = "ar"
 class _AutoReplyModuleManager(BaseCollection):
     """Class for managing the auto-reply modules."""
 
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "conn"
     model_class = AutoReplyModuleModel
 
     cache_name = f"{database_name}.{collection_name}"
 
+    # Shared by all instances because `AutoReplyManager` holds its own instance of this manager
+    # Channel OID to the normalized keywords and its type of the active modules, and the version of the keywords
+    _keyword_cache: "TTLCache[ObjectId, Tuple[FrozenSet[Tuple[str, int]], int]]" = \
+        TTLCache(maxsize=AutoReply.KeywordCacheSize, ttl=AutoReply.KeywordCacheExpirySeconds)
+    _keyword_cache_lock = Lock()
+    _keyword_cache_version = 0  # Bumped on every invalidation to prevent caching the stale keywords
+
     def build_indexes(self):
         # Using `_validate_content` to track the uniqueness of the modules instead of creating a index
         self.create_index(
@@ -53,6 +70,95 @@ class _AutoReplyModuleManager(BaseCollection):
              (AutoReplyModuleModel.Active.key, 1)],
             name="Index to get module")
 
+    @staticmethod
+    def _normalize_keyword(keyword: str) -> str:
+        if not AutoReply.CaseInsensitive:
+            return keyword
+
+        # Looser than `case_insensitive_collation`, so a keyword matching under the collation is never rejected
+        return collation_fold(keyword)
+
+    @classmethod
+    def _invalidate_keywords(cls, channel_oid: Optional[ObjectId] = None):
+        with cls._keyword_cache_lock:
+            cls._keyword_cache_version += 1
+
+            if channel_oid:
+                cls._keyword_cache.pop(channel_oid, None)
+            else:
+                cls._keyword_cache.clear()
+
+        if channel_oid:
+            AutoReplyKeywordVersionManager.bump(channel_oid)
+        else:
+            AutoReplyKeywordVersionManager.clear()
+
+    def _load_keywords(self, channel_oid: ObjectId) -> FrozenSet[Tuple[str, int]]:
+        projection = {AutoReplyModuleModel.KEY_KW_CONTENT: 1, AutoReplyModuleModel.KEY_KW_TYPE: 1}
+        filter_ = {AutoReplyModuleModel.ChannelOid.key: channel_oid, AutoReplyModuleModel.Active.key: True}
+
+        keywords = set()
+
+        for data in self.find(filter_, projection=projection):
+            keyword = data[AutoReplyModuleModel.Keyword.key]
+
+            keywords.add((self._normalize_keyword(str(keyword[AutoReplyContentModel.Content.key])),
+                          int(keyword[AutoReplyContentModel.ContentType.key])))
+
+        return frozenset(keywords)
+
+    def has_keyword(self, keyword: str, keyword_type: AutoReplyContentType, channel_oid: ObjectId) -> bool:
+        """
+        Check if ``channel_oid`` may have an active module which keyword is ``keyword``.
+
+        The keywords of a channel will be loaded and cached on the first call.
+        The cache of a channel will be invalidated when a module of the channel is added.
+        Removed modules stay in the cache until it expires, which only gives false positives.
+
+        If ``keyword`` is not in the cache, the shared version of the keywords is checked
+        to reload the keywords outdated by the modules added in the other processes.
+        The version is cached for a few seconds, so a miss usually does not query the database.
+
+        :param keyword: keyword of the module
+        :param keyword_type: type of the keyword of the module
+        :param channel_oid: channel of the module
+        :return: if the channel may have an active module with `keyword`
+        """
+        entry = (self._normalize_keyword(keyword), int(keyword_type))
+
+        with self._keyword_cache_lock:
+            cached = self._keyword_cache.get(channel_oid)
+            local_version = self._keyword_cache_version
+
+        if cached and entry in cached[0]:
+            return True
+
+        # Get the version before loading the keywords, so the modules added during the loading outdate the cache
+        version = AutoReplyKeywordVersionManager.get_version(channel_oid)
+        if cached and cached[1] == version:
+            return False
+
+        keywords = self._load_keywords(channel_oid)
+
+        with self._keyword_cache_lock:
+            if local_version == self._keyword_cache_version:
+                self._keyword_cache[channel_oid] = (keywords, version)
+
+        return entry in keywords
+
+    def insert_one_model(self, model: AutoReplyModuleModel) -> Tuple[WriteOutcome, Optional[Exception]]:
+        outcome, ex = super().insert_one_model(model)
+
+        if outcome.is_success:
+            self._invalidate_keywords(model.channel_oid)
+
+        return outcome, ex
+
+    def clear(self):
+        super().clear()
+
+        self._invalidate_keywords()
+
     @staticmethod
     def _has_access_to_pinned(channel_oid: ObjectId, user_oid: ObjectId):
         perms = ProfileManager.get_user_permissions(channel_oid, user_oid)
@@ -103,16 +209,21 @@ class _AutoReplyModuleManager(BaseCollection):
         """Delete modules which is created and marked inactive within `Bot.AutoReply.DeleteDataMins` minutes."""
         now = now_utc_aware()
 
-        self.delete_many(
-            {
-                OID_KEY: {
-                    "$gt": ObjectId.from_datetime(now - timedelta(minutes=Bot.AutoReply.DeleteDataMins))
-                },
-                AutoReplyModuleModel.KEY_KW_CONTENT: keyword,
-                AutoReplyModuleModel.Active.key: False
+        filter_ = {
+            OID_KEY: {
+                "$gt": ObjectId.from_datetime(now - timedelta(minutes=Bot.AutoReply.DeleteDataMins))
             },
-            collation=case_insensitive_collation if AutoReply.CaseInsensitive else None
-        )
+            AutoReplyModuleModel.KEY_KW_CONTENT: keyword,
+            AutoReplyModuleModel.Active.key: False
+        }
+        collation = case_insensitive_collation if AutoReply.CaseInsensitive else None
+
+        removed = list(self.find_cursor_with_count(filter_, collation=collation))
+        if not removed:
+            return
+
+        self.delete_many({OID_KEY: {"$in": [mdl.id for mdl in removed]}})
+        AutoReplyTagPopularityManager.on_modules_removed(removed)
 
     @staticmethod
     @arg_type_ensure
@@ -190,6 +301,9 @@ class _AutoReplyModuleManager(BaseCollection):
 
         outcome, ex = self.insert_one_model(mdl)
 
+        if outcome.is_inserted:
+            AutoReplyTagPopularityManager.on_modules_added([mdl])
+
         # Duplication was already checked when validating the content
         # However, the module ID is not acquired during check, so the module insertion still performed
         if outcome == WriteOutcome.O_DATA_EXISTS:
@@ -199,6 +313,7 @@ class _AutoReplyModuleManager(BaseCollection):
             self.update_many(
                 {AutoReplyModuleModel.Id.key: mdl.id},
                 {"$set": {AutoReplyModuleModel.Active.key: True}})
+            self._invalidate_keywords(mdl.channel_oid)
 
         if outcome.is_success:  # pylint: disable=no-member
             # Set other module with the same keyword to be inactive
@@ -317,6 +432,33 @@ class _AutoReplyModuleManager(BaseCollection):
         :param active_only: if to return active modules only
         :return: a cursor yielding the modules which match the given conditions
         """
+        return self.find_cursor_with_count(self._get_conn_list_filter(channel_oid, keyword, active_only),
+                                           sort=[(AutoReplyModuleModel.CalledCount.key, pymongo.DESCENDING)])
+
+    def get_conn_page(self, channel_oid: ObjectId, keyword: Optional[str] = None, *, active_only: bool = True,
+                      limit: int, page_token: Optional[str] = None, with_count: bool = False) \
+            -> KeysetPage[AutoReplyModuleModel]:
+        """
+        Get a page of the auto-reply module list in ``channel_oid`` with ``keyword``.
+
+        The conditions and the sort are the same as :meth:`get_conn_list()`.
+
+        :param channel_oid: channel of the module(s)
+        :param keyword: keyword to filter the returning module(s)
+        :param active_only: if to return active modules only
+        :param limit: max count of the modules in a page
+        :param page_token: `next_token` of the previous page, `None` to get the first page
+        :param with_count: if to count the total count of the modules
+        :return: a page of the modules which match the given conditions
+        :raises InvalidPageTokenError: `page_token` is invalid
+        """
+        return self.find_page(self._get_conn_list_filter(channel_oid, keyword, active_only),
+                              [(AutoReplyModuleModel.CalledCount.key, pymongo.DESCENDING)],
+                              limit=limit, page_token=page_token, with_count=with_count,
+                              count_cap=Pagination.CountCap)
+
+    @staticmethod
+    def _get_conn_list_filter(channel_oid: ObjectId, keyword: Optional[str], active_only: bool) -> dict:
         filter_ = {AutoReplyModuleModel.ChannelOid.key: channel_oid}
 
         if keyword:
@@ -325,7 +467,7 @@ class _AutoReplyModuleManager(BaseCollection):
         if active_only:
             filter_[AutoReplyModuleModel.Active.key] = True
 
-        return self.find_cursor_with_count(filter_, sort=[(AutoReplyModuleModel.CalledCount.key, pymongo.DESCENDING)])
+        return filter_
 
     def get_conn_list_oids(self, conn_oids: List[ObjectId]) -> ExtendedCursor[AutoReplyModuleModel]:
         """
@@ -337,6 +479,7 @@ class _AutoReplyModuleManager(BaseCollection):
         return self.find_cursor_with_count({OID_KEY: {"$in": conn_oids}},
                                            sort=[(AutoReplyModuleModel.CalledCount.key, pymongo.DESCENDING)])
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def get_module_count_stats(self, channel_oid: ObjectId, limit: Optional[int] = None) \
             -> ExtendedCursor[AutoReplyModuleModel]:
         """
@@ -353,6 +496,7 @@ class _AutoReplyModuleManager(BaseCollection):
 
         return ret
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def get_unique_keyword_count_stats(self, channel_oid: ObjectId, limit: Optional[int] = None) \
             -> UniqueKeywordCountResult:
         """
@@ -446,94 +590,213 @@ class _AutoReplyModuleTagManager(BaseCollection):
         """
         return self.find_one_casted({OID_KEY: tag_oid})
 
+    def get_tag_data_dict(self, tag_oids: List[ObjectId]) -> Dict[ObjectId, AutoReplyModuleTagModel]:
+        """
+        Get a :class:`dict` which key is the tag OID and value is its corresponding ``AutoReplyModuleTagModel``.
 
-class _AutoReplyManager(ClearableMixin):
-    """Main manager for auto-reply modules."""
+        Tags that do not exist will not be included in the returned :class:`dict`.
 
-    def __init__(self):
-        self._mod = _AutoReplyModuleManager()
-        self._tag = _AutoReplyModuleTagManager()
+        :param tag_oids: OIDs of the tags to get
+        :return: a `dict` which key is the tag OID and value is its corresponding `AutoReplyModuleTagModel`
+        """
+        return {model.id: model for model in self.find_cursor_with_count({OID_KEY: {"$in": tag_oids}})}
 
-    def clear(self):
-        self._mod.clear()
-        self._tag.clear()
 
-    def _get_tags_pop_score(self, filter_word: str = None, count: int = DataQuery.TagPopularitySearchCount) \
-            -> List[AutoReplyTagPopularityScore]:
+class _AutoReplyTagPopularityManager(BaseCollection):
+    """
+    Class for managing the materialized popularity scores of the auto-reply tags.
+
+    The scores are updated incrementally on the module addition and removal.
+    The time-weighting part of the score decays over time, so the scores are periodically recalculated
+    from the modules every ``Database.PopularityConfig.ReconcileIntervalSeconds`` seconds.
+
+    .. seealso::
+        Time Past Weighting: https://www.desmos.com/calculator/db92kdecxa
+        Appearance Weighting: https://www.desmos.com/calculator/a2uv5pqqku
+    """
+
+    database_name = DB_NAME
+    collection_name = "tagpop"
+    model_class = AutoReplyTagPopularityModel
+
+    def build_indexes(self):
+        self.create_index([(AutoReplyTagPopularityModel.Score.key, pymongo.DESCENDING)], name="Popularity Score")
+
+    def on_init_async(self):
+        super().on_init_async()
+
+        if not is_testing():
+            Thread(target=self._reconcile_thread, daemon=True).start()
+
+    def _reconcile_thread(self):
+        while True:
+            self.reconcile()
+
+            time.sleep(Database.PopularityConfig.ReconcileIntervalSeconds)
+
+    @staticmethod
+    def _get_time_weight(module_oid: ObjectId, now: datetime) -> float:
+        hrs_past = (now - module_oid.generation_time).total_seconds() / 3600
+
+        return Database.PopularityConfig.TimeCoeffA / (
+            1 + math.exp(Database.PopularityConfig.TimeCoeffB
+                         * (hrs_past - Database.PopularityConfig.TimeDiffIntersectHr)))
+
+    @staticmethod
+    def _get_score_stages() -> List[dict]:
+        """Get the pipeline stages calculating the score using the appearances and the sum of the time weights."""
+        key_app = "$" + AutoReplyTagPopularityModel.Appearances.key
+
+        return [
+            {"$addFields": {
+                AutoReplyTagPopularityModel.WeightedAvgTimeDiff.key: {"$cond": [
+                    {"$gt": [key_app, 0]},
+                    {"$divide": ["$" + AutoReplyTagPopularityModel.WeightedTimeDiffSum.key, key_app]},
+                    0
+                ]},
+                AutoReplyTagPopularityModel.WeightedAppearances.key: {
+                    "$multiply": [
+                        Database.PopularityConfig.AppearanceCoeffA,
+                        {"$pow": [key_app, Database.PopularityConfig.AppearanceFunctionCoeff]}
+                    ]
+                }
+            }},
+            {"$addFields": {
+                AutoReplyTagPopularityModel.Score.key: {
+                    "$subtract": [
+                        {"$multiply": [
+                            Database.PopularityConfig.AppearanceEquivalentWHr,
+                            "$" + AutoReplyTagPopularityModel.WeightedAppearances.key
+                        ]},
+                        "$" + AutoReplyTagPopularityModel.WeightedAvgTimeDiff.key
+                    ]
+                }
+            }}
+        ]
+
+    def _apply_deltas(self, deltas: Dict[ObjectId, List[float]]):
+        if not deltas:
+            return
+
+        key_app = AutoReplyTagPopularityModel.Appearances.key
+        key_w_sum = AutoReplyTagPopularityModel.WeightedTimeDiffSum.key
+
+        self.bulk_write([
+            UpdateOne(
+                {OID_KEY: tag_oid},
+                [
+                    {"$addFields": {
+                        key_app: {"$add": [{"$ifNull": ["$" + key_app, 0]}, app_delta]},
+                        key_w_sum: {"$add": [{"$ifNull": ["$" + key_w_sum, 0]}, w_sum_delta]}
+                    }}
+                ] + self._get_score_stages(),
+                upsert=True
+            )
+            for tag_oid, (app_delta, w_sum_delta) in deltas.items()
+        ], ordered=False)
+
+        self.delete_many({key_app: {"$lte": 0}})
+
+    def _get_deltas(self, modules: Iterable[AutoReplyModuleModel], sign: int) -> Dict[ObjectId, List[float]]:
+        now = now_utc_aware()
+        deltas = defaultdict(lambda: [0, 0.0])  # Tag OID -> [Appearances, Time weight sum]
+
+        for module in modules:
+            weight = self._get_time_weight(module.id, now)
+
+            for tag_oid in module.tag_ids:
+                deltas[tag_oid][0] += sign
+                deltas[tag_oid][1] += sign * weight
+
+        return deltas
+
+    def on_modules_added(self, modules: Iterable[AutoReplyModuleModel]):
         """
-        Get the tag popularity score.
+        Update the popularity scores of the tags of ``modules`` which were just added.
 
-        .. seealso::
-            Time Past Weighting: https://www.desmos.com/calculator/db92kdecxa
-            Appearance Weighting: https://www.desmos.com/calculator/a2uv5pqqku
+        :param modules: modules added
         """
-        pipeline = []
-        filter_ = {
-            AutoReplyModuleModel.TagIds.key: {"$in": [tag_data.id for tag_data in self._tag.search_tags(filter_word)]}
-        }
+        self._apply_deltas(self._get_deltas(modules, 1))
+
+    def on_modules_removed(self, modules: Iterable[AutoReplyModuleModel]):
+        """
+        Update the popularity scores of the tags of ``modules`` which were just deleted.
 
-        if filter_word:
-            pipeline.append({"$match": filter_})
-
-        pipeline.append({"$unwind": "$" + AutoReplyModuleModel.TagIds.key})
-        pipeline.append({"$group": {
-            OID_KEY: "$" + AutoReplyModuleModel.TagIds.key,
-            AutoReplyTagPopularityScore.KEY_W_AVG_TIME_DIFF: {
-                "$avg": {
-                    "$divide": [
-                        Database.PopularityConfig.TimeCoeffA,
-                        {"$add": [
-                            1,
-                            {"$pow": [
-                                math.e,
-                                {"$multiply": [
-                                    Database.PopularityConfig.TimeCoeffB,
-                                    {"$subtract": [
-                                        {"$divide": [
-                                            {"$subtract": [
-                                                {"$toDate": ObjectId.from_datetime(datetime.utcnow())},
-                                                {"$toDate": "$" + OID_KEY}
+        :param modules: modules deleted
+        """
+        self._apply_deltas(self._get_deltas(modules, -1))
+
+    def reconcile(self):
+        """Recalculate the popularity scores of all tags from the auto-reply modules."""
+        pipeline = [
+            {"$unwind": "$" + AutoReplyModuleModel.TagIds.key},
+            {"$group": {
+                OID_KEY: "$" + AutoReplyModuleModel.TagIds.key,
+                AutoReplyTagPopularityModel.WeightedTimeDiffSum.key: {
+                    "$sum": {
+                        "$divide": [
+                            Database.PopularityConfig.TimeCoeffA,
+                            {"$add": [
+                                1,
+                                {"$pow": [
+                                    math.e,
+                                    {"$multiply": [
+                                        Database.PopularityConfig.TimeCoeffB,
+                                        {"$subtract": [
+                                            {"$divide": [
+                                                {"$subtract": [
+                                                    {"$toDate": ObjectId.from_datetime(datetime.utcnow())},
+                                                    {"$toDate": "$" + OID_KEY}
+                                                ]},
+                                                3600000
                                             ]},
-                                            3600000
-                                        ]},
-                                        Database.PopularityConfig.TimeDiffIntersectHr
+                                            Database.PopularityConfig.TimeDiffIntersectHr
+                                        ]}
                                     ]}
                                 ]}
                             ]}
-                        ]}
-                    ]
-                }
-            },
-            AutoReplyTagPopularityScore.KEY_APPEARANCE: {"$sum": 1}
-        }})
-        pipeline.append({"$addFields": {
-            AutoReplyTagPopularityScore.KEY_W_APPEARANCE: {
-                "$multiply": [
-                    Database.PopularityConfig.AppearanceCoeffA,
-                    {"$pow": [
-                        "$" + AutoReplyTagPopularityScore.KEY_APPEARANCE,
-                        Database.PopularityConfig.AppearanceFunctionCoeff
-                    ]}
-                ]
-            }
-        }})
-        pipeline.append({"$addFields": {
-            AutoReplyTagPopularityScore.SCORE: {
-                "$subtract": [
-                    {"$multiply": [
-                        Database.PopularityConfig.AppearanceEquivalentWHr,
-                        "$" + AutoReplyTagPopularityScore.KEY_W_APPEARANCE
-                    ]},
-                    "$" + AutoReplyTagPopularityScore.KEY_W_AVG_TIME_DIFF
-                ]
-            }
-        }})
-        pipeline.append({"$sort": {
-            AutoReplyTagPopularityScore.SCORE: pymongo.DESCENDING
-        }})
-        pipeline.append({"$limit": count})
+                        ]
+                    }
+                },
+                AutoReplyTagPopularityModel.Appearances.key: {"$sum": 1}
+            }}
+        ]
+        pipeline.extend(self._get_score_stages())
+        pipeline.append({"$out": self.get_col_name()})
+
+        list(AutoReplyModuleManager.aggregate(pipeline))
+
+    def get_scores(self, tag_oids: Optional[List[ObjectId]] = None,
+                   count: int = DataQuery.TagPopularitySearchCount) -> List[AutoReplyTagPopularityScore]:
+        """
+        Get the popularity scores sorted by the score (DESC).
+
+        All tags will be considered if ``tag_oids`` is ``None``.
+
+        :param tag_oids: OIDs of the tags to get the scores
+        :param count: count of the scores to get
+        :return: list of the popularity scores
+        """
+        filter_ = {}
+        if tag_oids is not None:
+            filter_[OID_KEY] = {"$in": tag_oids}
 
-        return [AutoReplyTagPopularityScore.parse(doc) for doc in self._mod.aggregate(pipeline)]
+        return [AutoReplyTagPopularityScore.parse(doc)
+                for doc in self.find(filter_, sort=[(AutoReplyTagPopularityModel.Score.key, pymongo.DESCENDING)],
+                                     limit=count)]
+
+
+class _AutoReplyManager(ClearableMixin):
+    """Main manager for auto-reply modules."""
+
+    def __init__(self):
+        self._mod = _AutoReplyModuleManager()
+        self._tag = _AutoReplyModuleTagManager()
+
+    def clear(self):
+        self._mod.clear()
+        self._tag.clear()
+        AutoReplyTagPopularityManager.clear()
 
     def add_conn(self, **kwargs) -> AutoReplyModuleAddResult:
         """
@@ -576,6 +839,20 @@ class _AutoReplyManager(ClearableMixin):
         """
         return self._mod.module_mark_inactive(keyword, channel_oid, remover_oid)
 
+    def has_keyword(self, keyword: str, keyword_type: AutoReplyContentType, channel_oid: ObjectId) -> bool:
+        """
+        Check if ``channel_oid`` may have an active module which keyword is ``keyword``.
+
+        This is a cheap check that could give false positives, so it can be used to skip
+        the module lookup of :meth:`get_responses()`.
+
+        :param keyword: keyword of the module
+        :param keyword_type: type of the keyword of the module
+        :param channel_oid: channel of the module
+        :return: if the channel may have an active module with `keyword`
+        """
+        return self._mod.has_keyword(keyword, keyword_type, channel_oid)
+
     def get_responses(self, keyword: str, keyword_type: AutoReplyContentType, channel_oid: ObjectId, *,
                       update_async: bool = True) \
             -> List[Tuple[AutoReplyContentModel, bool]]:
@@ -609,14 +886,14 @@ class _AutoReplyManager(ClearableMixin):
         :param count: count of the tags to get
         :return: list of the tag names
         """
-        ret = []
+        tag_oids = None
+        if search_keyword:
+            tag_oids = [tag_data.id for tag_data in self._tag.search_tags(search_keyword)]
 
-        for pop_score in self._get_tags_pop_score(search_keyword, count):
-            tag_data = self._tag.get_tag_data(pop_score.tag_id)
-            if tag_data:
-                ret.append(tag_data.name)
+        pop_scores = AutoReplyTagPopularityManager.get_scores(tag_oids, count)
+        tag_dict = self._tag.get_tag_data_dict([pop_score.tag_id for pop_score in pop_scores])
 
-        return ret
+        return [tag_dict[pop_score.tag_id].name for pop_score in pop_scores if pop_score.tag_id in tag_dict]
 
     def tag_get_insert(self, name, color=ColorFactory.DEFAULT) -> AutoReplyModuleTagGetResult:
         """
@@ -646,6 +923,26 @@ class _AutoReplyManager(ClearableMixin):
         """
         return self._mod.get_conn_list(channel_oid, keyword, active_only=active_only)
 
+    def get_conn_page(self, channel_oid: ObjectId, keyword: Optional[str] = None, *, active_only: bool = True,
+                      limit: int, page_token: Optional[str] = None, with_count: bool = False) \
+            -> KeysetPage[AutoReplyModuleModel]:
+        """
+        Get a page of the auto-reply module list in ``channel_oid`` with ``keyword``.
+
+        The conditions and the sort are the same as :meth:`get_conn_list()`.
+
+        :param channel_oid: channel of the module(s)
+        :param keyword: keyword to filter the returning module(s)
+        :param active_only: if to return active modules only
+        :param limit: max count of the modules in a page
+        :param page_token: `next_token` of the previous page, `None` to get the first page
+        :param with_count: if to count the total count of the modules
+        :return: a page of the modules which match the given conditions
+        :raises InvalidPageTokenError: `page_token` is invalid
+        """
+        return self._mod.get_conn_page(channel_oid, keyword, active_only=active_only,
+                                       limit=limit, page_token=page_token, with_count=with_count)
+
     def get_conn_list_oids(self, conn_oids: List[ObjectId]) -> ExtendedCursor[AutoReplyModuleModel]:
         """
         Get a list of auto-reply modules sorted by used count (DESC) using the provided OIDs ``conn_oids``.
@@ -688,3 +985,4 @@ class _AutoReplyManager(ClearableMixin):
 AutoReplyManager = _AutoReplyManager()
 AutoReplyModuleManager = _AutoReplyModuleManager()
 AutoReplyModuleTagManager = _AutoReplyModuleTagManager()
+AutoReplyTagPopularityManager = _AutoReplyTagPopularityManager()
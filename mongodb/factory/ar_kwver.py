@@ -0,0 +1,79 @@
+"""Data manager for the versions of the auto-reply keywords."""
+from threading import Lock
+
+from bson import ObjectId
+from cachetools import TTLCache
+
+from JellyBot.systemconfig import AutoReply
+from models import OID_KEY, AutoReplyKeywordVersionModel
+
+from ._base import BaseCollection
+from .factory import ClientProfile
+
+__all__ = ("AutoReplyKeywordVersionManager",)
+
+DB_NAME = "ar"
+
+
+class _AutoReplyKeywordVersionManager(BaseCollection):
+    """
+    Class for managing the versions of the auto-reply keywords of each channel.
+
+    The versions are shared across the processes to detect the keyword cache
+    outdated by the modules added in the other processes.
+
+    The versions fetched are cached for ``AutoReply.KeywordVersionCacheSeconds``,
+    so the modules added in the other processes are detected within that period.
+    """
+
+    client_profile = ClientProfile.HOT_PATH
+    database_name = DB_NAME
+    collection_name = "kwver"
+    model_class = AutoReplyKeywordVersionModel
+
+    def __init__(self):
+        super().__init__()
+
+        # Channel OID to the version of the keywords
+        self._version_cache: "TTLCache[ObjectId, int]" = \
+            TTLCache(maxsize=AutoReply.KeywordCacheSize, ttl=AutoReply.KeywordVersionCacheSeconds)
+        self._version_cache_lock = Lock()
+
+    def get_version(self, channel_oid: ObjectId) -> int:
+        """
+        Get the current version of the keywords of ``channel_oid``.
+
+        :param channel_oid: channel to get the version
+        :return: version of the keywords of the channel
+        """
+        with self._version_cache_lock:
+            version = self._version_cache.get(channel_oid)
+
+        if version is None:
+            data = self.find_one({OID_KEY: channel_oid}, projection={AutoReplyKeywordVersionModel.Version.key: 1})
+            version = data[AutoReplyKeywordVersionModel.Version.key] if data else 0
+
+            with self._version_cache_lock:
+                self._version_cache[channel_oid] = version
+
+        return version
+
+    def bump(self, channel_oid: ObjectId):
+        """
+        Increase the version of the keywords of ``channel_oid``.
+
+        :param channel_oid: channel to increase the version
+        """
+        self.update_one({OID_KEY: channel_oid}, {"$inc": {AutoReplyKeywordVersionModel.Version.key: 1}}, upsert=True)
+
+        with self._version_cache_lock:
+            self._version_cache.pop(channel_oid, None)
+
+    def clear(self):
+        super().clear()
+
+        with self._version_cache_lock:
+            self._version_cache.clear()
+
+
+AutoReplyKeywordVersionManager = _AutoReplyKeywordVersionManager()
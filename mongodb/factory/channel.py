@@ -15,6 +15,7 @@ from mongodb.factory.results import (
 )
 
 from ._base import BaseCollection
+from .factory import ClientProfile
 
 __all__ = ("ChannelManager", "ChannelCollectionManager",)
 
@@ -24,6 +25,7 @@ DB_NAME = "channel"
 class _ChannelManager(BaseCollection):
     """Class to manage the channel data."""
 
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "dict"
     model_class = ChannelModel
@@ -52,18 +54,26 @@ class _ChannelManager(BaseCollection):
 
         # Inline import to avoid cyclic import
         from mongodb.factory import ProfileManager  # pylint: disable=import-outside-toplevel
+        from mongodb.factory.prof_base import ProfileDataManager  # pylint: disable=import-outside-toplevel
 
+        # Create the default profile first, so the channel is never visible without its default profile
         channel_oid = ObjectId()
+        profile_oid = ObjectId()
         create_result = ProfileManager.create_default_profile(
-            channel_oid, set_to_channel=False, check_channel=False)
+            channel_oid, set_to_channel=False, check_channel=False, profile_oid=profile_oid)
 
         if not create_result.success:
             return ChannelRegistrationResult(WriteOutcome.X_CNL_DEFAULT_CREATE_FAILED)
 
-        config = ChannelConfigModel.generate_default(
-            DefaultName=default_name, DefaultProfileOid=create_result.model.id)
+        config = ChannelConfigModel.generate_default(DefaultName=default_name, DefaultProfileOid=profile_oid)
 
-        mdl, outcome, ex = self.insert_one_data(Id=channel_oid, Platform=platform, Token=token, Config=config)
+        mdl, outcome, ex = self.upsert_one_data(
+            {ChannelModel.Platform.key: platform, ChannelModel.Token.key: token},
+            Id=channel_oid, Platform=platform, Token=token, Config=config)
+
+        # Remove the orphan profile if the channel was registered concurrently or failed to register
+        if not outcome.is_inserted:
+            ProfileDataManager.delete_one({OID_KEY: profile_oid})
 
         return ChannelRegistrationResult(outcome, ex, mdl)
 
@@ -212,15 +222,19 @@ class _ChannelManager(BaseCollection):
         return {model.id: model for model in self.find_cursor_with_count(filter_)}
 
     @arg_type_ensure
-    def get_channel_default_name(self, default_name: str, *, hide_private: bool = True) \
+    def get_channel_default_name(self, default_name: str, *, hide_private: bool = True,
+                                 channel_oids: Optional[List[ObjectId]] = None) \
             -> ExtendedCursor[ChannelModel]:
         """
         Get a list of channels which default name or token contains a part or all of ``default_name``.
 
+        If ``channel_oids`` is given, only the channels in ``channel_oids`` will be searched.
+
         Returned result will be sorted by channel OID (DESC).
 
         :param default_name: default name or part of the token of a channel
         :param hide_private: hide private channel from this search
+        :param channel_oids: OIDs of the channels to be searched
         :return: a cursor yielding the channels that match the conditions
         """
         filter_ = {
@@ -238,6 +252,9 @@ class _ChannelManager(BaseCollection):
         if hide_private:
             filter_[f"{ChannelModel.Config.key}.{ChannelConfigModel.InfoPrivate.key}"] = False
 
+        if channel_oids is not None:
+            filter_[OID_KEY] = {"$in": channel_oids}
+
         return self.find_cursor_with_count(filter_, sort=[(ChannelModel.Id.key, pymongo.DESCENDING)])
 
     def get_channel_packed(self, platform: Platform, token: str) -> ChannelGetResult:
@@ -296,8 +313,6 @@ class _ChannelCollectionManager(BaseCollection):
     However, in Discord, this concept is called a server (guild in ``discord.py``).
     """
 
-    # TEST: ChannelCollectionManager
-
     database_name = DB_NAME
     collection_name = "collection"
     model_class = ChannelCollectionModel
@@ -334,13 +349,11 @@ class _ChannelCollectionManager(BaseCollection):
         if not default_name:
             default_name = f"{token} ({platform.key})"
 
-        entry, outcome, ex = self.insert_one_data(
+        entry, outcome, ex = self.upsert_one_data(
+            {ChannelCollectionModel.Platform.key: platform, ChannelCollectionModel.Token.key: token},
+            {"$addToSet": {ChannelCollectionModel.ChildChannelOids.key: child_channel_oid}},
             DefaultName=default_name, Platform=platform, Token=token, ChildChannelOids=[child_channel_oid])
 
-        if outcome.data_found:
-            entry = self.get_chcoll(platform, token)
-            self.append_child_channel(entry.id, child_channel_oid)
-
         return ChannelCollectionRegistrationResult(outcome, ex, entry)
 
     @arg_type_ensure
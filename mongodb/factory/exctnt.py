@@ -1,11 +1,14 @@
 """Data manager for extra contents."""
+from threading import Lock
 from typing import Optional, Any, List, Tuple
 
 from bson import ObjectId
+from cachetools import TTLCache
 
 from JellyBot.systemconfig import Database
 from flags import ExtraContentType
 from models import ExtraContentModel, OID_KEY
+from models.exctnt import ExtraContentHTMLTransformer
 from mongodb.factory.results import RecordExtraContentResult, WriteOutcome
 from extutils.dt import now_utc_aware
 from extutils.checker import arg_type_ensure
@@ -25,6 +28,15 @@ class _ExtraContentManager(BaseCollection):
 
     DefaultTitle = "-"
 
+    def __init__(self):
+        super().__init__()
+
+        # Extra contents are immutable once recorded, so the cached data never becomes stale before its expiry.
+        # Content OID to the model and its HTML precomputed at the record time (`None` if not precomputed)
+        self._cache: "TTLCache[ObjectId, Tuple[ExtraContentModel, Optional[str]]]" = \
+            TTLCache(maxsize=Database.ExtraContentCacheSize, ttl=Database.ExtraContentCacheExpirySeconds)
+        self._cache_lock = Lock()
+
     def build_indexes(self):
         self.create_index(ExtraContentModel.Timestamp.key,
                           expireAfterSeconds=Database.ExtraContentExpirySeconds, name="Timestamp")
@@ -68,6 +80,15 @@ class _ExtraContentManager(BaseCollection):
         model, outcome, ex = self.insert_one_data(
             Type=type_, Title=title, Content=content, Timestamp=now_utc_aware(for_mongo=True), ChannelOid=channel_oid)
 
+        if outcome.is_inserted:
+            # Links to the extra content are usually opened by many users right after being sent
+            html = None
+            if ExtraContentHTMLTransformer.is_language_independent(model):
+                html = model.content_html
+
+            with self._cache_lock:
+                self._cache[model.id] = (model, html)
+
         return RecordExtraContentResult(outcome, ex, model)
 
     @arg_type_ensure
@@ -80,7 +101,50 @@ class _ExtraContentManager(BaseCollection):
         :param content_id: OID of the extra content to get
         :return: a `ExtraContentModel` if found, `None` otherwise
         """
-        return self.find_one_casted({OID_KEY: content_id})
+        return self._get_cached(content_id)[0]
+
+    def get_content_html(self, model: ExtraContentModel) -> str:
+        """
+        Get the HTML of the extra content ``model``.
+
+        The HTML precomputed when recording ``model`` will be returned if available.
+
+        :param model: extra content to get the HTML
+        :return: HTML of the extra content
+        """
+        with self._cache_lock:
+            cached = self._cache.get(model.id)
+
+        if cached and cached[1] is not None:
+            return cached[1]
+
+        return model.content_html
+
+    def _get_cached(self, content_id: ObjectId) -> Tuple[Optional[ExtraContentModel], Optional[str]]:
+        now = now_utc_aware()
+
+        with self._cache_lock:
+            cached = self._cache.get(content_id)
+
+        if cached:
+            if cached[0].expires_on > now:
+                return cached
+
+            with self._cache_lock:
+                self._cache.pop(content_id, None)
+
+        model = self.find_one_casted({OID_KEY: content_id})
+        if model and model.expires_on > now:
+            with self._cache_lock:
+                self._cache[content_id] = (model, None)
+
+        return model, None
+
+    def clear(self):
+        super().clear()
+
+        with self._cache_lock:
+            self._cache.clear()
 
 
 ExtraContentManager = _ExtraContentManager()
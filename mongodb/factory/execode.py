@@ -9,7 +9,7 @@ from extutils.dt import now_utc_aware
 from flags import Execode, ExecodeCompletionOutcome, ExecodeCollationFailedReason
 from models import ExecodeEntryModel, Model
 from models.exceptions import ModelConstructionError
-from mongodb.utils import ExtendedCursor
+from mongodb.utils import ExtendedCursor, KeysetPage
 from mongodb.exceptions import NoCompleteActionError, ExecodeCollationError
 from mongodb.helper import ExecodeCompletor, ExecodeRequiredKeys
 from mongodb.factory.results import (
@@ -84,6 +84,23 @@ class _ExecodeManager(GenerateTokenMixin, BaseCollection):
         filter_ = {ExecodeEntryModel.CreatorOid.key: root_uid}
         return ExtendedCursor(self.find(filter_), self.count_documents(filter_), parse_cls=ExecodeEntryModel)
 
+    def get_queued_execodes_page(self, root_uid: ObjectId, *, limit: int, page_token: Optional[str] = None,
+                                 with_count: bool = False) -> KeysetPage[ExecodeEntryModel]:
+        """
+        Get a page of the queued Execodes of ``root_uid``.
+
+        Returned result will be sorted by its creation timestamp (DESC).
+
+        :param root_uid: user OID to get the queued Execodes
+        :param limit: max count of the Execodes in a page
+        :param page_token: `next_token` of the previous page, `None` to get the first page
+        :param with_count: if to count the total count of the queued Execodes
+        :return: a page of the queued Execodes of the user
+        :raises InvalidPageTokenError: `page_token` is invalid
+        """
+        return self.find_page({ExecodeEntryModel.CreatorOid.key: root_uid},
+                              limit=limit, page_token=page_token, with_count=with_count)
+
     def get_execode_entry(self, execode: str, action: Optional[Execode] = None) -> GetExecodeEntryResult:
         """
         Get the entry of an Execode action.
@@ -1,10 +1,16 @@
 import os
+from enum import Enum
+from functools import wraps
+from threading import Lock, local
+from typing import Dict, Optional
 
 import pymongo
 
+from JellyBot.systemconfig import Database
 from mongodb.exceptions import MongoURLNotFoundError
 
-__all__ = ("MONGO_CLIENT", "new_mongo_session",)
+__all__ = ("MONGO_CLIENT", "new_mongo_session", "ClientProfile", "get_mongo_client", "use_client_profile",
+           "get_active_client_profile",)
 
 _url = os.environ.get("MONGO_URL")
 if _url is None:
@@ -13,6 +19,89 @@ if _url is None:
 MONGO_CLIENT = pymongo.MongoClient(_url)
 
 
+class ClientProfile(Enum):
+    """
+    Profiles of the MongoDB client.
+
+    Each profile has its own client, so the connection pools of the profiles are isolated from each other.
+    The client options of each profile are configured in ``Database.ClientProfile``.
+    """
+
+    DEFAULT = "default"
+    HOT_PATH = "hot-path"
+    ANALYTICS = "analytics"
+
+
+_profile_options: Dict[ClientProfile, dict] = {
+    ClientProfile.DEFAULT: {},
+    ClientProfile.HOT_PATH: Database.ClientProfile.HotPath,
+    ClientProfile.ANALYTICS: Database.ClientProfile.Analytics
+}
+
+_clients: Dict[ClientProfile, pymongo.MongoClient] = {ClientProfile.DEFAULT: MONGO_CLIENT}
+_clients_lock = Lock()
+
+_active_profile = local()
+
+
+def get_mongo_client(profile: ClientProfile = ClientProfile.DEFAULT) -> pymongo.MongoClient:
+    """
+    Get the MongoDB client of ``profile``. The client will be created on the first call.
+
+    :param profile: profile of the client
+    :return: MongoDB client of the profile
+    """
+    client = _clients.get(profile)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(profile)
+        if client is None:
+            client = pymongo.MongoClient(_url, **_profile_options[profile])
+            _clients[profile] = client
+
+    return client
+
+
+def get_active_client_profile() -> Optional[ClientProfile]:
+    """
+    Get the client profile activated by ``use_client_profile()`` on the current thread.
+
+    :return: client profile activated, `None` if not activated
+    """
+    return getattr(_active_profile, "profile", None)
+
+
+def use_client_profile(profile: ClientProfile):
+    """
+    Decorator to make the collection reads in the decorated method use the client of ``profile``.
+
+    The reads are ``find()``, ``aggregate()`` and ``count_documents()``.
+
+    >>> class _Manager(BaseCollection):
+    >>>     @use_client_profile(ClientProfile.ANALYTICS)
+    >>>     def heavy_stats(self):
+    >>>         return list(self.aggregate(pipeline))  # Executed using the analytics client
+
+    :param profile: client profile to be used
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            prev_profile = get_active_client_profile()
+            _active_profile.profile = profile
+
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _active_profile.profile = prev_profile
+
+        return wrapper
+
+    return decorator
+
+
 def new_mongo_session():
     """
     Create a new mongo session and return it.
@@ -1,10 +1,12 @@
 """Wrapper for the controls on a MongoDB collection as a mixin."""
 from datetime import datetime, tzinfo
 from threading import Thread
-from typing import Optional, Tuple, Union, TypeVar
+from typing import Optional, Tuple, Union, TypeVar, List
 
+from bson import ObjectId
 from bson.errors import InvalidDocument
 from django.conf import settings
+from pymongo import ReturnDocument
 from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
@@ -18,7 +20,10 @@ from models.exceptions import (
 from models.field.exceptions import (
     FieldReadOnlyError, FieldTypeMismatchError, FieldValueInvalidError, FieldCastingFailedError
 )
-from mongodb.utils import ExtendedCursor
+from mongodb.utils import ExtendedCursor, KeysetPage
+from mongodb.utils.page import (
+    complete_keyset_sort, get_keyset_filter, get_sort_values, encode_page_token, decode_page_token
+)
 from mongodb.factory.results import WriteOutcome, UpdateOutcome
 
 from .prop import CollectionPropertiesMixin
@@ -151,6 +156,97 @@ class ControlExtensionMixin(CollectionPropertiesMixin, Collection):
 
         :return: model, outcome, exception (if any)
         """
+        model, outcome, ex = self._construct_model(from_db=from_db, **model_args)
+
+        if model:
+            outcome, ex = self.insert_one_model(model)
+
+        if settings.DEBUG and not outcome.is_success:
+            raise ex
+
+        return model, outcome, ex
+
+    def upsert_one_model(self, filter_: dict, model: Model, update: Optional[dict] = None) \
+            -> Tuple[Optional[T], WriteOutcome, Optional[Exception]]:
+        """
+        Get the data matching ``filter_``, or insert ``model`` if no data matches ``filter_``.
+
+        This is done atomically in a single ``find_one_and_update()`` using ``$setOnInsert``,
+        so no :class:`DuplicateKeyError` will be raised for the existing data.
+
+        ``update`` will be applied no matter the data is inserted or not.
+        The fields updated by ``update`` will be excluded from ``$setOnInsert``.
+
+        Different from ``insert_one_model()``, the returned model is the data stored in the database.
+
+        :param filter_: condition to find the existing data
+        :param model: model to be inserted if the data does not exist
+        :param update: update operations to apply to the data
+        :return: model in the database, outcome, exception (if any)
+        """
+        if not update:
+            update = {}
+
+        if not model.get_oid():
+            model.set_oid(ObjectId())
+
+        updated_keys = {key for operation in update.values() for key in operation}
+        on_insert = {key: value for key, value in model.to_json().items() if key not in updated_keys}
+
+        exc = None
+
+        try:
+            try:
+                data = self.find_one_and_update(
+                    filter_, {"$setOnInsert": on_insert, **update}, upsert=True, return_document=ReturnDocument.AFTER)
+            except DuplicateKeyError:
+                # Concurrent upsert inserted the data first, the retry will then find it
+                data = self.find_one_and_update(
+                    filter_, {"$setOnInsert": on_insert, **update}, upsert=True, return_document=ReturnDocument.AFTER)
+
+            model = self.get_model_cls().cast_model(data)
+            outcome = WriteOutcome.O_INSERTED if data[OID_KEY] == on_insert[OID_KEY] else WriteOutcome.O_DATA_EXISTS
+        except (AttributeError, InvalidDocument) as ex:
+            model = None
+            outcome = WriteOutcome.X_NOT_SERIALIZABLE
+            exc = ex
+        except Exception as ex:
+            model = None
+            outcome = WriteOutcome.X_INSERT_UNKNOWN
+            exc = ex
+
+        return model, outcome, exc
+
+    def upsert_one_data(self, filter_: dict, update: Optional[dict] = None, *, from_db: bool = False, **model_args) \
+            -> Tuple[Optional[T], WriteOutcome, Optional[Exception]]:
+        """
+        Get the data matching ``filter_``, or insert the model constructed from ``model_args`` if not found.
+
+        This function constructs the model and if the construction succeed, executes ``upsert_one_model()``.
+
+        ``from_db`` determines the key type of ``model_args`` (json key or field key).
+
+        .. seealso::
+            Documentation of ``ControlExtensionMixin.upsert_one_model()``
+
+        :param filter_: condition to find the existing data
+        :param update: update operations to apply to the data
+        :param from_db: if the values in `model_args` comes from the database
+        :param model_args: arguments for the `Model` construction
+        :return: model in the database, outcome, exception (if any)
+        """
+        model, outcome, ex = self._construct_model(from_db=from_db, **model_args)
+
+        if model:
+            model, outcome, ex = self.upsert_one_model(filter_, model, update)
+
+        if settings.DEBUG and not outcome.is_success:
+            raise ex
+
+        return model, outcome, ex
+
+    def _construct_model(self, *, from_db: bool = False, **model_args) \
+            -> Tuple[Optional[T], WriteOutcome, Optional[Exception]]:
         model = None
         model_cls = self.get_model_cls()
         outcome: WriteOutcome = WriteOutcome.X_NOT_EXECUTED
@@ -174,12 +270,6 @@ class ControlExtensionMixin(CollectionPropertiesMixin, Collection):
             outcome = WriteOutcome.X_CONSTRUCT_UNKNOWN
             ex = e
 
-        if model:
-            outcome, ex = self.insert_one_model(model)
-
-        if settings.DEBUG and not outcome.is_success:
-            raise ex
-
         return model, outcome, ex
 
     def update_one_outcome(self, filter_, update, upsert=False, collation=None) -> UpdateOutcome:
@@ -292,6 +382,80 @@ class ControlExtensionMixin(CollectionPropertiesMixin, Collection):
         return ExtendedCursor(self.find(filter_, *args, **kwargs), self.count_documents(filter_),
                               parse_cls=self.get_model_cls())
 
+    def count_for_page(self, filter_: dict, *, count_cap: Optional[int] = None, **kwargs) -> Tuple[int, bool]:
+        """
+        Count the data matching ``filter_`` for the pagination.
+
+        If ``filter_`` is empty, the collection metadata will be used to estimate the count.
+
+        If ``count_cap`` is given, the counting stops at ``count_cap``,
+        so the count will be a lower bound if it reaches ``count_cap``.
+
+        :param filter_: condition of the data to be counted
+        :param count_cap: max count to count
+        :param kwargs: kwargs for `count_documents()`
+        :return: count of the data and if the count is exact
+        """
+        if not filter_:
+            return self.estimated_document_count(), False
+
+        if count_cap:
+            count = self.count_documents(filter_, limit=count_cap, **kwargs)
+            return count, count < count_cap
+
+        return self.count_documents(filter_, **kwargs), True
+
+    def find_page(self, filter_: Optional[dict] = None, sort: Optional[List[Tuple[str, int]]] = None, *,
+                  limit: int, page_token: Optional[str] = None, with_count: bool = False,
+                  count_cap: Optional[int] = None, collation=None) -> KeysetPage[T]:
+        """
+        Find a page of the data matching ``filter_`` using keyset pagination.
+
+        Instead of using ``skip``, the next page is located by the sort values of the last data of the previous page,
+        which are encoded in ``page_token``. Therefore, getting a deep page costs the same as getting the first page.
+
+        ``_id`` will be appended to ``sort`` as the tie-breaker if not included.
+        Check the documentation of :func:`complete_keyset_sort()` for the details.
+
+        The total count will be returned only if ``with_count`` is ``True``.
+        Check the documentation of :meth:`count_for_page()` for the exactness of the count.
+
+        :param filter_: condition to filter the returned data
+        :param sort: sort of the returned data
+        :param limit: max count of the data in a page
+        :param page_token: `next_token` of the previous page, `None` to get the first page
+        :param with_count: if to count the total count of the data
+        :param count_cap: max count to count
+        :param collation: collation for the query
+        :return: a page of the data
+        :raises InvalidPageTokenError: `page_token` is malformed or it is not for `sort`
+        """
+        filter_ = filter_ or {}
+        sort = complete_keyset_sort(sort)
+
+        total_count = None
+        count_is_exact = True
+        if with_count:
+            total_count, count_is_exact = self.count_for_page(filter_, count_cap=count_cap, collation=collation)
+
+        query = filter_
+        if page_token:
+            keyset_filter = get_keyset_filter(sort, decode_page_token(page_token, sort))
+            query = {"$and": [filter_, keyset_filter]} if filter_ else keyset_filter
+
+        # Get 1 more data to check if there is a next page
+        data = list(self.find(query, sort=sort, limit=limit + 1, collation=collation))
+
+        next_token = None
+        if len(data) > limit:
+            data = data[:limit]
+            next_token = encode_page_token(sort, get_sort_values(data[-1], sort))
+
+        model_cls = self.get_model_cls()
+
+        return KeysetPage([model_cls.cast_model(d) for d in data], next_token,
+                          total_count=total_count, count_is_exact=count_is_exact)
+
     def find_one_casted(self, filter_: Optional[dict] = None, /, *args,  # pylint: disable=keyword-arg-before-vararg
                         **kwargs) -> Optional[T]:
         """
@@ -54,6 +54,25 @@ class CollectionPropertiesMixin:
 
         return cls.collection_name
 
+    @classmethod
+    def get_planned_full_name(cls):
+        """
+        Get the full name of the collection in the format of <DATABASE_NAME>.<COLLECTION_NAME>.
+
+        The database name is the **"planned"** database name (defined as class variable ``database_name``)
+        regardless of single-db, so the name is unique among all collections in either mode.
+
+        :return: planned full name of the collection
+        :raises AttributeError: if `database_name` or `collection_name` is undefined or `None`
+        """
+        if cls.database_name is None:
+            raise AttributeError(f"Define `database_name` as class variable for {cls.__qualname__}.")
+
+        if cls.collection_name is None:
+            raise AttributeError(f"Define `collection_name` as class variable for {cls.__qualname__}.")
+
+        return f"{cls.database_name}.{cls.collection_name}"
+
     @classmethod
     def get_model_cls(cls):
         """
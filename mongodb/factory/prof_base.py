@@ -17,6 +17,7 @@ Profile-related data controllers.
 
     - This class should be used for all types of manipulation on permission promotion record.
 """
+from datetime import datetime
 from typing import Optional, List, Dict, Set, Union
 
 import pymongo
@@ -39,6 +40,8 @@ from mongodb.utils import ExtendedCursor
 from strres.mongodb import Profile
 
 from ._base import BaseCollection
+from .factory import ClientProfile
+from .user import UserIntegrationJobManager
 
 __all__ = ("ProfileDataManager", "UserProfileManager", "PermissionPromotionRecordHolder",)
 
@@ -46,6 +49,7 @@ DB_NAME = "channel"
 
 
 class _UserProfileManager(BaseCollection):
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "user"
     model_class = ChannelProfileConnectionModel
@@ -56,6 +60,7 @@ class _UserProfileManager(BaseCollection):
              (ChannelProfileConnectionModel.ChannelOid.key, pymongo.DESCENDING)],
             name="Profile Connection Identity",
             unique=True)
+        self.create_index(ChannelProfileConnectionModel.ExistenceCheckedAt.key, name="Existence Check Timestamp")
 
     @arg_type_ensure
     def user_attach_profile(self, channel_oid: ObjectId, root_uid: ObjectId,
@@ -116,8 +121,10 @@ class _UserProfileManager(BaseCollection):
         :return: `ChannelProfileConnectionModel` if exists
         """
         return self.find_one_casted(
-            {ChannelProfileConnectionModel.UserOid.key: root_uid,
-             ChannelProfileConnectionModel.ChannelOid.key: channel_oid}
+            {ChannelProfileConnectionModel.UserOid.key: UserIntegrationJobManager.get_uid_filter_value(root_uid),
+             ChannelProfileConnectionModel.ChannelOid.key: channel_oid},
+            # The integration destination always has the smaller OID, prefer its connection
+            sort=[(ChannelProfileConnectionModel.UserOid.key, pymongo.ASCENDING)]
         )
 
     def get_user_channel_prof_conns(self, root_uid: ObjectId, *, inside_only: bool = True) \
@@ -129,7 +136,7 @@ class _UserProfileManager(BaseCollection):
         :param inside_only: if to only get the connection where the user is inside
         :return: list of `ChannelProfileConnectionModel`
         """
-        filter_ = {ChannelProfileConnectionModel.UserOid.key: root_uid}
+        filter_ = {ChannelProfileConnectionModel.UserOid.key: UserIntegrationJobManager.get_uid_filter_value(root_uid)}
 
         if inside_only:
             filter_[f"{ChannelProfileConnectionModel.ProfileOids.key}.0"] = {"$exists": True}
@@ -211,6 +218,38 @@ class _UserProfileManager(BaseCollection):
         """
         return self.find_cursor_with_count({ChannelProfileConnectionModel.ProfileOids.key + ".0": {"$exists": True}})
 
+    def get_connections_to_check(self, checked_before: datetime, limit: int) -> List[ChannelProfileConnectionModel]:
+        """
+        Get at most ``limit`` available connections which user existence was not checked since ``checked_before``.
+
+        Connections never checked come first, then the connections checked least recently.
+
+        :param checked_before: connections checked at or after this time will be excluded
+        :param limit: max count of the connections to get
+        :return: list of the connections to be checked
+        """
+        key_checked = ChannelProfileConnectionModel.ExistenceCheckedAt.key
+
+        return [
+            ChannelProfileConnectionModel.cast_model(data) for data
+            in self.find({ChannelProfileConnectionModel.ProfileOids.key + ".0": {"$exists": True},
+                          "$or": [{key_checked: None}, {key_checked: {"$lt": checked_before}}]},
+                         sort=[(key_checked, pymongo.ASCENDING)], limit=limit)
+        ]
+
+    def mark_existence_checked(self, conn_oids: List[ObjectId], checked_at: datetime):
+        """
+        Record that the user existence of the connections ``conn_oids`` was checked at ``checked_at``.
+
+        :param conn_oids: OIDs of the connections checked
+        :param checked_at: time of the check
+        """
+        if not conn_oids:
+            return
+
+        self.update_many({OID_KEY: {"$in": conn_oids}},
+                         {"$set": {ChannelProfileConnectionModel.ExistenceCheckedAt.key: checked_at}})
+
     def get_profile_user_oids(self, profile_oid: ObjectId) -> Set[ObjectId]:
         """
         Get a set of user OIDs who have the profile ``profile_oid``.
@@ -339,6 +378,7 @@ class _UserProfileManager(BaseCollection):
 
 
 class _ProfileDataManager(BaseCollection):
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "prof"
     model_class = ChannelProfileModel
@@ -511,7 +551,8 @@ class _ProfileDataManager(BaseCollection):
         return self.find_cursor_with_count(filter_)
 
     def create_default_profile(self, channel_oid: ObjectId, *,
-                               set_to_channel: bool = True, check_channel: bool = True) -> CreateProfileResult:
+                               set_to_channel: bool = True, check_channel: bool = True,
+                               profile_oid: Optional[ObjectId] = None) -> CreateProfileResult:
         """
         Create a default profile for ``channel_oid`` and set it to the channel if ``set_to_channel`` is ``True``.
 
@@ -521,12 +562,17 @@ class _ProfileDataManager(BaseCollection):
         :param channel_oid: channel to get the default profile
         :param set_to_channel: if the created profile should be set to the channel
         :param check_channel: check if the channel is registered
+        :param profile_oid: OID of the profile to be created. A new OID will be used if not given
         :return: result of creating the default profile
         """
         if check_channel and not ChannelManager.get_channel_oid(channel_oid):
             return CreateProfileResult(WriteOutcome.X_CHANNEL_NOT_FOUND)
 
-        result = self.create_profile(ChannelOid=channel_oid, Name=str(Profile.DEFAULT_PROFILE_NAME))
+        if profile_oid:
+            result = self.create_profile(
+                Id=profile_oid, ChannelOid=channel_oid, Name=str(Profile.DEFAULT_PROFILE_NAME))
+        else:
+            result = self.create_profile(ChannelOid=channel_oid, Name=str(Profile.DEFAULT_PROFILE_NAME))
 
         if set_to_channel and result.outcome.is_inserted:
             set_result = ChannelManager.set_config(
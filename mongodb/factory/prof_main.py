@@ -6,6 +6,7 @@ Profile-related data controllers.
     - Any controls besides tests and access to permission promotion record should use
       this class to manipulate the profile data.
 """
+from datetime import datetime
 from threading import Thread
 from typing import Optional, List, Dict, Set, Union, Iterable
 
@@ -269,7 +270,8 @@ class _ProfileManager(ClearableMixin):
         return ProfilePermission.PRF_CONTROL_MEMBER in permissions
 
     def create_default_profile(self, channel_oid: ObjectId, *,
-                               set_to_channel: bool = True, check_channel: bool = True) \
+                               set_to_channel: bool = True, check_channel: bool = True,
+                               profile_oid: Optional[ObjectId] = None) \
             -> CreateProfileResult:
         """
         Create a default profile for ``channel_oid`` and set it to the channel if ``set_to_channel`` is ``True``.
@@ -280,10 +282,11 @@ class _ProfileManager(ClearableMixin):
         :param channel_oid: channel to get the default profile
         :param set_to_channel: if the created profile should be set to the channel
         :param check_channel: check if the channel is registered
+        :param profile_oid: OID of the profile to be created. A new OID will be used if not given
         :return: result of creating the default profile
         """
         return self._prof.create_default_profile(
-            channel_oid, set_to_channel=set_to_channel, check_channel=check_channel)
+            channel_oid, set_to_channel=set_to_channel, check_channel=check_channel, profile_oid=profile_oid)
 
     @arg_type_ensure
     def register_new(self, root_uid: ObjectId, parsed_args: Optional[ArgumentParseResult] = None, **profile_fkwargs) \
@@ -560,6 +563,15 @@ class _ProfileManager(ClearableMixin):
 
         return OperationOutcome.O_COMPLETED
 
+    def mark_unavailable(self, channel_oid: ObjectId, root_oid: ObjectId):
+        """
+        Mark the user ``root_oid`` in the channel ``channel_oid`` unavailable.
+
+        :param channel_oid: channel of the user to be marked
+        :param root_oid: user to be marked unavailable
+        """
+        self._conn.mark_unavailable(channel_oid, root_oid)
+
     def mark_unavailable_async(self, channel_oid: ObjectId, root_oid: ObjectId) -> Thread:
         """
         Mark the user ``root_oid`` in the channel ``channel_oid`` unavailable asynchronously.
@@ -570,7 +582,7 @@ class _ProfileManager(ClearableMixin):
         :param root_oid: user to be marked unavailable
         :return: started thread which marks the user unavailable
         """
-        thread = Thread(target=self._conn.mark_unavailable, args=(channel_oid, root_oid))
+        thread = Thread(target=self.mark_unavailable, args=(channel_oid, root_oid))
         thread.start()
 
         return thread
@@ -893,6 +905,27 @@ class _ProfileManager(ClearableMixin):
         """
         return self._conn.get_available_connections()
 
+    def get_connections_to_check(self, checked_before: datetime, limit: int) -> List[ChannelProfileConnectionModel]:
+        """
+        Get at most ``limit`` available connections which user existence was not checked since ``checked_before``.
+
+        Connections never checked come first, then the connections checked least recently.
+
+        :param checked_before: connections checked at or after this time will be excluded
+        :param limit: max count of the connections to get
+        :return: list of the connections to be checked
+        """
+        return self._conn.get_connections_to_check(checked_before, limit)
+
+    def mark_existence_checked(self, conn_oids: List[ObjectId], checked_at: datetime):
+        """
+        Record that the user existence of the connections ``conn_oids`` was checked at ``checked_at``.
+
+        :param conn_oids: OIDs of the connections checked
+        :param checked_at: time of the check
+        """
+        self._conn.mark_existence_checked(conn_oids, checked_at)
+
     # endregion
 
     # region Get data for batch process
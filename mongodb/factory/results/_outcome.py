@@ -355,6 +355,8 @@ class OperationOutcome(BaseOutcome):
 
         -102 - Readonly args omitted
 
+    -2 - Operation accepted and running in the background
+
     -1 - Operation completed
 
     ================================
@@ -450,6 +452,9 @@ class OperationOutcome(BaseOutcome):
     O_READONLY_ARGS_OMITTED = \
         -102, _("O: Readonly args omitted"), \
         _("Operation succeed. Some arguments are omitted because it is readonly.")
+    O_ACCEPTED = \
+        -2, _("O: Accepted"), \
+        _("The operation was accepted and is running in the background.")
     O_COMPLETED = \
         -1, _("O: Completed"), \
         _("The operation was successfully completed.")
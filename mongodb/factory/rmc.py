@@ -9,6 +9,7 @@ from extutils.dt import now_utc_aware
 from models import RemoteControlEntryModel
 
 from ._base import BaseCollection
+from .factory import ClientProfile
 
 __all__ = ("RemoteControlManager",)
 
@@ -16,6 +17,7 @@ DB_NAME = "rmc"
 
 
 class _RemoteControlManager(BaseCollection):
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "data"
     model_class = RemoteControlEntryModel
@@ -1,18 +1,20 @@
 """Data manager for the Short URL service."""
 import os
-import math
 import random
-from typing import Optional
+from threading import Lock
+from typing import Optional, Tuple
 
 import pymongo
 from bson import ObjectId
+from pymongo import ReturnDocument
 
+from extutils.feistel import FeistelPermutation
 from extutils.url import is_valid_url
 from extutils.logger import SYSTEM
 from extutils.checker import arg_type_ensure
-from models import ShortUrlRecordModel
+from models import ShortUrlRecordModel, ShortUrlCodeCounterModel, OID_KEY
 from mongodb.factory.results import WriteOutcome, UrlShortenResult
-from mongodb.utils import ExtendedCursor
+from mongodb.utils import ExtendedCursor, KeysetPage
 
 from ._base import BaseCollection
 
@@ -21,12 +23,56 @@ __all__ = ("ShortUrlDataManager",)
 DB_NAME = "surl"
 
 
+class _ShortUrlCodeCounterManager(BaseCollection):
+    database_name = DB_NAME
+    collection_name = "counter"
+    model_class = ShortUrlCodeCounterModel
+
+    COUNTER_KEY = "code"
+
+    def build_indexes(self):
+        self.create_index(ShortUrlCodeCounterModel.Key.key, name="Counter Key", unique=True)
+
+    def is_initialized(self) -> bool:
+        """
+        Check if the code counter exists.
+
+        :return: if the code counter exists
+        """
+        return self.count_documents({ShortUrlCodeCounterModel.Key.key: self.COUNTER_KEY}) > 0
+
+    def reserve(self, count: int, min_length: int) -> Tuple[int, ShortUrlCodeCounterModel]:
+        """
+        Atomically reserve ``count`` sequence numbers from the code counter.
+
+        If the code counter does not exist, the counter will be created
+        with ``min_length`` as its min code length and a random scramble key.
+
+        :param count: count of the sequence numbers to reserve
+        :param min_length: min code length to be used if the counter does not exist
+        :return: the first reserved sequence number and the counter after the reservation
+        """
+        counter = ShortUrlCodeCounterModel.cast_model(self.find_one_and_update(
+            {ShortUrlCodeCounterModel.Key.key: self.COUNTER_KEY},
+            {
+                "$inc": {ShortUrlCodeCounterModel.Next.key: count},
+                "$setOnInsert": {
+                    ShortUrlCodeCounterModel.MinLength.key: min_length,
+                    ShortUrlCodeCounterModel.ScrambleKey.key: random.getrandbits(62)
+                }
+            },
+            upsert=True, return_document=ReturnDocument.AFTER))
+
+        return counter.next - count, counter
+
+
 class _ShortUrlDataManager(BaseCollection):
     database_name = DB_NAME
     collection_name = "data"
     model_class = ShortUrlRecordModel
 
     MIN_CODE_LENGTH = 5
+    CODE_BLOCK_SIZE = 100
     AVAILABLE_CHARACTERS = \
         [chr(c) for c in range(ord('A'), ord('Z') + 1)] + [chr(c) for c in range(ord('a'), ord('z') + 1)]  # A-Z & a-z
 
@@ -53,29 +99,90 @@ class _ShortUrlDataManager(BaseCollection):
 
         self.available = _ShortUrlDataManager.check_service()
 
-        self.code_length = self._calc_code_length()
+        self._counter = _ShortUrlCodeCounterManager()
+
+        self._code_lock = Lock()
+        self._code_next = 0
+        self._code_end = 0
+        self._code_min_length = _ShortUrlDataManager.MIN_CODE_LENGTH
+        self._code_scramble_key = 0
+        self._code_perms = {}  # Code length -> permutation
+
+    def build_indexes(self):
+        self.create_index(ShortUrlRecordModel.Code.key, name="Short URL Code", unique=True)
+
+    def _get_initial_code_length(self) -> int:
+        # Codes generated before using the code counter were random,
+        # so start from a longer code length to prevent the collision
+        pipeline = [
+            {"$group": {
+                OID_KEY: None,
+                "len": {"$max": {"$strLenCP": "$" + ShortUrlRecordModel.Code.key}}
+            }}
+        ]
+
+        max_len = next(iter(self.aggregate(pipeline)), {}).get("len")
+        if not max_len:
+            return _ShortUrlDataManager.MIN_CODE_LENGTH
 
-    def _calc_code_length(self) -> int:
-        doc_count = self.estimated_document_count()
+        return max(max_len + 1, _ShortUrlDataManager.MIN_CODE_LENGTH)
 
-        if doc_count > 0:
-            calc = math.ceil(math.log(doc_count, len(_ShortUrlDataManager.AVAILABLE_CHARACTERS)))
-        else:
-            calc = 0
+    def _reserve_code_block(self):
+        # Must be called with `self._code_lock` acquired
+        min_length = _ShortUrlDataManager.MIN_CODE_LENGTH
+        if not self._counter.is_initialized():
+            min_length = self._get_initial_code_length()
 
-        return max(calc, _ShortUrlDataManager.MIN_CODE_LENGTH)
+        self._code_next, counter = self._counter.reserve(_ShortUrlDataManager.CODE_BLOCK_SIZE, min_length)
+        self._code_end = self._code_next + _ShortUrlDataManager.CODE_BLOCK_SIZE
 
-    def generate_code(self):
-        """Generate a code for the short URL."""
-        def generate():
-            return "".join([random.choice(_ShortUrlDataManager.AVAILABLE_CHARACTERS) for _ in range(self.code_length)])
+        if (counter.min_length, counter.scramble_key) != (self._code_min_length, self._code_scramble_key):
+            self._code_min_length = counter.min_length
+            self._code_scramble_key = counter.scramble_key
+            self._code_perms = {}
 
-        code = generate()
-        # Check if not existed in the database
-        while self.count_documents({ShortUrlRecordModel.Code.key: code}) > 0:
-            code = generate()
+    def _seq_to_code(self, seq: int) -> str:
+        chars = _ShortUrlDataManager.AVAILABLE_CHARACTERS
+        base = len(chars)
 
-        return code
+        # Grow the code length if the code space of the current length is exhausted
+        code_length = self._code_min_length
+        while seq >= base ** code_length:
+            seq -= base ** code_length
+            code_length += 1
+
+        perm = self._code_perms.get(code_length)
+        if not perm:
+            perm = self._code_perms[code_length] = FeistelPermutation(base ** code_length, self._code_scramble_key)
+
+        num = perm.permute(seq)
+
+        code = []
+        for _ in range(code_length):
+            num, digit = divmod(num, base)
+            code.append(chars[digit])
+
+        return "".join(reversed(code))
+
+    def generate_code(self) -> str:
+        """
+        Generate a unique code for the short URL.
+
+        The code is allocated from a block of sequence numbers reserved from the code counter,
+        then scrambled by a keyed permutation, so the codes are not sequential and never collide.
+
+        The code length grows automatically if the code space of the current length is exhausted.
+
+        :return: unique code for the short URL
+        """
+        with self._code_lock:
+            if self._code_next >= self._code_end:
+                self._reserve_code_block()
+
+            seq = self._code_next
+            self._code_next += 1
+
+            return self._seq_to_code(seq)
 
     @arg_type_ensure
     def create_record(self, target: str, creator_oid: ObjectId) -> UrlShortenResult:
@@ -132,6 +239,24 @@ class _ShortUrlDataManager(BaseCollection):
         return self.find_cursor_with_count({ShortUrlRecordModel.CreatorOid.key: creator_oid},
                                            sort=[(ShortUrlRecordModel.Id.key, pymongo.ASCENDING)])
 
+    def get_user_record_page(self, creator_oid: ObjectId, *, limit: int, page_token: Optional[str] = None,
+                             with_count: bool = False) -> KeysetPage[ShortUrlRecordModel]:
+        """
+        Get a page of the short URLs created by ``creator_oid``.
+
+        The returned result will be sorted by its creation timestamp (ASC).
+
+        :param creator_oid: user who creates the returned short URLs
+        :param limit: max count of the short URLs in a page
+        :param page_token: `next_token` of the previous page, `None` to get the first page
+        :param with_count: if to count the total count of the short URLs created by `creator_oid`
+        :return: a page of the short URL data created by `creator_oid`
+        :raises InvalidPageTokenError: `page_token` is invalid
+        """
+        return self.find_page({ShortUrlRecordModel.CreatorOid.key: creator_oid},
+                              [(ShortUrlRecordModel.Id.key, pymongo.ASCENDING)],
+                              limit=limit, page_token=page_token, with_count=with_count)
+
     @arg_type_ensure
     def update_target(self, creator_oid: ObjectId, code: str, new_target: str) -> bool:
         """
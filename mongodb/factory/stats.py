@@ -1,40 +1,80 @@
 """Module of various stats data manager."""
+import re
+import time
 import traceback
+from collections import defaultdict
 from datetime import datetime, tzinfo, timedelta
-from threading import Thread
-from typing import Any, Optional, Union, List, Dict, Set
+from threading import Thread, Lock
+from typing import Any, Optional, Union, List, Dict, Set, Iterable, Tuple, Callable
 
 import pymongo
 from bson import ObjectId
+from cachetools import Cache, LRUCache
+from pymongo import ReturnDocument, UpdateOne, WriteConcern
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 
 from env_var import is_testing
 from extutils import dt_to_objectid
 from extutils.checker import arg_type_ensure
 from extutils.emailutils import MailSender
 from extutils.dt import now_utc_aware, localtime, TimeRange
+from extutils.leaderboard import RollingLeaderboard
 from extutils.locales import UTC, PytzInfo
+from extutils.tokenize import tokenize_for_search
+from extutils.tracing import Trace
 from flags import APICommand, MessageType, BotFeature
 from JellyBot.systemconfig import Database
 from models import (
-    APIStatisticModel, MessageRecordModel, OID_KEY, BotFeatureUsageModel,
+    APIStatisticModel, MessageRecordModel, MessageKeywordModel, MessageKeywordBackfillModel, OID_KEY,
+    BotFeatureUsageModel,
     HourlyIntervalAverageMessageResult, DailyMessageResult, BotFeatureUsageResult, BotFeatureHourlyAvgResult,
     HourlyResult, BotFeaturePerUserUsageResult, MemberMessageByCategoryResult, MemberDailyMessageResult,
-    MemberMessageCountResult, MeanMessageResultGenerator, CountBeforeTimeResult
+    MemberMessageCountResult, MeanMessageResultGenerator, CountBeforeTimeResult, MessageTraceModel,
+    MessageTraceSpanModel, MessageLatencyResult
 )
 from mongodb.factory.results import RecordAPIStatisticsResult, WriteOutcome
-from mongodb.utils import ExtendedCursor
+from mongodb.utils import ExtendedCursor, TelemetryWriter
 from ._base import BaseCollection
+from .factory import ClientProfile, use_client_profile
 
-__all__ = ("APIStatisticsManager", "MessageRecordStatisticsManager", "BotFeatureUsageDataManager",)
+__all__ = ("APIStatisticsManager", "MessageRecordStatisticsManager", "MessageKeywordIndexManager",
+           "MessageKeywordBackfillManager", "BotFeatureUsageDataManager", "MessageTraceManager",)
 
 DB_NAME = "stats"
 
 
+def _new_telemetry_writer(name: str, collection: BaseCollection, *,
+                          on_flushed: Optional[Callable[[List[dict]], None]] = None) -> TelemetryWriter:
+    telemetry_col: Collection = collection.with_options(
+        write_concern=WriteConcern(**Database.Telemetry.WriteConcern))
+
+    return TelemetryWriter(
+        name, telemetry_col,
+        capacity=Database.Telemetry.BufferCapacity, batch_size=Database.Telemetry.BatchSize,
+        flush_interval=Database.Telemetry.FlushIntervalSeconds,
+        health_log_interval=Database.Telemetry.HealthLogIntervalSeconds,
+        on_flushed=on_flushed, synchronous=is_testing()
+    )
+
+
 class _APIStatisticsManager(BaseCollection):
+    """
+    Class for managing the API usage records.
+
+    Records from ``record_stats_async()`` are buffered and inserted in batches
+    using the write concern of ``Database.Telemetry.WriteConcern``.
+    """
+
     database_name = DB_NAME
     collection_name = "api"
     model_class = APIStatisticModel
 
+    def __init__(self):
+        super().__init__()
+
+        self._telemetry = _new_telemetry_writer("API stats", self)
+
     # pylint: disable=too-many-arguments
 
     @arg_type_ensure
@@ -60,14 +100,501 @@ class _APIStatisticsManager(BaseCollection):
 
         return RecordAPIStatisticsResult(outcome, ex, entry)
 
+    @arg_type_ensure
+    def record_stats_async(self, api_action: APICommand, sender_oid: ObjectId, parameter: dict, response: dict,
+                           success: bool, org_param: dict, path_info: str, path_info_full: str):
+        """
+        Same functionality as ``record_stats()`` except that the record is buffered and inserted in the background.
+
+        :param api_action: action of the API call
+        :param sender_oid: OID of the user who send the request
+        :param parameter: parameter of the API call
+        :param response: response of the API call
+        :param success: if the response is successive
+        :param org_param: original parameter of the API call
+        :param path_info: `path_info` of the request
+        :param path_info_full: path info got by calling `request.get_full_path_info()`
+        """
+        if is_testing():
+            self.record_stats(api_action, sender_oid, parameter, response, success, org_param,
+                              path_info, path_info_full)
+            return
+
+        model, _, _ = self._construct_model(
+            ApiAction=api_action, SenderOid=sender_oid, Parameter=parameter, Response=response, Success=success,
+            Timestamp=datetime.utcnow(), PathInfo=path_info, PathInfoFull=path_info_full, PathParameter=org_param)
+
+        if model:
+            model.set_oid(ObjectId())
+            self._telemetry.submit(model.to_json())
+
     # pylint: enable=too-many-arguments
 
 
+class _MessageKeywordBackfillManager(BaseCollection):
+    database_name = DB_NAME
+    collection_name = "msgkwbf"
+    model_class = MessageKeywordBackfillModel
+
+    STATE_KEY = "msg"
+
+    def build_indexes(self):
+        self.create_index(MessageKeywordBackfillModel.Key.key, name="Backfill Key", unique=True)
+
+    def get_state(self) -> MessageKeywordBackfillModel:
+        """
+        Get the progress of the backfill.
+
+        If the progress does not exist, it will be created to backfill the messages recorded before now.
+
+        :return: progress of the backfill
+        """
+        return MessageKeywordBackfillModel.cast_model(self.find_one_and_update(
+            {MessageKeywordBackfillModel.Key.key: self.STATE_KEY},
+            {"$setOnInsert": {
+                MessageKeywordBackfillModel.EndOid.key: ObjectId(),
+                MessageKeywordBackfillModel.LastOid.key: None,
+                MessageKeywordBackfillModel.Completed.key: False
+            }},
+            upsert=True, return_document=ReturnDocument.AFTER))
+
+    def acquire(self, owner: ObjectId) -> bool:
+        """
+        Let ``owner`` hold the backfill for ``Database.MessageStats.KeywordBackfillLeaseSeconds`` seconds.
+
+        :param owner: ID of the process to hold the backfill
+        :return: if the backfill is held by `owner`
+        """
+        now = now_utc_aware()
+
+        return self.update_one(
+            {
+                MessageKeywordBackfillModel.Key.key: self.STATE_KEY,
+                MessageKeywordBackfillModel.Completed.key: False,
+                "$or": [{MessageKeywordBackfillModel.LeaseUntil.key: None},
+                        {MessageKeywordBackfillModel.LeaseUntil.key: {"$lt": now}}]
+            },
+            {"$set": {
+                MessageKeywordBackfillModel.Owner.key: owner,
+                MessageKeywordBackfillModel.LeaseUntil.key:
+                    now + timedelta(seconds=Database.MessageStats.KeywordBackfillLeaseSeconds)
+            }}
+        ).modified_count > 0
+
+    def save_progress(self, owner: ObjectId, last_oid: ObjectId) -> bool:
+        """
+        Save ``last_oid`` as the ID of the last message indexed and renew the lease of ``owner``.
+
+        :param owner: ID of the process holding the backfill
+        :param last_oid: ID of the last message indexed
+        :return: if the backfill is still held by `owner`
+        """
+        return self.update_one(
+            {MessageKeywordBackfillModel.Key.key: self.STATE_KEY, MessageKeywordBackfillModel.Owner.key: owner},
+            {"$set": {
+                MessageKeywordBackfillModel.LastOid.key: last_oid,
+                MessageKeywordBackfillModel.LeaseUntil.key:
+                    now_utc_aware() + timedelta(seconds=Database.MessageStats.KeywordBackfillLeaseSeconds)
+            }}
+        ).modified_count > 0
+
+    def complete(self, owner: ObjectId):
+        """
+        Mark the backfill held by ``owner`` completed.
+
+        :param owner: ID of the process holding the backfill
+        """
+        self.update_one(
+            {MessageKeywordBackfillModel.Key.key: self.STATE_KEY, MessageKeywordBackfillModel.Owner.key: owner},
+            {"$set": {MessageKeywordBackfillModel.Completed.key: True,
+                      MessageKeywordBackfillModel.LeaseUntil.key: None}})
+
+
+class _MessageKeywordIndexManager(BaseCollection):
+    client_profile = ClientProfile.HOT_PATH
+    database_name = DB_NAME
+    collection_name = "msgkw"
+    model_class = MessageKeywordModel
+
+    BATCH_SIZE = 1000
+
+    def build_indexes(self):
+        self.create_index(
+            [(MessageKeywordModel.Keyword.key, pymongo.ASCENDING),
+             (MessageKeywordModel.ChannelOid.key, pymongo.ASCENDING)],
+            name="Keyword Identity", unique=True)
+
+    def _upsert_keywords(self, stats: Dict[tuple, list]):
+        if not stats:
+            return
+
+        requests = [
+            UpdateOne(
+                {MessageKeywordModel.Keyword.key: keyword, MessageKeywordModel.ChannelOid.key: channel_oid},
+                {"$inc": {MessageKeywordModel.Count.key: count},
+                 "$max": {MessageKeywordModel.LastUsed.key: last_used}},
+                upsert=True
+            )
+            for (keyword, channel_oid), (count, last_used) in stats.items()
+        ]
+
+        try:
+            self.bulk_write(requests, ordered=False)
+        except BulkWriteError as ex:
+            # Concurrent upserts of the same new keyword could violate the unique index.
+            # Retrying the failed requests updates the entry inserted by the other one.
+            errors = ex.details["writeErrors"]
+            if any(error["code"] != 11000 for error in errors):
+                raise
+
+            self.bulk_write([requests[error["index"]] for error in errors], ordered=False)
+
+    def index_messages(self, messages: Iterable[MessageRecordModel]):
+        """
+        Index the keywords of ``messages``.
+
+        Only the messages which type is :class:`MessageType.TEXT` will be indexed.
+
+        :param messages: messages to be indexed
+        """
+        stats = defaultdict(lambda: [0, None])  # (Keyword, Channel OID) -> [Count, Last Used]
+        indexed_count = 0
+
+        for message in messages:
+            if message.message_type != MessageType.TEXT or not message.message_content:
+                continue
+
+            timestamp = message.id.generation_time
+            keywords = tokenize_for_search(message.message_content, with_suffixes=True,
+                                           max_count=Database.MessageStats.MaxKeywordsPerMessage)
+
+            for keyword in keywords:
+                entry = stats[(keyword, message.channel_oid)]
+                entry[0] += 1
+                entry[1] = max(entry[1], timestamp) if entry[1] else timestamp
+
+            indexed_count += 1
+            if indexed_count % self.BATCH_SIZE == 0:
+                self._upsert_keywords(stats)
+                stats.clear()
+
+        self._upsert_keywords(stats)
+
+    def backfill(self, records: Collection):
+        """
+        Index the keywords of the text messages in ``records`` recorded before the index exists.
+
+        The messages are indexed in batches in the ascending order of their ID.
+        The ID of the last indexed message is saved after each batch, so an interrupted backfill resumes from it.
+        Note that a batch will be indexed again if the process stopped before saving its progress.
+
+        Only one process backfills at a time. Returns immediately if the backfill is held by the other process.
+
+        :param records: collection of the message records
+        """
+        state = MessageKeywordBackfillManager.get_state()
+        if state.completed:
+            return
+
+        owner = ObjectId()
+        if not MessageKeywordBackfillManager.acquire(owner):
+            return
+
+        id_range = {"$lt": state.end_oid}
+        if state.last_oid:
+            id_range["$gt"] = state.last_oid
+
+        cursor = records.find({OID_KEY: id_range, MessageRecordModel.MessageType.key: MessageType.TEXT}) \
+            .sort(OID_KEY, pymongo.ASCENDING) \
+            .batch_size(self.BATCH_SIZE)
+
+        batch: List[MessageRecordModel] = []
+        for data in cursor:
+            batch.append(MessageRecordModel.cast_model(data))
+
+            if len(batch) >= self.BATCH_SIZE:
+                self.index_messages(batch)
+                # Stop if the lease expired and the other process took over
+                if not MessageKeywordBackfillManager.save_progress(owner, batch[-1].id):
+                    return
+
+                batch = []
+
+        if batch:
+            self.index_messages(batch)
+            if not MessageKeywordBackfillManager.save_progress(owner, batch[-1].id):
+                return
+
+        MessageKeywordBackfillManager.complete(owner)
+
+    @staticmethod
+    def _get_search_keywords(keyword: str) -> List[str]:
+        keywords = sorted(tokenize_for_search(keyword), key=len, reverse=True)
+
+        # Remove the keywords which is a prefix of the other keywords because
+        # the longer keyword matches the index entries which are the subset of the shorter one
+        ret = []
+        for kw in keywords:
+            if not any(selected.startswith(kw) for selected in ret):
+                ret.append(kw)
+
+        return ret[:Database.MessageStats.MaxSearchKeywords]
+
+    @use_client_profile(ClientProfile.ANALYTICS)
+    def search_channels(self, keyword: str, channel_oids: List[ObjectId], *,
+                        skip: int = 0, limit: Optional[int] = None) -> List[ObjectId]:
+        """
+        Search the channels in ``channel_oids`` where the messages in it contain all the keywords in ``keyword``.
+
+        Each keyword of ``keyword`` matches any part of the keywords in the messages, case-insensitively.
+
+        Returned channel OIDs will be sorted by the count of the matched keywords (DESC),
+        then the last time that any of the matched keywords were used (DESC), then the channel OID (DESC).
+
+        Returns an empty list if ``keyword`` does not contain any keywords.
+
+        :param keyword: keyword to search
+        :param channel_oids: OIDs of the channels to be searched
+        :param skip: count of the results to skip
+        :param limit: max count of the results
+        :return: list of the OIDs of the channels matching the conditions
+        """
+        keywords = self._get_search_keywords(keyword)
+
+        if not keywords or not channel_oids:
+            return []
+
+        key_kw = "$" + MessageKeywordModel.Keyword.key
+        key_matched = "m"
+        key_count = "c"
+        key_last_used = "lt"
+
+        pipeline = [
+            {"$match": {
+                "$or": [{MessageKeywordModel.Keyword.key: {"$regex": f"^{re.escape(kw)}"}} for kw in keywords],
+                MessageKeywordModel.ChannelOid.key: {"$in": channel_oids}
+            }},
+            {"$group": {
+                OID_KEY: "$" + MessageKeywordModel.ChannelOid.key,
+                key_matched: {"$addToSet": {"$switch": {
+                    "branches": [
+                        {"case": {"$eq": [{"$substrCP": [key_kw, 0, len(kw)]}, kw]}, "then": idx}
+                        for idx, kw in enumerate(keywords)
+                    ]
+                }}},
+                key_count: {"$sum": "$" + MessageKeywordModel.Count.key},
+                key_last_used: {"$max": "$" + MessageKeywordModel.LastUsed.key}
+            }},
+            {"$match": {
+                key_matched: {"$size": len(keywords)}
+            }},
+            {"$sort": {
+                key_count: pymongo.DESCENDING,
+                key_last_used: pymongo.DESCENDING,
+                OID_KEY: pymongo.DESCENDING
+            }}
+        ]
+
+        if skip:
+            pipeline.append({"$skip": skip})
+
+        if limit:
+            pipeline.append({"$limit": limit})
+
+        return [data[OID_KEY] for data in self.aggregate(pipeline)]
+
+
+class _LeaderboardCache(LRUCache):
+    """
+    LRU cache of the leaderboards keyed by the sorted channel OIDs.
+
+    The keys are also indexed by each channel OID in the keys, so the leaderboards containing a channel
+    can be found without scanning all the cached keys.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+
+        self._keys_by_channel: Dict[ObjectId, Set[Tuple[ObjectId, ...]]] = defaultdict(set)
+
+    def __setitem__(self, key: Tuple[ObjectId, ...], value: RollingLeaderboard, cache_setitem=Cache.__setitem__):
+        super().__setitem__(key, value, cache_setitem)
+
+        for channel_oid in key:
+            self._keys_by_channel[channel_oid].add(key)
+
+    def __delitem__(self, key: Tuple[ObjectId, ...], cache_delitem=Cache.__delitem__):
+        # Evictions also delete the items using this
+        super().__delitem__(key, cache_delitem)
+
+        for channel_oid in key:
+            keys = self._keys_by_channel.get(channel_oid)
+            if keys is None:
+                continue
+
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_channel[channel_oid]
+
+    def get_by_channel(self, channel_oid: ObjectId) -> List[RollingLeaderboard]:
+        """
+        Get the cached leaderboards containing ``channel_oid`` without updating their recency.
+
+        :param channel_oid: channel contained in the leaderboards
+        :return: leaderboards containing the channel
+        """
+        return [Cache.__getitem__(self, key) for key in self._keys_by_channel.get(channel_oid, ())]
+
+
 class _MessageRecordStatisticsManager(BaseCollection):
+    """
+    Class for managing the message records.
+
+    The message count leaderboards of the users in the rolling windows of
+    ``Database.MessageStats.LeaderboardWindowHours`` hours are maintained in the memory.
+
+    A leaderboard is loaded from the message records on its first use, then updated on every recorded message.
+    The leaderboards are reloaded every ``Database.MessageStats.LeaderboardReconcileIntervalSeconds`` seconds
+    to fix the drift, for example, the messages recorded by the other processes.
+
+    Records from ``record_message_async()`` are buffered and inserted in batches
+    using the write concern of ``Database.Telemetry.WriteConcern``.
+    The keywords of the records are indexed after the records are inserted.
+    """
+
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "msg"
     model_class = MessageRecordModel
 
+    def __init__(self):
+        super().__init__()
+
+        # Sorted channel OIDs to the leaderboard of the users in the channels
+        self._leaderboards = _LeaderboardCache(maxsize=Database.MessageStats.LeaderboardCacheSize)
+        self._leaderboard_lock = Lock()
+
+        self._telemetry = _new_telemetry_writer("Message records", self, on_flushed=self._on_records_flushed)
+
+    @staticmethod
+    def _on_records_flushed(documents: List[dict]):
+        MessageKeywordIndexManager.index_messages(MessageRecordModel.cast_model(doc) for doc in documents)
+
+    def on_init_async(self):
+        super().on_init_async()
+
+        # Index the messages recorded before the keyword index exists
+        if not is_testing():
+            MessageKeywordIndexManager.backfill(self)
+
+        if not is_testing():
+            Thread(target=self._reconcile_leaderboards_thread, daemon=True).start()
+
+    def _reconcile_leaderboards_thread(self):
+        while True:
+            time.sleep(Database.MessageStats.LeaderboardReconcileIntervalSeconds)
+
+            self.reconcile_leaderboards()
+
+    @staticmethod
+    def _get_hour_bucket(dt: datetime) -> int:
+        return int(dt.timestamp() // 3600)
+
+    def _load_leaderboard(self, channel_oids: Tuple[ObjectId, ...], leaderboard: RollingLeaderboard):
+        now = now_utc_aware()
+        max_hours = max(leaderboard.window_lengths)
+
+        pipeline = [
+            {"$match": {
+                MessageRecordModel.ChannelOid.key: {"$in": list(channel_oids)},
+                MessageRecordModel.UserRootOid.key: {"$ne": None},
+                OID_KEY: {"$gte": dt_to_objectid(now - timedelta(hours=max_hours))}
+            }},
+            {"$group": {
+                OID_KEY: {
+                    "u": "$" + MessageRecordModel.UserRootOid.key,
+                    "h": {"$trunc": {"$divide": [{"$toLong": {"$toDate": "$" + OID_KEY}}, 3600000]}}
+                },
+                "c": {"$sum": 1}
+            }}
+        ]
+
+        leaderboard.reset(
+            ((data[OID_KEY]["u"], int(data[OID_KEY]["h"]), data["c"]) for data in self.aggregate(pipeline)),
+            self._get_hour_bucket(now))
+
+    def _get_leaderboard(self, channel_oids: Iterable[ObjectId]) -> RollingLeaderboard:
+        key = tuple(sorted(set(channel_oids)))
+
+        with self._leaderboard_lock:
+            leaderboard = self._leaderboards.get(key)
+
+        if not leaderboard:
+            leaderboard = RollingLeaderboard(Database.MessageStats.LeaderboardWindowHours)
+            self._load_leaderboard(key, leaderboard)
+
+            with self._leaderboard_lock:
+                self._leaderboards[key] = leaderboard
+
+        return leaderboard
+
+    def _add_to_leaderboards(self, model: MessageRecordModel):
+        if not model.user_root_oid:
+            return
+
+        with self._leaderboard_lock:
+            leaderboards = self._leaderboards.get_by_channel(model.channel_oid)
+
+        bucket = self._get_hour_bucket(model.id.generation_time)
+
+        for leaderboard in leaderboards:
+            leaderboard.add(model.user_root_oid, bucket)
+
+    def reconcile_leaderboards(self):
+        """Reload all the cached message count leaderboards from the message records."""
+        with self._leaderboard_lock:
+            leaderboards = list(self._leaderboards.items())
+
+        for channel_oids, leaderboard in leaderboards:
+            self._load_leaderboard(channel_oids, leaderboard)
+
+    def get_user_rank(self, channel_oids: Union[ObjectId, List[ObjectId]], root_oid: ObjectId, hours_within: int) \
+            -> Optional[Tuple[int, int]]:
+        """
+        Get the message count rank of ``root_oid`` in ``channel_oids`` using the leaderboard.
+
+        The rank is counted within ``hours_within`` hours.
+
+        The window includes the current hour and the previous ``hours_within - 1`` whole hours.
+
+        Users having the same message count share the same rank.
+
+        Returns ``None`` if ``hours_within`` is not one of ``Database.MessageStats.LeaderboardWindowHours``.
+
+        The 1st element of the returned tuple is the rank of the user, ``-1`` if the user has no message.
+
+        The 2nd element of the returned tuple is the count of the users who have sent any message.
+
+        :param channel_oids: channel(s) to get the rank
+        :param root_oid: user to get the rank
+        :param hours_within: length of the window in hours
+        :return: rank of the user and the count of the users if available
+        """
+        if hours_within not in Database.MessageStats.LeaderboardWindowHours:
+            return None
+
+        if isinstance(channel_oids, ObjectId):
+            channel_oids = [channel_oids]
+
+        return self._get_leaderboard(channel_oids).get_rank(
+            root_oid, hours_within, self._get_hour_bucket(now_utc_aware()))
+
+    def clear(self):
+        super().clear()
+
+        with self._leaderboard_lock:
+            self._leaderboards.clear()
+
     # pylint: disable=too-many-arguments
 
     @arg_type_ensure
@@ -84,24 +611,36 @@ class _MessageRecordStatisticsManager(BaseCollection):
         :param proc_time_secs: message processing time
         :return: outcome of the recording process
         """
+        model, outcome, _ = self.insert_one_data(
+            **self._get_record_args(channel_oid, user_root_oid, message_type, message_content, proc_time_secs))
+
+        if outcome.is_inserted:
+            MessageKeywordIndexManager.index_messages([model])
+            self._add_to_leaderboards(model)
+
+        return outcome
+
+    @staticmethod
+    def _get_record_args(channel_oid: Optional[ObjectId], user_root_oid: Optional[ObjectId],
+                         message_type: MessageType, message_content: Any, proc_time_secs: float) -> dict:
         # Avoid casting `None` to `str`
         if message_content:
             # Truncate message content
             message_content = str(message_content)[:Database.MessageStats.MaxContentCharacter]
 
-        _, outcome, _ = self.insert_one_data(
-            ChannelOid=channel_oid, UserRootOid=user_root_oid, MessageType=message_type,
-            MessageContent=message_content, ProcessTimeSecs=proc_time_secs
-        )
-
-        return outcome
+        return {
+            "ChannelOid": channel_oid, "UserRootOid": user_root_oid, "MessageType": message_type,
+            "MessageContent": message_content, "ProcessTimeSecs": proc_time_secs
+        }
 
     @arg_type_ensure
     def record_message_async(self, channel_oid: ObjectId, user_root_oid: Optional[ObjectId],
                              message_type: MessageType, message_content: Any,
                              proc_time_secs: float):
         """
-        Same functionality as ``record_message()`` except that this method executes asynchronously.
+        Same functionality as ``record_message()`` except that the record is buffered and inserted in the background.
+
+        The message counts on the leaderboards are updated immediately.
 
         :param channel_oid: channel of the message
         :param user_root_oid: user who sent the message
@@ -112,10 +651,15 @@ class _MessageRecordStatisticsManager(BaseCollection):
         if is_testing():
             # No async if testing
             self.record_message(channel_oid, user_root_oid, message_type, message_content, proc_time_secs)
-        else:
-            Thread(
-                target=self.record_message,
-                args=(channel_oid, user_root_oid, message_type, message_content, proc_time_secs)).start()
+            return
+
+        model, _, _ = self._construct_model(
+            **self._get_record_args(channel_oid, user_root_oid, message_type, message_content, proc_time_secs))
+
+        if model:
+            model.set_oid(ObjectId())
+            self._telemetry.submit(model.to_json())
+            self._add_to_leaderboards(model)
 
     # pylint: enable=too-many-arguments
 
@@ -147,6 +691,30 @@ class _MessageRecordStatisticsManager(BaseCollection):
         return self.find_cursor_with_count({MessageRecordModel.ChannelOid.key: channel_oid},
                                            sort=[(OID_KEY, pymongo.DESCENDING)], **addl_kwargs)
 
+    @arg_type_ensure
+    def get_recent_messages_before(self, channel_oid: ObjectId, before_oid: Optional[ObjectId] = None, *,
+                                   limit: Optional[int] = None) -> List[MessageRecordModel]:
+        """
+        Get recent messages in the ``channel_oid`` which are recorded before the message ``before_oid``.
+
+        The returned messages will be sorted by its timestamp (DESC).
+
+        Unlike ``get_recent_messages()``, this does not count the messages and uses the OID instead of ``skip``
+        to locate the page, so getting a deeper page costs the same as getting the first page.
+
+        :param channel_oid: channel of the returned messages
+        :param before_oid: OID of the last message of the previous page, `None` to get the first page
+        :param limit: max count of the results
+        :return: list of the messages in `channel_oid` from the most recent one
+        """
+        filter_ = {MessageRecordModel.ChannelOid.key: channel_oid}
+
+        if before_oid:
+            filter_[OID_KEY] = {"$lt": before_oid}
+
+        return [MessageRecordModel.cast_model(data) for data
+                in self.find(filter_, sort=[(OID_KEY, pymongo.DESCENDING)], limit=limit or 0)]
+
     @arg_type_ensure
     def get_message_frequency(self, channel_oid: ObjectId, range_mins: Union[float, int, None] = None) -> float:
         """
@@ -264,10 +832,13 @@ class _MessageRecordStatisticsManager(BaseCollection):
 
         return ret
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def get_messages_distinct_channel(self, message_fragment: str) -> Set[ObjectId]:
         """
         Get the channel OIDs where any of the messages in it contain ``message_fragment``.
 
+        This scans all the messages. Use ``MessageKeywordIndexManager.search_channels()`` for searching the channels.
+
         :param message_fragment: message fragment to search
         :return: a set of channel OIDs where any of the messages contain `message_fragment`
         """
@@ -313,6 +884,7 @@ class _MessageRecordStatisticsManager(BaseCollection):
 
         return switch_branches
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def get_user_messages_total_count(self, channel_oids: Union[ObjectId, List[ObjectId]], *,
                                       hours_within: Optional[int] = None,
                                       start: Optional[datetime] = None, end: Optional[datetime] = None,
@@ -360,6 +932,7 @@ class _MessageRecordStatisticsManager(BaseCollection):
 
         return MemberMessageCountResult(list(self.aggregate(aggr_pipeline)), period_count, trange)
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def get_user_messages_by_category(self, channel_oids: Union[ObjectId, List[ObjectId]], *,
                                       hours_within: Optional[int] = None,
                                       start: Optional[datetime] = None, end: Optional[datetime] = None,
@@ -391,6 +964,7 @@ class _MessageRecordStatisticsManager(BaseCollection):
 
         return MemberMessageByCategoryResult(list(self.aggregate(aggr_pipeline)))
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def hourly_interval_message_count(self, channel_oids: Union[ObjectId, List[ObjectId]], *,
                                       tzinfo_: PytzInfo = UTC.to_tzinfo(), hours_within: Optional[int] = None,
                                       start: Optional[datetime] = None, end: Optional[datetime] = None) \
@@ -428,6 +1002,7 @@ class _MessageRecordStatisticsManager(BaseCollection):
             end_time=end
         )
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def daily_message_count(self, channel_oids: Union[ObjectId, List[ObjectId]], *,
                             tzinfo_: PytzInfo = UTC.to_tzinfo(), hours_within: Optional[int] = None,
                             start: Optional[datetime] = None, end: Optional[datetime] = None) \
@@ -473,6 +1048,7 @@ class _MessageRecordStatisticsManager(BaseCollection):
             tzinfo_,
             start=start, end=end)
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def mean_message_count(self, channel_oids: Union[ObjectId, List[ObjectId]], *,
                            tzinfo_: PytzInfo = UTC.to_tzinfo(), hours_within: Optional[int] = None,
                            start: Optional[datetime] = None, end: Optional[datetime] = None,
@@ -523,6 +1099,7 @@ class _MessageRecordStatisticsManager(BaseCollection):
             tzinfo_,
             trange=trange, max_mean_days=max_mean_days)
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def message_count_before_time(self, channel_oids: Union[ObjectId, List[ObjectId]], *,
                                   tzinfo_: PytzInfo = UTC.to_tzinfo(), hours_within: Optional[int] = None,
                                   start: Optional[datetime] = None, end: Optional[datetime] = None) \
@@ -580,6 +1157,7 @@ class _MessageRecordStatisticsManager(BaseCollection):
             tzinfo_,
             trange=trange)
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     def member_daily_message_count(self, channel_oids: Union[ObjectId, List[ObjectId]], *,
                                    tzinfo_: PytzInfo = UTC.to_tzinfo(), hours_within: Optional[int] = None,
                                    start: Optional[datetime] = None, end: Optional[datetime] = None) \
@@ -625,10 +1203,22 @@ class _MessageRecordStatisticsManager(BaseCollection):
 
 
 class _BotFeatureUsageDataManager(BaseCollection):
+    """
+    Class for managing the bot feature usage records.
+
+    Records from ``record_usage_async()`` are buffered and inserted in batches
+    using the write concern of ``Database.Telemetry.WriteConcern``.
+    """
+
     database_name = DB_NAME
     collection_name = "bot"
     model_class = BotFeatureUsageModel
 
+    def __init__(self):
+        super().__init__()
+
+        self._telemetry = _new_telemetry_writer("Bot feature usage", self)
+
     @arg_type_ensure
     def record_usage(self, feature_used: BotFeature, channel_oid: ObjectId, root_oid: ObjectId):
         """
@@ -656,19 +1246,25 @@ class _BotFeatureUsageDataManager(BaseCollection):
     @arg_type_ensure
     def record_usage_async(self, feature_used: BotFeature, channel_oid: ObjectId, root_oid: ObjectId):
         """
-        Same functionality as ``record_usage()`` except that this method executes asynchronously.
+        Same functionality as ``record_usage()`` except that the record is buffered and inserted in the background.
 
         :param feature_used: bot feature used
         :param channel_oid: channel where the feature was used
         :param root_oid: user who uses the feature
         """
-        if is_testing():
+        if is_testing() or feature_used == BotFeature.UNDEFINED:
             self.record_usage(feature_used, channel_oid, root_oid)
-        else:
-            Thread(target=self.record_usage, args=(feature_used, channel_oid, root_oid)).start()
+            return
+
+        model, _, _ = self._construct_model(Feature=feature_used, ChannelOid=channel_oid, SenderRootOid=root_oid)
+
+        if model:
+            model.set_oid(ObjectId())
+            self._telemetry.submit(model.to_json())
 
     # Statistics
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     @arg_type_ensure
     def get_channel_usage(self, channel_oid: ObjectId, *, hours_within: int = None, incl_not_used: bool = False) \
             -> BotFeatureUsageResult:
@@ -700,6 +1296,7 @@ class _BotFeatureUsageDataManager(BaseCollection):
 
         return BotFeatureUsageResult(list(self.aggregate(pipeline)), incl_not_used)
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     @arg_type_ensure
     def get_channel_hourly_avg(self, channel_oid: ObjectId, *,
                                hours_within: int = None, incl_not_used: bool = False,
@@ -746,6 +1343,7 @@ class _BotFeatureUsageDataManager(BaseCollection):
             HourlyResult.data_days_collected(self, filter_, hr_range=hours_within)
         )
 
+    @use_client_profile(ClientProfile.ANALYTICS)
     @arg_type_ensure
     def get_channel_per_user_usage(self, channel_oid: ObjectId, *,
                                    hours_within: int = None, member_oid_list: Optional[List[ObjectId]] = None) \
@@ -788,6 +1386,78 @@ class _BotFeatureUsageDataManager(BaseCollection):
         return BotFeaturePerUserUsageResult(list(self.aggregate(pipeline)))
 
 
+class _MessageTraceManager(BaseCollection):
+    """
+    Class for managing the sampled traces of the message handling.
+
+    Traces are buffered and inserted in batches using the write concern of ``Database.Telemetry.WriteConcern``.
+    Traces are removed after ``Database.MessageTrace.ExpirySeconds`` seconds.
+    """
+
+    database_name = DB_NAME
+    collection_name = "trace"
+    model_class = MessageTraceModel
+
+    TAG_CHANNEL_OID = "channel_oid"
+    TAG_MESSAGE_TYPE = "message_type"
+
+    def __init__(self):
+        super().__init__()
+
+        self._telemetry = _new_telemetry_writer("Message traces", self)
+
+    def build_indexes(self):
+        self.create_index(MessageTraceModel.Timestamp.key, name="Timestamp (for TTL)",
+                          expireAfterSeconds=Database.MessageTrace.ExpirySeconds)
+
+    def record_trace(self, trace: Trace) -> bool:
+        """
+        Record the finished ``trace``.
+
+        The channel and the message type of the trace are read from its tags
+        ``TAG_CHANNEL_OID`` and ``TAG_MESSAGE_TYPE``.
+
+        :param trace: finished trace to be recorded
+        :return: if the trace is buffered without dropping the other traces
+        """
+        spans = [MessageTraceSpanModel(Name=span.name, Parent=span.parent,
+                                       StartMs=span.start_ms, DurationMs=span.duration_ms)
+                 for span in trace.spans]
+
+        model, _, _ = self._construct_model(
+            Name=trace.name, ChannelOid=trace.tags.get(self.TAG_CHANNEL_OID),
+            MessageType=trace.tags.get(self.TAG_MESSAGE_TYPE), DurationMs=trace.duration_ms, Spans=spans,
+            Timestamp=now_utc_aware(for_mongo=True))
+
+        if not model:
+            return False
+
+        model.set_oid(ObjectId())
+
+        return self._telemetry.submit(model.to_json())
+
+    @use_client_profile(ClientProfile.ANALYTICS)
+    def get_latency_percentiles(self, *, hours_within: Optional[int] = None) -> MessageLatencyResult:
+        """
+        Get the latency percentiles of the message handling from the recent traces.
+
+        Only the latest ``Database.MessageTrace.MaxAnalyzeCount`` traces are used.
+
+        :param hours_within: hour range of the traces
+        :return: a `MessageLatencyResult` containing the latency percentiles of each stage and text handler
+        """
+        filter_ = {}
+
+        self.attach_time_range(filter_, hours_within=hours_within)
+
+        cursor = self.find(filter_).sort([(OID_KEY, pymongo.DESCENDING)]).limit(Database.MessageTrace.MaxAnalyzeCount)
+
+        return MessageLatencyResult(MessageTraceModel.cast_model(data) for data in cursor)
+
+
 APIStatisticsManager = _APIStatisticsManager()
+MessageKeywordBackfillManager = _MessageKeywordBackfillManager()
+MessageKeywordIndexManager = _MessageKeywordIndexManager()
 MessageRecordStatisticsManager = _MessageRecordStatisticsManager()
 BotFeatureUsageDataManager = _BotFeatureUsageDataManager()
+MessageTraceManager = _MessageTraceManager()
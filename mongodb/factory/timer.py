@@ -1,7 +1,9 @@
 """Data manager for the timers."""
 from datetime import datetime, timedelta
-from typing import Optional, List
+from threading import Lock
+from typing import Optional, List, Tuple, FrozenSet
 
+from cachetools import TTLCache
 import pymongo
 from bson import ObjectId
 
@@ -13,6 +15,7 @@ from extutils.dt import is_tz_naive, now_utc_aware, make_tz_aware
 from JellyBot.systemconfig import Bot
 
 from ._base import BaseCollection
+from .factory import ClientProfile
 
 __all__ = ("TimerManager",)
 
@@ -20,14 +23,119 @@ DB_NAME = "timer"
 
 
 class _TimerManager(BaseCollection):
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "timer"
     model_class = TimerModel
 
+    def __init__(self):
+        super().__init__()
+
+        # Channel OID to the keywords of the active timers and the earliest deletion time of the timers
+        self._keyword_cache: "TTLCache[ObjectId, Tuple[FrozenSet[str], Optional[datetime]]]" = \
+            TTLCache(maxsize=Bot.Timer.KeywordCacheSize, ttl=Bot.Timer.KeywordCacheExpirySeconds)
+        self._keyword_cache_lock = Lock()
+        self._keyword_cache_version = 0  # Bumped on every invalidation to prevent caching the stale keywords
+
     def build_indexes(self):
         self.create_index(TimerModel.Keyword.key)
         self.create_index(TimerModel.DeletionTime.key, expireAfterSeconds=0)
 
+    def _invalidate_keywords(self, channel_oid: Optional[ObjectId] = None):
+        with self._keyword_cache_lock:
+            self._keyword_cache_version += 1
+
+            if channel_oid:
+                self._keyword_cache.pop(channel_oid, None)
+            else:
+                self._keyword_cache.clear()
+
+    def _load_keywords(self, channel_oid: ObjectId) -> Tuple[FrozenSet[str], Optional[datetime]]:
+        now = now_utc_aware()
+
+        keywords = set()
+        earliest_deletion = None
+
+        projection = {TimerModel.Keyword.key: 1, TimerModel.DeletionTime.key: 1}
+        for data in self.find({TimerModel.ChannelOid.key: channel_oid}, projection=projection):
+            deletion_time = data.get(TimerModel.DeletionTime.key)
+
+            if deletion_time:
+                deletion_time = make_tz_aware(deletion_time, UTC.to_tzinfo())
+
+                # Expired timers may not be deleted by the TTL monitor yet
+                if deletion_time <= now:
+                    continue
+
+                if not earliest_deletion or deletion_time < earliest_deletion:
+                    earliest_deletion = deletion_time
+
+            keywords.add(data[TimerModel.Keyword.key])
+
+        return frozenset(keywords), earliest_deletion
+
+    def _get_keywords(self, channel_oid: ObjectId) -> FrozenSet[str]:
+        """
+        Get the keywords of the active timers in ``channel_oid``.
+
+        The keywords will be loaded and cached on the first call of a channel.
+        The cache of a channel will be invalidated when a timer of the channel is added or deleted,
+        or once any timer of the channel expires.
+
+        :param channel_oid: channel of the timers
+        :return: keywords of the active timers in the channel
+        """
+        with self._keyword_cache_lock:
+            cached = self._keyword_cache.get(channel_oid)
+            version = self._keyword_cache_version
+
+        if cached:
+            keywords, earliest_deletion = cached
+
+            if not earliest_deletion or now_utc_aware() < earliest_deletion:
+                return keywords
+
+        cached = self._load_keywords(channel_oid)
+
+        with self._keyword_cache_lock:
+            if version == self._keyword_cache_version:
+                self._keyword_cache[channel_oid] = cached
+
+        return cached[0]
+
+    @arg_type_ensure
+    def has_keyword(self, channel_oid: ObjectId, keyword: str) -> bool:
+        """
+        Check if ``channel_oid`` has any active timer which keyword is ``keyword``.
+
+        This only checks the cached keywords, so the database will not be queried on cache hit.
+
+        :param channel_oid: channel of the timers
+        :param keyword: keyword of the timers
+        :return: if the channel has any active timer with `keyword`
+        """
+        return keyword in self._get_keywords(channel_oid)
+
+    @arg_type_ensure
+    def has_timer(self, channel_oid: ObjectId) -> bool:
+        """
+        Check if ``channel_oid`` has any active timer.
+
+        This only checks the cached keywords, so the database will not be queried on cache hit.
+
+        :param channel_oid: channel of the timers
+        :return: if the channel has any active timer
+        """
+        return bool(self._get_keywords(channel_oid))
+
+    def insert_one_model(self, model: TimerModel) -> Tuple[WriteOutcome, Optional[Exception]]:
+        outcome, ex = super().insert_one_model(model)
+
+        if outcome.is_inserted:
+            self._invalidate_keywords(model.channel_oid)
+
+        return outcome, ex
+
     @arg_type_ensure
     def add_new_timer(
             self, ch_oid: ObjectId, keyword: str, title: str, target_time: datetime, *,
@@ -57,7 +165,14 @@ class _TimerManager(BaseCollection):
         :param timer_oid: OID of the timer to be deleted
         :return: if the timer was successfully deleted
         """
-        return self.delete_one({OID_KEY: timer_oid}).deleted_count > 0
+        deleted = self.find_one_and_delete({OID_KEY: timer_oid}, projection={TimerModel.ChannelOid.key: 1})
+
+        if not deleted:
+            return False
+
+        self._invalidate_keywords(deleted[TimerModel.ChannelOid.key])
+
+        return True
 
     @arg_type_ensure
     def list_all_timer(self, channel_oid: ObjectId) -> TimerListResult:
@@ -83,18 +198,22 @@ class _TimerManager(BaseCollection):
 
         ``keyword`` needs to be an exact match, **NOT** partial match.
 
+        The database will be queried only if ``keyword`` is one of the cached timer keywords of ``channel_oid``.
+
         All timers in the returned result will be sorted by its target time (ASC).
 
         :param channel_oid: channel of the timers
         :param keyword: keyword of the timers
         :return: a `TimerListResult` containing the timers that match the conditions
         """
-        return TimerListResult(
-            self.find_cursor_with_count(
-                {TimerModel.Keyword.key: keyword, TimerModel.ChannelOid.key: channel_oid},
-                sort=[(TimerModel.TargetTime.key, pymongo.ASCENDING)]
-            )
-        )
+        if not self.has_keyword(channel_oid, keyword):
+            return TimerListResult([])
+
+        return TimerListResult([
+            TimerModel.cast_model(data) for data
+            in self.find({TimerModel.Keyword.key: keyword, TimerModel.ChannelOid.key: channel_oid},
+                         sort=[(TimerModel.TargetTime.key, pymongo.ASCENDING)])
+        ])
 
     @arg_type_ensure
     def get_notify(self, channel_oid: ObjectId, within_secs: Optional[int] = None) -> List[TimerModel]:
@@ -148,6 +267,11 @@ class _TimerManager(BaseCollection):
 
         return ret
 
+    def clear(self):
+        super().clear()
+
+        self._invalidate_keywords()
+
     @staticmethod
     def get_notify_within_secs(message_frequency: float):
         """
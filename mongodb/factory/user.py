@@ -1,22 +1,29 @@
 """Data managers of the user identities."""
 from collections import namedtuple
-from datetime import tzinfo
-from typing import Optional, Dict, List, Union, NamedTuple
+from datetime import timedelta, tzinfo
+from threading import Lock, Thread
+from typing import Optional, Dict, List, Union, NamedTuple, Iterable
 
 from bson import ObjectId
+from cachetools import TTLCache
+from pymongo import ReturnDocument, UpdateOne
 
-from pymongo import ReturnDocument
-
+from env_var import is_testing
+from extutils.dt import now_utc_aware, make_tz_aware
 from extutils.gidentity import GoogleIdentityUserData
 from extutils.emailutils import MailSender
 from extutils.locales import DEFAULT_LOCALE
 from extutils.checker import arg_type_ensure
+from extutils.namecache import NameCacheBackend, NameCacheEntry
 from flags import Platform
+from JellyBot.systemconfig import Database, DataQuery
 from models import APIUserModel, OnPlatformUserModel, RootUserModel, RootUserConfigModel, OID_KEY, ChannelModel, \
-    ChannelCollectionModel
+    ChannelCollectionModel, UserIntegrationJobModel, UserIntegrationProgressModel, UserNameCacheModel, \
+    get_uname_cache_batch, set_uname_cache_backend
 from mongodb.factory.results import OperationOutcome
 
 from ._base import BaseCollection
+from .factory import ClientProfile
 from .mixin import GenerateTokenMixin
 from .results import (
     WriteOutcome, GetOutcome, UpdateOutcome,
@@ -24,7 +31,8 @@ from .results import (
     RootUserUpdateResult, GetRootUserDataResult
 )
 
-__all__ = ("APIUserManager", "OnPlatformIdentityManager", "RootUserManager",)
+__all__ = ("APIUserManager", "OnPlatformIdentityManager", "RootUserManager", "UserIntegrationJobManager",
+           "UserNameCacheManager",)
 
 DB_NAME = "user"
 
@@ -101,6 +109,7 @@ class _APIUserManager(GenerateTokenMixin, BaseCollection):
 class _OnPlatformIdentityManager(BaseCollection):
     """Class to manage the on-platform identity."""
 
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "onplat"
     model_class = OnPlatformUserModel
@@ -153,9 +162,268 @@ class _OnPlatformIdentityManager(BaseCollection):
         return self.find_one_casted({OnPlatformUserModel.Id.key: oid})
 
 
+class _UserNameCacheManager(NameCacheBackend, BaseCollection):
+    """
+    Class to manage the user name cache shared across the processes.
+
+    Cached user names are removed after ``DataQuery.UserNameSharedCacheExpirySeconds`` seconds since updated.
+    """
+
+    client_profile = ClientProfile.HOT_PATH
+    database_name = DB_NAME
+    collection_name = "uname"
+    model_class = UserNameCacheModel
+
+    def build_indexes(self):
+        self.create_index(UserNameCacheModel.UpdatedAt.key, name="Timestamp (for TTL)",
+                          expireAfterSeconds=DataQuery.UserNameSharedCacheExpirySeconds)
+
+    def get_names(self, keys: List[ObjectId]) -> Dict[ObjectId, NameCacheEntry]:
+        return {
+            data[OID_KEY]: NameCacheEntry(name=data[UserNameCacheModel.Name.key],
+                                          updated_at=make_tz_aware(data[UserNameCacheModel.UpdatedAt.key]))
+            for data in self.find({OID_KEY: {"$in": keys}})
+        }
+
+    def set_names(self, entries: Dict[ObjectId, NameCacheEntry]):
+        if not entries:
+            return
+
+        self.bulk_write([
+            UpdateOne(
+                {OID_KEY: onplat_oid},
+                {"$set": {
+                    UserNameCacheModel.Name.key: entry.name,
+                    UserNameCacheModel.UpdatedAt.key: entry.updated_at
+                }},
+                upsert=True
+            )
+            for onplat_oid, entry in entries.items()
+        ], ordered=False)
+
+    def clear(self):
+        self.delete_many({})
+
+
+class _UserIntegrationJobManager(BaseCollection):
+    """
+    Class to manage the user data integration jobs.
+
+    While a job is not completed, the data of the source user is partially migrated to the destination user.
+    Any reads of the user data should use ``resolve_uid()`` / ``get_uid_aliases()`` to include the data of both.
+    """
+
+    database_name = DB_NAME
+    collection_name = "intg"
+    model_class = UserIntegrationJobModel
+
+    def __init__(self):
+        super().__init__()
+
+        # Source UID to destination UID of the incomplete jobs
+        self._alias_cache: "TTLCache[str, Dict[ObjectId, ObjectId]]" = \
+            TTLCache(maxsize=1, ttl=Database.UserIntegration.AliasCacheExpirySeconds)
+        self._alias_cache_lock = Lock()
+
+    def build_indexes(self):
+        self.create_index(UserIntegrationJobModel.Completed.key, name="Job Status")
+
+    def _invalidate_alias(self):
+        with self._alias_cache_lock:
+            self._alias_cache.clear()
+
+    @arg_type_ensure
+    def create_job(self, src_oid: ObjectId, dst_oid: ObjectId, collection_names: List[str]) \
+            -> UserIntegrationJobModel:
+        """
+        Create a job to integrate the user data from ``src_oid`` to ``dst_oid``.
+
+        :param src_oid: OID of the source user
+        :param dst_oid: OID of the destination user
+        :param collection_names: planned full names (`<database>.<collection>`) of the collections to be migrated
+        :return: created job
+        """
+        model = UserIntegrationJobModel(
+            SourceOid=src_oid, DestinationOid=dst_oid,
+            Progress=[UserIntegrationProgressModel(CollectionName=name) for name in collection_names])
+
+        self.insert_one_model(model)
+        self._invalidate_alias()
+
+        return model
+
+    @arg_type_ensure
+    def acquire_job(self, job_oid: ObjectId, owner: ObjectId) -> bool:
+        """
+        Let ``owner`` hold the job for ``Database.UserIntegration.JobLeaseSeconds`` seconds.
+
+        The job can only be held if it is not completed and not held by the other process.
+
+        :param job_oid: OID of the job
+        :param owner: ID of the process to hold the job
+        :return: if the job is held by `owner`
+        """
+        now = now_utc_aware()
+
+        return self.update_one(
+            {
+                OID_KEY: job_oid,
+                UserIntegrationJobModel.Completed.key: False,
+                "$or": [{UserIntegrationJobModel.LeaseUntil.key: None},
+                        {UserIntegrationJobModel.LeaseUntil.key: {"$lt": now}}]
+            },
+            {"$set": {
+                UserIntegrationJobModel.Owner.key: owner,
+                UserIntegrationJobModel.LeaseUntil.key:
+                    now + timedelta(seconds=Database.UserIntegration.JobLeaseSeconds)
+            }}
+        ).modified_count > 0
+
+    @arg_type_ensure
+    def release_job(self, job_oid: ObjectId, owner: ObjectId):
+        """
+        Release the job held by ``owner``, so it can be resumed by any process.
+
+        :param job_oid: OID of the job
+        :param owner: ID of the process holding the job
+        """
+        self.update_one(
+            {OID_KEY: job_oid, UserIntegrationJobModel.Owner.key: owner},
+            {"$set": {UserIntegrationJobModel.LeaseUntil.key: None}})
+
+    # pylint: disable=too-many-arguments
+
+    @arg_type_ensure
+    def update_progress(self, job_oid: ObjectId, owner: ObjectId, collection_name: str,
+                        last_oid: Optional[ObjectId], count: int, failed_count: int, *,
+                        completed: bool = False) -> bool:
+        """
+        Record the integration progress of a collection and renew the lease of ``owner``.
+
+        :param job_oid: OID of the job
+        :param owner: ID of the process holding the job
+        :param collection_name: planned full name (`<database>.<collection>`) of the collection
+        :param last_oid: OID of the last document processed
+        :param count: count of the documents migrated so far
+        :param failed_count: count of the documents failed to be migrated so far
+        :param completed: if the migration of the collection is completed
+        :return: if the job is still held by `owner`
+        """
+        progress_key = UserIntegrationJobModel.Progress.key
+
+        return self.update_one(
+            {OID_KEY: job_oid, UserIntegrationJobModel.Owner.key: owner,
+             f"{progress_key}.{UserIntegrationProgressModel.CollectionName.key}": collection_name},
+            {"$set": {
+                f"{progress_key}.$.{UserIntegrationProgressModel.LastOid.key}": last_oid,
+                f"{progress_key}.$.{UserIntegrationProgressModel.Count.key}": count,
+                f"{progress_key}.$.{UserIntegrationProgressModel.FailedCount.key}": failed_count,
+                f"{progress_key}.$.{UserIntegrationProgressModel.Completed.key}": completed,
+                UserIntegrationJobModel.LeaseUntil.key:
+                    now_utc_aware() + timedelta(seconds=Database.UserIntegration.JobLeaseSeconds)
+            }}
+        ).modified_count > 0
+
+    @arg_type_ensure
+    def complete_job(self, job_oid: ObjectId, owner: ObjectId) -> Optional[UserIntegrationJobModel]:
+        """
+        Mark the job held by ``owner`` as completed.
+
+        :param job_oid: OID of the job
+        :param owner: ID of the process holding the job
+        :return: completed job if found
+        """
+        ret = self.find_one_and_update(
+            {OID_KEY: job_oid, UserIntegrationJobModel.Owner.key: owner},
+            {"$set": {UserIntegrationJobModel.Completed.key: True,
+                      UserIntegrationJobModel.CompletedAt.key: now_utc_aware(),
+                      UserIntegrationJobModel.LeaseUntil.key: None}},
+            return_document=ReturnDocument.AFTER)
+
+        self._invalidate_alias()
+
+        return UserIntegrationJobModel.cast_model(ret)
+
+    @arg_type_ensure
+    def get_job(self, job_oid: ObjectId) -> Optional[UserIntegrationJobModel]:
+        """
+        Get the job by its OID.
+
+        :param job_oid: OID of the job
+        :return: job if found
+        """
+        return self.find_one_casted({OID_KEY: job_oid})
+
+    def get_incomplete_jobs(self) -> List[UserIntegrationJobModel]:
+        """
+        Get the jobs which are not yet completed, sorted by the creation time (ASC).
+
+        :return: list of the incomplete jobs
+        """
+        return [UserIntegrationJobModel.cast_model(data) for data
+                in self.find({UserIntegrationJobModel.Completed.key: False}, sort=[(OID_KEY, 1)])]
+
+    def get_alias_map(self) -> Dict[ObjectId, ObjectId]:
+        """
+        Get the map of the source UID to the destination UID of the incomplete jobs.
+
+        :return: map of source UID to destination UID
+        """
+        with self._alias_cache_lock:
+            alias_map = self._alias_cache.get("alias")
+
+        if alias_map is None:
+            alias_map = {job.source_oid: job.destination_oid for job in self.get_incomplete_jobs()}
+
+            with self._alias_cache_lock:
+                self._alias_cache["alias"] = alias_map
+
+        return alias_map
+
+    def resolve_uid(self, uid: ObjectId) -> ObjectId:
+        """
+        Get the UID that ``uid`` is being integrated to. Returns ``uid`` if it is not being integrated.
+
+        :param uid: UID to be resolved
+        :return: UID that `uid` is being integrated to
+        """
+        return self.get_alias_map().get(uid, uid)
+
+    def get_uid_aliases(self, uid: ObjectId) -> List[ObjectId]:
+        """
+        Get ``uid`` and the UIDs that are being integrated to ``uid``.
+
+        :param uid: UID to get the aliases
+        :return: list of UIDs with `uid` being the first element
+        """
+        return [uid] + [src for src, dst in self.get_alias_map().items() if dst == uid]
+
+    def get_uid_filter_value(self, uid: ObjectId) -> Union[ObjectId, dict]:
+        """
+        Get the value to be used in a filter to find the data of ``uid``.
+
+        The value includes the UIDs that are being integrated to ``uid``.
+
+        :param uid: UID to be used in the filter
+        :return: `uid` if no UIDs are being integrated to `uid`, `$in` condition of the aliases otherwise
+        """
+        aliases = self.get_uid_aliases(uid)
+
+        if len(aliases) == 1:
+            return uid
+
+        return {"$in": aliases}
+
+    def clear(self):
+        super().clear()
+
+        self._invalidate_alias()
+
+
 class _RootUserManager(BaseCollection):
     """Class to manage the root user data. This also serve as the main data controller of the user identities."""
 
+    client_profile = ClientProfile.HOT_PATH
     database_name = DB_NAME
     collection_name = "root"
     model_class = RootUserModel
@@ -173,6 +441,7 @@ class _RootUserManager(BaseCollection):
 
         APIUserManager.clear()
         OnPlatformIdentityManager.clear()
+        UserIntegrationJobManager.clear()
         OnPlatformUserModel.clear_name_cache()
 
     def register_onplat(self, platform: Platform, user_token: str) -> RootUserRegistrationResult:
@@ -251,7 +520,7 @@ class _RootUserManager(BaseCollection):
         :param root_oid: OID of the user
         :return: `RootUserModel` if found, `None` otherwise
         """
-        return self.find_one_casted({OID_KEY: root_oid})
+        return self.find_one_casted({OID_KEY: UserIntegrationJobManager.resolve_uid(root_oid)})
 
     @arg_type_ensure
     def get_root_data_uname(
@@ -342,6 +611,94 @@ class _RootUserManager(BaseCollection):
         name_str = onplat_data.get_name_str(channel_data) if onplat_data else None
         return UserNameEntry(user_id=root_oid, user_name=on_not_found or name_str)
 
+    @staticmethod
+    def _fetch_onplat_names(onplat_models: List[OnPlatformUserModel],
+                            channel_data: Union[ChannelModel, ChannelCollectionModel, None]):
+        for onplat_model in onplat_models:
+            # Names will be stored in the cache once fetched
+            onplat_model.get_name(channel_data)
+
+    def get_root_data_uname_batch(
+            self, root_oids: Iterable[ObjectId],
+            channel_data: Union[ChannelModel, ChannelCollectionModel, None] = None, *,
+            on_not_found: Optional[str] = None) -> Dict[ObjectId, str]:
+        """
+        Get the user names of ``root_oids`` using a single aggregation regardless the count of the users.
+
+        The user names are determined in the same order as ``get_root_data_uname()``,
+        except that only the cached on-platform user names will be used.
+        If ``channel_data`` is a :class:`ChannelModel`, the names of the on-platform identities not in the cache
+        will be fetched in the background, so they will be available on the later calls.
+
+        Users whose root data is not found will not be included in the returned result.
+
+        :param root_oids: OIDs of the users
+        :param channel_data: channel to get the user names
+        :param on_not_found: user name to be used if not found
+        :return: `dict` which key is the user root OID and the value is the user name
+        """
+        ret = {}
+        onplat_to_fetch = []
+
+        onplat_key = "onplat"
+        pipeline = [
+            {"$match": {OID_KEY: {"$in": list(root_oids)}}},
+            {"$lookup": {
+                "from": OnPlatformIdentityManager.get_col_name(),
+                "localField": RootUserModel.OnPlatOids.key,
+                "foreignField": OID_KEY,
+                "as": onplat_key
+            }}
+        ]
+
+        data_list = list(self.aggregate(pipeline))
+
+        # Get the cached names of all on-platform identities at once
+        cached_names = get_uname_cache_batch(
+            onplat_data[OID_KEY] for data in data_list for onplat_data in data[onplat_key])
+
+        for data in data_list:
+            onplat_dict = {onplat_data[OID_KEY]: OnPlatformUserModel.cast_model(onplat_data)
+                           for onplat_data in data.pop(onplat_key)}
+            udata = RootUserModel.cast_model(data)
+
+            if udata.config.name:
+                ret[udata.id] = udata.config.name
+                continue
+
+            if not udata.has_onplat_data:
+                ret[udata.id] = on_not_found or f"UID - {udata.id}"
+                continue
+
+            # `$lookup` does not preserve the order of the on-platform OIDs
+            onplat_models = [onplat_dict[oid] for oid in udata.on_plat_oids if oid in onplat_dict]
+
+            cached = next(filter(None, (cached_names.get(onplat_model.id) for onplat_model in onplat_models)), None)
+            if cached:
+                ret[udata.id] = cached.name
+
+                if cached.stale:
+                    onplat_to_fetch.extend(onplat_models)
+
+                continue
+
+            onplat_to_fetch.extend(onplat_models)
+
+            if onplat_models:
+                last_model = onplat_models[-1]
+                ret[udata.id] = on_not_found or f"{last_model.token} ({last_model.platform.key})"
+            else:
+                ret[udata.id] = on_not_found or f"UID - {udata.id}"
+
+        # Fetching the names requires the channel data, check `OnPlatformUserModel.get_name()` for details
+        if onplat_to_fetch and isinstance(channel_data, ChannelModel):
+            if is_testing():
+                self._fetch_onplat_names(onplat_to_fetch, channel_data)
+            else:
+                Thread(target=self._fetch_onplat_names, args=(onplat_to_fetch, channel_data)).start()
+
+        return ret
+
     def get_root_data_api_token(self, token: str, *, skip_on_plat=True) -> GetRootUserDataResult:
         """
         Get the via API token.
@@ -448,17 +805,23 @@ class _RootUserManager(BaseCollection):
         return OnPlatformIdentityManager.get_onplat(platform, user_token)
 
     @staticmethod
-    def get_onplat_data_dict() -> Dict[ObjectId, OnPlatformUserModel]:
+    def get_onplat_data_dict(onplat_oids: Optional[List[ObjectId]] = None) -> Dict[ObjectId, OnPlatformUserModel]:
         """
         Get a :class:`dict` which key is the on-platform identity OID and value is its corresponding user data.
 
-        This :class:`dict` includes all on-platform identity data,
+        If ``onplat_oids`` is ``None``, this :class:`dict` includes all on-platform identity data,
         hence the use of this function should be carefully considered as it's expensive.
 
-        :return: a `dict` containing all on-platform identity data
+        :param onplat_oids: OIDs of the on-platform identity data to get
+        :return: a `dict` containing the on-platform identity data
         """
+        filter_ = {}
+
+        if onplat_oids:
+            filter_[OID_KEY] = {"$in": onplat_oids}
+
         ret = {}
-        for onplat_data in OnPlatformIdentityManager.find_cursor_with_count():
+        for onplat_data in OnPlatformIdentityManager.find_cursor_with_count(filter_):
             ret[onplat_data.id] = onplat_data
 
         return ret
@@ -627,4 +990,8 @@ class _RootUserManager(BaseCollection):
 
 APIUserManager = _APIUserManager()
 OnPlatformIdentityManager = _OnPlatformIdentityManager()
+UserIntegrationJobManager = _UserIntegrationJobManager()
 RootUserManager = _RootUserManager()
+UserNameCacheManager = _UserNameCacheManager()
+
+set_uname_cache_backend(UserNameCacheManager)
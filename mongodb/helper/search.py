@@ -9,7 +9,9 @@ from bson import ObjectId
 
 from extutils.emailutils import MailSender
 from models import ChannelModel, ChannelCollectionModel
-from mongodb.factory import ChannelManager, MessageRecordStatisticsManager, RootUserManager, ProfileManager
+from mongodb.factory import (
+    ChannelManager, MessageRecordStatisticsManager, MessageKeywordIndexManager, RootUserManager, ProfileManager
+)
 
 __all__ = ("IdentitySearcher",)
 
@@ -26,19 +28,22 @@ class IdentitySearcher:
     """Class to search for any types of identity data."""
 
     @staticmethod
-    def search_channel(keyword: str, root_oid: ObjectId) -> List[ChannelData]:
+    def search_channel(keyword: str, root_oid: ObjectId, *,
+                       skip: int = 0, limit: Optional[int] = None) -> List[ChannelData]:
         """
         Search the channels that the user ``root_oid`` is inside using ``keyword``.
 
         This search **hides** all private channels.
 
-        Returned result will be sorted by last message time (DESC) then by its ID (DESC).
+        Channels which default name or token matches ``keyword`` come first,
+        sorted by last message time (DESC) then by its ID (DESC).
+        The channels matched by the messages follow in the order ranked by the keyword index.
 
         -----------
 
         ``keyword`` can be:
 
-        - partial word from the message of a channel
+        - partial words from the message of a channel
 
         - a part of the default name of a channel
 
@@ -48,39 +53,58 @@ class IdentitySearcher:
 
         :param keyword: keyword to search the channel
         :param root_oid: OID of the user inside the returned channels
+        :param skip: count of the results to skip
+        :param limit: max count of the results
         :return: list of `ChannelData` that the user is in and match the conditions
         """
-        checked_choid: Set[ObjectId] = set()  # This prevents duplicated entries
         ret: List[ChannelData] = []
-        missing = []
 
         # Get channels that the user is in - early terminate if not in any channel
         ch_oids = ProfileManager.get_users_exist_channel_dict([root_oid]).get(root_oid)
         if not ch_oids:
             return ret
 
-        # Get channels by default name
-        for ch_model in ChannelManager.get_channel_default_name(keyword, hide_private=True):
-            ch_oid = ch_model.id
+        ch_oids = list(ch_oids)
+
+        # Get channels by default name - count of these is bounded by the channels that the user is in
+        name_matched = [ChannelData(ch_model, ch_model.get_channel_name(root_oid))
+                        for ch_model
+                        in ChannelManager.get_channel_default_name(keyword, hide_private=True, channel_oids=ch_oids)]
+
+        name_matched_choid: Set[ObjectId] = {data.channel_model.id for data in name_matched}
 
-            if ch_oid not in ch_oids:
-                continue
+        last_msg_dict = MessageRecordStatisticsManager.get_channel_last_message_ts(root_oid, list(name_matched_choid))
+
+        def sort_key(data):
+            cid = data.channel_model.id
 
-            checked_choid.add(ch_oid)
-            ret.append(ChannelData(ch_model, ch_model.get_channel_name(root_oid)))
+            return last_msg_dict.get(cid, datetime.min.replace(tzinfo=pytz.utc)), cid
+
+        name_matched.sort(key=sort_key, reverse=True)
+
+        ret.extend(name_matched[skip:skip + limit] if limit else name_matched[skip:])
+
+        if limit and len(ret) >= limit:
+            return ret
 
-        # Get channels by messages
-        for channel_oid in MessageRecordStatisticsManager.get_messages_distinct_channel(keyword):
-            if channel_oid in checked_choid or channel_oid not in ch_oids:
-                continue
+        # Get channels by messages - private channels are excluded before the search to keep the page full
+        ch_dict = ChannelManager.get_channel_dict([ch_oid for ch_oid in ch_oids if ch_oid not in name_matched_choid])
 
-            checked_choid.add(channel_oid)
-            ch_model = ChannelManager.get_channel_oid(channel_oid, hide_private=True)
+        msg_ch_oids = MessageKeywordIndexManager.search_channels(
+            keyword,
+            [ch_oid for ch_oid in ch_oids
+             if ch_oid not in name_matched_choid and not (ch_oid in ch_dict and ch_dict[ch_oid].config.info_private)],
+            skip=max(0, skip - len(name_matched)), limit=limit - len(ret) if limit else None)
+
+        missing = []
+
+        for ch_oid in msg_ch_oids:
+            ch_model = ch_dict.get(ch_oid)
 
             if ch_model:
                 ret.append(ChannelData(ch_model, ch_model.get_channel_name(root_oid)))
             else:
-                missing.append(channel_oid)
+                missing.append(ch_oid)
 
         # Send email report if hanging channel OID found in messages
         if missing:
@@ -89,15 +113,7 @@ class IdentitySearcher:
                 f"{' | '.join([str(i) for i in missing])}",
                 subject="Missing Channel Data")
 
-        # Sort the resulting list
-        last_msg_dict = MessageRecordStatisticsManager.get_channel_last_message_ts(root_oid, list(checked_choid))
-
-        def sort_key(data):
-            cid = data.channel_model.id
-
-            return last_msg_dict.get(cid, datetime.min.replace(tzinfo=pytz.utc)), cid
-
-        return list(sorted(ret, key=sort_key, reverse=True))
+        return ret
 
     @staticmethod
     def get_batch_user_name(user_oids: Iterable[ObjectId], channel_data: Union[ChannelModel, ChannelCollectionModel],
@@ -16,7 +16,7 @@ from models import (
     MemberMessageByCategoryResult, MemberMessageCountResult, MemberDailyMessageResult
 )
 from mongodb.factory import (
-    MessageRecordStatisticsManager, ProfileManager, BotFeatureUsageDataManager
+    MessageRecordStatisticsManager, ProfileManager, BotFeatureUsageDataManager, RootUserManager
 )
 
 from .search import IdentitySearcher
@@ -157,6 +157,7 @@ class HandledMessageRecords:
     """Represents a collection of handled messages and its related stats."""
 
     data: List[HandledMessageRecordEntry]
+    next_before_oid: Optional[ObjectId] = None
     avg_processing_secs: Dict[MessageType, float] = field(init=False, default_factory=dict)
     message_frequency = float
     unique_sender_count: int = field(init=False, default_factory=int)
@@ -172,7 +173,7 @@ class HandledMessageRecords:
         msg_count = len(self.data)
 
         proc_secs = [msg.model.process_time_secs for msg in self.data]
-        self.avg_processing_secs = sum(proc_secs) / msg_count
+        self.avg_processing_secs = sum(proc_secs) / msg_count if msg_count else 0
 
         counter = {mt: 0 for mt in MessageType}
         for entry in self.data:
@@ -431,6 +432,11 @@ class MessageStatsDataProcessor:
                               hours_within: Optional[int] = None, start: Optional[datetime] = None,
                               end: Optional[datetime] = None) \
             -> UserMessageRanking:
+        if hours_within and not start and not end:
+            rank = MessageRecordStatisticsManager.get_user_rank(channel_oids, root_oid, hours_within)
+            if rank is not None:
+                return UserMessageRanking(rank=rank[0], total=rank[1])
+
         msg_by_cat = MessageRecordStatisticsManager.get_user_messages_by_category(
             channel_oids, hours_within=hours_within, start=start, end=end)
 
@@ -555,6 +561,10 @@ class MessageStatsDataProcessor:
         """
         Get the message count ranking of ``root_oid`` in ``channel_data``.
 
+        If only ``hours_within`` is given and it is one of ``Database.MessageStats.LeaderboardWindowHours``,
+        the rank will be got from the leaderboard maintained in the memory.
+        Check :meth:`MessageRecordStatisticsManager.get_user_rank()` for the details.
+
         :param channel_data: channel to get the user message ranking
         :param root_oid: user OID to get the message ranking
         :param hours_within: time range in hours of the data
@@ -573,6 +583,10 @@ class MessageStatsDataProcessor:
         """
         Get the message count ranking of ``root_oid`` in ``chcoll_data``.
 
+        If only ``hours_within`` is given and it is one of ``Database.MessageStats.LeaderboardWindowHours``,
+        the rank will be got from the leaderboard maintained in the memory.
+        Check :meth:`MessageRecordStatisticsManager.get_user_rank()` for the details.
+
         :param chcoll_data: channel collection to get the user message ranking
         :param root_oid: user OID to get the message ranking
         :param hours_within: time range in hours of the data
@@ -585,26 +599,38 @@ class MessageStatsDataProcessor:
 
     @staticmethod
     def get_recent_messages(channel_data: ChannelModel, *,
-                            limit: Optional[int] = None, skip: Optional[int] = None, tz: Optional[tzinfo] = None) \
-            -> HandledMessageRecords:
+                            limit: Optional[int] = None, before_oid: Optional[ObjectId] = None,
+                            tz: Optional[tzinfo] = None) -> HandledMessageRecords:
         """
         Get the most recent messages of ``channel_data``.
 
+        This takes 2 queries regardless the count of the messages and the count of the unique senders.
+        One for the messages and another one for the names of the senders.
+
+        To get the next page, pass ``next_before_oid`` of the returned result as ``before_oid``.
+
         :param channel_data: channel to get the recent messages
         :param limit: maximum count of the messages to be returned
-        :param skip: count of the messages to skip in the returned result
+        :param before_oid: OID of the last message of the previous page
         :param tz: timezone info to apply on the message timestamps
         :return: a `HandledMessageRecords`
         """
-        ret = []
-        msgs = list(MessageRecordStatisticsManager.get_recent_messages(channel_data.id, limit=limit, skip=skip))
-        uids = {msg.user_root_oid for msg in msgs}
-        uids_handled = IdentitySearcher.get_batch_user_name(uids, channel_data)
+        # Get 1 more message to check if there is a next page
+        msgs = MessageRecordStatisticsManager.get_recent_messages_before(
+            channel_data.id, before_oid, limit=limit + 1 if limit else None)
+
+        next_before_oid = None
+        if limit and len(msgs) > limit:
+            msgs = msgs[:limit]
+            next_before_oid = msgs[-1].id
+
+        unames = RootUserManager.get_root_data_uname_batch({msg.user_root_oid for msg in msgs}, channel_data)
 
-        for msg in msgs:
-            ret.append(HandledMessageRecordEntry(model=msg, user_name=uids_handled[msg.user_root_oid], tz=tz))
+        ret = [HandledMessageRecordEntry(
+            model=msg, user_name=unames.get(msg.user_root_oid, f"UID - {msg.user_root_oid}"), tz=tz)
+            for msg in msgs]
 
-        return HandledMessageRecords(data=ret)
+        return HandledMessageRecords(data=ret, next_before_oid=next_before_oid)
 
     @staticmethod
     def get_user_channel_message_count_interval(channel_data: ChannelModel, *,
@@ -1,15 +1,231 @@
 """Implementations for integrating user data."""
-from typing import List
+import time
+from threading import Thread, RLock
+from typing import Dict, List, Optional, Type
 
 from bson import ObjectId
+from pymongo.collection import Collection
+from pymongo.errors import PyMongoError
 
+from env_var import is_testing
 from extutils.emailutils import MailSender
 from extutils.checker import arg_type_ensure
+from extutils.mongo import get_codec_options
+from JellyBot.systemconfig import Database
+from models import OID_KEY, UserIntegrationJobModel, UserIntegrationProgressModel
 from mongodb.factory.results import OperationOutcome
+from mongodb.utils.logger import logger
 
 
 class UserDataIntegrationHelper:
-    """Class for helping the user data integration."""
+    """
+    Class for helping the user data integration.
+
+    The UIDs stored in each collection are replaced in ``_id``-ordered batches of
+    ``Database.UserIntegration.BatchSize`` documents instead of a single transaction,
+    so the integration of a heavy user does not lock the collections for a long time.
+
+    The progress of each collection is recorded in the job document after every batch,
+    so an interrupted job or a job with failed batches can be resumed by ``resume_incomplete()``.
+
+    A job is leased to a single process while it is running. The lease is renewed after every batch,
+    so a job abandoned by a stopped process can be taken over after ``Database.UserIntegration.JobLeaseSeconds``.
+    """
+
+    _lock = RLock()
+
+    @staticmethod
+    def _get_collections() -> Dict[str, Type]:
+        """
+        Get the data manager classes having any field storing the UIDs.
+
+        :return: planned full name of the collection to the data manager class
+        """
+        # Inline import to prevent cyclic import
+        # pylint: disable=import-outside-toplevel
+        from mongodb.factory import get_collection_subclasses
+
+        return {cls.get_planned_full_name(): cls for cls in get_collection_subclasses()
+                if cls.model_class and cls.model_class.uid_fields()}
+
+    @staticmethod
+    def _replace_batch(col: Collection, job: UserIntegrationJobModel, model_cls: Type,
+                       batch_oids: List[ObjectId]) -> bool:
+        """
+        Replace the UIDs in the documents of ``batch_oids``, retrying with backoff on failure.
+
+        :return: if the replacement of the batch succeeded
+        """
+        for attempt in range(Database.UserIntegration.BatchRetryCount + 1):
+            if attempt:
+                time.sleep(Database.UserIntegration.BatchRetryBackoffSeconds * 2 ** (attempt - 1))
+
+            try:
+                failed_names = model_cls.replace_uid(
+                    col, job.source_oid, job.destination_oid, extra_filter={OID_KEY: {"$in": batch_oids}})
+            except PyMongoError as ex:
+                failed_names = [str(ex)]
+
+            if not failed_names:
+                return True
+
+            logger.logger.warning("Failed to replace the UIDs in `%s` (attempt #%d): %s",
+                                  col.full_name, attempt + 1, ", ".join(failed_names))
+
+        return False
+
+    @staticmethod
+    def _migrate_collection(job: UserIntegrationJobModel, owner: ObjectId, progress: UserIntegrationProgressModel,
+                            col_cls: Type) -> Optional[int]:
+        """
+        Migrate the UIDs in a collection batch by batch.
+
+        If a batch still fails after the retries, the migration of the collection stops at that batch
+        and its progress stays incomplete, so the batch is retried when the job is resumed.
+
+        :return: count of the documents failed to be migrated, `None` if the job is no longer held by `owner`
+        """
+        # Inline import to prevent cyclic import
+        # pylint: disable=import-outside-toplevel
+        from mongodb.factory import MONGO_CLIENT, UserIntegrationJobManager
+
+        # Plain collection to avoid the initialization side effects of the data managers
+        col = Collection(
+            MONGO_CLIENT.get_database(col_cls.get_db_name()), col_cls.get_col_name(),
+            codec_options=get_codec_options())
+        model_cls = col_cls.model_class
+
+        uid_filter = model_cls.get_uid_filter(job.source_oid)
+
+        last_oid: Optional[ObjectId] = progress.last_oid
+        count = progress.count
+
+        while True:
+            filter_ = uid_filter
+            if last_oid:
+                filter_ = {"$and": [uid_filter, {OID_KEY: {"$gt": last_oid}}]}
+
+            batch_oids = [data[OID_KEY] for data in col.find(
+                filter_, projection={OID_KEY: 1}, sort=[(OID_KEY, 1)], limit=Database.UserIntegration.BatchSize)]
+
+            if not batch_oids:
+                break
+
+            if not UserDataIntegrationHelper._replace_batch(col, job, model_cls, batch_oids):
+                # Keep `last_oid` before the failed batch for the retry on resume
+                if not UserIntegrationJobManager.update_progress(
+                        job.id, owner, progress.collection_name, last_oid, count, len(batch_oids)):
+                    return None
+
+                return len(batch_oids)
+
+            count += len(batch_oids)
+            last_oid = batch_oids[-1]
+
+            # Stop if the lease expired and the other process took over
+            if not UserIntegrationJobManager.update_progress(
+                    job.id, owner, progress.collection_name, last_oid, count, 0):
+                return None
+
+        if not UserIntegrationJobManager.update_progress(
+                job.id, owner, progress.collection_name, last_oid, count, 0, completed=True):
+            return None
+
+        return 0
+
+    @staticmethod
+    def run_job(job: UserIntegrationJobModel) -> OperationOutcome:
+        """
+        Run or resume the user data integration job ``job``.
+
+        The job stays incomplete if any batch failed to be migrated, so the UIDs are still aliased
+        and the failed batches are retried on the next ``resume_incomplete()``.
+
+        Returns ``OperationOutcome.O_ACCEPTED`` without running the job if it is held by the other process,
+        or stops running the job if the other process took it over.
+
+        An email report containing the progress of each collection will be sent if any replacement failed.
+
+        :param job: job to run
+        :return: outcome of the integration
+        """
+        # Inline import to prevent cyclic import
+        # pylint: disable=import-outside-toplevel
+        from mongodb.factory import UserIntegrationJobManager
+
+        owner = ObjectId()
+
+        with UserDataIntegrationHelper._lock:
+            if not UserIntegrationJobManager.acquire_job(job.id, owner):
+                job = UserIntegrationJobManager.get_job(job.id) or job
+
+                return OperationOutcome.O_COMPLETED if job.completed else OperationOutcome.O_ACCEPTED
+
+            # Get the latest progress in case the job was resumed by the other process
+            job = UserIntegrationJobManager.get_job(job.id) or job
+
+            collections = UserDataIntegrationHelper._get_collections()
+            has_failure = False
+
+            for progress in job.progress:
+                if progress.completed:
+                    continue
+
+                col_cls = collections.get(progress.collection_name)
+                if not col_cls:
+                    continue
+
+                failed_count = UserDataIntegrationHelper._migrate_collection(job, owner, progress, col_cls)
+                if failed_count is None:
+                    return OperationOutcome.O_ACCEPTED
+
+                has_failure = has_failure or failed_count > 0
+
+            if has_failure:
+                UserIntegrationJobManager.release_job(job.id, owner)
+                job = UserIntegrationJobManager.get_job(job.id) or job
+            else:
+                job = UserIntegrationJobManager.complete_job(job.id, owner) or job
+
+        if has_failure:
+            MailSender.send_email_async(
+                f"Fields value replacements failed.<hr><pre>{job.get_progress_report()}</pre>",
+                subject="User Data Integration Failed.")
+            return OperationOutcome.X_INTEGRATION_FAILED
+
+        return OperationOutcome.O_COMPLETED
+
+    @staticmethod
+    def resume_incomplete():
+        """Resume all of the incomplete user data integration jobs."""
+        # Inline import to prevent cyclic import
+        # pylint: disable=import-outside-toplevel
+        from mongodb.factory import UserIntegrationJobManager
+
+        with UserDataIntegrationHelper._lock:
+            for job in UserIntegrationJobManager.get_incomplete_jobs():
+                UserDataIntegrationHelper.run_job(job)
+
+    @staticmethod
+    def resume_incomplete_async():
+        """Resume all of the incomplete user data integration jobs asynchronously."""
+        Thread(target=UserDataIntegrationHelper.resume_incomplete).start()
+
+    @staticmethod
+    @arg_type_ensure
+    def get_progress_report(src_oid: ObjectId) -> List[str]:
+        """
+        Get the progress reports of the integration jobs of ``src_oid``.
+
+        :param src_oid: source root user OID
+        :return: list of the progress reports
+        """
+        # Inline import to prevent cyclic import
+        # pylint: disable=import-outside-toplevel
+        from mongodb.factory import UserIntegrationJobManager
+
+        return [UserIntegrationJobModel.cast_model(data).get_progress_report() for data
+                in UserIntegrationJobManager.find({UserIntegrationJobModel.SourceOid.key: src_oid})]
 
     @staticmethod
     @arg_type_ensure
@@ -22,9 +238,12 @@ class UserDataIntegrationHelper:
 
         After this, all fields which are storing UIDs will be checked to see if they are storing ``src_oid``.
 
-        If so, replace it with ``dst_oid``.
+        If so, replace it with ``dst_oid``. The replacement runs as a background job, except in tests.
+        Reads of the user data will be redirected to include the data of both users until the job completes.
 
-        Will **NOT** change the database content and **WILL** send an email report if the replacement failed.
+        Returns ``OperationOutcome.O_ACCEPTED`` once the background job is started.
+
+        **WILL** send an email report if any replacement failed.
 
         :param src_oid: source root user OID
         :param dst_oid: destination root user OID
@@ -32,38 +251,23 @@ class UserDataIntegrationHelper:
         """
         # Inline import to prevent cyclic import
         # pylint: disable=import-outside-toplevel
-        from mongodb.factory import (
-            new_mongo_session, get_collection_subclasses, BaseCollection, RootUserManager
-        )
+        from mongodb.factory import RootUserManager, UserIntegrationJobManager
 
         merge_result = RootUserManager.merge_onplat_to_api(src_oid, dst_oid)
 
         if not merge_result.is_success:
             return merge_result
 
-        # Replace UID entries
-        failed_names: List[str] = []
-
         # Get the actual `src_oid` and `dst_oid` for actual destination
         actual_src = max(src_oid, dst_oid)
         actual_dst = min(src_oid, dst_oid)
 
-        with new_mongo_session() as session:
-            session.start_transaction()
-
-            cls: BaseCollection
-            for cls in get_collection_subclasses():
-                if cls.model_class:
-                    failed_names.extend(cls.model_class.replace_uid(cls(), actual_src, actual_dst, session))
+        job = UserIntegrationJobManager.create_job(
+            actual_src, actual_dst, list(UserDataIntegrationHelper._get_collections()))
 
-            if failed_names:
-                session.abort_transaction()
+        if is_testing():
+            return UserDataIntegrationHelper.run_job(job)
 
-                MailSender.send_email_async(
-                    f"Fields value replacements failed.<hr><pre>{'<br>'.join(failed_names)}</pre>",
-                    subject="User Data Integration Failed.")
-                return OperationOutcome.X_INTEGRATION_FAILED
+        Thread(target=UserDataIntegrationHelper.run_job, args=(job,)).start()
 
-            session.commit_transaction()
-
-        return OperationOutcome.O_COMPLETED
+        return OperationOutcome.O_ACCEPTED
@@ -1,4 +1,6 @@
 from .cursor import ExtendedCursor
 from .bulk import BulkWriteDataHolder
-from .misc import case_insensitive_collation
+from .misc import case_insensitive_collation, collation_fold
 from .backup import backup_collection
+from .page import KeysetPage
+from .telemetry import TelemetryWriter, TelemetryHealth, get_telemetry_health
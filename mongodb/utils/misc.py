@@ -1,3 +1,73 @@
+"""Miscellaneous utilities for the MongoDB operations."""
+import unicodedata
+
 from pymongo.collation import Collation
 
 case_insensitive_collation = Collation(locale='en', strength=1)
+
+# Default ignorable code points, which are ignored by the collation
+_DEFAULT_IGNORABLE_RANGES = (
+    (0x00AD, 0x00AD), (0x034F, 0x034F), (0x061C, 0x061C), (0x115F, 0x1160), (0x17B4, 0x17B5), (0x180B, 0x180F),
+    (0x200B, 0x200F), (0x202A, 0x202E), (0x2060, 0x206F), (0x3164, 0x3164), (0xFE00, 0xFE0F), (0xFEFF, 0xFEFF),
+    (0xFFA0, 0xFFA0), (0xFFF0, 0xFFF8), (0x1BCA0, 0x1BCA3), (0x1D173, 0x1D17A), (0xE0000, 0xE0FFF)
+)
+
+# Characters having the same primary weight as the corresponding characters under the collation
+_EXPANSIONS = {"æ": "ae", "œ": "oe", "ð": "d", "ŉ": "n"}
+
+_DROPPED_CATEGORIES = {"Mn", "Mc", "Me", "Cf", "Cc", "Cs", "Cn"}
+
+# Small kana to the normal kana, which only have a tertiary difference
+_SMALL_KANA = dict(zip("ぁぃぅぇぉっゃゅょゎゕゖ", "あいうえおつやゆよわかけ"))
+
+
+def _is_default_ignorable(c: str) -> bool:
+    code = ord(c)
+
+    return any(start <= code <= end for start, end in _DEFAULT_IGNORABLE_RANGES)
+
+
+def _fold_char(c: str) -> str:
+    if unicodedata.category(c) in _DROPPED_CATEGORIES or _is_default_ignorable(c):
+        return ""
+
+    if c in _EXPANSIONS:
+        return _EXPANSIONS[c]
+
+    decimal = unicodedata.decimal(c, None)
+    if decimal is not None:
+        return str(decimal)
+
+    # Katakana to hiragana
+    if "ァ" <= c <= "ヶ" or c in "ヽヾ":
+        c = chr(ord(c) - 0x60)
+
+    if c in _SMALL_KANA:
+        return _SMALL_KANA[c]
+
+    # Letters with the modifiers (for example, `ø` - LATIN SMALL LETTER O WITH STROKE) to its base letter
+    name = unicodedata.name(c, "")
+    if " WITH " in name:
+        try:
+            return unicodedata.lookup(name.split(" WITH ", 1)[0])
+        except KeyError:
+            pass
+
+    return c
+
+
+def collation_fold(text: str) -> str:
+    """
+    Fold ``text`` so the strings equal under ``case_insensitive_collation`` have the same folded string.
+
+    The folding is looser than the collation - the case, the diacritics, the marks, the ignorable code points
+    (for example, ``U+FE0F`` of emojis), the width, the kana type and the digit scripts are all ignored.
+    Therefore, different folded strings could be used to determine that the strings are not equal
+    under the collation, but the strings having the same folded string may still be different.
+
+    :param text: text to be folded
+    :return: folded text
+    """
+    text = unicodedata.normalize("NFKD", unicodedata.normalize("NFKD", text).casefold())
+
+    return "".join(_fold_char(c) for c in text)
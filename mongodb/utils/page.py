@@ -0,0 +1,148 @@
+"""Keyset pagination utilities."""
+import base64
+import binascii
+from typing import Generic, TypeVar, List, Tuple, Optional, Any, Iterator
+
+import bson
+from bson.errors import BSONError
+
+from models import Model, OID_KEY
+from mongodb.exceptions import InvalidPageTokenError
+
+T = TypeVar("T", bound=Model)  # pylint: disable=invalid-name
+
+SortType = List[Tuple[str, int]]
+
+__all__ = ("KeysetPage", "complete_keyset_sort", "get_keyset_filter", "encode_page_token", "decode_page_token",
+           "get_sort_values")
+
+
+class KeysetPage(Generic[T]):
+    """
+    A page of the data got by keyset pagination.
+
+    Pass ``next_token`` to the same query to get the next page.
+    """
+
+    def __init__(self, data: List[T], next_token: Optional[str], *,
+                 total_count: Optional[int] = None, count_is_exact: bool = True):
+        """
+        Create a page containing ``data``.
+
+        :param data: data of this page
+        :param next_token: token to get the next page, `None` if this is the last page
+        :param total_count: total count of the data matching the query, `None` if not counted
+        :param count_is_exact: if `total_count` is exact
+        """
+        self.data = data
+        self.next_token = next_token
+        self.total_count = total_count
+        self.count_is_exact = count_is_exact
+
+    @property
+    def has_next(self) -> bool:
+        """
+        Check if there is a next page.
+
+        :return: if there is a next page
+        """
+        return self.next_token is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"<KeysetPage - {len(self.data)} data, next: {self.next_token}, total: {self.total_count}>"
+
+
+def complete_keyset_sort(sort: Optional[SortType]) -> SortType:
+    """
+    Append ``_id`` to ``sort`` as the tie-breaker if it is not in ``sort``.
+
+    ``_id`` will be sorted in the same direction as the last key of ``sort``. Descending if ``sort`` is empty.
+
+    :param sort: sort of the query
+    :return: sort with `_id` as the last key
+    """
+    sort = list(sort or [])
+
+    if not any(key == OID_KEY for key, _ in sort):
+        sort.append((OID_KEY, sort[-1][1] if sort else -1))
+
+    return sort
+
+
+def get_sort_values(data: dict, sort: SortType) -> List[Any]:
+    """
+    Get the values of the keys in ``sort`` from ``data``. Keys can be dotted for the nested fields.
+
+    :param data: data to get the values
+    :param sort: sort containing the keys to get
+    :return: values of the keys in `sort`
+    """
+    ret = []
+
+    for key, _ in sort:
+        value = data
+        for sub_key in key.split("."):
+            value = value.get(sub_key) if isinstance(value, dict) else None
+
+        ret.append(value)
+
+    return ret
+
+
+def get_keyset_filter(sort: SortType, values: List[Any]) -> dict:
+    """
+    Get the filter to locate the data after the data which sort values are ``values``.
+
+    For sort ``[(a, 1), (b, -1)]`` and values ``[x, y]``,
+    the filter will be ``{"$or": [{a: {"$gt": x}}, {a: x, b: {"$lt": y}}]}``.
+
+    :param sort: sort of the query, which should be completed by `complete_keyset_sort()`
+    :param values: sort values of the last data of the previous page
+    :return: filter to get the data after the last data of the previous page
+    """
+    or_list = []
+
+    for idx, (key, direction) in enumerate(sort):
+        condition = {prev_key: values[prev_idx] for prev_idx, (prev_key, _) in enumerate(sort[:idx])}
+        condition[key] = {"$gt" if direction > 0 else "$lt": values[idx]}
+
+        or_list.append(condition)
+
+    return {"$or": or_list}
+
+
+def encode_page_token(sort: SortType, values: List[Any]) -> str:
+    """
+    Encode the sort values of the last data of a page to an opaque token.
+
+    :param sort: sort of the query
+    :param values: sort values of the last data of the page
+    :return: URL-safe page token
+    """
+    return base64.urlsafe_b64encode(bson.encode({"s": [key for key, _ in sort], "v": values})).decode("ascii")
+
+
+def decode_page_token(token: str, sort: SortType) -> List[Any]:
+    """
+    Decode the page token ``token`` to the sort values.
+
+    :param token: page token to be decoded
+    :param sort: sort of the query
+    :return: sort values of the last data of the previous page
+    :raises InvalidPageTokenError: `token` is malformed or it is not for `sort`
+    """
+    try:
+        decoded = bson.decode(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (BSONError, binascii.Error, ValueError) as ex:
+        raise InvalidPageTokenError(token) from ex
+
+    if decoded.get("s") != [key for key, _ in sort] or len(decoded.get("v", [])) != len(sort):
+        raise InvalidPageTokenError(token)
+
+    return decoded["v"]
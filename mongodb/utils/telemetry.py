@@ -0,0 +1,233 @@
+"""
+Buffered writer of the telemetry data.
+
+Telemetry documents are held in a bounded ring buffer and inserted in batches by a background thread,
+so recording them never waits for the database.
+If the buffer is full, the oldest document is dropped and counted.
+"""
+from collections import deque
+from datetime import datetime
+from threading import Event, Lock, Thread
+import time
+from typing import Callable, Deque, List, NamedTuple, Optional
+
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+
+from extutils.dt import now_utc_aware
+
+from .logger import logger
+
+__all__ = ("TelemetryHealth", "TelemetryWriter", "get_telemetry_health",)
+
+_writers: List["TelemetryWriter"] = []
+_writers_lock = Lock()
+
+
+class TelemetryHealth(NamedTuple):
+    """Health of a :class:`TelemetryWriter`."""
+
+    name: str
+    buffered: int
+    capacity: int
+    dropped: int
+    written: int
+    failed: int
+    flushes: int
+    last_flush_at: Optional[datetime]
+    last_flush_secs: float
+
+    def __str__(self):
+        return f"Telemetry `{self.name}`: {self.buffered} / {self.capacity} buffered - " \
+               f"{self.written} written / {self.dropped} dropped / {self.failed} failed " \
+               f"in {self.flushes} flushes (last flush took {self.last_flush_secs:.3f} secs)"
+
+
+class TelemetryWriter:
+    """
+    Writer inserting the telemetry documents to ``collection`` in batches.
+
+    Write concern of the inserts follows ``collection``,
+    so a collection from ``with_options()`` could be passed in to lower the write concern.
+
+    The documents are flushed every ``flush_interval`` seconds or once ``batch_size`` documents are buffered.
+    ``on_flushed`` will be called with the documents inserted after each flush.
+
+    If ``synchronous`` is ``True``, the documents will be inserted on the calling thread immediately.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+
+    def __init__(self, name: str, collection: Collection, *, capacity: int, batch_size: int,
+                 flush_interval: float, health_log_interval: float = 600,
+                 on_flushed: Optional[Callable[[List[dict]], None]] = None, synchronous: bool = False):
+        """
+        Create a writer of the telemetry ``name`` which buffers up to ``capacity`` documents.
+
+        :param name: name of the telemetry
+        :param collection: collection to insert the documents
+        :param capacity: max count of the documents to be buffered
+        :param batch_size: count of the buffered documents to flush the buffer immediately
+        :param flush_interval: seconds between the flushes
+        :param health_log_interval: seconds between the logs of the health
+        :param on_flushed: function to be called with the documents inserted
+        :param synchronous: if the documents should be inserted on the calling thread
+        """
+        self._name = name
+        self._collection = collection
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._health_log_interval = health_log_interval
+        self._on_flushed = on_flushed
+        self._synchronous = synchronous
+
+        self._buffer: Deque[dict] = deque(maxlen=capacity)
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._flush_event = Event()
+        self._flusher: Optional[Thread] = None
+
+        self._dropped = 0
+        self._written = 0
+        self._failed = 0
+        self._flushes = 0
+        self._last_flush_at: Optional[datetime] = None
+        self._last_flush_secs = 0.0
+
+        with _writers_lock:
+            _writers.append(self)
+
+    def submit(self, document: dict) -> bool:
+        """
+        Put ``document`` to the buffer to be inserted.
+
+        :param document: document to be inserted
+        :return: if the buffer has room for `document` without dropping the oldest document
+        """
+        with self._lock:
+            has_room = len(self._buffer) < self._buffer.maxlen
+            if not has_room:
+                self._dropped += 1
+
+            self._buffer.append(document)
+            flush_now = len(self._buffer) >= self._batch_size
+
+        if self._synchronous:
+            self.flush()
+            return has_room
+
+        if flush_now:
+            self._flush_event.set()
+
+        self._ensure_flusher()
+
+        return has_room
+
+    def flush(self) -> int:
+        """
+        Insert all the buffered documents.
+
+        :return: count of the documents inserted
+        """
+        with self._flush_lock:
+            with self._lock:
+                documents = list(self._buffer)
+                self._buffer.clear()
+
+            if not documents:
+                return 0
+
+            start = time.perf_counter()
+            inserted = []
+            failed = 0
+
+            for idx in range(0, len(documents), self._batch_size):
+                batch = documents[idx:idx + self._batch_size]
+
+                try:
+                    self._collection.insert_many(batch, ordered=False)
+                    inserted.extend(batch)
+                except BulkWriteError as ex:
+                    failed_indexes = {error["index"] for error in ex.details.get("writeErrors", [])}
+                    inserted.extend(doc for doc_idx, doc in enumerate(batch) if doc_idx not in failed_indexes)
+                    failed += len(failed_indexes)
+
+                    logger.logger.warning(f"{len(failed_indexes)} documents of telemetry `{self._name}` "
+                                          f"failed to insert. Error: {ex.details.get('writeErrors', [])[:1]}")
+                except Exception as ex:  # pylint: disable=broad-except
+                    failed += len(batch)
+
+                    logger.logger.warning(f"Failed to flush {len(batch)} documents of telemetry `{self._name}`. "
+                                          f"Error: {ex} ({type(ex)})")
+
+            with self._lock:
+                self._written += len(inserted)
+                self._failed += failed
+                self._flushes += 1
+                self._last_flush_at = now_utc_aware()
+                self._last_flush_secs = time.perf_counter() - start
+
+        if self._on_flushed and inserted:
+            try:
+                self._on_flushed(inserted)
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.logger.warning(f"Post-flush action of telemetry `{self._name}` failed. "
+                                      f"Error: {ex} ({type(ex)})")
+
+        return len(inserted)
+
+    def _ensure_flusher(self):
+        if self._flusher:
+            return
+
+        with self._lock:
+            if not self._flusher:
+                self._flusher = Thread(target=self._flush_loop, name=f"Telemetry-{self._name}", daemon=True)
+                self._flusher.start()
+
+    def _flush_loop(self):
+        last_health_log = time.monotonic()
+        last_logged = None
+
+        while True:
+            self._flush_event.wait(self._flush_interval)
+            self._flush_event.clear()
+
+            self.flush()
+
+            if time.monotonic() - last_health_log >= self._health_log_interval:
+                last_health_log = time.monotonic()
+
+                health = self.health()
+                counts = (health.dropped, health.written, health.failed)
+
+                # Only log if anything happened since the last log
+                if counts != last_logged:
+                    logger.logger.info(str(health))
+                    last_logged = counts
+
+    def health(self) -> TelemetryHealth:
+        """
+        Get the health of this writer.
+
+        :return: health of this writer
+        """
+        with self._lock:
+            return TelemetryHealth(
+                name=self._name, buffered=len(self._buffer), capacity=self._buffer.maxlen, dropped=self._dropped,
+                written=self._written, failed=self._failed, flushes=self._flushes,
+                last_flush_at=self._last_flush_at, last_flush_secs=self._last_flush_secs
+            )
+
+
+def get_telemetry_health() -> List[TelemetryHealth]:
+    """
+    Get the health of all the telemetry writers.
+
+    :return: health of all the telemetry writers
+    """
+    with _writers_lock:
+        writers = list(_writers)
+
+    return [writer.health() for writer in writers]
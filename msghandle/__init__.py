@@ -2,4 +2,4 @@
 # noinspection PyUnresolvedReferences
 from .logger import logger
 # noinspection PyUnresolvedReferences
-from .handle import handle_message_main, HandlingFunctionBox, HandlingFunctionsNotLoadedError
+from .handle import handle_message_main, HandlingFunctionBox, HandlingFunctionsNotLoadedError, MESSAGE_TRACER
@@ -1 +1 @@
-from .main import handle_bot_cmd_main
+from .main import handle_bot_cmd_main, has_command_prefix
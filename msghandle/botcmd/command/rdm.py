@@ -1,9 +1,10 @@
+import math
 import random
-from collections import defaultdict
 
 from django.utils.translation import gettext_lazy as _
 
 from extutils import safe_cast
+from extutils.sampling import multinomial
 from flags import BotFeature
 from msghandle.models import TextMessageEventObject, HandledMessageEventText
 from JellyBot.systemconfig import Bot
@@ -16,12 +17,17 @@ cmd = CommandNode(
 
 
 class OptionList:
-    def __init__(self, txt: str):
-        self.elements = list(set(txt.split(Bot.RandomChoiceSplitter)))
+    def __init__(self, txt: str, max_count: int = Bot.RandomChoiceOptionLimit):
+        # `dict.fromkeys()` removes the duplicated options while keeping the order
+        self.elements = list(dict.fromkeys(elem for elem in txt.split(Bot.RandomChoiceSplitter) if elem))
         self.weights = None
         self.elem_ignored = False
 
-        if len(self.elements) > 1 and all([Bot.RandomChoiceWeightSplitter in elem for elem in self.elements]):
+        # Skip parsing the weights if the options are going to be rejected
+        if len(self.elements) > max_count:
+            return
+
+        if len(self.elements) > 1 and all(Bot.RandomChoiceWeightSplitter in elem for elem in self.elements):
             temp = []
             self.weights = []
 
@@ -30,7 +36,7 @@ class OptionList:
 
                 weight = safe_cast(weight, float)
 
-                if weight:
+                if weight and math.isfinite(weight) and weight > 0:
                     self.weights.append(weight)
                     temp.append(option)
                 else:
@@ -50,15 +56,15 @@ class OptionList:
         return random.choices(self.elements, self.weights, k=1)[0]
 
     def pick_multi(self, count: int) -> dict:
-        # noinspection PyTypeChecker
-        results = random.choices(self.elements, self.weights, k=count)
-
-        counter = defaultdict(lambda: 0)
+        counts = multinomial(count, self.weights or [1] * len(self.elements))
 
-        for result in results:
-            counter[result] += 1
+        # Weighted options could be repeated with different weights, so the counts are summed per option
+        ret = {}
+        for elem, elem_count in zip(self.elements, counts):
+            if elem_count:
+                ret[elem] = ret.get(elem, 0) + elem_count
 
-        return counter
+        return ret
 
 
 elem_help_txt = _(
@@ -80,6 +86,8 @@ elem_help_txt = _(
 option_overlimit_txt = _("Maximum count of options is {}.").format(Bot.RandomChoiceOptionLimit)
 pick_overlimit_txt = _(
     "Maximum count of picking an option in a single command is {}.").format(Bot.RandomChoiceCountLimit)
+pick_nonpositive_txt = _("Count of picking an option must be positive.")
+no_option_txt = _("No valid options to be picked.")
 
 
 # noinspection PyUnusedLocal
@@ -96,6 +104,9 @@ def random_once(e: TextMessageEventObject, elements: str):
             HandledMessageEventText(
                 content=option_overlimit_txt)]
 
+    if not option_list:
+        return [HandledMessageEventText(content=no_option_txt)]
+
     ctnt = [_("Option Picked: {}").format(option_list.pick_one())]
 
     if option_list.elem_ignored:
@@ -119,11 +130,17 @@ def random_multi(e: TextMessageEventObject, elements: str, times: int):
     if times > Bot.RandomChoiceCountLimit:
         return [HandledMessageEventText(content=pick_overlimit_txt)]
 
+    if times < 1:
+        return [HandledMessageEventText(content=pick_nonpositive_txt)]
+
     option_list = OptionList(elements)
 
     if len(option_list) > Bot.RandomChoiceOptionLimit:
         return [HandledMessageEventText(content=option_overlimit_txt)]
 
+    if not option_list:
+        return [HandledMessageEventText(content=no_option_txt)]
+
     results = sorted(option_list.pick_multi(times).items(), key=lambda kv: kv[1], reverse=True)
 
     if option_list.elem_ignored:
@@ -5,11 +5,17 @@ from msghandle.models import TextMessageEventObject, HandledMessageEventText
 from msghandle.botcmd.command import cmd_handler
 
 
+def has_command_prefix(content: str) -> bool:
+    if not content:
+        return False
+
+    return content.startswith(Bot.Prefix) \
+        or (Bot.CaseInsensitivePrefix and content.lower().startswith(Bot.Prefix.lower()))
+
+
 def handle_bot_cmd_main(e: TextMessageEventObject) -> List[HandledMessageEventText]:
     # Terminate if empty string / not starts with command prefix
-    if e.content:
-        if e.content.startswith(Bot.Prefix) \
-                or (Bot.CaseInsensitivePrefix and e.content.lower().startswith(Bot.Prefix.lower())):
-            return cmd_handler.handle(e)
+    if has_command_prefix(e.content):
+        return cmd_handler.handle(e)
 
     return []
@@ -11,7 +11,9 @@ from typing import Type
 
 from django.utils.translation import activate, deactivate
 
-from mongodb.factory import MessageRecordStatisticsManager, ProfileManager
+from extutils.tracing import Tracer, span, tag
+from JellyBot.systemconfig import Bot
+from mongodb.factory import MessageRecordStatisticsManager, MessageTraceManager, ProfileManager
 
 from .models.pipe_in import (
     MessageEventObject, TextMessageEventObject, ImageMessageEventObject, LineStickerMessageEventObject
@@ -19,7 +21,15 @@ from .models.pipe_in import (
 from .models.pipe_out import HandledMessageEventsHolder
 from .logger import logger
 
-__all__ = ("HandlingFunctionBox", "handle_message_main", "HandlingFunctionsNotLoadedError")
+__all__ = ("HandlingFunctionBox", "handle_message_main", "HandlingFunctionsNotLoadedError", "MESSAGE_TRACER")
+
+MESSAGE_TRACER = Tracer(sample_rate=Bot.TraceSampleRate, on_finished=MessageTraceManager.record_trace)
+"""
+Tracer of the message handling.
+
+Start the trace at the platform entry point to include the event construction and the response sending.
+Otherwise, the trace starts at ``handle_message_main()``.
+"""
 
 
 # Lazy loading handling functions because some imports requires Django to be fully loaded first
@@ -108,14 +118,19 @@ def handle_message_main(e: MessageEventObject) -> HandledMessageEventsHolder:
     """
     HandlingFunctionBox.check_loaded()
 
-    has_user_model = hasattr(e, "user_model") and e.user_model is not None
+    with MESSAGE_TRACER.trace("handle_message_main"):
+        tag(MessageTraceManager.TAG_CHANNEL_OID, e.channel_model.id)
+        tag(MessageTraceManager.TAG_MESSAGE_TYPE, e.message_type)
+
+        has_user_model = hasattr(e, "user_model") and e.user_model is not None
 
-    ret = _handle_message(e, has_user_model)
+        ret = _handle_message(e, has_user_model)
 
-    # Record message for stats / User model could be `None` on LINE
-    MessageRecordStatisticsManager.record_message_async(
-        e.channel_model.id, e.user_model.id if has_user_model else None,
-        e.message_type, e.content, e.constructed_time)
+        # Record message for stats / User model could be `None` on LINE
+        with span("record_message"):
+            MessageRecordStatisticsManager.record_message_async(
+                e.channel_model.id, e.user_model.id if has_user_model else None,
+                e.message_type, e.content, e.constructed_time)
 
     return ret
 
@@ -124,7 +139,8 @@ def _handle_message(e: MessageEventObject, has_user_model: bool) -> HandledMessa
     try:
         if has_user_model:
             # Ensure User existence in channel
-            ProfileManager.register_new_default_async(e.channel_model.id, e.user_model.id)
+            with span("register_profile"):
+                ProfileManager.register_new_default_async(e.channel_model.id, e.user_model.id)
 
             # Translation activation
             activate(e.user_model.config.language)
@@ -136,7 +152,8 @@ def _handle_message(e: MessageEventObject, has_user_model: bool) -> HandledMessa
             return HandledMessageEventsHolder(e.channel_model, handle_no_user_token(e))
 
         # Main handle process
-        ret = HandledMessageEventsHolder(e.channel_model, HandlingFunctionBox.get_handling_function(type(e))(e))
+        with span("handle"):
+            ret = HandledMessageEventsHolder(e.channel_model, HandlingFunctionBox.get_handling_function(type(e))(e))
     except NoCorrespondingHandlingFunctionError:
         logger.logger.warning("Message handle object not handled. Raw: %s", e.raw)
 
@@ -3,7 +3,7 @@ from typing import List
 from django.utils.translation import gettext_lazy as _
 
 from extutils import exec_timing_result
-from extutils.imgproc import ImgurClient
+from extutils.imgproc import ImgurClient, LazyImageBinary
 from flags import ChannelType, BotFeature, Platform
 from mongodb.factory import BotFeatureUsageDataManager
 from msghandle.models import HandledMessageEvent, HandledMessageEventText, ImageMessageEventObject
@@ -13,8 +13,12 @@ def process_imgur_upload(e: ImageMessageEventObject) -> List[HandledMessageEvent
     if e.channel_type == ChannelType.PRIVATE_TEXT:
         BotFeatureUsageDataManager.record_usage_async(BotFeature.IMG_IMGUR_UPLOAD, e.channel_oid, e.user_model.id)
 
+        content = e.content.content
+        if isinstance(content, LazyImageBinary):
+            content = content.open()
+
         # Using the key of `e.content.content_type` because it's a directly-used-parameter to upload the image
-        exec_result = exec_timing_result(ImgurClient.upload_image, e.content.content, e.content.content_type.key)
+        exec_result = exec_timing_result(ImgurClient.upload_image, content, e.content.content_type.key)
         upload_result = exec_result.return_
 
         if upload_result.success:
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Union
 
+from extutils.imgproc import LazyImageBinary
 from flags import ImageContentType
 
 
@@ -12,13 +13,16 @@ class BaseContent:
 
 @dataclass
 class ImageContent(BaseContent):
-    content: str
+    content: Union[str, LazyImageBinary]
     content_type: ImageContentType
     comment: Optional[str] = None
 
     def __repr__(self):
         if self.content_type == ImageContentType.BASE64:
             return f"(Base64 Image), Comment={self.comment}"
+        elif self.content_type == ImageContentType.FILE:
+            # Not showing the content because it may trigger the fetch of the image
+            return f"(Image File), Comment={self.comment}"
         elif self.content_type == ImageContentType.URL:
             return f"Image at {self.content}, Comment={self.comment}"
         else:
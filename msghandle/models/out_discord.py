@@ -0,0 +1,74 @@
+"""Module for sending the handled responses to a Discord channel."""
+from typing import List, Optional, Union, Tuple
+
+from discord import Embed
+
+__all__ = ("DiscordReplyDispatcher",)
+
+DiscordMessage = Tuple[Optional[str], Optional[Embed]]
+
+
+class DiscordReplyDispatcher:
+    """
+    Dispatcher to send the responses to a Discord channel with as few messages as possible.
+
+    Consecutive text responses are joined by ``separator`` into a single message
+    as long as the message does not exceed ``max_length``.
+    If an embed follows a pending text message, the text will be sent together with the embed.
+
+    Messages are sent one by one in order. All messages sent to a channel share the same rate limit bucket
+    (``POST /channels/{channel.id}/messages``) which is handled by ``discord.py``,
+    so sending them concurrently does not reduce the latency but breaks the order of the messages.
+    """
+
+    def __init__(self, max_length: int, separator: str = "------------------------------"):
+        """
+        Create a dispatcher which sends the messages no longer than ``max_length``.
+
+        :param max_length: max length of the content of a message
+        :param separator: separator to be inserted between the text responses
+        """
+        self.max_length = max_length
+        self.separator = f"\n{separator}\n"
+
+    def coalesce(self, responses: List[Union[str, Embed]]) -> List[DiscordMessage]:
+        """
+        Coalesce ``responses`` into the messages to be sent.
+
+        :param responses: text or embed responses to be sent
+        :return: list of message content and embed to be sent
+        """
+        ret: List[DiscordMessage] = []
+        pending_text: Optional[str] = None
+
+        for response in responses:
+            if isinstance(response, Embed):
+                ret.append((pending_text, response))
+                pending_text = None
+            elif pending_text is None:
+                pending_text = response
+            elif len(pending_text) + len(self.separator) + len(response) <= self.max_length:
+                pending_text += self.separator + response
+            else:
+                ret.append((pending_text, None))
+                pending_text = response
+
+        if pending_text is not None:
+            ret.append((pending_text, None))
+
+        return ret
+
+    async def dispatch(self, channel, responses: List[Union[str, Embed]]) -> int:
+        """
+        Send ``responses`` to ``channel`` in order.
+
+        :param channel: channel to send the responses, which has the coroutine method `send(content, *, embed)`
+        :param responses: text or embed responses to be sent
+        :return: count of the messages sent
+        """
+        messages = self.coalesce(responses)
+
+        for content, embed in messages:
+            await channel.send(content, embed=embed)
+
+        return len(messages)
@@ -1,4 +1,5 @@
-from typing import List, Tuple, Type
+from typing import List, Tuple, Type, Optional, Union
+import asyncio
 import traceback
 
 from discord import Embed
@@ -7,19 +8,21 @@ from linebot.models import TextSendMessage, ImageSendMessage
 
 from flags import MessageType
 from extutils.dt import now_utc_aware
-from extutils.utils import list_insert_in_between
 from extutils.emailutils import MailSender
 from extutils.linesticker import LineStickerUtils
 from JellyBot.systemconfig import PlatformConfig
 from mongodb.factory import ExtraContentManager
+from mongodb.factory.results import RecordExtraContentResult
 from strres.msghandle import ToSiteReason
 
+from .out_discord import DiscordReplyDispatcher
 from .pipe_out import HandledMessageCalculateResult, HandledMessageEventsHolder, HandledMessageEvent, \
     HandledMessageEventText
 
 
 class HandledEventsHolderPlatform:
     def __init__(self, holder: HandledMessageEventsHolder, config_class: Type[PlatformConfig]):
+        self._holder = holder
         self.config_class = config_class
         self.to_send: List[Tuple[MessageType, str]] = []
         self.to_site: List[Tuple[str, str]] = []
@@ -29,33 +32,32 @@ class HandledEventsHolderPlatform:
         if len(self.to_send) > config_class.max_responses:
             self.to_site.append((ToSiteReason.TOO_MANY_RESPONSES, self.to_send.pop(config_class.max_responses - 1)[1]))
 
-        if len(self.to_site) > 0:
-            rec_result = ExtraContentManager.record_extra_message(
-                holder.channel_model.id, self.to_site,
-                now_utc_aware().strftime("%m-%d %H:%M:%S UTC%z"))
-
-            if rec_result.success:
-                self.to_send.append(
-                    (MessageType.TEXT,
-                     _("{} content(s) needs to be viewed on the website because of the following reason(s):{}\n"
-                       "URL: {}")
-                     .format(
-                         len(self.to_site),
-                         "".join([f"\n - {reason}" for reason, content in self.to_site]),
-                         rec_result.url)
-                     )
-                )
-            else:
-                MailSender.send_email_async(
-                    f"Failed to record extra content.<hr>Result: {rec_result.outcome}<hr>"
-                    f"To Send:<br>{str(self.to_send)}<br>To Site:<br>{str(self.to_site)}<hr>"
-                    f"Exception:<br><pre>"
-                    f"{traceback.format_exception(None, rec_result.exception, rec_result.exception.__traceback__)}"
-                    f"</pre>",
-                    subject="Failure on Recording Extra Content")
-                self.to_send.append(
-                    _("Content(s) is supposed to be recorded to database but failed. "
-                      "An error report should be sent for investigation."))
+    def _record_to_site(self) -> Optional[RecordExtraContentResult]:
+        if not self.to_site:
+            return None
+
+        return ExtraContentManager.record_extra_message(
+            self._holder.channel_model.id, self.to_site,
+            now_utc_aware().strftime("%m-%d %H:%M:%S UTC%z"))
+
+    def _get_to_site_notice(self, rec_result: RecordExtraContentResult) -> str:
+        if rec_result.success:
+            return _("{} content(s) needs to be viewed on the website because of the following reason(s):{}\n"
+                     "URL: {}").format(
+                len(self.to_site),
+                "".join([f"\n - {reason}" for reason, content in self.to_site]),
+                rec_result.url)
+
+        MailSender.send_email_async(
+            f"Failed to record extra content.<hr>Result: {rec_result.outcome}<hr>"
+            f"To Send:<br>{str(self.to_send)}<br>To Site:<br>{str(self.to_site)}<hr>"
+            f"Exception:<br><pre>"
+            f"{traceback.format_exception(None, rec_result.exception, rec_result.exception.__traceback__)}"
+            f"</pre>",
+            subject="Failure on Recording Extra Content")
+
+        return str(_("Content(s) is supposed to be recorded to database but failed. "
+                     "An error report should be sent for investigation."))
 
     def _sort_data_(self, holder: HandledMessageEventsHolder, config_class: Type[PlatformConfig]):
         e: HandledMessageEvent
@@ -84,6 +86,10 @@ class HandledEventsHolderPlatform:
             self.to_send.append((e.msg_type, e.content))
 
     def send_line(self, reply_token):
+        rec_result = self._record_to_site()
+        if rec_result:
+            self.to_send.append((MessageType.TEXT, self._get_to_site_notice(rec_result)))
+
         if self.to_send:
             from extline import LineApiWrapper
 
@@ -101,30 +107,39 @@ class HandledEventsHolderPlatform:
             LineApiWrapper.reply_message(reply_token, send_list)
 
     async def send_discord(self, dc_channel):
-        send_list: List[str, Embed] = []
+        # Record the extra contents in the other thread while sending the other responses
+        rec_future = None
+        if self.to_site:
+            # Translate the reasons here because the language is not activated in the other thread
+            self.to_site = [(str(reason), str(content)) for reason, content in self.to_site]
+            rec_future = asyncio.get_event_loop().run_in_executor(None, self._record_to_site)
+
+        dispatcher = DiscordReplyDispatcher(self.config_class.max_content_length)
+
+        await dispatcher.dispatch(dc_channel, self._to_discord_responses(self.to_send))
 
-        for msg_type, content in self.to_send:
+        if rec_future:
+            rec_result = await rec_future
+            await dispatcher.dispatch(dc_channel, [self._get_to_site_notice(rec_result)])
+
+    @staticmethod
+    def _to_discord_responses(to_send: List[Tuple[MessageType, str]]) -> List[Union[str, Embed]]:
+        ret: List[Union[str, Embed]] = []
+
+        for msg_type, content in to_send:
             if msg_type == MessageType.TEXT:
-                send_list.append(content)
+                ret.append(str(content))
             elif msg_type == MessageType.IMAGE:
                 embed = Embed()
                 embed = embed.set_image(url=content)
                 embed = embed.set_footer(text=_("Image URL: {}").format(content))
 
-                send_list.append(embed)
+                ret.append(embed)
             elif msg_type == MessageType.LINE_STICKER:
                 embed = Embed()
                 embed = embed.set_image(url=LineStickerUtils.get_sticker_url(content))
                 embed = embed.set_footer(text=_("Sticker ID: {}").format(content))
 
-                send_list.append(embed)
-
-        # Insert separator between responses
-        send_list = list_insert_in_between(send_list, "------------------------------")
+                ret.append(embed)
 
-        # 2 For loops so that responses seem to be sent at once
-        for s in send_list:
-            if isinstance(s, Embed):
-                await dc_channel.send(embed=s)
-            else:
-                await dc_channel.send(s)
+        return ret
@@ -0,0 +1,274 @@
+"""
+Dispatching layer of the text message handlers.
+
+Each handler declares a cheap precondition. Handlers failing the precondition will be skipped,
+and the remaining handlers that are independent to each other will be executed concurrently.
+
+The hit rate and the latency of each handler are recorded in :class:`TextHandlerStats`.
+The precondition check and the execution of each handler are also recorded as the spans of the active trace.
+"""
+import time
+from concurrent.futures.thread import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, List, Optional, Dict, Union
+
+from django.utils.translation import activate, deactivate, get_language
+
+from extutils.tracing import span, wrap_context
+from models import ChannelConfigModel, MessageLatencyResult
+from msghandle.models import TextMessageEventObject, HandledMessageEvent
+
+__all__ = ("TextHandler", "TextHandlerStats", "TextHandlerDispatcher")
+
+HandlerReturn = Union[HandledMessageEvent, List[HandledMessageEvent], None]
+
+
+class TextHandlerStats:
+    """Hit rate and latency counters of a text message handler."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, name: str):
+        self.name = name
+
+        self._lock = Lock()
+
+        self.considered = 0
+        self.hits = 0
+        self.responded = 0
+
+        self.precondition_ms = 0.0
+        self.handle_ms = 0.0
+        self.max_handle_ms = 0.0
+
+    def record_precondition(self, passed: bool, elapsed_ms: float):
+        """
+        Record a precondition check of the handler.
+
+        :param passed: if the precondition passed
+        :param elapsed_ms: time spent on the check in milliseconds
+        """
+        with self._lock:
+            self.considered += 1
+            self.precondition_ms += elapsed_ms
+
+            if passed:
+                self.hits += 1
+
+    def record_handle(self, responded: bool, elapsed_ms: float):
+        """
+        Record an execution of the handler.
+
+        :param responded: if the handler gave any response
+        :param elapsed_ms: time spent on the execution in milliseconds
+        """
+        with self._lock:
+            self.handle_ms += elapsed_ms
+            self.max_handle_ms = max(self.max_handle_ms, elapsed_ms)
+
+            if responded:
+                self.responded += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Rate of the messages passing the precondition.
+
+        :return: hit rate of the handler
+        """
+        return self.hits / self.considered if self.considered else 0.0
+
+    @property
+    def avg_handle_ms(self) -> float:
+        """
+        Average execution time of the handler in milliseconds.
+
+        :return: average execution time in milliseconds
+        """
+        return self.handle_ms / self.hits if self.hits else 0.0
+
+    @property
+    def avg_precondition_ms(self) -> float:
+        """
+        Average time spent on the precondition check in milliseconds.
+
+        :return: average precondition check time in milliseconds
+        """
+        return self.precondition_ms / self.considered if self.considered else 0.0
+
+    def reset(self):
+        """Reset all the counters."""
+        with self._lock:
+            self.considered = 0
+            self.hits = 0
+            self.responded = 0
+
+            self.precondition_ms = 0.0
+            self.handle_ms = 0.0
+            self.max_handle_ms = 0.0
+
+    def __repr__(self):
+        return f"<TextHandlerStats - {self.name}: " \
+               f"{self.hits}/{self.considered} hits ({self.hit_rate:.2%}), {self.responded} responded, " \
+               f"avg {self.avg_handle_ms:.3f} ms / max {self.max_handle_ms:.3f} ms " \
+               f"(precondition avg {self.avg_precondition_ms:.3f} ms)>"
+
+
+class TextHandler:
+    """A text message handler with its precondition."""
+
+    # pylint: disable=too-many-arguments
+
+    def __init__(self, name: str, fn: Callable[[TextMessageEventObject], HandlerReturn],
+                 precondition: Callable[[TextMessageEventObject], bool], *,
+                 enabled: Optional[Callable[[ChannelConfigModel], bool]] = None, concurrent: bool = True):
+        """
+        Create a handler named ``name`` which handles the messages passing ``precondition`` using ``fn``.
+
+        :param name: name of the handler
+        :param fn: function to handle the text message
+        :param precondition: cheap check to see if `fn` should be executed
+        :param enabled: function to check if the handler is enabled in the channel config
+        :param concurrent: if the handler can be executed concurrently with the other handlers
+        """
+        self.name = name
+        self.fn = fn
+        self.precondition = precondition
+        self.enabled = enabled
+        self.concurrent = concurrent
+
+        self.stats = TextHandlerStats(name)
+
+    def is_enabled(self, config: ChannelConfigModel) -> bool:
+        """
+        Check if the handler is enabled in the channel config ``config``.
+
+        :param config: config of the channel
+        :return: if the handler is enabled
+        """
+        return not self.enabled or self.enabled(config)
+
+    def should_handle(self, e: TextMessageEventObject) -> bool:
+        """
+        Check the precondition of the handler and record the result.
+
+        :param e: text message event to be checked
+        :return: if the handler should handle `e`
+        """
+        start = time.perf_counter()
+        with span(f"precondition.{self.name}"):
+            passed = bool(self.precondition(e))
+        self.stats.record_precondition(passed, (time.perf_counter() - start) * 1000)
+
+        return passed
+
+    def handle(self, e: TextMessageEventObject) -> List[HandledMessageEvent]:
+        """
+        Handle the text message event ``e`` and record the latency.
+
+        :param e: text message event to be handled
+        :return: responses of the handler
+        """
+        start = time.perf_counter()
+        with span(f"{MessageLatencyResult.HANDLER_PREFIX}{self.name}"):
+            resp = self.fn(e)
+
+        if isinstance(resp, HandledMessageEvent):
+            resp = [resp]
+        if not isinstance(resp, (list, tuple)):
+            resp = []
+
+        self.stats.record_handle(bool(resp), (time.perf_counter() - start) * 1000)
+
+        return list(resp)
+
+
+class TextHandlerDispatcher:
+    """
+    Dispatcher of the text message handlers.
+
+    The responses are always ordered by the order of the handlers regardless the execution order.
+
+    Handlers which cannot be executed concurrently are executed first in order,
+    so the exception raised from these handlers will terminate the handling.
+    """
+
+    def __init__(self, handlers: List[TextHandler], *, max_workers: int):
+        self._handlers = handlers
+        self._max_workers = max_workers
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if not self._executor:
+            with self._executor_lock:
+                if not self._executor:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers, thread_name_prefix="TextHandler")
+
+        return self._executor
+
+    @staticmethod
+    def _handle_translated(handler: TextHandler, e: TextMessageEventObject, lang: Optional[str]) \
+            -> List[HandledMessageEvent]:
+        # Activated language is thread-local, so it needs to be activated again in the worker thread
+        if lang:
+            activate(lang)
+
+        try:
+            return handler.handle(e)
+        finally:
+            deactivate()
+
+    @property
+    def stats(self) -> Dict[str, TextHandlerStats]:
+        """
+        Get the stats of each handler.
+
+        :return: dict which key is the handler name and value is its stats
+        """
+        return {handler.name: handler.stats for handler in self._handlers}
+
+    def reset_stats(self):
+        """Reset the stats of all handlers."""
+        for handler in self._handlers:
+            handler.stats.reset()
+
+    def dispatch(self, e: TextMessageEventObject) -> List[HandledMessageEvent]:
+        """
+        Dispatch the text message event ``e`` to the handlers.
+
+        :param e: text message event to be dispatched
+        :return: responses of all handlers
+        """
+        handlers = [handler for handler in self._handlers
+                    if handler.is_enabled(e.channel_model.config) and handler.should_handle(e)]
+
+        results: Dict[int, List[HandledMessageEvent]] = {}
+
+        concurrent = []
+        for idx, handler in enumerate(handlers):
+            if handler.concurrent:
+                concurrent.append((idx, handler))
+            else:
+                results[idx] = handler.handle(e)
+
+        if len(concurrent) > 1:
+            lang = get_language()
+            # Context is copied for each handler to carry the active trace to the worker thread
+            futures = {idx: self._get_executor().submit(wrap_context(self._handle_translated), handler, e, lang)
+                       for idx, handler in concurrent}
+
+            for idx, future in futures.items():
+                results[idx] = future.result()
+        else:
+            for idx, handler in concurrent:
+                results[idx] = handler.handle(e)
+
+        responses = []
+
+        for idx in sorted(results):
+            responses.extend(results[idx])
+
+        return responses
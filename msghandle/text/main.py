@@ -1,36 +1,45 @@
 from typing import List
 
+from JellyBot.systemconfig import Bot
+from flags import AutoReplyContentType
+from mongodb.factory import AutoReplyManager, TimerManager
+from msghandle.botcmd import has_command_prefix
 from msghandle.models import TextMessageEventObject, HandledMessageEvent
 
 from .autoreply import process_auto_reply
 from .error_test import process_error_test
 from .calculator import process_calculator
 from .botcmd import process_bot_cmd
+from .dispatch import TextHandler, TextHandlerDispatcher
 from .timer import process_timer_get, process_timer_notification
 
+text_handler_dispatcher = TextHandlerDispatcher([
+    TextHandler(
+        "error_test", process_error_test,
+        lambda e: e.text == "ERRORTEST",
+        concurrent=False),
+    TextHandler(
+        "bot_cmd", process_bot_cmd,
+        lambda e: has_command_prefix(e.content),
+        enabled=lambda config: config.enable_bot_command),
+    TextHandler(
+        "auto_reply", process_auto_reply,
+        lambda e: AutoReplyManager.has_keyword(e.text, AutoReplyContentType.TEXT, e.channel_oid),
+        enabled=lambda config: config.enable_auto_reply),
+    TextHandler(
+        "timer_get", process_timer_get,
+        lambda e: TimerManager.has_keyword(e.channel_oid, e.content),
+        enabled=lambda config: config.enable_timer),
+    TextHandler(
+        "timer_notification", process_timer_notification,
+        lambda e: TimerManager.has_timer(e.channel_oid),
+        enabled=lambda config: config.enable_timer),
+    TextHandler(
+        "calculator", process_calculator,
+        lambda e: bool(e.text) and e.text.endswith("="),
+        enabled=lambda config: config.enable_calculator)
+], max_workers=Bot.TextHandlerMaxWorkers)
 
-def handle_text_event(e: TextMessageEventObject) -> List[HandledMessageEvent]:
-    responses = []
-    handle_fn = [process_error_test]
-
-    if e.channel_model.config.enable_bot_command:
-        handle_fn.append(process_bot_cmd)
-
-    if e.channel_model.config.enable_auto_reply:
-        handle_fn.append(process_auto_reply)
-
-    if e.channel_model.config.enable_timer:
-        handle_fn.append(process_timer_get)
-        handle_fn.append(process_timer_notification)
 
-    if e.channel_model.config.enable_calculator:
-        handle_fn.append(process_calculator)
-
-    for fn in handle_fn:
-        resp = fn(e)
-        if isinstance(resp, HandledMessageEvent):
-            resp = [resp]
-        if isinstance(resp, (list, tuple)):
-            responses.extend(resp)
-
-    return responses
+def handle_text_event(e: TextMessageEventObject) -> List[HandledMessageEvent]:
+    return text_handler_dispatcher.dispatch(e)
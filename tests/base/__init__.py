@@ -2,6 +2,7 @@ from .base import TestCase
 from .db import TestDatabaseMixin
 from .deco import locale_cht, locale_en
 from .image import TestImageComparisonMixin
+from .line import LineContentApiDouble
 from .mdl import TestModelMixin
 from .mdl_test import TestModel
 from .msgevent import EventFactory
@@ -0,0 +1,49 @@
+from threading import Lock
+from typing import Dict, Iterator, Optional
+
+__all__ = ("LineContentApiDouble",)
+
+
+class _LineContentDouble:
+    def __init__(self, content: bytes, content_type: str):
+        self.content = content
+        self.content_type = content_type
+
+    def iter_content(self, chunk_size: int = 1024) -> Iterator[bytes]:
+        for idx in range(0, len(self.content), chunk_size):
+            yield self.content[idx:idx + chunk_size]
+
+
+class LineContentApiDouble:
+    """
+    Offline replacement of the content API of :class:`linebot.LineBotApi`.
+
+    Serves the registered message contents without any network request, and records the count of the fetches.
+    """
+
+    def __init__(self, contents: Optional[Dict[str, bytes]] = None, content_type: str = "image/png"):
+        self._contents: Dict[str, bytes] = contents or {}
+        self._content_type = content_type
+        self._fetch_count: Dict[str, int] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def load_file(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def register(self, message_id: str, content: bytes):
+        self._contents[message_id] = content
+
+    def get_message_content(self, message_id: str, timeout=None) -> _LineContentDouble:
+        # pylint: disable=unused-argument
+        with self._lock:
+            self._fetch_count[message_id] = self._fetch_count.get(message_id, 0) + 1
+
+        return _LineContentDouble(self._contents[message_id], self._content_type)
+
+    def fetch_count(self, message_id: Optional[str] = None) -> int:
+        if message_id:
+            return self._fetch_count.get(message_id, 0)
+
+        return sum(self._fetch_count.values())
@@ -1 +1,2 @@
 from .utils import *  # noqa
+from .user import *  # noqa
@@ -0,0 +1,154 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from bson import ObjectId
+
+from bot.user import UserExistenceChecker
+from extutils.dt import now_utc_aware
+from extutils.ratelimit import TokenBucket
+from flags import Platform
+from models import (
+    OID_KEY, OnPlatformUserModel, RootUserModel, RootUserConfigModel, ChannelModel, ChannelConfigModel,
+    ChannelProfileConnectionModel
+)
+from mongodb.factory import ChannelManager, ProfileManager, RootUserManager
+from mongodb.factory.prof_base import UserProfileManager
+from mongodb.factory.user import OnPlatformIdentityManager
+from tests.base import TestModelMixin
+
+__all__ = ["TestUserExistenceChecker"]
+
+
+class TestUserExistenceChecker(TestModelMixin):
+    CHANNEL_OID = ObjectId()
+    PROF_OID = ObjectId()
+
+    @staticmethod
+    def obj_to_clear():
+        return [ChannelManager, ProfileManager, RootUserManager]
+
+    def setUpTestCase(self) -> None:
+        ChannelManager.insert_one_model(
+            ChannelModel(Id=self.CHANNEL_OID, Platform=Platform.LINE, Token="C123456",
+                         Config=ChannelConfigModel.generate_default()))
+
+        self.requested = []
+        self.onplat_models = {}
+
+    def tearDownTestCase(self) -> None:
+        OnPlatformUserModel.clear_name_cache()
+
+    def _insert_user(self, token: str) -> ChannelProfileConnectionModel:
+        mdl_onplat = OnPlatformUserModel(Platform=Platform.LINE, Token=token)
+        OnPlatformIdentityManager.insert_one_model(mdl_onplat)
+
+        mdl_root = RootUserModel(OnPlatOids=[mdl_onplat.id], Config=RootUserConfigModel.generate_default())
+        RootUserManager.insert_one_model(mdl_root)
+
+        mdl_conn = ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=mdl_root.id,
+                                                 ProfileOids=[self.PROF_OID])
+        UserProfileManager.insert_one_model(mdl_conn)
+
+        self.onplat_models[token] = mdl_onplat
+
+        return mdl_conn
+
+    def _get_name(self, model_onplat: OnPlatformUserModel, _):
+        self.requested.append(model_onplat.token)
+
+        if model_onplat.token.startswith("X"):
+            return None
+
+        return f"Name of {model_onplat.token}"
+
+    def _get_checker(self, batch_size=10):
+        return UserExistenceChecker({Platform.LINE: self._get_name},
+                                    {Platform.LINE: TokenBucket(1000, 1000)},
+                                    batch_size=batch_size, idle_seconds=0)
+
+    def test_check_batch(self):
+        mdl_conn_1 = self._insert_user("U1")
+        mdl_conn_2 = self._insert_user("X2")
+
+        checker = self._get_checker()
+
+        self.assertEqual(1, checker.check_batch())
+        self.assertEqual(["U1", "X2"], sorted(self.requested))
+
+        self.assertTrue(UserProfileManager.find_one_casted({OID_KEY: mdl_conn_1.id}).available)
+        self.assertFalse(UserProfileManager.find_one_casted({OID_KEY: mdl_conn_2.id}).available)
+        self.assertEqual("Name of U1", self.onplat_models["U1"].get_cached_name())
+        self.assertIsNone(self.onplat_models["X2"].get_cached_name())
+
+    def test_check_batch_records_time(self):
+        mdl_conn = self._insert_user("U1")
+
+        checker = self._get_checker()
+        checker.check_batch()
+
+        checked_at = UserProfileManager.find_one_casted({OID_KEY: mdl_conn.id}).existence_checked_at
+        self.assertIsNotNone(checked_at)
+        self.assertLess(now_utc_aware() - checked_at, timedelta(seconds=10))
+
+    def test_check_batch_resumes_from_stale(self):
+        self._insert_user("U1")
+        self._insert_user("U2")
+        self._insert_user("U3")
+
+        checker = self._get_checker(batch_size=2)
+
+        self.assertEqual(0, checker.check_batch())
+        self.assertEqual(2, len(self.requested))
+
+        # Another checker, for example after a restart, continues from the connection not checked
+        checker = self._get_checker(batch_size=2)
+
+        self.assertEqual(0, checker.check_batch())
+        self.assertEqual(["U1", "U2", "U3"], sorted(self.requested))
+        self.assertEqual(-1, checker.check_batch())
+        self.assertEqual(3, len(self.requested))
+
+    def test_run_continues_after_error(self):
+        self._insert_user("U1")
+
+        checker = self._get_checker()
+        check_batch = checker.check_batch
+        results = []
+
+        def _check_batch():
+            if not results:
+                results.append(None)
+                raise ValueError("Failed")
+
+            checker.stop()
+            results.append(check_batch())
+            return results[-1]
+
+        with patch.object(checker, "check_batch", side_effect=_check_batch):
+            checker.run()
+
+        self.assertEqual([None, 0], results)
+        self.assertEqual(["U1"], self.requested)
+
+    def test_check_batch_nothing_to_check(self):
+        self.assertEqual(-1, self._get_checker().check_batch())
+        self.assertEqual([], self.requested)
+
+    def test_check_batch_rate_limited(self):
+        self._insert_user("U1")
+        self._insert_user("U2")
+
+        clock = [0.0]
+        slept = []
+
+        def _sleep(secs):
+            slept.append(secs)
+            clock[0] += secs
+
+        checker = UserExistenceChecker({Platform.LINE: self._get_name},
+                                       {Platform.LINE: TokenBucket(2, 1, clock=lambda: clock[0], sleep=_sleep)},
+                                       idle_seconds=0)
+        checker.check_batch()
+
+        self.assertEqual(2, len(self.requested))
+        self.assertEqual([0.5], slept)
@@ -1,4 +1,5 @@
 from .ar_conn import *  # noqa
+from .base import *  # noqa
 from .channel import *  # noqa
 from .exctnt import *  # noqa
 from .execode import *  # noqa
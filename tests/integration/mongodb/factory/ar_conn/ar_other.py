@@ -1,9 +1,14 @@
 import time
+from unittest.mock import patch
+
+from bson import ObjectId
+from cachetools import TTLCache
 
 from flags import AutoReplyContentType
-from models import AutoReplyContentModel, AutoReplyModuleModel
+from models import OID_KEY, AutoReplyContentModel, AutoReplyModuleModel, AutoReplyKeywordVersionModel
 from models.ar import UniqueKeywordCountEntry
 from mongodb.factory.ar_conn import AutoReplyManager, AutoReplyModuleManager
+from mongodb.factory.ar_kwver import AutoReplyKeywordVersionManager
 from tests.base import TestModelMixin
 
 from ._base_ar import TestAutoReplyManagerBase
@@ -28,6 +33,88 @@ class TestAutoReplyManagerOther(TestAutoReplyManagerBase.TestClass, TestModelMix
             })
             self.assertEqual(mdl.called_count, i)
 
+    def test_has_keyword(self):
+        mdl = self.get_mdl_1()
+        kw_content = mdl.keyword.content
+
+        self.assertFalse(AutoReplyManager.has_keyword(kw_content, mdl.keyword.content_type, mdl.channel_oid))
+
+        AutoReplyManager.add_conn(**self.get_mdl_1_args())
+
+        self.assertTrue(AutoReplyManager.has_keyword(kw_content, mdl.keyword.content_type, mdl.channel_oid))
+        self.assertTrue(
+            AutoReplyManager.has_keyword(kw_content.swapcase(), mdl.keyword.content_type, mdl.channel_oid))
+        self.assertFalse(AutoReplyManager.has_keyword(f"{kw_content}X", mdl.keyword.content_type, mdl.channel_oid))
+        self.assertFalse(AutoReplyManager.has_keyword(kw_content, mdl.keyword.content_type, ObjectId()))
+
+    def test_has_keyword_module_manager_insert(self):
+        mdl = self.get_mdl_1()
+
+        self.assertFalse(
+            AutoReplyManager.has_keyword(mdl.keyword.content, mdl.keyword.content_type, mdl.channel_oid))
+
+        AutoReplyModuleManager.insert_one_model(mdl)
+
+        self.assertTrue(
+            AutoReplyManager.has_keyword(mdl.keyword.content, mdl.keyword.content_type, mdl.channel_oid))
+
+    def test_has_keyword_collation(self):
+        keywords = {
+            "❤": ["❤️", "❤\u200b"],
+            "Café": ["cafe", "CAFÉ", "cafe\u0301"],
+            "Straße": ["STRASSE"],
+            "アイウ": ["ｱｲｳ", "あいう"],
+            "Ø3": ["o٣"],
+            "soft\u00adhyphen": ["softhyphen"]
+        }
+
+        for keyword, messages in keywords.items():
+            args = self.get_mdl_1_args()
+            args["Keyword"] = AutoReplyContentModel(Content=keyword, ContentType=AutoReplyContentType.TEXT)
+            AutoReplyManager.add_conn(**args)
+
+            for message in [keyword] + messages:
+                with self.subTest(keyword=keyword, message=message):
+                    # The check must not reject any message which has responses
+                    if AutoReplyManager.get_responses(
+                            message, AutoReplyContentType.TEXT, self.channel_oid, update_async=False):
+                        self.assertTrue(
+                            AutoReplyManager.has_keyword(message, AutoReplyContentType.TEXT, self.channel_oid))
+
+        self.assertTrue(AutoReplyManager.has_keyword("❤️", AutoReplyContentType.TEXT, self.channel_oid))
+        self.assertFalse(AutoReplyManager.has_keyword("cafes", AutoReplyContentType.TEXT, self.channel_oid))
+
+    def test_has_keyword_other_process(self):
+        mdl = self.get_mdl_1()
+
+        self.assertFalse(
+            AutoReplyManager.has_keyword(mdl.keyword.content, mdl.keyword.content_type, mdl.channel_oid))
+
+        # Simulate the module added by the other process, which does not invalidate the caches of this process
+        AutoReplyModuleManager.insert_one(mdl.to_json())
+        AutoReplyKeywordVersionManager.update_one(
+            {OID_KEY: mdl.channel_oid}, {"$inc": {AutoReplyKeywordVersionModel.Version.key: 1}}, upsert=True)
+
+        # Version cache not expired yet
+        self.assertFalse(
+            AutoReplyManager.has_keyword(mdl.keyword.content, mdl.keyword.content_type, mdl.channel_oid))
+
+        with patch.object(AutoReplyKeywordVersionManager, "_version_cache", TTLCache(maxsize=1, ttl=1)):
+            self.assertTrue(
+                AutoReplyManager.has_keyword(mdl.keyword.content, mdl.keyword.content_type, mdl.channel_oid))
+
+    def test_has_keyword_miss_cached(self):
+        mdl = self.get_mdl_1()
+        AutoReplyManager.add_conn(**self.get_mdl_1_args())
+
+        self.assertFalse(AutoReplyManager.has_keyword("X", mdl.keyword.content_type, mdl.channel_oid))
+
+        with patch.object(AutoReplyKeywordVersionManager, "find_one") as find_one:
+            for _ in range(3):
+                self.assertFalse(AutoReplyManager.has_keyword("X", mdl.keyword.content_type, mdl.channel_oid))
+
+        find_one.assert_not_called()
+
     def test_get_after_add_multi(self):
         AutoReplyManager.add_conn(**self.get_mdl_1_args())
         AutoReplyManager.add_conn(**self.get_mdl_4_args())
@@ -2,9 +2,9 @@ from bson import ObjectId
 
 from extutils.color import ColorFactory
 from flags import AutoReplyContentType
-from models import AutoReplyModuleTagModel, AutoReplyContentModel
+from models import AutoReplyModuleTagModel, AutoReplyContentModel, AutoReplyModuleModel
 from mongodb.factory.results import GetOutcome
-from mongodb.factory.ar_conn import AutoReplyManager, AutoReplyModuleManager
+from mongodb.factory.ar_conn import AutoReplyManager, AutoReplyModuleManager, AutoReplyTagPopularityManager
 from tests.base import TestDatabaseMixin, TestModelMixin
 
 __all__ = ["TestAutoReplyManagerTag"]
@@ -96,3 +96,41 @@ class TestAutoReplyManagerTag(TestModelMixin, TestDatabaseMixin):
     def test_get_score_limit_count(self):
         self._insert_5_tags(add_related_ar_module=True)
         self.assertTrue(len(AutoReplyManager.get_popularity_scores("TAG", 3)), 3)
+
+    def test_get_score_order(self):
+        self._insert_5_tags(add_related_ar_module=True)
+        self.assertEqual(AutoReplyManager.get_popularity_scores("TAG", 2), ["TAG1", "TAG2"])
+
+    def test_get_score_filtered(self):
+        self._insert_5_tags(add_related_ar_module=True)
+        self.assertEqual(AutoReplyManager.get_popularity_scores("TAG3"), ["TAG3"])
+
+    def test_get_score_all(self):
+        self._insert_5_tags(add_related_ar_module=True)
+        self.assertEqual(len(AutoReplyManager.get_popularity_scores()), 5)
+
+    def test_get_score_module_removed(self):
+        self._insert_5_tags(add_related_ar_module=True)
+
+        AutoReplyTagPopularityManager.on_modules_removed(
+            AutoReplyModuleManager.find_cursor_with_count({AutoReplyModuleModel.KEY_KW_CONTENT: {"$in": ["C", "E"]}}))
+
+        result = AutoReplyManager.get_popularity_scores("TAG")
+
+        # Tags with the same appearances have almost the same score
+        self.assertEqual(len(result), 4)
+        self.assertEqual(set(result[:2]), {"TAG1", "TAG2"})
+        self.assertEqual(set(result[2:]), {"TAG3", "TAG4"})
+
+    def test_reconcile(self):
+        self._insert_5_tags(add_related_ar_module=True)
+
+        expected = {score.tag_id: score.appearances for score in AutoReplyTagPopularityManager.get_scores()}
+
+        AutoReplyTagPopularityManager.clear()
+        AutoReplyTagPopularityManager.reconcile()
+
+        self.assertEqual(
+            {score.tag_id: score.appearances for score in AutoReplyTagPopularityManager.get_scores()},
+            expected
+        )
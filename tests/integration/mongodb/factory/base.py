@@ -0,0 +1,120 @@
+from models import PendingRepairDataModel
+from mongodb.factory import BaseCollection, ClientProfile, get_mongo_client, use_client_profile, wait_indexes_ready
+from mongodb.factory.factory import get_active_client_profile
+
+from tests.base import TestDatabaseMixin
+
+__all__ = ["TestBaseCollectionIndexes", "TestBaseCollectionClientProfile"]
+
+
+class IndexedCollection(BaseCollection):
+    database_name = "testdb"
+    collection_name = "testidx"
+    model_class = PendingRepairDataModel
+
+    def __init__(self):
+        self.index_creations = []
+
+        super().__init__()
+
+    def build_indexes(self):
+        self.create_index("a", unique=True, name="Unique A")
+        self.create_index([("b", 1), ("c", -1)], name="Compound BC")
+
+    def create_indexes(self, indexes, session=None, **kwargs):
+        self.index_creations.append([index.document["name"] for index in indexes])
+
+        return super().create_indexes(indexes, session=session, **kwargs)
+
+
+class TestBaseCollectionIndexes(TestDatabaseMixin):
+    def tearDownTestCase(self) -> None:
+        IndexedCollection().drop()
+
+    def test_indexes_created(self):
+        col = IndexedCollection()
+
+        self.assertEqual([["Unique A", "Compound BC"]], col.index_creations)
+        self.assertTrue(col.index_information()["Unique A"]["unique"])
+        self.assertEqual([("b", 1), ("c", -1)], col.index_information()["Compound BC"]["key"])
+
+    def test_indexes_exist_skipped(self):
+        IndexedCollection()
+        col = IndexedCollection()
+
+        self.assertEqual([], col.index_creations)
+
+    def test_indexes_missing_created(self):
+        IndexedCollection().drop_index("Compound BC")
+        col = IndexedCollection()
+
+        self.assertEqual([["Compound BC"]], col.index_creations)
+
+    def test_create_index_after_init(self):
+        col = IndexedCollection()
+
+        self.assertEqual("Single D", col.create_index("d", name="Single D"))
+        self.assertIn("Single D", col.index_information())
+
+    def test_wait_indexes_ready(self):
+        IndexedCollection()
+
+        self.assertTrue(wait_indexes_ready(timeout=10))
+
+
+class HotPathCollection(BaseCollection):
+    database_name = "testdb"
+    collection_name = "testprof"
+    model_class = PendingRepairDataModel
+    client_profile = ClientProfile.HOT_PATH
+
+    def find_default(self):
+        return self.find({})
+
+    @use_client_profile(ClientProfile.ANALYTICS)
+    def find_analytics(self):
+        return self.find({})
+
+    @use_client_profile(ClientProfile.ANALYTICS)
+    def aggregate_analytics(self):
+        return list(self.aggregate([{"$match": {}}])), self.count_documents({})
+
+    @use_client_profile(ClientProfile.HOT_PATH)
+    def find_hot_path(self):
+        return self.find({})
+
+
+_col_hot_path = HotPathCollection()
+
+
+class TestBaseCollectionClientProfile(TestDatabaseMixin):
+    def tearDownTestCase(self) -> None:
+        _col_hot_path.delete_many({})
+
+    def test_get_client(self):
+        self.assertIs(get_mongo_client(ClientProfile.ANALYTICS), get_mongo_client(ClientProfile.ANALYTICS))
+        self.assertIsNot(get_mongo_client(ClientProfile.ANALYTICS), get_mongo_client(ClientProfile.HOT_PATH))
+
+    def test_collection_profile(self):
+        self.assertIs(_col_hot_path.database.client, get_mongo_client(ClientProfile.HOT_PATH))
+        self.assertIs(_col_hot_path.find_default().collection, _col_hot_path)
+        self.assertIs(_col_hot_path.find_hot_path().collection, _col_hot_path)
+
+    def test_method_profile(self):
+        _col_hot_path.insert_one({"a": 1})
+
+        cursor = _col_hot_path.find_analytics()
+
+        self.assertIs(cursor.collection.database.client, get_mongo_client(ClientProfile.ANALYTICS))
+        self.assertEqual(_col_hot_path.codec_options, cursor.collection.codec_options)
+        self.assertEqual(1, len(list(cursor)))
+
+        data, count = _col_hot_path.aggregate_analytics()
+
+        self.assertEqual(1, len(data))
+        self.assertEqual(1, count)
+
+    def test_method_profile_restored(self):
+        _col_hot_path.find_analytics()
+
+        self.assertIsNone(get_active_client_profile())
@@ -1,20 +1,23 @@
 from typing import Dict
+from unittest.mock import patch
 
 from bson import ObjectId
 
 from flags import Platform
 from models import ChannelConfigModel, ChannelModel
-from mongodb.factory.channel import ChannelManager
+from mongodb.factory import ProfileManager
+from mongodb.factory.channel import ChannelManager, ChannelCollectionManager
+from mongodb.factory.prof_base import ProfileDataManager
 from mongodb.factory.results import WriteOutcome, GetOutcome, UpdateOutcome
 from tests.base import TestDatabaseMixin, TestModelMixin
 
-__all__ = ["TestChannelManager"]
+__all__ = ["TestChannelManager", "TestChannelCollectionManager"]
 
 
 class TestChannelManager(TestModelMixin, TestDatabaseMixin):
     @staticmethod
     def obj_to_clear():
-        return [ChannelManager]
+        return [ChannelManager, ProfileDataManager]
 
     def test_add_duplicate(self):
         self.assertEqual(
@@ -95,6 +98,32 @@ class TestChannelManager(TestModelMixin, TestDatabaseMixin):
         self.assertTrue(result.success)
         self.assertEqual(result.model, mdl)
 
+    def test_register_default_profile(self):
+        result = ChannelManager.ensure_register(Platform.LINE, "U1234567")
+
+        prof = ProfileManager.get_profile(result.model.config.default_profile_oid)
+        self.assertIsNotNone(prof)
+        self.assertEqual(prof.channel_oid, result.model.id)
+
+    def test_register_exists_no_profile_created(self):
+        ChannelManager.ensure_register(Platform.LINE, "U1234567")
+        ChannelManager.ensure_register(Platform.LINE, "U1234567")
+
+        self.assertEqual(ProfileDataManager.count_documents({}), 1)
+        self.assertEqual(ChannelManager.count_documents({}), 1)
+
+    def test_register_concurrent_orphan_profile_removed(self):
+        mdl = ChannelManager.ensure_register(Platform.LINE, "U1234567").model
+
+        # Simulate the channel being registered by the other request after the existence check
+        with patch.object(ChannelManager, "get_channel_token", return_value=None):
+            result = ChannelManager.ensure_register(Platform.LINE, "U1234567")
+
+        self.assertEqual(result.outcome, WriteOutcome.O_DATA_EXISTS)
+        self.assertEqual(result.model, mdl)
+        self.assertEqual(ProfileDataManager.count_documents({}), 1)
+        self.assertIsNotNone(ProfileManager.get_profile(mdl.config.default_profile_oid))
+
     def test_register_default_name(self):
         result = ChannelManager.ensure_register(Platform.LINE, "U1234567", default_name="N")
 
@@ -424,3 +453,51 @@ class TestChannelManager(TestModelMixin, TestDatabaseMixin):
 
         self.assertEqual(ChannelManager.set_config(mdl.id, "AABBCCDDD", 1),
                          UpdateOutcome.X_CONFIG_NOT_EXISTS)
+
+
+class TestChannelCollectionManager(TestModelMixin, TestDatabaseMixin):
+    @staticmethod
+    def obj_to_clear():
+        return [ChannelCollectionManager]
+
+    def test_register_new(self):
+        child_oid = ObjectId()
+
+        result = ChannelCollectionManager.ensure_register(Platform.DISCORD, "123456", child_oid)
+
+        self.assertEqual(result.outcome, WriteOutcome.O_INSERTED)
+        self.assertTrue(result.success)
+        self.assertEqual(result.model.default_name, f"123456 ({Platform.DISCORD.key})")
+        self.assertEqual(result.model.child_channel_oids, [child_oid])
+
+    def test_register_default_name(self):
+        result = ChannelCollectionManager.ensure_register(Platform.DISCORD, "123456", ObjectId(), "N")
+
+        self.assertEqual(result.outcome, WriteOutcome.O_INSERTED)
+        self.assertEqual(result.model.default_name, "N")
+
+    def test_register_exists(self):
+        child_oid = ObjectId()
+
+        mdl = ChannelCollectionManager.ensure_register(Platform.DISCORD, "123456", child_oid).model
+
+        result = ChannelCollectionManager.ensure_register(Platform.DISCORD, "123456", child_oid, "N")
+
+        self.assertEqual(result.outcome, WriteOutcome.O_DATA_EXISTS)
+        self.assertTrue(result.success)
+        self.assertModelEqual(result.model, mdl)
+        self.assertEqual(ChannelCollectionManager.count_documents({}), 1)
+
+    def test_register_exists_new_child(self):
+        child_oid = ObjectId()
+        child_oid_2 = ObjectId()
+
+        mdl = ChannelCollectionManager.ensure_register(Platform.DISCORD, "123456", child_oid).model
+
+        result = ChannelCollectionManager.ensure_register(Platform.DISCORD, "123456", child_oid_2)
+
+        self.assertEqual(result.outcome, WriteOutcome.O_DATA_EXISTS)
+        self.assertEqual(result.model.id, mdl.id)
+        self.assertEqual(result.model.child_channel_oids, [child_oid, child_oid_2])
+        self.assertEqual(ChannelCollectionManager.get_chcoll(Platform.DISCORD, "123456").child_channel_oids,
+                         [child_oid, child_oid_2])
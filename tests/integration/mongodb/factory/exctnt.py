@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from bson import ObjectId
 
 from extutils.dt import now_utc_aware
@@ -102,3 +104,42 @@ class TestExtraContentManager(TestModelMixin, TestTimeComparisonMixin, TestDatab
         result = ExtraContentManager.record_content(ExtraContentType.PURE_TEXT, self.CHANNEL_OID, "ABCDE", "T")
 
         self.assertEqual(ExtraContentManager.get_content(result.model_id), result.model)
+
+    def test_get_content_cached(self):
+        result = ExtraContentManager.record_content(ExtraContentType.PURE_TEXT, self.CHANNEL_OID, "ABCDE", "T")
+
+        # Deleting the document bypassing the cache
+        ExtraContentManager.delete_many({})
+
+        self.assertEqual(ExtraContentManager.get_content(result.model_id), result.model)
+
+    def test_get_content_not_cached(self):
+        mdl = ExtraContentModel(Type=ExtraContentType.PURE_TEXT, Title="T", Content="ABCDE",
+                                Timestamp=now_utc_aware(for_mongo=True), ChannelOid=self.CHANNEL_OID)
+        ExtraContentManager.insert_one_model(mdl)
+
+        self.assertModelEqual(ExtraContentManager.get_content(mdl.id), mdl)
+        self.assertIsNone(ExtraContentManager.get_content(ObjectId()))
+
+    def test_get_content_expired(self):
+        mdl = ExtraContentModel(Type=ExtraContentType.PURE_TEXT, Title="T", Content="ABCDE",
+                                Timestamp=now_utc_aware(for_mongo=True) - timedelta(days=60),
+                                ChannelOid=self.CHANNEL_OID)
+        ExtraContentManager.insert_one_model(mdl)
+
+        self.assertModelEqual(ExtraContentManager.get_content(mdl.id), mdl)
+
+        # Expired content should not be cached
+        ExtraContentManager.delete_many({})
+
+        self.assertIsNone(ExtraContentManager.get_content(mdl.id))
+
+    def test_get_content_html_precomputed(self):
+        result = ExtraContentManager.record_extra_message(
+            self.CHANNEL_OID, [(ToSiteReason.FORCED_ONSITE, "A")], "T")
+
+        self.assertEqual(ExtraContentManager.get_content_html(result.model), result.model.content_html)
+
+        result = ExtraContentManager.record_content(ExtraContentType.PURE_TEXT, self.CHANNEL_OID, "ABCDE", "T")
+
+        self.assertEqual(ExtraContentManager.get_content_html(result.model), "ABCDE")
@@ -124,6 +124,36 @@ class TestExecodeManager(TestModelMixin, TestTimeComparisonMixin, TestDatabaseMi
         self.assertEqual(ExecodeManager.count_documents({ExecodeEntryModel.CreatorOid.key: self.CREATOR_OID}), 5)
         self.assertEqual(ExecodeManager.count_documents({ExecodeEntryModel.CreatorOid.key: self.CREATOR_OID_2}), 3)
 
+    def test_get_list_page(self):
+        expected = []
+
+        for _ in range(5):
+            mdl = ExecodeEntryModel(CreatorOid=self.CREATOR_OID, Execode=ExecodeManager.generate_hex_token(),
+                                    ActionType=Execode.REGISTER_CHANNEL, Timestamp=now_utc_aware(for_mongo=True))
+            ExecodeManager.insert_one_model(mdl)
+            expected.append(mdl)
+
+        ExecodeManager.insert_one_model(
+            ExecodeEntryModel(CreatorOid=self.CREATOR_OID_2, Execode=ExecodeManager.generate_hex_token(),
+                              ActionType=Execode.REGISTER_CHANNEL, Timestamp=now_utc_aware(for_mongo=True)))
+
+        expected = list(reversed(expected))
+
+        page = ExecodeManager.get_queued_execodes_page(self.CREATOR_OID, limit=3, with_count=True)
+        self.assertEqual(page.total_count, 5)
+        self.assertTrue(page.count_is_exact)
+        self.assertTrue(page.has_next)
+        for actual_mdl, expected_mdl in zip(page, expected[:3]):
+            with self.subTest(expected_mdl):
+                self.assertModelEqual(actual_mdl, expected_mdl)
+
+        page = ExecodeManager.get_queued_execodes_page(self.CREATOR_OID, limit=3, page_token=page.next_token)
+        self.assertEqual(len(page), 2)
+        self.assertFalse(page.has_next)
+        for actual_mdl, expected_mdl in zip(page, expected[3:]):
+            with self.subTest(expected_mdl):
+                self.assertModelEqual(actual_mdl, expected_mdl)
+
     def test_get_list_no_exists(self):
         self.assertEqual(list(ExecodeManager.get_queued_execodes(self.CREATOR_OID)), [])
         self.assertEqual(ExecodeManager.count_documents({}), 0)
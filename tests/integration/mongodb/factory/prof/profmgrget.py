@@ -1,5 +1,8 @@
+from datetime import timedelta
+
 from bson import ObjectId
 
+from extutils.dt import now_utc_aware
 from flags import ProfilePermission, PermissionLevel, ProfilePermissionDefault, Platform
 from models import ChannelProfileModel, ChannelProfileConnectionModel, ChannelModel, ChannelConfigModel
 from mongodb.factory import ChannelManager, ProfileManager
@@ -782,6 +785,41 @@ class TestProfileManagerGetInfo(TestModelMixin, TestDatabaseMixin):
     def test_available_conns_empty(self):
         self.assertModelSetEqual(set(ProfileManager.get_available_connections()), set(), ignore_oid=False)
 
+    def test_conns_to_check(self):
+        # Database stores the timestamp in milliseconds
+        now = now_utc_aware().replace(microsecond=0)
+
+        mdl = ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=self.USER_OID,
+                                            ProfileOids=[self.PROF_OID_1], ExistenceCheckedAt=now - timedelta(days=3))
+        mdl2 = ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=self.USER_OID_2,
+                                             ProfileOids=[self.PROF_OID_1])
+        mdl3 = ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=self.USER_OID_3,
+                                             ProfileOids=[self.PROF_OID_1], ExistenceCheckedAt=now)
+        mdl4 = ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID_2, UserOid=self.USER_OID,
+                                             ProfileOids=[])
+        for conn in (mdl, mdl2, mdl3, mdl4):
+            UserProfileManager.insert_one_model(conn)
+
+        self.assertModelSequenceEqual(
+            ProfileManager.get_connections_to_check(now - timedelta(days=1), 10), [mdl2, mdl], ignore_oid=False)
+        self.assertModelSequenceEqual(
+            ProfileManager.get_connections_to_check(now - timedelta(days=1), 1), [mdl2], ignore_oid=False)
+
+    def test_conns_to_check_mark_checked(self):
+        now = now_utc_aware()
+
+        mdl = ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=self.USER_OID,
+                                            ProfileOids=[self.PROF_OID_1])
+        mdl2 = ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=self.USER_OID_2,
+                                             ProfileOids=[self.PROF_OID_1])
+        UserProfileManager.insert_one_model(mdl)
+        UserProfileManager.insert_one_model(mdl2)
+
+        ProfileManager.mark_existence_checked([mdl.id], now)
+
+        self.assertModelSequenceEqual(
+            ProfileManager.get_connections_to_check(now - timedelta(days=1), 10), [mdl2], ignore_oid=False)
+
     def test_attachable(self):
         mdls = self._insert_sample_attachable()
 
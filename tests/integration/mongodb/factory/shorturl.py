@@ -32,6 +32,23 @@ class TestShortUrlDataManager(TestModelMixin, TestDatabaseMixin):
             all(c in ShortUrlDataManager.AVAILABLE_CHARACTERS for c in ShortUrlDataManager.generate_code())
         )
 
+    def test_generate_code_unique(self):
+        codes = [ShortUrlDataManager.generate_code() for _ in range(ShortUrlDataManager.CODE_BLOCK_SIZE * 3)]
+
+        self.assertEqual(len(set(codes)), len(codes))
+        self.assertTrue(all(len(code) >= ShortUrlDataManager.MIN_CODE_LENGTH for code in codes))
+
+    def test_generate_code_length_grow(self):
+        ShortUrlDataManager.generate_code()
+
+        # pylint: disable=protected-access
+        min_length = ShortUrlDataManager._code_min_length
+        space = len(ShortUrlDataManager.AVAILABLE_CHARACTERS) ** min_length
+
+        self.assertEqual(len(ShortUrlDataManager._seq_to_code(space - 1)), min_length)
+        self.assertEqual(len(ShortUrlDataManager._seq_to_code(space)), min_length + 1)
+        # pylint: enable=protected-access
+
     def test_create_record(self):
         result = ShortUrlDataManager.create_record("https://google.com", self.USER_OID)
 
@@ -1,3 +1,5 @@
 from .api import *  # noqa
 from .bot import *  # noqa
 from .msg import *  # noqa
+from .msgkw import *  # noqa
+from .trace import *  # noqa
@@ -1,4 +1,5 @@
 from datetime import datetime, date, timedelta
+from unittest.mock import patch
 
 import pytz
 from bson import ObjectId
@@ -10,8 +11,9 @@ from models import (
     MessageRecordModel, MemberMessageCountEntry
 )
 from models.stats import MemberMessageByCategoryEntry
-from mongodb.factory import MessageRecordStatisticsManager
+from mongodb.factory import MessageRecordStatisticsManager, MessageKeywordIndexManager
 from mongodb.factory.results import WriteOutcome
+from mongodb.factory.stats import _LeaderboardCache
 from tests.base import TestDatabaseMixin, TestModelMixin, TestTimeComparisonMixin
 from strres.models import StatsResults
 
@@ -29,7 +31,7 @@ class TestMessageRecordStatisticsManager(TestTimeComparisonMixin, TestModelMixin
 
     @staticmethod
     def obj_to_clear():
-        return [MessageRecordStatisticsManager]
+        return [MessageRecordStatisticsManager, MessageKeywordIndexManager]
 
     def test_record_stats(self):
         self.assertEqual(
@@ -43,6 +45,10 @@ class TestMessageRecordStatisticsManager(TestTimeComparisonMixin, TestModelMixin
             MessageRecordModel(ChannelOid=self.CHANNEL_OID, UserRootOid=self.USER_OID, MessageType=MessageType.TEXT,
                                MessageContent="ABC", ProcessTimeSecs=2.13)
         )
+        self.assertEqual(
+            MessageKeywordIndexManager.search_channels("BC", [self.CHANNEL_OID]),
+            [self.CHANNEL_OID]
+        )
 
     def _insert_messages(self):
         mdls = [
@@ -108,6 +114,24 @@ class TestMessageRecordStatisticsManager(TestTimeComparisonMixin, TestModelMixin
             list(reversed(mdls[0:4]))
         )
 
+    def test_get_recent_before(self):
+        mdls = self._insert_messages()
+
+        self.assertModelSequenceEqual(
+            MessageRecordStatisticsManager.get_recent_messages_before(self.CHANNEL_OID, limit=2),
+            list(reversed(mdls[4:6]))
+        )
+        self.assertModelSequenceEqual(
+            MessageRecordStatisticsManager.get_recent_messages_before(self.CHANNEL_OID, mdls[4].id, limit=2),
+            list(reversed(mdls[2:4]))
+        )
+        self.assertModelSequenceEqual(
+            MessageRecordStatisticsManager.get_recent_messages_before(self.CHANNEL_OID, mdls[2].id),
+            list(reversed(mdls[0:2]))
+        )
+        self.assertModelSequenceEqual(
+            MessageRecordStatisticsManager.get_recent_messages_before(self.CHANNEL_OID, mdls[0].id), [])
+
     def test_get_recent_channel_miss(self):
         self._insert_messages()
 
@@ -2671,3 +2695,85 @@ class TestMessageRecordStatisticsManager(TestTimeComparisonMixin, TestModelMixin
                 "2020-06-02": {}
             }
         )
+
+    def _insert_recent_messages(self, channel_oid, user_oid, hours_ago, count=1):
+        now = datetime.utcnow().replace(tzinfo=pytz.utc)
+
+        MessageRecordStatisticsManager.insert_many([
+            MessageRecordModel(Id=ObjectId.from_datetime(now - timedelta(hours=hours_ago)),
+                               ChannelOid=channel_oid, UserRootOid=user_oid,
+                               MessageType=MessageType.TEXT, MessageContent="ABC", ProcessTimeSecs=1)
+            for _ in range(count)
+        ])
+
+    def test_get_user_rank(self):
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID, 0, 2)
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID_2, 0, 1)
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID_2, 48, 5)
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID, 240, 10)
+        self._insert_recent_messages(self.CHANNEL_OID_2, self.USER_OID_2, 0, 10)
+
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID, 24), (1, 2))
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID_2, 24), (2, 2))
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID, 168), (2, 2))
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID_2, 168), (1, 2))
+
+        self.assertEqual(
+            MessageRecordStatisticsManager.get_user_rank([self.CHANNEL_OID, self.CHANNEL_OID_2], self.USER_OID, 24),
+            (2, 2))
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID_2, self.USER_OID, 24), (-1, 1))
+
+    def test_get_user_rank_unsupported_window(self):
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID, 0)
+
+        self.assertIsNone(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID, 5))
+
+    def test_get_user_rank_updated_on_record(self):
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID, 0, 2)
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID_2, 0, 1)
+
+        # Load the leaderboards
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID_2, 24), (2, 2))
+        self.assertEqual(
+            MessageRecordStatisticsManager.get_user_rank([self.CHANNEL_OID, self.CHANNEL_OID_2], self.USER_OID_2, 24),
+            (2, 2))
+
+        for _ in range(2):
+            MessageRecordStatisticsManager.record_message(
+                self.CHANNEL_OID_2, self.USER_OID_2, MessageType.TEXT, "ABC", 1)
+
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID_2, 24), (2, 2))
+        self.assertEqual(
+            MessageRecordStatisticsManager.get_user_rank([self.CHANNEL_OID, self.CHANNEL_OID_2], self.USER_OID_2, 24),
+            (1, 2))
+
+    def test_get_user_rank_updated_on_record_evicted(self):
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID, 0, 2)
+
+        # pylint: disable=protected-access
+        with patch.object(MessageRecordStatisticsManager, "_leaderboards", _LeaderboardCache(1)):
+            self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID, 24), (1, 1))
+
+            # The leaderboard of `CHANNEL_OID` is evicted by the one of `CHANNEL_OID_2`
+            self.assertEqual(
+                MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID_2, self.USER_OID, 24), (-1, 0))
+            self.assertEqual(MessageRecordStatisticsManager._leaderboards.get_by_channel(self.CHANNEL_OID), [])
+
+            for channel_oid in (self.CHANNEL_OID, self.CHANNEL_OID_2):
+                MessageRecordStatisticsManager.record_message(channel_oid, self.USER_OID, MessageType.TEXT, "ABC", 1)
+
+            self.assertEqual(
+                MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID_2, self.USER_OID, 24), (1, 1))
+            self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID, 24), (1, 1))
+        # pylint: enable=protected-access
+
+    def test_reconcile_leaderboards(self):
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID, 0, 2)
+
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID_2, 24), (-1, 1))
+
+        # Inserted bypassing the leaderboards
+        self._insert_recent_messages(self.CHANNEL_OID, self.USER_OID_2, 0, 3)
+        MessageRecordStatisticsManager.reconcile_leaderboards()
+
+        self.assertEqual(MessageRecordStatisticsManager.get_user_rank(self.CHANNEL_OID, self.USER_OID_2, 24), (1, 2))
@@ -0,0 +1,182 @@
+from datetime import datetime, timedelta
+
+import pytz
+from bson import ObjectId
+
+from flags import MessageType
+from extutils.dt import now_utc_aware
+from models import MessageRecordModel, MessageKeywordModel, MessageKeywordBackfillModel
+from mongodb.factory import (
+    MessageKeywordIndexManager, MessageKeywordBackfillManager, MessageRecordStatisticsManager
+)
+from tests.base import TestDatabaseMixin
+
+__all__ = ("TestMessageKeywordIndexManager",)
+
+
+class TestMessageKeywordIndexManager(TestDatabaseMixin):
+    CHANNEL_OID = ObjectId()
+    CHANNEL_OID_2 = ObjectId()
+    CHANNEL_OID_3 = ObjectId()
+
+    USER_OID = ObjectId()
+
+    @staticmethod
+    def obj_to_clear():
+        return [MessageKeywordIndexManager, MessageKeywordBackfillManager, MessageRecordStatisticsManager]
+
+    def _index_messages(self):
+        mdls = [
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 6, 1, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_OID, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="Hello World", ProcessTimeSecs=2.13),
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 6, 1, 1, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_OID_2, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="hello", ProcessTimeSecs=2.13),
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 6, 2, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_OID_2, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="HELLO!", ProcessTimeSecs=2.13),
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 6, 3, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_OID_3, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.IMAGE, MessageContent="hello", ProcessTimeSecs=2.13)
+        ]
+
+        MessageKeywordIndexManager.index_messages(mdls)
+
+        return mdls
+
+    def test_index(self):
+        self._index_messages()
+
+        entry = MessageKeywordIndexManager.find_one_casted({
+            MessageKeywordModel.Keyword.key: "hello",
+            MessageKeywordModel.ChannelOid.key: self.CHANNEL_OID_2
+        })
+        self.assertEqual(entry.count, 2)
+        self.assertEqual(entry.last_used, datetime(2020, 6, 2, tzinfo=pytz.utc))
+
+    def test_index_image_skipped(self):
+        self._index_messages()
+
+        self.assertIsNone(MessageKeywordIndexManager.find_one_casted(
+            {MessageKeywordModel.ChannelOid.key: self.CHANNEL_OID_3}))
+
+    def test_search_ranked(self):
+        self._index_messages()
+
+        channel_oids = [self.CHANNEL_OID, self.CHANNEL_OID_2, self.CHANNEL_OID_3]
+
+        self.assertEqual(
+            MessageKeywordIndexManager.search_channels("hello", channel_oids),
+            [self.CHANNEL_OID_2, self.CHANNEL_OID]
+        )
+        self.assertEqual(
+            MessageKeywordIndexManager.search_channels("ELL", channel_oids),
+            [self.CHANNEL_OID_2, self.CHANNEL_OID]
+        )
+
+    def test_search_all_keywords_required(self):
+        self._index_messages()
+
+        channel_oids = [self.CHANNEL_OID, self.CHANNEL_OID_2, self.CHANNEL_OID_3]
+
+        self.assertEqual(
+            MessageKeywordIndexManager.search_channels("hell worl", channel_oids),
+            [self.CHANNEL_OID]
+        )
+
+    def test_search_paginated(self):
+        self._index_messages()
+
+        channel_oids = [self.CHANNEL_OID, self.CHANNEL_OID_2, self.CHANNEL_OID_3]
+
+        self.assertEqual(
+            MessageKeywordIndexManager.search_channels("hello", channel_oids, limit=1),
+            [self.CHANNEL_OID_2]
+        )
+        self.assertEqual(
+            MessageKeywordIndexManager.search_channels("hello", channel_oids, skip=1),
+            [self.CHANNEL_OID]
+        )
+
+    def test_search_channel_filtered(self):
+        self._index_messages()
+
+        self.assertEqual(
+            MessageKeywordIndexManager.search_channels("hello", [self.CHANNEL_OID]),
+            [self.CHANNEL_OID]
+        )
+
+    def test_search_no_keyword(self):
+        self._index_messages()
+
+        self.assertEqual(MessageKeywordIndexManager.search_channels("!", [self.CHANNEL_OID]), [])
+        self.assertEqual(MessageKeywordIndexManager.search_channels("", [self.CHANNEL_OID]), [])
+
+    def _insert_records(self):
+        mdls = [
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 6, 1, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_OID, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="alpha", ProcessTimeSecs=2.13),
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 6, 2, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_OID, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="beta", ProcessTimeSecs=2.13),
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 6, 3, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_OID_2, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="gamma", ProcessTimeSecs=2.13)
+        ]
+
+        MessageRecordStatisticsManager.insert_many(mdls)
+
+        return mdls
+
+    def _get_indexed_keywords(self):
+        return {entry.keyword for entry in MessageKeywordIndexManager.find_cursor_with_count({})}
+
+    def test_backfill(self):
+        self._insert_records()
+
+        MessageKeywordIndexManager.backfill(MessageRecordStatisticsManager)
+
+        self.assertTrue({"alpha", "beta", "gamma"}.issubset(self._get_indexed_keywords()))
+        self.assertTrue(MessageKeywordBackfillManager.get_state().completed)
+
+    def test_backfill_resume(self):
+        mdls = self._insert_records()
+
+        MessageKeywordBackfillManager.insert_one_model(MessageKeywordBackfillModel(
+            Key=MessageKeywordBackfillManager.STATE_KEY, EndOid=ObjectId(), LastOid=mdls[0].id, Completed=False))
+
+        MessageKeywordIndexManager.backfill(MessageRecordStatisticsManager)
+
+        keywords = self._get_indexed_keywords()
+        self.assertNotIn("alpha", keywords)
+        self.assertTrue({"beta", "gamma"}.issubset(keywords))
+
+        state = MessageKeywordBackfillManager.get_state()
+        self.assertTrue(state.completed)
+        self.assertEqual(state.last_oid, mdls[-1].id)
+
+    def test_backfill_end_excluded(self):
+        mdls = self._insert_records()
+
+        MessageKeywordBackfillManager.insert_one_model(MessageKeywordBackfillModel(
+            Key=MessageKeywordBackfillManager.STATE_KEY, EndOid=mdls[-1].id, Completed=False))
+
+        MessageKeywordIndexManager.backfill(MessageRecordStatisticsManager)
+
+        keywords = self._get_indexed_keywords()
+        self.assertTrue({"alpha", "beta"}.issubset(keywords))
+        self.assertNotIn("gamma", keywords)
+
+    def test_backfill_held_by_other(self):
+        self._insert_records()
+
+        MessageKeywordBackfillManager.insert_one_model(MessageKeywordBackfillModel(
+            Key=MessageKeywordBackfillManager.STATE_KEY, EndOid=ObjectId(), Completed=False,
+            Owner=ObjectId(), LeaseUntil=now_utc_aware() + timedelta(minutes=5)))
+
+        MessageKeywordIndexManager.backfill(MessageRecordStatisticsManager)
+
+        self.assertEqual(self._get_indexed_keywords(), set())
+        self.assertFalse(MessageKeywordBackfillManager.get_state().completed)
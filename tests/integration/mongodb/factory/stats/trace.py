@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from bson import ObjectId
+
+from extutils.dt import now_utc_aware
+from extutils.tracing import Tracer, span, tag
+from flags import MessageType
+from models import MessageTraceModel
+from mongodb.factory import MessageTraceManager
+from tests.base import TestDatabaseMixin
+
+__all__ = ("TestMessageTraceManager",)
+
+
+class TestMessageTraceManager(TestDatabaseMixin):
+    CHANNEL_OID = ObjectId()
+
+    @staticmethod
+    def obj_to_clear():
+        return [MessageTraceManager]
+
+    def setUpTestCase(self) -> None:
+        self.now = 0.0
+        self.tracer = Tracer(sample_rate=1, on_finished=MessageTraceManager.record_trace, clock=lambda: self.now)
+
+    def _trace(self, name: str, handle_ms: float):
+        with self.tracer.trace(name):
+            tag(MessageTraceManager.TAG_CHANNEL_OID, self.CHANNEL_OID)
+            tag(MessageTraceManager.TAG_MESSAGE_TYPE, MessageType.TEXT)
+
+            with span("handle"):
+                with span("handler.auto_reply"):
+                    self.now += handle_ms / 1000
+
+    def test_record_trace(self):
+        self._trace("LINE", 5)
+
+        model = MessageTraceModel.cast_model(MessageTraceManager.find_one())
+
+        self.assertEqual(model.name, "LINE")
+        self.assertEqual(model.channel_oid, self.CHANNEL_OID)
+        self.assertEqual(model.message_type, MessageType.TEXT)
+        self.assertAlmostEqual(model.duration_ms, 5)
+        self.assertEqual([span_.name for span_ in model.spans], ["handler.auto_reply", "handle"])
+        self.assertEqual([span_.parent for span_ in model.spans], ["handle", None])
+        self.assertAlmostEqual(model.spans[0].duration_ms, 5)
+        self.assertLess(now_utc_aware() - model.timestamp, timedelta(seconds=10))
+
+    def test_get_latency_percentiles(self):
+        for handle_ms in (1, 2, 3, 4, 5):
+            self._trace("LINE", handle_ms)
+
+        result = MessageTraceManager.get_latency_percentiles(hours_within=1)
+
+        self.assertEqual(result.trace_count, 5)
+        self.assertEqual([entry.name for entry in result.stages], ["handle"])
+        self.assertEqual([entry.name for entry in result.handlers], ["auto_reply"])
+        self.assertAlmostEqual(result.handlers[0].p50, 3)
+        self.assertAlmostEqual(result.handlers[0].max, 5)
+
+    def test_get_latency_percentiles_out_of_range(self):
+        MessageTraceManager.insert_one(
+            MessageTraceModel(Id=ObjectId.from_datetime(now_utc_aware() - timedelta(hours=3)), Name="LINE",
+                              DurationMs=1, Timestamp=now_utc_aware(for_mongo=True)).to_json())
+
+        self.assertEqual(MessageTraceManager.get_latency_percentiles(hours_within=1).trace_count, 0)
+        self.assertEqual(MessageTraceManager.get_latency_percentiles().trace_count, 1)
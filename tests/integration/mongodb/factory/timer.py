@@ -412,6 +412,74 @@ class TestTimerManager(TestModelMixin, TestTimeComparisonMixin):
         self.assertEqual(len(result.past_done), 0)
         self.assertEqual(len(result.future), 0)
 
+    def test_get_timers_cache_added(self):
+        self.assertFalse(TimerManager.get_timers(TestTimerManager.CHANNEL_OID, "KEYWORD").has_data)
+
+        TimerManager.add_new_timer(
+            TestTimerManager.CHANNEL_OID, "KEYWORD", "TITLE", now_utc_aware() + timedelta(hours=1))
+
+        result = TimerManager.get_timers(TestTimerManager.CHANNEL_OID, "KEYWORD")
+        self.assertTrue(result.has_data)
+        self.assertEqual(result.future[0].title, "TITLE")
+
+    def test_get_timers_cache_deleted(self):
+        TimerManager.add_new_timer(
+            TestTimerManager.CHANNEL_OID, "KEYWORD", "TITLE", now_utc_aware() + timedelta(hours=1))
+
+        result = TimerManager.get_timers(TestTimerManager.CHANNEL_OID, "KEYWORD")
+        self.assertTrue(result.has_data)
+
+        self.assertTrue(TimerManager.del_timer(result.future[0].id))
+
+        self.assertFalse(TimerManager.get_timers(TestTimerManager.CHANNEL_OID, "KEYWORD").has_data)
+
+    def test_get_timers_cache_expired(self):
+        now = now_utc_aware(for_mongo=True)
+
+        outcome, ex = TimerManager.insert_one_model(
+            TimerModel(
+                ChannelOid=TestTimerManager.CHANNEL_OID, Keyword="KEYWORD", Title="EXPIRED",
+                TargetTime=now - timedelta(days=Bot.Timer.AutoDeletionDays), DeletionTime=now
+            )
+        )
+        self.assertEqual(outcome, WriteOutcome.O_INSERTED)
+
+        outcome, ex = TimerManager.insert_one_model(
+            TimerModel(
+                ChannelOid=TestTimerManager.CHANNEL_OID, Keyword="KEYWORD_2", Title="ACTIVE",
+                TargetTime=now + timedelta(hours=1), DeletionTime=now + timedelta(days=Bot.Timer.AutoDeletionDays)
+            )
+        )
+        self.assertEqual(outcome, WriteOutcome.O_INSERTED)
+
+        self.assertFalse(TimerManager.get_timers(TestTimerManager.CHANNEL_OID, "KEYWORD").has_data)
+        self.assertTrue(TimerManager.get_timers(TestTimerManager.CHANNEL_OID, "KEYWORD_2").has_data)
+
+    def test_get_timers_cache_channel_isolated(self):
+        channel_oid = ObjectId()
+
+        TimerManager.add_new_timer(
+            TestTimerManager.CHANNEL_OID, "KEYWORD", "TITLE", now_utc_aware() + timedelta(hours=1))
+
+        self.assertFalse(TimerManager.get_timers(channel_oid, "KEYWORD").has_data)
+
+        TimerManager.add_new_timer(channel_oid, "KEYWORD", "TITLE", now_utc_aware() + timedelta(hours=1))
+
+        self.assertTrue(TimerManager.get_timers(channel_oid, "KEYWORD").has_data)
+        self.assertTrue(TimerManager.get_timers(TestTimerManager.CHANNEL_OID, "KEYWORD").has_data)
+
+    def test_has_timer(self):
+        self.assertFalse(TimerManager.has_timer(TestTimerManager.CHANNEL_OID))
+        self.assertFalse(TimerManager.has_keyword(TestTimerManager.CHANNEL_OID, "KEYWORD"))
+
+        TimerManager.add_new_timer(
+            TestTimerManager.CHANNEL_OID, "KEYWORD", "TITLE", now_utc_aware() + timedelta(hours=1))
+
+        self.assertTrue(TimerManager.has_timer(TestTimerManager.CHANNEL_OID))
+        self.assertTrue(TimerManager.has_keyword(TestTimerManager.CHANNEL_OID, "KEYWORD"))
+        self.assertFalse(TimerManager.has_keyword(TestTimerManager.CHANNEL_OID, "KEYWORD_2"))
+        self.assertFalse(TimerManager.has_timer(ObjectId()))
+
     def test_get_notify(self):
         timer_time = now_utc_aware(for_mongo=True) + timedelta(seconds=590)
         timer_time_2 = now_utc_aware(for_mongo=True) + timedelta(seconds=1200)
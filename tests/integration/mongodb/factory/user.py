@@ -1,19 +1,25 @@
+from datetime import timedelta
+
 from bson import ObjectId
 from django.conf import settings
 
 from extutils.emailutils import EmailServer
 from extutils.gidentity import GoogleIdentityUserData
+from extutils.dt import now_utc_aware
 from extutils.locales import DEFAULT_LOCALE, USA_CENT
+from extutils.namecache import NameCacheEntry
 from flags import Platform
 from models import (
-    OID_KEY, APIUserModel, OnPlatformUserModel, RootUserModel, RootUserConfigModel, ChannelModel, ChannelConfigModel
+    OID_KEY, APIUserModel, OnPlatformUserModel, RootUserModel, RootUserConfigModel, ChannelModel, ChannelConfigModel,
+    set_uname_cache
 )
 from mongodb.factory import RootUserManager
 from mongodb.factory.results import WriteOutcome, GetOutcome, UpdateOutcome, OperationOutcome
-from mongodb.factory.user import APIUserManager, OnPlatformIdentityManager
+from mongodb.factory.user import APIUserManager, OnPlatformIdentityManager, UserNameCacheManager
 from tests.base import TestModelMixin
 
-__all__ = ("TestAPIUserManager", "TestOnPlatformIdentityManager", "TestRootUserManager",)
+__all__ = ("TestAPIUserManager", "TestOnPlatformIdentityManager", "TestRootUserManager",
+           "TestUserNameCacheManager",)
 
 
 class TestAPIUserManager(TestModelMixin):
@@ -406,6 +412,57 @@ class TestRootUserManager(TestModelMixin):
     def test_get_root_data_uname_no_data(self):
         self.assertIsNone(RootUserManager.get_root_data_uname(self.ROOT_OID))
 
+    def test_get_root_data_uname_batch(self):
+        RootUserManager.insert_many([
+            RootUserModel(Id=self.ROOT_OID, ApiOid=self.API_OID,
+                          Config=RootUserConfigModel.generate_default(Name="UserName")),
+            RootUserModel(Id=self.ROOT_OID_2, OnPlatOids=[self.ONPLAT_OID, self.ONPLAT_OID_2],
+                          Config=RootUserConfigModel.generate_default()),
+            RootUserModel(Id=self.ROOT_OID_3, ApiOid=self.API_OID_2, Config=RootUserConfigModel.generate_default())
+        ])
+        OnPlatformIdentityManager.insert_many([
+            OnPlatformUserModel(Id=self.ONPLAT_OID, Platform=Platform.LINE, Token=self.LINE_TOKEN_2),
+            OnPlatformUserModel(Id=self.ONPLAT_OID_2, Platform=Platform.LINE, Token=self.LINE_TOKEN)
+        ])
+        set_uname_cache(self.ONPLAT_OID_2, "Cached")
+
+        self.assertEqual(
+            RootUserManager.get_root_data_uname_batch([self.ROOT_OID, self.ROOT_OID_2, self.ROOT_OID_3, ObjectId()]),
+            {self.ROOT_OID: "UserName", self.ROOT_OID_2: "Cached", self.ROOT_OID_3: f"UID - {self.ROOT_OID_3}"}
+        )
+
+    def test_get_root_data_uname_batch_not_cached(self):
+        RootUserManager.insert_one(RootUserModel(Id=self.ROOT_OID, OnPlatOids=[self.ONPLAT_OID],
+                                                 Config=RootUserConfigModel.generate_default()))
+        OnPlatformIdentityManager.insert_one(
+            OnPlatformUserModel(Id=self.ONPLAT_OID, Platform=Platform.LINE, Token=self.LINE_TOKEN))
+
+        # Name not cached, fetched after returning the placeholder
+        self.assertEqual(
+            RootUserManager.get_root_data_uname_batch([self.ROOT_OID], self.LINE_CHANNEL_MODEL),
+            {self.ROOT_OID: f"{self.LINE_TOKEN} ({Platform.LINE.key})"}
+        )
+        self.assertEqual(
+            RootUserManager.get_root_data_uname_batch([self.ROOT_OID], self.LINE_CHANNEL_MODEL),
+            {self.ROOT_OID: self.LINE_NAME}
+        )
+
+    def test_get_root_data_uname_batch_onplat_missing(self):
+        RootUserManager.insert_one(RootUserModel(Id=self.ROOT_OID, OnPlatOids=[self.ONPLAT_OID],
+                                                 Config=RootUserConfigModel.generate_default()))
+
+        self.assertEqual(
+            RootUserManager.get_root_data_uname_batch([self.ROOT_OID]),
+            {self.ROOT_OID: f"UID - {self.ROOT_OID}"}
+        )
+        self.assertEqual(
+            RootUserManager.get_root_data_uname_batch([self.ROOT_OID], on_not_found="N/A"),
+            {self.ROOT_OID: "N/A"}
+        )
+
+    def test_get_root_data_uname_batch_no_data(self):
+        self.assertEqual(RootUserManager.get_root_data_uname_batch([self.ROOT_OID]), {})
+
     def test_get_root_data_api_token_skip_onplat_no_onplat(self):
         mdl_api = APIUserModel(Id=self.API_OID, Email="Fake2@email.com", GoogleUid="FakeUID", Token="Toke" * 8)
         mdl_root = RootUserModel(Id=self.ROOT_OID, ApiOid=self.API_OID, Config=RootUserConfigModel.generate_default())
@@ -941,3 +998,46 @@ class TestRootUserManager(TestModelMixin):
         self.assertFalse(result.success)
         self.assertIsNone(result.model)
         self.assertIsNone(RootUserManager.find_one({OID_KEY: self.ROOT_OID}))
+
+
+class TestUserNameCacheManager(TestModelMixin):
+    ONPLAT_OID = ObjectId()
+    ONPLAT_OID_2 = ObjectId()
+
+    @staticmethod
+    def obj_to_clear():
+        return [UserNameCacheManager]
+
+    def test_set_get_names(self):
+        updated_at = now_utc_aware(for_mongo=True)
+
+        UserNameCacheManager.set_names({
+            self.ONPLAT_OID: NameCacheEntry("Name", updated_at),
+            self.ONPLAT_OID_2: NameCacheEntry("Name 2", updated_at)
+        })
+
+        self.assertEqual(
+            UserNameCacheManager.get_names([self.ONPLAT_OID, self.ONPLAT_OID_2, ObjectId()]),
+            {self.ONPLAT_OID: NameCacheEntry("Name", updated_at),
+             self.ONPLAT_OID_2: NameCacheEntry("Name 2", updated_at)}
+        )
+
+    def test_set_names_overwrite(self):
+        updated_at = now_utc_aware(for_mongo=True)
+
+        UserNameCacheManager.set_names({self.ONPLAT_OID: NameCacheEntry("Name", updated_at - timedelta(days=1))})
+        UserNameCacheManager.set_names({self.ONPLAT_OID: NameCacheEntry("Name 2", updated_at)})
+
+        self.assertEqual(
+            UserNameCacheManager.get_names([self.ONPLAT_OID]),
+            {self.ONPLAT_OID: NameCacheEntry("Name 2", updated_at)}
+        )
+        self.assertEqual(UserNameCacheManager.count_documents({}), 1)
+
+    def test_get_names_no_data(self):
+        self.assertEqual(UserNameCacheManager.get_names([self.ONPLAT_OID]), {})
+
+    def test_shared_through_uname_cache(self):
+        set_uname_cache(self.ONPLAT_OID, "Name")
+
+        self.assertEqual(UserNameCacheManager.get_names([self.ONPLAT_OID])[self.ONPLAT_OID].name, "Name")
@@ -1,3 +1,4 @@
 from .execode import *  # noqa
 from .info import *  # noqa
 from .prof import *  # noqa
+from .user_intergate import *  # noqa
@@ -10,7 +10,9 @@ from models import (
     ChannelModel, ChannelConfigModel, ChannelProfileConnectionModel, MessageRecordModel, RootUserModel,
     RootUserConfigModel, OnPlatformUserModel
 )
-from mongodb.factory import ChannelManager, MessageRecordStatisticsManager, RootUserManager
+from mongodb.factory import (
+    ChannelManager, MessageRecordStatisticsManager, MessageKeywordIndexManager, RootUserManager
+)
 from mongodb.factory.prof_base import UserProfileManager
 from mongodb.factory.user import OnPlatformIdentityManager
 from mongodb.helper import IdentitySearcher
@@ -58,7 +60,8 @@ class TestIdentitySearcher(TestCase):
 
     @staticmethod
     def obj_to_clear():
-        return [ChannelManager, UserProfileManager, RootUserManager, MessageRecordStatisticsManager, EmailServer]
+        return [ChannelManager, UserProfileManager, RootUserManager, MessageRecordStatisticsManager,
+                MessageKeywordIndexManager, EmailServer]
 
     def _insert_messages(self):
         mdls = [
@@ -77,6 +80,7 @@ class TestIdentitySearcher(TestCase):
         ]
 
         MessageRecordStatisticsManager.insert_many(mdls)
+        MessageKeywordIndexManager.index_messages(mdls)
 
         return mdls
 
@@ -145,6 +149,100 @@ class TestIdentitySearcher(TestCase):
         self.assertEqual(entry.channel_name, "CHANNEL #2")
         self.assertEqual(entry.channel_model, self.CHANNEL_2)
 
+    def test_search_channel_by_message_partial(self):
+        self._insert_messages()
+
+        ChannelManager.insert_many([self.CHANNEL_1, self.CHANNEL_2, self.CHANNEL_3])
+        UserProfileManager.insert_many([
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_1_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_1_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_2_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_2_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_3_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_3_OID])
+        ])
+
+        result = IdentitySearcher.search_channel("m2", self.USER_OID)
+
+        self.assertEqual(len(result), 1)
+        entry = result[0]
+        self.assertEqual(entry.channel_name, "CHANNEL #2")
+        self.assertEqual(entry.channel_model, self.CHANNEL_2)
+
+    def test_search_channel_paginated(self):
+        self._insert_messages()
+
+        ChannelManager.insert_many([self.CHANNEL_1, self.CHANNEL_2, self.CHANNEL_3])
+        UserProfileManager.insert_many([
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_1_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_1_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_2_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_2_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_3_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_3_OID])
+        ])
+
+        result = IdentitySearcher.search_channel("#", self.USER_OID, skip=1, limit=1)
+
+        self.assertEqual(len(result), 1)
+        entry = result[0]
+        self.assertEqual(entry.channel_name, "CHANNEL #2")
+        self.assertEqual(entry.channel_model, self.CHANNEL_2)
+
+    def test_search_channel_ranked_by_index(self):
+        self._insert_messages()
+
+        # More matches in channel 2 but the last message of channel 1 is newer
+        mdls = [
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 5, 31, 1, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_2_OID, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="M5 M6", ProcessTimeSecs=2.13)
+        ]
+        MessageRecordStatisticsManager.insert_many(mdls)
+        MessageKeywordIndexManager.index_messages(mdls)
+
+        ChannelManager.insert_many([self.CHANNEL_1, self.CHANNEL_2, self.CHANNEL_3])
+        UserProfileManager.insert_many([
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_1_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_1_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_2_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_2_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_3_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_3_OID])
+        ])
+
+        result = IdentitySearcher.search_channel("M", self.USER_OID)
+
+        self.assertEqual([entry.channel_model for entry in result], [self.CHANNEL_2, self.CHANNEL_1])
+
+    def test_search_channel_paginated_mixed(self):
+        self._insert_messages()
+
+        mdls = [
+            MessageRecordModel(Id=ObjectId.from_datetime(datetime(2020, 5, 31, 1, tzinfo=pytz.utc)),
+                               ChannelOid=self.CHANNEL_3_OID, UserRootOid=self.USER_OID,
+                               MessageType=MessageType.TEXT, MessageContent="channel talk", ProcessTimeSecs=2.13)
+        ]
+        MessageRecordStatisticsManager.insert_many(mdls)
+        MessageKeywordIndexManager.index_messages(mdls)
+
+        ChannelManager.insert_many([self.CHANNEL_1, self.CHANNEL_2, self.CHANNEL_3])
+        UserProfileManager.insert_many([
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_1_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_1_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_2_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_2_OID]),
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_3_OID, UserOid=self.USER_OID,
+                                          ProfileOids=[self.PROF_3_OID])
+        ])
+
+        # Channel 1 and 2 are matched by the default name, channel 3 is matched by the message
+        result = IdentitySearcher.search_channel("CHANNEL", self.USER_OID, skip=1, limit=2)
+        self.assertEqual([entry.channel_model for entry in result], [self.CHANNEL_2, self.CHANNEL_3])
+
+        result = IdentitySearcher.search_channel("CHANNEL", self.USER_OID, skip=2, limit=1)
+        self.assertEqual([entry.channel_model for entry in result], [self.CHANNEL_3])
+
     def test_search_channel_msg_hanging_cid(self):
         self._insert_messages()
 
@@ -0,0 +1,248 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from bson import ObjectId
+from pymongo.errors import PyMongoError
+
+from extutils.dt import now_utc_aware
+from flags import Platform
+from JellyBot.systemconfig import Database
+from models import (
+    AutoReplyModuleModel, AutoReplyContentModel, ChannelProfileConnectionModel, RemoteControlEntryModel,
+    ShortUrlRecordModel, UserIntegrationJobModel
+)
+from mongodb.factory import RemoteControlManager, RootUserManager, ShortUrlDataManager, UserIntegrationJobManager
+from mongodb.factory.ar_conn import AutoReplyModuleManager
+from mongodb.factory.prof_base import UserProfileManager
+from mongodb.factory.results import OperationOutcome
+from mongodb.helper import UserDataIntegrationHelper
+from tests.base import TestCase
+
+__all__ = ("TestUserDataIntegrationHelper",)
+
+
+class TestUserDataIntegrationHelper(TestCase):
+    CHANNEL_OID = ObjectId()
+
+    @staticmethod
+    def obj_to_clear():
+        return [RootUserManager, UserIntegrationJobManager, AutoReplyModuleManager, UserProfileManager,
+                RemoteControlManager, ShortUrlDataManager]
+
+    def setUpTestCase(self) -> None:
+        uid_1 = RootUserManager.register_onplat(Platform.LINE, "U12345").model.id
+        uid_2 = RootUserManager.register_onplat(Platform.LINE, "U67890").model.id
+
+        self.src_oid = max(uid_1, uid_2)
+        self.dst_oid = min(uid_1, uid_2)
+
+    def _insert_modules(self, count: int, creator_oid: ObjectId):
+        AutoReplyModuleManager.insert_many([
+            AutoReplyModuleModel(
+                Keyword=AutoReplyContentModel(Content=f"A{i}"), Responses=[AutoReplyContentModel(Content="B")],
+                CreatorOid=creator_oid, ChannelOid=self.CHANNEL_OID)
+            for i in range(count)
+        ])
+
+    def _count_modules(self, creator_oid: ObjectId) -> int:
+        return AutoReplyModuleManager.count_documents({AutoReplyModuleModel.CreatorOid.key: creator_oid})
+
+    def test_integrate_batched(self):
+        count = Database.UserIntegration.BatchSize * 2 + 1
+        self._insert_modules(count, self.src_oid)
+
+        outcome = UserDataIntegrationHelper.integrate(self.src_oid, self.dst_oid)
+
+        self.assertEqual(outcome, OperationOutcome.O_COMPLETED)
+        self.assertEqual(self._count_modules(self.src_oid), 0)
+        self.assertEqual(self._count_modules(self.dst_oid), count)
+
+        self.assertEqual(UserIntegrationJobManager.get_incomplete_jobs(), [])
+        self.assertEqual(UserIntegrationJobManager.get_alias_map(), {})
+
+        job = UserIntegrationJobManager.find_one_casted()
+        self.assertTrue(job.completed)
+        self.assertTrue(all(progress.completed for progress in job.progress))
+
+        progress = {progress.collection_name: progress for progress in job.progress}
+        ar_progress = progress[AutoReplyModuleManager.get_planned_full_name()]
+        self.assertEqual(ar_progress.count, count)
+        self.assertEqual(ar_progress.failed_count, 0)
+
+        reports = UserDataIntegrationHelper.get_progress_report(self.src_oid)
+        self.assertEqual(len(reports), 1)
+        self.assertIn(AutoReplyModuleManager.get_planned_full_name(), reports[0])
+
+    def test_integrate_resume(self):
+        self._insert_modules(3, self.dst_oid)
+        last_oid = AutoReplyModuleManager.find_one(sort=[("_id", -1)])["_id"]
+        self._insert_modules(3, self.src_oid)
+
+        job = UserIntegrationJobManager.create_job(
+            self.src_oid, self.dst_oid, [AutoReplyModuleManager.get_planned_full_name()])
+
+        owner = ObjectId()
+        self.assertTrue(UserIntegrationJobManager.acquire_job(job.id, owner))
+        self.assertTrue(UserIntegrationJobManager.update_progress(
+            job.id, owner, AutoReplyModuleManager.get_planned_full_name(), last_oid, 3, 0))
+        UserIntegrationJobManager.release_job(job.id, owner)
+
+        UserDataIntegrationHelper.resume_incomplete()
+
+        self.assertEqual(self._count_modules(self.src_oid), 0)
+        self.assertEqual(self._count_modules(self.dst_oid), 6)
+
+        job = UserIntegrationJobManager.get_job(job.id)
+        self.assertTrue(job.completed)
+        self.assertEqual(job.progress[0].count, 6)
+
+    def test_integrate_background(self):
+        self._insert_modules(3, self.src_oid)
+
+        with patch("mongodb.helper.user_intergate.is_testing", return_value=False), \
+                patch("mongodb.helper.user_intergate.Thread") as mock:
+            outcome = UserDataIntegrationHelper.integrate(self.src_oid, self.dst_oid)
+
+        self.assertEqual(outcome, OperationOutcome.O_ACCEPTED)
+        mock.return_value.start.assert_called_once()
+
+        job = UserIntegrationJobManager.find_one_casted()
+        self.assertFalse(job.completed)
+
+        self.assertEqual(UserDataIntegrationHelper.run_job(job), OperationOutcome.O_COMPLETED)
+        self.assertEqual(self._count_modules(self.dst_oid), 3)
+
+    def test_job_held_by_other_process(self):
+        self._insert_modules(3, self.src_oid)
+
+        job = UserIntegrationJobManager.create_job(
+            self.src_oid, self.dst_oid, [AutoReplyModuleManager.get_planned_full_name()])
+        self.assertTrue(UserIntegrationJobManager.acquire_job(job.id, ObjectId()))
+
+        self.assertEqual(UserDataIntegrationHelper.run_job(job), OperationOutcome.O_ACCEPTED)
+        self.assertEqual(self._count_modules(self.src_oid), 3)
+        self.assertFalse(UserIntegrationJobManager.get_job(job.id).completed)
+
+    def test_job_lease_expired(self):
+        self._insert_modules(3, self.src_oid)
+
+        job = UserIntegrationJobManager.create_job(
+            self.src_oid, self.dst_oid, [AutoReplyModuleManager.get_planned_full_name()])
+
+        with patch.object(Database.UserIntegration, "JobLeaseSeconds", -1):
+            self.assertTrue(UserIntegrationJobManager.acquire_job(job.id, ObjectId()))
+
+        self.assertEqual(UserDataIntegrationHelper.run_job(job), OperationOutcome.O_COMPLETED)
+        self.assertEqual(self._count_modules(self.dst_oid), 3)
+        self.assertTrue(UserIntegrationJobManager.get_job(job.id).completed)
+
+        self.assertEqual(UserDataIntegrationHelper.run_job(job), OperationOutcome.O_COMPLETED)
+
+    def test_job_taken_over(self):
+        self._insert_modules(3, self.src_oid)
+
+        job = UserIntegrationJobManager.create_job(
+            self.src_oid, self.dst_oid, [AutoReplyModuleManager.get_planned_full_name()])
+
+        def take_over(*_, **__):
+            UserIntegrationJobManager.update_one(
+                {"_id": job.id}, {"$set": {UserIntegrationJobModel.Owner.key: ObjectId()}})
+            return []
+
+        with patch.object(AutoReplyModuleModel, "replace_uid", side_effect=take_over):
+            outcome = UserDataIntegrationHelper.run_job(job)
+
+        self.assertEqual(outcome, OperationOutcome.O_ACCEPTED)
+
+        job = UserIntegrationJobManager.get_job(job.id)
+        self.assertFalse(job.completed)
+        self.assertEqual(job.progress[0].count, 0)
+
+    @patch.object(Database.UserIntegration, "BatchRetryBackoffSeconds", 0)
+    def test_integrate_conflict(self):
+        for uid in (self.src_oid, self.dst_oid):
+            UserProfileManager.insert_one_model(
+                ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=uid, ProfileOids=[ObjectId()]))
+
+        outcome = UserDataIntegrationHelper.integrate(self.src_oid, self.dst_oid)
+
+        self.assertEqual(outcome, OperationOutcome.X_INTEGRATION_FAILED)
+
+        job = UserIntegrationJobManager.find_one_casted()
+        self.assertFalse(job.completed)
+        self.assertEqual(UserIntegrationJobManager.resolve_uid(self.src_oid), self.dst_oid)
+
+        progress = {progress.collection_name: progress for progress in job.progress}
+        prof_progress = progress[UserProfileManager.get_planned_full_name()]
+        self.assertFalse(prof_progress.completed)
+        self.assertEqual(prof_progress.failed_count, 1)
+
+    @patch.object(Database.UserIntegration, "BatchRetryBackoffSeconds", 0)
+    def test_integrate_failed_batch_retried(self):
+        self._insert_modules(3, self.src_oid)
+
+        with patch.object(AutoReplyModuleModel, "replace_uid", side_effect=PyMongoError("Failed")) as mock:
+            outcome = UserDataIntegrationHelper.integrate(self.src_oid, self.dst_oid)
+
+        self.assertEqual(outcome, OperationOutcome.X_INTEGRATION_FAILED)
+        self.assertEqual(mock.call_count, Database.UserIntegration.BatchRetryCount + 1)
+        self.assertEqual(self._count_modules(self.src_oid), 3)
+        self.assertEqual(UserIntegrationJobManager.resolve_uid(self.src_oid), self.dst_oid)
+
+        job = UserIntegrationJobManager.find_one_casted()
+        self.assertFalse(job.completed)
+
+        UserDataIntegrationHelper.resume_incomplete()
+
+        self.assertEqual(self._count_modules(self.src_oid), 0)
+        self.assertEqual(self._count_modules(self.dst_oid), 3)
+        self.assertEqual(UserIntegrationJobManager.get_alias_map(), {})
+
+        job = UserIntegrationJobManager.get_job(job.id)
+        self.assertTrue(job.completed)
+
+        progress = {progress.collection_name: progress for progress in job.progress}
+        ar_progress = progress[AutoReplyModuleManager.get_planned_full_name()]
+        self.assertEqual(ar_progress.count, 3)
+        self.assertEqual(ar_progress.failed_count, 0)
+
+    def test_integrate_same_collection_name(self):
+        self.assertEqual(RemoteControlManager.get_col_name().split(".")[-1],
+                         ShortUrlDataManager.get_col_name().split(".")[-1])
+
+        collections = UserDataIntegrationHelper._get_collections()  # pylint: disable=protected-access
+        self.assertIs(collections[RemoteControlManager.get_planned_full_name()], type(RemoteControlManager))
+        self.assertIs(collections[ShortUrlDataManager.get_planned_full_name()], type(ShortUrlDataManager))
+
+        RemoteControlManager.insert_one_model(RemoteControlEntryModel(
+            UserOid=self.src_oid, SourceChannelOid=self.CHANNEL_OID, TargetChannelOid=ObjectId(),
+            ExpiryUtc=now_utc_aware() + timedelta(hours=1)))
+        ShortUrlDataManager.insert_one_model(ShortUrlRecordModel(
+            Code="abcde", Target="https://google.com", CreatorOid=self.src_oid))
+
+        outcome = UserDataIntegrationHelper.integrate(self.src_oid, self.dst_oid)
+
+        self.assertEqual(outcome, OperationOutcome.O_COMPLETED)
+        self.assertEqual(
+            RemoteControlManager.count_documents({RemoteControlEntryModel.UserOid.key: self.dst_oid}), 1)
+        self.assertEqual(
+            ShortUrlDataManager.count_documents({ShortUrlRecordModel.CreatorOid.key: self.dst_oid}), 1)
+
+        job = UserIntegrationJobManager.find_one_casted()
+        progress = {progress.collection_name: progress for progress in job.progress}
+        self.assertEqual(progress[RemoteControlManager.get_planned_full_name()].count, 1)
+        self.assertEqual(progress[ShortUrlDataManager.get_planned_full_name()].count, 1)
+
+    def test_alias_during_integration(self):
+        UserProfileManager.insert_one_model(
+            ChannelProfileConnectionModel(ChannelOid=self.CHANNEL_OID, UserOid=self.src_oid, ProfileOids=[]))
+
+        UserIntegrationJobManager.create_job(self.src_oid, self.dst_oid, [])
+
+        self.assertEqual(UserIntegrationJobManager.resolve_uid(self.src_oid), self.dst_oid)
+        self.assertEqual(UserIntegrationJobManager.get_uid_aliases(self.dst_oid), [self.dst_oid, self.src_oid])
+        self.assertEqual(RootUserManager.get_root_data_oid(self.src_oid).id, self.dst_oid)
+
+        conn = UserProfileManager.get_user_profile_conn(self.CHANNEL_OID, self.dst_oid)
+        self.assertIsNotNone(conn)
+        self.assertEqual(conn.user_oid, self.src_oid)
@@ -9,6 +9,7 @@ from models import Model
 from models.exceptions import InvalidModelFieldError, RequiredKeyNotFilledError, FieldKeyNotExistError
 from models.field import IntegerField, BooleanField, ArrayField, ModelDefaultValueExt
 from models.field.exceptions import FieldCastingFailedError, FieldValueInvalidError, FieldTypeMismatchError
+from mongodb.exceptions import InvalidPageTokenError
 from mongodb.factory import ControlExtensionMixin
 from mongodb.factory.results import WriteOutcome, UpdateOutcome
 from tests.base import TestDatabaseMixin, TestModelMixin
@@ -151,6 +152,69 @@ class TestControlExtensionMixin(TestModelMixin, TestDatabaseMixin):
 
         self.collection.drop_indexes()
 
+    def test_upsert_one_model(self):
+        mdl, outcome, exception = self.collection.upsert_one_model({"i": 5}, ModelTest(i=5, b=True, from_db=True))
+
+        self.assertIsNone(exception)
+        self.assertEqual(outcome, WriteOutcome.O_INSERTED)
+        self.assertEqual(mdl.int_f, 5)
+        self.assertTrue(mdl.bool_f)
+        self.assertIsNotNone(mdl.get_oid())
+        self.assertEqual(self.collection.count_documents({}), 1)
+
+    def test_upsert_one_model_existed(self):
+        oid = ObjectId()
+        existing = ModelTest(i=5, b=False, from_db=True)
+        existing.set_oid(oid)
+        self.collection.insert_one_model(existing)
+
+        mdl, outcome, exception = self.collection.upsert_one_model({"i": 5}, ModelTest(i=5, b=True, from_db=True))
+
+        self.assertIsNone(exception)
+        self.assertEqual(outcome, WriteOutcome.O_DATA_EXISTS)
+        self.assertEqual(mdl.get_oid(), oid)
+        self.assertFalse(mdl.bool_f)
+        self.assertEqual(self.collection.count_documents({}), 1)
+
+    def test_upsert_one_model_update(self):
+        mdl, outcome, exception = self.collection.upsert_one_model(
+            {"i": 5}, ModelTest(i=5, b=True, a=[1], from_db=True), {"$addToSet": {"a": 2}})
+
+        self.assertIsNone(exception)
+        self.assertEqual(outcome, WriteOutcome.O_INSERTED)
+        self.assertEqual(mdl.array_f, [2])
+
+        mdl, outcome, exception = self.collection.upsert_one_model(
+            {"i": 5}, ModelTest(i=5, b=True, a=[1], from_db=True), {"$addToSet": {"a": 3}})
+
+        self.assertIsNone(exception)
+        self.assertEqual(outcome, WriteOutcome.O_DATA_EXISTS)
+        self.assertEqual(mdl.array_f, [2, 3])
+        self.assertEqual(self.collection.count_documents({}), 1)
+
+    def test_upsert_one_data(self):
+        mdl, outcome, exception = self.collection.upsert_one_data({"i": 5}, IntF=5, BoolF=True)
+
+        self.assertIsNone(exception)
+        self.assertEqual(outcome, WriteOutcome.O_INSERTED)
+        self.assertEqual(mdl.int_f, 5)
+        self.assertTrue(mdl.bool_f)
+
+        mdl_2, outcome, exception = self.collection.upsert_one_data({"i": 5}, IntF=5, BoolF=False)
+
+        self.assertIsNone(exception)
+        self.assertEqual(outcome, WriteOutcome.O_DATA_EXISTS)
+        self.assertEqual(mdl_2.get_oid(), mdl.get_oid())
+        self.assertTrue(mdl_2.bool_f)
+
+    def test_upsert_one_data_type_mismatch(self):
+        mdl, outcome, exception = self.collection.upsert_one_data({"i": 5}, IntF="X", BoolF=True)
+
+        self.assertIsInstance(exception, InvalidModelFieldError)
+        self.assertEqual(outcome, WriteOutcome.X_TYPE_MISMATCH)
+        self.assertIsNone(mdl)
+        self.assertEqual(self.collection.count_documents({}), 0)
+
     def test_update_many_outcome(self):
         self.collection.insert_many([
             {"a": 7, "b": [8]},
@@ -211,6 +275,62 @@ class TestControlExtensionMixin(TestModelMixin, TestDatabaseMixin):
             with self.subTest(expected_mdl):
                 self.assertModelEqual(actual_mdl, expected_mdl)
 
+    def test_find_page(self):
+        self.collection.insert_many([{"i": i % 3 + 1, "b": True} for i in range(7)])
+
+        expected = [ModelTest.cast_model(data) for data in self.collection.find(sort=[("i", -1), ("_id", -1)])]
+
+        actual = []
+        page_token = None
+
+        while True:
+            page = self.collection.find_page(sort=[("i", -1)], limit=3, page_token=page_token)
+            actual.extend(page)
+
+            self.assertLessEqual(len(page), 3)
+
+            if not page.has_next:
+                break
+
+            page_token = page.next_token
+
+        self.assertEqual(len(actual), len(expected))
+        for actual_mdl, expected_mdl in zip(actual, expected):
+            with self.subTest(expected_mdl):
+                self.assertModelEqual(actual_mdl, expected_mdl, ignore_oid=False)
+
+    def test_find_page_with_filter(self):
+        self.collection.insert_many([{"i": i, "b": i % 2 == 0} for i in range(1, 8)])
+
+        page = self.collection.find_page({"b": True}, [("i", 1)], limit=2, with_count=True)
+        self.assertEqual([mdl.int_f for mdl in page], [2, 4])
+        self.assertEqual(page.total_count, 3)
+        self.assertTrue(page.count_is_exact)
+
+        page = self.collection.find_page({"b": True}, [("i", 1)], limit=2, page_token=page.next_token)
+        self.assertEqual([mdl.int_f for mdl in page], [6])
+        self.assertFalse(page.has_next)
+        self.assertIsNone(page.total_count)
+
+    def test_find_page_invalid_token(self):
+        self.collection.insert_many([{"i": i, "b": True} for i in range(1, 4)])
+
+        page = self.collection.find_page(sort=[("i", 1)], limit=1)
+
+        with self.assertRaises(InvalidPageTokenError):
+            self.collection.find_page(sort=[("b", 1)], limit=1, page_token=page.next_token)
+
+        with self.assertRaises(InvalidPageTokenError):
+            self.collection.find_page(sort=[("i", 1)], limit=1, page_token="token")
+
+    def test_count_for_page(self):
+        self.collection.insert_many([{"i": i, "b": True} for i in range(1, 6)])
+
+        self.assertEqual(self.collection.count_for_page({"b": True}), (5, True))
+        self.assertEqual(self.collection.count_for_page({"b": True}, count_cap=3), (3, False))
+        self.assertEqual(self.collection.count_for_page({"b": True}, count_cap=10), (5, True))
+        self.assertEqual(self.collection.count_for_page({}), (5, False))
+
     def test_find_one_casted(self):
         self.collection.insert_many([
             {"i": 7, "b": True},
@@ -1,5 +1,7 @@
+from .extline import *  # noqa
 from .extutils import *  # noqa
 from .game_pkchess import *  # noqa
 from .models import *  # noqa
 from .mongodb import *  # noqa
+from .msghandle import *  # noqa
 from .strres import *  # noqa
@@ -0,0 +1,36 @@
+import base64
+
+from linebot.models import ImageMessage
+
+from extline.wrapper import _LineApiWrapper
+from tests.base import TestCase, LineContentApiDouble
+
+__all__ = ["TestLineApiWrapperImage"]
+
+
+class TestLineApiWrapperImage(TestCase):
+    MESSAGE_ID = "1000"
+
+    def setUp(self) -> None:
+        self.img_bytes = LineContentApiDouble.load_file("tests/res/1x1.png")
+        self.api = LineContentApiDouble({self.MESSAGE_ID: self.img_bytes})
+        self.wrapper = _LineApiWrapper(self.api)
+        self.message = ImageMessage(id=self.MESSAGE_ID)
+
+    def test_get_image_binary(self):
+        self.assertEqual(self.wrapper.get_image_binary(self.message), self.img_bytes)
+        self.assertEqual(self.api.fetch_count(self.MESSAGE_ID), 1)
+
+    def test_get_image_base64_str(self):
+        self.assertEqual(self.wrapper.get_image_base64_str(self.message),
+                         base64.b64encode(self.img_bytes).decode("utf-8"))
+
+    def test_get_image_lazy(self):
+        img = self.wrapper.get_image_lazy(self.message)
+
+        self.assertFalse(img.fetched)
+        self.assertEqual(self.api.fetch_count(), 0)
+
+        self.assertEqual(img.content, self.img_bytes)
+        self.assertEqual(img.content, self.img_bytes)
+        self.assertEqual(self.api.fetch_count(self.MESSAGE_ID), 1)
@@ -4,8 +4,16 @@ from .checker import *  # noqa
 from .color import *  # noqa
 from .dt import *  # noqa
 from .email import *  # noqa
+from .feistel import *  # noqa
 from .flags import *  # noqa
 from .imgproc import *  # noqa
+from .leaderboard import *  # noqa
 from .linesticker import *  # noqa
+from .namecache import *  # noqa
+from .ratelimit import *  # noqa
+from .sampling import *  # noqa
 from .singleton import *  # noqa
+from .startup import *  # noqa
+from .tokenize import *  # noqa
+from .tracing import *  # noqa
 from .utils import *  # noqa
@@ -0,0 +1,39 @@
+from extutils.feistel import FeistelPermutation
+from tests.base import TestCase
+
+__all__ = ["TestFeistelPermutation"]
+
+
+class TestFeistelPermutation(TestCase):
+    def test_bijective(self):
+        for domain_size in (1, 2, 3, 52, 52 ** 2, 4096, 4097):
+            with self.subTest(domain_size=domain_size):
+                perm = FeistelPermutation(domain_size, 12345)
+
+                self.assertEqual(sorted(perm.permute(x) for x in range(domain_size)), list(range(domain_size)))
+
+    def test_non_sequential(self):
+        perm = FeistelPermutation(52 ** 5, 12345)
+
+        self.assertNotEqual([perm.permute(x) for x in range(5)], list(range(5)))
+
+    def test_deterministic(self):
+        self.assertEqual(FeistelPermutation(10000, 7).permute(123), FeistelPermutation(10000, 7).permute(123))
+
+    def test_key_differs(self):
+        values_1 = [FeistelPermutation(10000, 7).permute(x) for x in range(10)]
+        values_2 = [FeistelPermutation(10000, 8).permute(x) for x in range(10)]
+
+        self.assertNotEqual(values_1, values_2)
+
+    def test_out_of_domain(self):
+        perm = FeistelPermutation(100, 7)
+
+        with self.assertRaises(ValueError):
+            perm.permute(100)
+        with self.assertRaises(ValueError):
+            perm.permute(-1)
+
+    def test_invalid_domain(self):
+        with self.assertRaises(ValueError):
+            FeistelPermutation(0, 7)
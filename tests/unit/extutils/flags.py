@@ -1,8 +1,11 @@
+import bson
+
 from extutils.flags import (
     DuplicatedCodeError,
     FlagCodeEnum, FlagSingleEnum, FlagDoubleEnum, FlagPrefixedDoubleEnum,
-    is_flag_instance, is_flag_class, is_flag_single, is_flag_double
+    is_flag_instance, is_flag_class, is_flag_single, is_flag_double, type_registry
 )
+from extutils.mongo import get_codec_options
 from tests.base import TestCase
 
 __all__ = ["TestFlagMisc", "TestFlagCodeEnum", "TestFlagSingleEnum", "TestFlagDoubleEnum",
@@ -102,6 +105,27 @@ class TestFlagMisc(TestCase):
             A = 1, "A"
             B = 2, "A"
 
+    def test_encoder_registered_once(self):
+        encoded_types = [encoder.python_type for encoder in type_registry]
+
+        self.assertEqual(1, encoded_types.count(CodeEnum))
+        self.assertEqual(1, encoded_types.count(CodeDoubleEnum))
+
+    def test_codec_options(self):
+        codec_options = get_codec_options()
+
+        self.assertIs(codec_options, get_codec_options())
+        self.assertEqual({"a": 2}, bson.decode(bson.encode({"a": CodeDoubleEnum.B}, codec_options=codec_options)))
+
+    def test_codec_options_new_flag(self):
+        codec_options = get_codec_options()
+
+        class NewEnum(FlagCodeEnum):
+            A = 7
+
+        self.assertIsNot(codec_options, get_codec_options())
+        self.assertEqual({"a": 7}, bson.decode(bson.encode({"a": NewEnum.A}, codec_options=get_codec_options())))
+
 
 class TestFlagCodeEnum(TestCase):
     def test_enum_equals(self):
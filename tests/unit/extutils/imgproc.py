@@ -1,11 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile, is_zipfile
 
-from extutils.imgproc.apng2gif import convert, ConvertResult, ConvertOpResult
-from tests.base import TestCase
+import numpy as np
+from PIL import Image
 
-__all__ = ["TestApng2Gif", "TestApng2GifConvertResult", "TestApng2GifConvertOpResult"]
+from extutils.imgproc.apng2gif import (
+    convert, convert_in_pool, ConvertResult, ConvertOpResult,
+    _process_frame_transparent, _IDX_CLR_TRANSPARENT, _ALPHA_TRANSPARENT_THRESHOLD
+)
+from extutils.imgproc.apng2png import extract_frames
+from extutils.imgproc.lazy import LazyImageBinary
+from tests.base import TestCase, LineContentApiDouble
+
+__all__ = ["TestApng2Gif", "TestApng2GifConvertResult", "TestApng2GifConvertOpResult", "TestLazyImageBinary"]
 
 
 class TestApng2Gif(TestCase):
@@ -60,6 +70,45 @@ class TestApng2Gif(TestCase):
             self.assertTrue(is_zipfile(out_path_frames))
             self.assertGreaterEqual(len(ZipFile(out_path_frames).namelist()), 0)
 
+    def test_convert_in_pool(self):
+        with TemporaryDirectory() as temp_dir:
+            out_path = os.path.join(temp_dir, "out.gif")
+            out_path_frames = os.path.join(temp_dir, "out-frames.zip")
+
+            with open("tests/res/linesticker.apng", "rb") as f:
+                result = convert_in_pool(f.read(), out_path)
+
+            self.assertTrue(result.frame_extraction.success)
+            self.assertTrue(result.frame_zipping.success)
+            self.assertTrue(result.image_data_collation.success)
+            self.assertTrue(result.gif_merging.success)
+            self.assertTrue(result.succeed)
+            self.assertTrue(os.path.exists(out_path), out_path)
+            self.assertTrue(os.path.exists(out_path_frames), out_path_frames)
+
+            with open(out_path, "rb") as f:
+                self.assertTrue(f.read(6) in (b"GIF87a", b"GIF89a"))
+
+    def test_convert_in_pool_failed(self):
+        with TemporaryDirectory() as temp_dir:
+            out_path = os.path.join(temp_dir, "out.gif")
+
+            result = convert_in_pool(b"", out_path)
+
+            self.assertFalse(result.succeed)
+            self.assertFalse(os.path.exists(out_path))
+
+    def test_process_frame_transparent(self):
+        with open("tests/res/linesticker.apng", "rb") as f:
+            frame_byte, _ = extract_frames(f.read())[0]
+
+        alpha = np.asarray(Image.open(io.BytesIO(frame_byte)).getchannel("A"))
+        frame = _process_frame_transparent(frame_byte)
+
+        self.assertEqual(frame.mode, "P")
+        np.testing.assert_array_equal(np.asarray(frame) == _IDX_CLR_TRANSPARENT,
+                                      alpha <= _ALPHA_TRANSPARENT_THRESHOLD)
+
 
 class TestApng2GifConvertResult(TestCase):
     def test_succeed(self):
@@ -192,3 +241,46 @@ class TestApng2GifConvertOpResult(TestCase):
         self.assertTrue(result.success)
         self.assertEqual(result.duration, 0.7)
         self.assertIsNone(result.exception)
+
+
+class TestLazyImageBinary(TestCase):
+    MESSAGE_ID = "1000"
+
+    def setUp(self) -> None:
+        self.img_bytes = LineContentApiDouble.load_file("tests/res/1x1.png")
+        self.api = LineContentApiDouble({self.MESSAGE_ID: self.img_bytes})
+
+    def get_image(self) -> LazyImageBinary:
+        return LazyImageBinary(lambda: self.api.get_message_content(self.MESSAGE_ID).content)
+
+    def test_not_fetched(self):
+        img = self.get_image()
+
+        self.assertFalse(img.fetched)
+        self.assertEqual(repr(img), "<LazyImageBinary - Not fetched>")
+        self.assertEqual(self.api.fetch_count(), 0)
+
+    def test_fetch_once(self):
+        img = self.get_image()
+
+        self.assertEqual(img.content, self.img_bytes)
+        self.assertTrue(img.fetched)
+        self.assertEqual(img.content, self.img_bytes)
+        self.assertEqual(self.api.fetch_count(self.MESSAGE_ID), 1)
+
+    def test_fetch_once_concurrent(self):
+        img = self.get_image()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: img.content, range(32)))
+
+        self.assertTrue(all(result == self.img_bytes for result in results))
+        self.assertEqual(self.api.fetch_count(self.MESSAGE_ID), 1)
+
+    def test_open(self):
+        img = self.get_image()
+
+        self.assertEqual(img.open().read(), self.img_bytes)
+        self.assertEqual(img.open().read(), self.img_bytes)
+        self.assertEqual(Image.open(img.open()).size, (1, 1))
+        self.assertEqual(self.api.fetch_count(self.MESSAGE_ID), 1)
@@ -0,0 +1,59 @@
+from extutils.leaderboard import RollingLeaderboard
+from tests.base import TestCase
+
+__all__ = ("TestRollingLeaderboard",)
+
+
+class TestRollingLeaderboard(TestCase):
+    def test_rank(self):
+        board = RollingLeaderboard([3])
+        board.add("A", 0, 5)
+        board.add("B", 0, 3)
+        board.add("C", 0, 3)
+        board.add("D", 0, 1)
+
+        self.assertEqual(board.get_rank("A", 3, 0), (1, 4))
+        self.assertEqual(board.get_rank("B", 3, 0), (2, 4))
+        self.assertEqual(board.get_rank("C", 3, 0), (2, 4))
+        self.assertEqual(board.get_rank("D", 3, 0), (4, 4))
+        self.assertEqual(board.get_rank("E", 3, 0), (-1, 4))
+
+    def test_expiry(self):
+        board = RollingLeaderboard([2, 4])
+        board.add("A", 0, 5)
+        board.add("B", 2, 1)
+        board.add("A", 3, 1)
+
+        self.assertEqual(board.get_count("A", 4, 3), 6)
+        self.assertEqual(board.get_count("A", 2, 3), 1)
+        self.assertEqual(board.get_rank("B", 2, 3), (1, 2))
+        self.assertEqual(board.get_rank("B", 4, 3), (2, 2))
+
+        self.assertEqual(board.get_count("A", 4, 4), 1)
+        self.assertEqual(board.get_rank("B", 2, 4), (-1, 1))
+        self.assertEqual(board.get_rank("B", 4, 4), (1, 2))
+
+        self.assertEqual(board.get_rank("A", 4, 100), (-1, 0))
+
+    def test_add_late(self):
+        board = RollingLeaderboard([2, 4])
+        board.add("A", 5)
+        board.add("B", 3, 2)
+        board.add("B", 1, 2)
+
+        self.assertEqual(board.get_count("B", 2, 5), 0)
+        self.assertEqual(board.get_count("B", 4, 5), 2)
+
+        self.assertEqual(board.get_count("B", 4, 6), 2)
+        self.assertEqual(board.get_count("B", 4, 7), 0)
+
+    def test_reset(self):
+        board = RollingLeaderboard([2, 4])
+        board.add("A", 0, 5)
+
+        board.reset([("B", 8, 2), ("C", 9, 1), ("C", 6, 3), ("A", 1, 7)], 9)
+
+        self.assertEqual(board.get_rank("A", 4, 9), (-1, 2))
+        self.assertEqual(board.get_rank("B", 2, 9), (1, 2))
+        self.assertEqual(board.get_rank("C", 2, 9), (2, 2))
+        self.assertEqual(board.get_rank("C", 4, 9), (1, 2))
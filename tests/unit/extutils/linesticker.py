@@ -1,7 +1,14 @@
-from extutils.linesticker import LineStickerUtils
+import os
+from tempfile import TemporaryDirectory
+from threading import Thread
+import time
+from unittest.mock import patch
+
+from extutils.linesticker import LineStickerUtils, LineStickerCacheManager
+from JellyBot.systemconfig import ExtraService
 from tests.base import TestCase
 
-__all__ = ["TestLineStickerUtils"]
+__all__ = ["TestLineStickerUtils", "TestLineStickerCacheManager"]
 
 
 class TestLineStickerUtils(TestCase):
@@ -28,3 +35,136 @@ class TestLineStickerUtils(TestCase):
                     self.assertEqual(LineStickerUtils.get_pack_meta_from_url(url).pack_id, expected_return)
                 else:
                     self.assertIsNone(LineStickerUtils.get_pack_meta_from_url(url))
+
+
+class TestLineStickerCacheManager(TestCase):
+    def setUpTestCase(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.patch_dir = patch.object(LineStickerCacheManager, "_DIR", self.temp_dir.name)
+        self.patch_dir.start()
+
+        LineStickerCacheManager.clear()
+
+    def tearDownTestCase(self) -> None:
+        LineStickerCacheManager.clear()
+
+        self.patch_dir.stop()
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def put_file(name: str, size: int) -> str:
+        temp_path = LineStickerCacheManager.get_temp_path("bin")
+        with open(temp_path, "wb") as f:
+            f.write(b"\x00" * size)
+
+        path = LineStickerCacheManager.get_path(name)
+        LineStickerCacheManager.put(path, temp_path)
+
+        return path
+
+    def test_put(self):
+        path = self.put_file("a.bin", 10)
+
+        self.assertTrue(LineStickerCacheManager.is_cached(path))
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(os.listdir(self.temp_dir.name), ["a.bin"])
+
+    def test_not_cached(self):
+        self.assertFalse(LineStickerCacheManager.is_cached(LineStickerCacheManager.get_path("a.bin")))
+
+    def test_evict_lru(self):
+        with patch.object(ExtraService.Sticker, "MaxCacheSizeMB", 1):
+            path_a = self.put_file("a.bin", 400 * 1024)
+            path_b = self.put_file("b.bin", 400 * 1024)
+
+            # Mark `a.bin` as recently used
+            self.assertTrue(LineStickerCacheManager.is_cached(path_a))
+
+            path_c = self.put_file("c.bin", 400 * 1024)
+
+            self.assertTrue(LineStickerCacheManager.is_cached(path_a))
+            self.assertFalse(LineStickerCacheManager.is_cached(path_b))
+            self.assertTrue(LineStickerCacheManager.is_cached(path_c))
+            self.assertFalse(os.path.exists(path_b))
+
+    def test_evict_expired(self):
+        path_a = self.put_file("a.bin", 10)
+
+        with patch.object(ExtraService.Sticker, "MaxStickerTempFileLifeSeconds", 0):
+            time.sleep(0.01)
+            path_b = self.put_file("b.bin", 10)
+
+            self.assertFalse(LineStickerCacheManager.is_cached(path_a))
+            self.assertTrue(LineStickerCacheManager.is_cached(path_b))
+
+    def test_persist(self):
+        path = self.put_file("a.bin", 10)
+
+        # Simulate restart
+        with patch.object(LineStickerCacheManager, "_INDEXED", False), \
+                patch.object(LineStickerCacheManager, "_ENTRIES", type(LineStickerCacheManager._ENTRIES)()), \
+                patch.object(LineStickerCacheManager, "_LAST_USED", {}), \
+                patch.object(LineStickerCacheManager, "_TOTAL_SIZE", 0):
+            self.assertTrue(LineStickerCacheManager.is_cached(path))
+
+    def test_lock_single_flight(self):
+        path = LineStickerCacheManager.get_path("a.bin")
+        generated = []
+
+        def generate():
+            with LineStickerCacheManager.lock(path):
+                if LineStickerCacheManager.is_cached(path):
+                    return
+
+                time.sleep(0.05)
+                generated.append(self.put_file("a.bin", 10))
+
+        threads = [Thread(target=generate) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(generated), 1)
+        self.assertTrue(LineStickerCacheManager.is_cached(path))
+
+    def test_generate(self):
+        path = LineStickerCacheManager.get_path("a.bin")
+
+        with LineStickerCacheManager.generate(path, "bin") as temp_path:
+            self.assertIsNotNone(temp_path)
+
+            with open(temp_path, "wb") as f:
+                f.write(b"\x00")
+
+        self.assertTrue(LineStickerCacheManager.is_cached(path))
+
+        with LineStickerCacheManager.generate(path, "bin") as temp_path:
+            self.assertIsNone(temp_path)
+
+    def test_generate_not_generated(self):
+        path = LineStickerCacheManager.get_path("a.bin")
+
+        with LineStickerCacheManager.generate(path, "bin"):
+            pass
+
+        self.assertFalse(LineStickerCacheManager.is_cached(path))
+
+    def test_generate_dependent_not_cached(self):
+        path = self.put_file("a.bin", 10)
+
+        with LineStickerCacheManager.generate(path, "bin", dependents=[LineStickerCacheManager.get_path("b.bin")]) \
+                as temp_path:
+            self.assertIsNotNone(temp_path)
+
+    def test_open_entry(self):
+        path = LineStickerCacheManager.get_path("a.bin")
+
+        self.assertIsNone(LineStickerCacheManager.open_entry(path, lambda: False))
+
+        def generate():
+            self.put_file("a.bin", 10)
+            return True
+
+        with LineStickerCacheManager.open_entry(path, generate) as f:
+            self.assertEqual(f.read(), b"\x00" * 10)
@@ -0,0 +1,139 @@
+from datetime import timedelta
+
+from extutils.dt import now_utc_aware
+from extutils.namecache import MemoryNameCacheBackend, NameCacheEntry, TieredNameCache
+from tests.base import TestCase
+
+__all__ = ["TestTieredNameCache"]
+
+
+class _CountingBackend(MemoryNameCacheBackend):
+    def __init__(self):
+        super().__init__(maxsize=100, ttl=3600)
+
+        self.get_calls = []
+        self.set_calls = []
+
+    def get_names(self, keys):
+        self.get_calls.append(list(keys))
+
+        return super().get_names(keys)
+
+    def set_names(self, entries):
+        self.set_calls.append(dict(entries))
+
+        super().set_names(entries)
+
+
+class TestTieredNameCache(TestCase):
+    def setUpTestCase(self) -> None:
+        self.backend = _CountingBackend()
+
+    def _get_cache(self, **kwargs):
+        kwargs = {"local_size": 100, "local_ttl": 3600, "stale_seconds": 60, "synchronous": True, **kwargs}
+
+        return TieredNameCache(self.backend, **kwargs)
+
+    def test_get_many_single_backend_call(self):
+        self.backend.set_names({
+            "A": NameCacheEntry("Name A", now_utc_aware()),
+            "B": NameCacheEntry("Name B", now_utc_aware())
+        })
+        cache = self._get_cache()
+
+        result = cache.get_many(["A", "B", "C"])
+
+        self.assertEqual({"A", "B"}, set(result))
+        self.assertEqual("Name A", result["A"].name)
+        self.assertEqual([["A", "B", "C"]], self.backend.get_calls)
+
+    def test_get_local_tier(self):
+        self.backend.set_names({"A": NameCacheEntry("Name A", now_utc_aware())})
+        cache = self._get_cache()
+
+        cache.get("A")
+        cache.get("A")
+        cache.get_many(["A", "B"])
+
+        self.assertEqual([["A"], ["B"]], self.backend.get_calls)
+
+    def test_set_synchronous(self):
+        cache = self._get_cache()
+
+        cache.set("A", "Name A")
+
+        self.assertEqual("Name A", cache.get("A").name)
+        self.assertEqual(1, len(self.backend.set_calls))
+        self.assertEqual("Name A", self.backend.get_names(["A"])["A"].name)
+
+    def test_set_buffered(self):
+        cache = self._get_cache(synchronous=False, flush_size=3, flush_interval=3600)
+
+        cache.set("A", "Name A")
+        cache.set("B", "Name B")
+
+        # Available in the local tier before flushing
+        self.assertEqual("Name A", cache.get("A").name)
+        self.assertEqual([], self.backend.set_calls)
+
+        cache.flush()
+
+        self.assertEqual([{"A", "B"}], [set(entries) for entries in self.backend.set_calls])
+
+    def test_stale(self):
+        self.backend.set_names({
+            "A": NameCacheEntry("Name A", now_utc_aware() - timedelta(seconds=120)),
+            "B": NameCacheEntry("Name B", now_utc_aware())
+        })
+        cache = self._get_cache()
+
+        result = cache.get_many(["A", "B"])
+
+        self.assertTrue(result["A"].stale)
+        self.assertEqual("Name A", result["A"].name)
+        self.assertFalse(result["B"].stale)
+
+    def test_refresh(self):
+        cache = self._get_cache()
+
+        self.assertTrue(cache.refresh_async("A", lambda: "Name A"))
+        self.assertEqual("Name A", cache.get("A").name)
+
+    def test_refresh_not_found(self):
+        cache = self._get_cache()
+        cache.set("A", "Name A")
+
+        self.assertTrue(cache.refresh_async("A", lambda: None))
+        self.assertEqual("Name A", cache.get("A").name)
+
+    def test_refresh_deduplicated(self):
+        cache = self._get_cache()
+        started = []
+
+        def _fetch():
+            started.append(cache.refresh_async("A", lambda: "Name A2"))
+            return "Name A"
+
+        self.assertTrue(cache.refresh_async("A", _fetch))
+        self.assertEqual([False], started)
+        self.assertEqual("Name A", cache.get("A").name)
+
+    def test_set_backend(self):
+        cache = self._get_cache(synchronous=False, flush_interval=3600)
+        cache.set("A", "Name A")
+
+        new_backend = MemoryNameCacheBackend(maxsize=100, ttl=3600)
+        cache.set_backend(new_backend)
+
+        self.assertIs(new_backend, cache.backend)
+        self.assertEqual("Name A", self.backend.get_names(["A"])["A"].name)
+        self.assertIsNone(cache.get("A"))
+
+    def test_clear(self):
+        cache = self._get_cache()
+        cache.set("A", "Name A")
+
+        cache.clear()
+
+        self.assertIsNone(cache.get("A"))
+        self.assertEqual({}, self.backend.get_names(["A"]))
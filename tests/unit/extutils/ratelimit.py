@@ -0,0 +1,65 @@
+from extutils.ratelimit import TokenBucket
+from tests.base import TestCase
+
+__all__ = ["TestTokenBucket"]
+
+
+class TestTokenBucket(TestCase):
+    def setUpTestCase(self) -> None:
+        self.now = 0.0
+        self.slept = []
+
+    def _sleep(self, secs):
+        self.slept.append(secs)
+        self.now += secs
+
+    def _get_bucket(self, rate, capacity):
+        return TokenBucket(rate, capacity, clock=lambda: self.now, sleep=self._sleep)
+
+    def test_burst(self):
+        bucket = self._get_bucket(1, 3)
+
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_refill(self):
+        bucket = self._get_bucket(2, 2)
+
+        self.assertTrue(bucket.try_acquire(2))
+        self.assertFalse(bucket.try_acquire())
+
+        self.now += 0.5
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_refill_capped(self):
+        bucket = self._get_bucket(10, 2)
+
+        self.assertTrue(bucket.try_acquire(2))
+
+        self.now += 100
+        self.assertTrue(bucket.try_acquire(2))
+        self.assertFalse(bucket.try_acquire())
+
+    def test_acquire_blocks(self):
+        bucket = self._get_bucket(4, 1)
+
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        self.assertEqual([0.25, 0.25], self.slept)
+
+    def test_acquire_over_capacity(self):
+        bucket = self._get_bucket(1, 2)
+
+        with self.assertRaises(ValueError):
+            bucket.acquire(3)
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0, 1)
+        with self.assertRaises(ValueError):
+            TokenBucket(1, 0)
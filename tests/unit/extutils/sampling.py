@@ -0,0 +1,136 @@
+import math
+import random
+
+from extutils.sampling import binomial, multinomial
+from tests.base import TestCase
+
+__all__ = ["TestBinomial", "TestMultinomial"]
+
+
+def _chi2_critical(dof: int) -> float:
+    # Wilson-Hilferty approximation of the chi-squared critical value at the significance level of 0.001
+    return dof * (1 - 2 / (9 * dof) + 3.090 * math.sqrt(2 / (9 * dof))) ** 3
+
+
+class _ChiSquaredMixin(TestCase):
+    def assertFitsDistribution(self, observed, expected):
+        """Check if the ``observed`` counts fit the ``expected`` counts using Pearson's chi-squared test."""
+        # Merge the bins with few expected counts to keep the approximation valid
+        bins = []
+        obs_acc = exp_acc = 0
+        for obs, exp in zip(observed, expected):
+            obs_acc += obs
+            exp_acc += exp
+
+            if exp_acc >= 5:
+                bins.append((obs_acc, exp_acc))
+                obs_acc = exp_acc = 0
+
+        if exp_acc and bins:
+            obs_last, exp_last = bins.pop()
+            bins.append((obs_last + obs_acc, exp_last + exp_acc))
+
+        dof = len(bins) - 1
+        chi2 = sum((obs - exp) ** 2 / exp for obs, exp in bins)
+        critical = _chi2_critical(dof)
+
+        self.assertLess(chi2, critical, f"Chi-squared statistic {chi2:.3f} (DoF {dof}) exceeds {critical}")
+
+
+def _binomial_pmf(n, p, k):
+    return math.comb(n, k) * p ** k * (1 - p) ** (n - k)
+
+
+class TestBinomial(_ChiSquaredMixin):
+    SAMPLES = 20000
+
+    def _assert_binomial(self, n, p):
+        rnd = random.Random(42)
+
+        observed = [0] * (n + 1)
+        for _ in range(self.SAMPLES):
+            observed[binomial(n, p, rnd)] += 1
+
+        self.assertFitsDistribution(observed, [self.SAMPLES * _binomial_pmf(n, p, k) for k in range(n + 1)])
+
+    def test_small_mean(self):
+        self._assert_binomial(30, 0.1)
+
+    def test_large_mean(self):
+        self._assert_binomial(200, 0.3)
+
+    def test_large_p(self):
+        self._assert_binomial(200, 0.85)
+
+    def test_large_n(self):
+        rnd = random.Random(42)
+        n, p = 10 ** 9, 0.25
+
+        samples = [binomial(n, p, rnd) for _ in range(2000)]
+
+        mean = sum(samples) / len(samples)
+        std = math.sqrt(n * p * (1 - p))
+        # Standard error of the mean is `std / sqrt(2000)`, allowing 5 times of it
+        self.assertLess(abs(mean - n * p), 5 * std / math.sqrt(len(samples)))
+        self.assertTrue(all(0 <= sample <= n for sample in samples))
+
+    def test_edge(self):
+        self.assertEqual(0, binomial(0, 0.5))
+        self.assertEqual(0, binomial(100, 0))
+        self.assertEqual(100, binomial(100, 1))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            binomial(-1, 0.5)
+        with self.assertRaises(ValueError):
+            binomial(10, 1.5)
+
+
+class TestMultinomial(_ChiSquaredMixin):
+    def test_distribution(self):
+        rnd = random.Random(42)
+        weights = [1, 2, 3, 4]
+        picks = 50
+
+        # Counts of the 1st option follow Binomial(picks, 0.1)
+        observed = [0] * (picks + 1)
+        totals = [0] * len(weights)
+        for _ in range(10000):
+            counts = multinomial(picks, weights, rnd)
+
+            self.assertEqual(picks, sum(counts))
+            observed[counts[0]] += 1
+            for idx, count in enumerate(counts):
+                totals[idx] += count
+
+        self.assertFitsDistribution(observed, [10000 * _binomial_pmf(picks, 0.1, k) for k in range(picks + 1)])
+        self.assertFitsDistribution(totals, [10000 * picks * weight / sum(weights) for weight in weights])
+
+    def test_large_count(self):
+        counts = multinomial(10 ** 12, [1.5, 0.5, 2], random.Random(42))
+
+        self.assertEqual(10 ** 12, sum(counts))
+        for count, ratio in zip(counts, [0.375, 0.125, 0.5]):
+            self.assertAlmostEqual(ratio, count / 10 ** 12, places=4)
+
+    def test_zero_weights(self):
+        rnd = random.Random(42)
+
+        for _ in range(1000):
+            self.assertEqual([0, 100, 0], multinomial(100, [0, 0.3, 0], rnd))
+
+    def test_no_picks(self):
+        self.assertEqual([0, 0], multinomial(0, [1, 1]))
+
+    def test_no_options(self):
+        self.assertEqual([], multinomial(10, []))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            multinomial(-1, [1])
+        with self.assertRaises(ValueError):
+            multinomial(10, [1, -1])
+        with self.assertRaises(ValueError):
+            multinomial(10, [1, float("nan")])
+        with self.assertRaises(ValueError):
+            multinomial(10, [0, 0])
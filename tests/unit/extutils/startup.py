@@ -0,0 +1,88 @@
+from extutils.startup import StartupProfiler, StartupRecord
+from tests.base import TestCase
+
+__all__ = ["TestStartupProfiler"]
+
+
+class TestStartupProfiler(TestCase):
+    def setUpTestCase(self) -> None:
+        self.now = 0.0
+        self.profiler = StartupProfiler(clock=lambda: self.now, synchronous=True)
+
+    def test_measure(self):
+        with self.profiler.measure("Collection", "A"):
+            self.now += 2
+
+        self.assertEqual([StartupRecord("Collection", "A", 2)], self.profiler.records)
+
+    def test_measure_exception(self):
+        with self.assertRaises(ValueError):
+            with self.profiler.measure("Collection", "A"):
+                self.now += 1
+                raise ValueError()
+
+        self.assertEqual([StartupRecord("Collection", "A", 1)], self.profiler.records)
+
+    def test_mark_ready(self):
+        self.now += 5
+
+        self.assertIsNone(self.profiler.seconds_to_ready)
+        self.assertFalse(self.profiler.is_ready)
+        self.assertEqual(5, self.profiler.mark_ready())
+        self.assertTrue(self.profiler.is_ready)
+
+        self.now += 5
+
+        self.assertEqual(5, self.profiler.mark_ready())
+        self.assertEqual(5, self.profiler.seconds_to_ready)
+
+    def test_defer(self):
+        executed = []
+
+        self.profiler.defer("A", lambda: executed.append("A"))
+        self.profiler.defer("B", lambda: executed.append("B"))
+
+        self.assertEqual([], executed)
+
+        self.profiler.mark_ready()
+
+        self.assertEqual(["A", "B"], executed)
+        self.assertEqual(["A", "B"], [rec.name for rec in self.profiler.records if rec.category == "Deferred"])
+
+    def test_defer_after_ready(self):
+        executed = []
+
+        self.profiler.mark_ready()
+        self.profiler.defer("A", lambda: executed.append("A"))
+
+        self.assertEqual(["A"], executed)
+
+    def test_defer_failed(self):
+        executed = []
+
+        def _fail():
+            raise ValueError()
+
+        self.profiler.defer("A", _fail)
+        self.profiler.defer("B", lambda: executed.append("B"))
+        self.profiler.mark_ready()
+
+        self.assertEqual(["B"], executed)
+
+    def test_report(self):
+        self.profiler.record("Collection", "A", 1)
+        self.profiler.record("Collection", "B", 3)
+        self.profiler.record("Index", "A", 2)
+        self.now += 4
+        self.profiler.mark("Django ready")
+        self.profiler.mark_ready()
+
+        report = self.profiler.get_report(slowest=2)
+
+        self.assertIn("Ready in 4.000 secs", report)
+        self.assertIn("Django ready: 4.000 secs", report)
+        self.assertIn("Collection: 4.000 secs / 2 steps", report)
+        self.assertIn("[Collection] B: 3.000 secs", report)
+        self.assertIn("[Index] A: 2.000 secs", report)
+        self.assertNotIn("[Collection] A", report)
+        self.assertNotIn("[Milestone]", report)
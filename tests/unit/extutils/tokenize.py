@@ -0,0 +1,25 @@
+from extutils.tokenize import tokenize_for_search, MAX_KEYWORD_LENGTH
+from tests.base import TestCase
+
+__all__ = ["TestTokenizeForSearch"]
+
+
+class TestTokenizeForSearch(TestCase):
+    def test_tokenize(self):
+        self.assertEqual(tokenize_for_search("Hello World"), {"hello", "world"})
+
+    def test_tokenize_punctuations(self):
+        self.assertEqual(tokenize_for_search("Hello, World!"), {"hello", "world"})
+        self.assertEqual(tokenize_for_search("!?, ."), set())
+
+    def test_tokenize_empty(self):
+        self.assertEqual(tokenize_for_search(""), set())
+
+    def test_tokenize_suffixes(self):
+        self.assertEqual(tokenize_for_search("ABC D", with_suffixes=True), {"abc", "bc", "c", "d"})
+
+    def test_tokenize_truncated(self):
+        self.assertEqual(tokenize_for_search("A" * (MAX_KEYWORD_LENGTH + 5)), {"a" * MAX_KEYWORD_LENGTH})
+
+    def test_tokenize_max_count(self):
+        self.assertEqual(len(tokenize_for_search("ABCDEF", with_suffixes=True, max_count=3)), 3)
@@ -0,0 +1,146 @@
+from concurrent.futures.thread import ThreadPoolExecutor
+import random
+
+from extutils.tracing import Tracer, span, tag, wrap_context, percentile
+from tests.base import TestCase
+
+__all__ = ["TestTracer", "TestPercentile"]
+
+
+class TestTracer(TestCase):
+    def setUpTestCase(self) -> None:
+        self.now = 0.0
+        self.finished = []
+        self.tracer = Tracer(sample_rate=1, on_finished=self.finished.append, clock=lambda: self.now)
+
+    def test_trace(self):
+        with self.tracer.trace("message") as trace:
+            self.now += 0.001
+
+            with span("handle"):
+                self.now += 0.002
+
+                with span("handler.ar"):
+                    self.now += 0.003
+
+            with span("send"):
+                self.now += 0.004
+
+        self.assertEqual([trace], self.finished)
+        self.assertAlmostEqual(10, trace.duration_ms)
+
+        spans = trace.spans
+        self.assertEqual(["handler.ar", "handle", "send"], [span_.name for span_ in spans])
+        self.assertEqual(["handle", None, None], [span_.parent for span_ in spans])
+        self.assertAlmostEqual(3, spans[0].start_ms)
+        self.assertAlmostEqual(3, spans[0].duration_ms)
+        self.assertAlmostEqual(1, spans[1].start_ms)
+        self.assertAlmostEqual(5, spans[1].duration_ms)
+
+    def test_span_exception(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.trace("message") as trace:
+                with span("handle"):
+                    self.now += 0.001
+                    raise ValueError()
+
+        self.assertEqual(["handle"], [span_.name for span_ in trace.spans])
+        self.assertEqual([trace], self.finished)
+
+    def test_nested_trace_as_span(self):
+        with self.tracer.trace("LINE") as trace:
+            with self.tracer.trace("handle_message_main") as trace_inner:
+                self.assertIs(trace, trace_inner)
+
+        self.assertEqual([trace], self.finished)
+        self.assertEqual(["handle_message_main"], [span_.name for span_ in trace.spans])
+
+    def test_not_sampled(self):
+        tracer = Tracer(sample_rate=0, on_finished=self.finished.append)
+
+        with tracer.trace("message") as trace:
+            self.assertIsNone(trace)
+
+            with span("handle"):
+                tag("key", "value")
+
+            # Nested trace should not be sampled again
+            with self.tracer.trace("inner") as trace_inner:
+                self.assertIsNone(trace_inner)
+
+        self.assertEqual([], self.finished)
+
+    def test_sample_rate(self):
+        tracer = Tracer(sample_rate=0.25, on_finished=self.finished.append, rnd=random.Random(42))
+
+        for _ in range(4000):
+            with tracer.trace("message"):
+                pass
+
+        self.assertAlmostEqual(1000, len(self.finished), delta=100)
+
+    def test_no_active_trace(self):
+        with span("handle"):
+            tag("key", "value")
+
+        self.assertEqual([], self.finished)
+
+    def test_tag(self):
+        with self.tracer.trace("message") as trace:
+            with span("handle"):
+                tag("channel", "A")
+
+        self.assertEqual({"channel": "A"}, trace.tags)
+
+    def test_on_finished_error(self):
+        def _raise(_):
+            raise ValueError()
+
+        tracer = Tracer(sample_rate=1, on_finished=_raise)
+
+        with tracer.trace("message") as trace:
+            pass
+
+        self.assertIsNotNone(trace.duration_ms)
+
+    def test_wrap_context(self):
+        def _handle(name):
+            with span(name):
+                return name
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.tracer.trace("message") as trace:
+                with span("dispatch"):
+                    futures = [executor.submit(wrap_context(_handle), name) for name in ("A", "B", "C")]
+                    self.assertEqual(["A", "B", "C"], [future.result() for future in futures])
+
+            # Spans are not recorded without wrapping the context
+            executor.submit(_handle, "D").result()
+
+        spans = {span_.name: span_ for span_ in trace.spans}
+        self.assertEqual({"A", "B", "C", "dispatch"}, set(spans))
+        self.assertEqual("dispatch", spans["A"].parent)
+        self.assertEqual("dispatch", spans["C"].parent)
+
+
+class TestPercentile(TestCase):
+    def test_percentile(self):
+        values = [1, 2, 3, 4, 5]
+
+        self.assertEqual(1, percentile(values, 0))
+        self.assertEqual(3, percentile(values, 50))
+        self.assertEqual(5, percentile(values, 100))
+        self.assertAlmostEqual(4.96, percentile(values, 99))
+        self.assertAlmostEqual(1.4, percentile(values, 10))
+
+    def test_single_value(self):
+        self.assertEqual(7, percentile([7], 50))
+        self.assertEqual(7, percentile([7], 99))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+        with self.assertRaises(ValueError):
+            percentile([1], 101)
+        with self.assertRaises(ValueError):
+            percentile([1], -1)
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import Dict, Tuple, Any, Type
 
 from bson import ObjectId
@@ -97,6 +98,12 @@ class TestChannelProfileConnectionModel(TestModel.TestClass):
             ("p", "ProfileOids"): TestChannelProfileConnectionModel.PROFILE_OIDS
         }
 
+    @classmethod
+    def get_optional(cls) -> Dict[Tuple[str, str], Any]:
+        return {
+            ("ec", "ExistenceCheckedAt"): datetime(2020, 5, 10, 10, 36, tzinfo=timezone.utc)
+        }
+
     @classmethod
     def get_default(cls) -> Dict[Tuple[str, str], Tuple[Any, Any]]:
         return {
@@ -12,7 +12,8 @@ from tests.base import TestDatabaseMixin
 from models import (
     HourlyResult, DailyResult, HourlyIntervalAverageMessageResult, DailyMessageResult, MemberMessageByCategoryResult,
     MeanMessageResultGenerator, MemberDailyMessageResult, CountBeforeTimeResult, MemberMessageCountResult,
-    MemberMessageCountEntry, BotFeatureUsageResult, BotFeaturePerUserUsageResult, BotFeatureHourlyAvgResult
+    MemberMessageCountEntry, BotFeatureUsageResult, BotFeaturePerUserUsageResult, BotFeatureHourlyAvgResult,
+    MessageLatencyResult, MessageTraceModel, MessageTraceSpanModel, LatencyPercentileEntry
 )
 from models import MemberMessageByCategoryEntry
 from strres.models import StatsResults
@@ -21,7 +22,7 @@ from tests.base import TestCase
 __all__ = ["TestDailyResult", "TestHourlyResult", "TestHourlyIntervalAverageMessageResult", "TestDailyMessageResult",
            "TestMeanMessageResultGenerator", "TestMemberDailyMessageResult", "TestMemberMessageCountResult",
            "TestMemberMessageByCategoryResult", "TestBotFeatureUsageResult", "TestBotFeaturePerUserUsageResult",
-           "TestBotFeatureHourlyAvgResult", "TestCountBeforeTimeResult"]
+           "TestBotFeatureHourlyAvgResult", "TestCountBeforeTimeResult", "TestMessageLatencyResult"]
 
 
 class TestHourlyResult(TestDatabaseMixin):
@@ -1108,3 +1109,56 @@ class TestBotFeatureHourlyAvgResult(TestCase):
         self.assertFalse((BotFeature.TXT_AR_ADD_EXECODE,
                           [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], "#9C0000", "true")
                          in result.data)
+
+
+class TestMessageLatencyResult(TestCase):
+    @staticmethod
+    def _get_trace(name, duration_ms, spans):
+        return MessageTraceModel(
+            Name=name, DurationMs=duration_ms, Timestamp=datetime.utcnow(),
+            Spans=[MessageTraceSpanModel(Name=span_name, StartMs=0, DurationMs=span_duration)
+                   for span_name, span_duration in spans])
+
+    def test_empty(self):
+        result = MessageLatencyResult([])
+
+        self.assertEqual(result.trace_count, 0)
+        self.assertEqual(result.traces, [])
+        self.assertEqual(result.stages, [])
+        self.assertEqual(result.handlers, [])
+
+    def assertEntriesEqual(self, expected, actual):
+        self.assertEqual([(entry.name, entry.count) for entry in expected],
+                         [(entry.name, entry.count) for entry in actual])
+
+        for entry_expected, entry_actual in zip(expected, actual):
+            with self.subTest(entry_expected.name):
+                self.assertAlmostEqual(entry_expected.p50, entry_actual.p50)
+                self.assertAlmostEqual(entry_expected.p90, entry_actual.p90)
+                self.assertAlmostEqual(entry_expected.p99, entry_actual.p99)
+                self.assertAlmostEqual(entry_expected.max, entry_actual.max)
+
+    def test_data(self):
+        result = MessageLatencyResult([
+            self._get_trace("LINE", 10, [("handle", 8), ("handler.auto_reply", 5), ("send", 1)]),
+            self._get_trace("LINE", 20, [("handle", 16), ("handler.auto_reply", 3)]),
+            self._get_trace("LINE", 30, [("handle", 24), ("handler.bot_cmd", 20), ("send", 2)]),
+            self._get_trace("Discord", 100, [("handle", 50), ("send", 40)])
+        ])
+
+        self.assertEqual(result.trace_count, 4)
+        self.assertEntriesEqual(
+            [LatencyPercentileEntry("Discord", 1, 100, 100, 100, 100),
+             LatencyPercentileEntry("LINE", 3, 20, 28, 29.8, 30)],
+            result.traces
+        )
+        self.assertEntriesEqual(
+            [LatencyPercentileEntry("handle", 4, 20, 42.2, 49.22, 50),
+             LatencyPercentileEntry("send", 3, 2, 32.4, 39.24, 40)],
+            result.stages
+        )
+        self.assertEntriesEqual(
+            [LatencyPercentileEntry("bot_cmd", 1, 20, 20, 20, 20),
+             LatencyPercentileEntry("auto_reply", 2, 4, 4.8, 4.98, 5)],
+            result.handlers
+        )
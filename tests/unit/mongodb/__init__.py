@@ -1 +1,4 @@
+from .misc import *  # noqa
 from .outcome import *  # noqa
+from .page import *  # noqa
+from .telemetry import *  # noqa
@@ -0,0 +1,36 @@
+from mongodb.utils import collation_fold
+from tests.base import TestCase
+
+__all__ = ("TestCollationFold",)
+
+
+class TestCollationFold(TestCase):
+    def test_case_and_diacritics(self):
+        self.assertEqual(collation_fold("Café"), collation_fold("CAFE"))
+        self.assertEqual(collation_fold("café"), collation_fold("café"))
+        self.assertEqual(collation_fold("Straße"), collation_fold("STRASSE"))
+        self.assertEqual(collation_fold("İ"), collation_fold("i"))
+        self.assertEqual(collation_fold("Łódź"), collation_fold("lodz"))
+        self.assertEqual(collation_fold("Æsir"), collation_fold("aesir"))
+
+    def test_ignorable(self):
+        self.assertEqual(collation_fold("❤\ufe0f"), collation_fold("❤"))
+        self.assertEqual(collation_fold("a\u200bb"), collation_fold("ab"))
+        self.assertEqual(collation_fold("soft\u00adhyphen"), collation_fold("softhyphen"))
+        self.assertEqual(collation_fold("\ufeffA"), collation_fold("a"))
+
+    def test_width_and_kana(self):
+        self.assertEqual(collation_fold("ｱｲｳ"), collation_fold("アイウ"))
+        self.assertEqual(collation_fold("カタカナ"), collation_fold("かたかな"))
+        self.assertEqual(collation_fold("ァ"), collation_fold("あ"))
+        self.assertEqual(collation_fold("がぎ"), collation_fold("かき"))
+        self.assertEqual(collation_fold("ＡＢＣ"), collation_fold("abc"))
+
+    def test_digits(self):
+        self.assertEqual(collation_fold("٣"), collation_fold("3"))
+        self.assertEqual(collation_fold("①"), collation_fold("1"))
+
+    def test_different(self):
+        self.assertNotEqual(collation_fold("abc"), collation_fold("abd"))
+        self.assertNotEqual(collation_fold("你"), collation_fold("好"))
+        self.assertNotEqual(collation_fold("cafe"), collation_fold("cafes"))
@@ -0,0 +1,59 @@
+from bson import ObjectId
+
+from mongodb.exceptions import InvalidPageTokenError
+from mongodb.utils.page import (
+    complete_keyset_sort, get_sort_values, get_keyset_filter, encode_page_token, decode_page_token
+)
+from tests.base import TestCase
+
+__all__ = ("TestKeysetPagination",)
+
+
+class TestKeysetPagination(TestCase):
+    def test_complete_sort(self):
+        self.assertEqual(complete_keyset_sort(None), [("_id", -1)])
+        self.assertEqual(complete_keyset_sort([("a", 1)]), [("a", 1), ("_id", 1)])
+        self.assertEqual(complete_keyset_sort([("a", 1), ("b", -1)]), [("a", 1), ("b", -1), ("_id", -1)])
+        self.assertEqual(complete_keyset_sort([("_id", 1), ("a", -1)]), [("_id", 1), ("a", -1)])
+
+    def test_get_sort_values(self):
+        oid = ObjectId()
+
+        self.assertEqual(
+            get_sort_values({"_id": oid, "a": 7, "b": {"c": "x"}}, [("b.c", 1), ("a", -1), ("_id", -1)]),
+            ["x", 7, oid]
+        )
+        self.assertEqual(get_sort_values({"_id": oid}, [("a", 1), ("_id", 1)]), [None, oid])
+
+    def test_keyset_filter(self):
+        oid = ObjectId()
+
+        self.assertEqual(
+            get_keyset_filter([("a", 1), ("b", -1), ("_id", -1)], [5, "x", oid]),
+            {"$or": [
+                {"a": {"$gt": 5}},
+                {"a": 5, "b": {"$lt": "x"}},
+                {"a": 5, "b": "x", "_id": {"$lt": oid}}
+            ]}
+        )
+
+    def test_token_round_trip(self):
+        sort = [("a", -1), ("_id", -1)]
+        values = [7, ObjectId()]
+
+        token = encode_page_token(sort, values)
+
+        self.assertTrue(all(c.isalnum() or c in "-_=" for c in token))
+        self.assertEqual(decode_page_token(token, sort), values)
+
+    def test_token_sort_mismatch(self):
+        token = encode_page_token([("a", -1), ("_id", -1)], [7, ObjectId()])
+
+        with self.assertRaises(InvalidPageTokenError):
+            decode_page_token(token, [("b", -1), ("_id", -1)])
+
+    def test_token_malformed(self):
+        for token in ("", "abc", "!@#$", encode_page_token([("_id", 1)], [ObjectId()])[:-4]):
+            with self.subTest(token=token):
+                with self.assertRaises(InvalidPageTokenError):
+                    decode_page_token(token, [("_id", 1)])
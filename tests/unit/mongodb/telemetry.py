@@ -0,0 +1,114 @@
+from pymongo.errors import BulkWriteError
+
+from mongodb.utils.telemetry import TelemetryWriter, get_telemetry_health
+from tests.base import TestCase
+
+__all__ = ("TestTelemetryWriter",)
+
+
+class _FakeCollection:
+    def __init__(self, fail_indexes=None, raise_error=False):
+        self.batches = []
+        self.fail_indexes = fail_indexes or set()
+        self.raise_error = raise_error
+
+    def insert_many(self, documents, ordered=True):
+        if self.raise_error:
+            raise ConnectionError("Connection lost")
+
+        self.batches.append(list(documents))
+
+        if self.fail_indexes:
+            raise BulkWriteError({"writeErrors": [{"index": idx, "code": 11000} for idx in self.fail_indexes]})
+
+
+class TestTelemetryWriter(TestCase):
+    @staticmethod
+    def _get_writer(collection, **kwargs):
+        kwargs = {"capacity": 10, "batch_size": 3, "flush_interval": 60, **kwargs}
+
+        return TelemetryWriter("Test", collection, **kwargs)
+
+    def test_flush_in_batches(self):
+        col = _FakeCollection()
+        writer = self._get_writer(col)
+
+        # Submit directly to the buffer without starting the flushing thread
+        writer._buffer.extend({"i": i} for i in range(7))
+
+        self.assertEqual(7, writer.flush())
+        self.assertEqual([3, 3, 1], [len(batch) for batch in col.batches])
+        self.assertEqual(0, writer.flush())
+
+        health = writer.health()
+        self.assertEqual(0, health.buffered)
+        self.assertEqual(7, health.written)
+        self.assertEqual(1, health.flushes)
+        self.assertIsNotNone(health.last_flush_at)
+
+    def test_synchronous(self):
+        col = _FakeCollection()
+        writer = self._get_writer(col, synchronous=True)
+
+        self.assertTrue(writer.submit({"i": 1}))
+        self.assertEqual([[{"i": 1}]], col.batches)
+        self.assertIsNone(writer._flusher)
+
+    def test_drop_oldest_if_full(self):
+        col = _FakeCollection()
+        writer = self._get_writer(col, capacity=3, batch_size=10)
+        writer._flusher = True  # Prevent the flushing thread from starting
+
+        self.assertTrue(writer.submit({"i": 1}))
+        self.assertTrue(writer.submit({"i": 2}))
+        self.assertTrue(writer.submit({"i": 3}))
+        self.assertFalse(writer.submit({"i": 4}))
+
+        health = writer.health()
+        self.assertEqual(1, health.dropped)
+        self.assertEqual(3, health.buffered)
+
+        writer.flush()
+        self.assertEqual([[{"i": 2}, {"i": 3}, {"i": 4}]], col.batches)
+
+    def test_partial_failure(self):
+        col = _FakeCollection(fail_indexes={1})
+        flushed = []
+        writer = self._get_writer(col, synchronous=True, batch_size=3, on_flushed=flushed.extend)
+
+        writer._buffer.extend({"i": i} for i in range(3))
+        writer.flush()
+
+        self.assertEqual([{"i": 0}, {"i": 2}], flushed)
+
+        health = writer.health()
+        self.assertEqual(2, health.written)
+        self.assertEqual(1, health.failed)
+
+    def test_failure(self):
+        flushed = []
+        writer = self._get_writer(_FakeCollection(raise_error=True), on_flushed=flushed.extend)
+
+        writer._buffer.extend({"i": i} for i in range(4))
+
+        self.assertEqual(0, writer.flush())
+        self.assertEqual([], flushed)
+
+        health = writer.health()
+        self.assertEqual(0, health.written)
+        self.assertEqual(4, health.failed)
+
+    def test_on_flushed_error_not_propagated(self):
+        def _raise(_):
+            raise ValueError()
+
+        writer = self._get_writer(_FakeCollection(), synchronous=True, on_flushed=_raise)
+
+        self.assertTrue(writer.submit({"i": 1}))
+        self.assertEqual(1, writer.health().written)
+
+    def test_get_all_health(self):
+        writer = self._get_writer(_FakeCollection(), synchronous=True)
+        writer.submit({"i": 1})
+
+        self.assertIn(writer.health(), get_telemetry_health())
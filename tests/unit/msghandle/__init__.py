@@ -0,0 +1,3 @@
+from .text_dispatch import *  # noqa
+from .out_discord import *  # noqa
+from .rdm import *  # noqa
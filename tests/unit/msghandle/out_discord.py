@@ -0,0 +1,56 @@
+import asyncio
+
+from discord import Embed
+
+from msghandle.models.out_discord import DiscordReplyDispatcher
+from tests.base import TestCase
+
+__all__ = ["TestDiscordReplyDispatcher"]
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, *, embed=None):
+        # Yield to the event loop to simulate the network I/O
+        await asyncio.sleep(0)
+        self.sent.append((content, embed))
+
+
+class TestDiscordReplyDispatcher(TestCase):
+    def test_coalesce_texts(self):
+        dispatcher = DiscordReplyDispatcher(20, separator="-")
+
+        self.assertEqual(dispatcher.coalesce(["A", "B", "C"]), [("A\n-\nB\n-\nC", None)])
+
+    def test_coalesce_length_limit(self):
+        dispatcher = DiscordReplyDispatcher(10, separator="-")
+
+        self.assertEqual(
+            dispatcher.coalesce(["AAAA", "BBB", "CCCCCCCCCC", "D"]),
+            [("AAAA\n-\nBBB", None), ("CCCCCCCCCC", None), ("D", None)]
+        )
+
+    def test_coalesce_embed(self):
+        dispatcher = DiscordReplyDispatcher(20, separator="-")
+        embed_1 = Embed(title="1")
+        embed_2 = Embed(title="2")
+
+        self.assertEqual(
+            dispatcher.coalesce([embed_1, "A", "B", embed_2, "C"]),
+            [(None, embed_1), ("A\n-\nB", embed_2), ("C", None)]
+        )
+
+    def test_coalesce_empty(self):
+        self.assertEqual(DiscordReplyDispatcher(20).coalesce([]), [])
+
+    def test_dispatch_order(self):
+        dispatcher = DiscordReplyDispatcher(3, separator="-")
+        channel = FakeChannel()
+        embed = Embed(title="E")
+
+        count = asyncio.run(dispatcher.dispatch(channel, ["A", "B", embed, "C"]))
+
+        self.assertEqual(count, 3)
+        self.assertEqual(channel.sent, [("A", None), ("B", embed), ("C", None)])
@@ -0,0 +1,27 @@
+from msghandle.botcmd.command.rdm import OptionList
+from tests.base import TestCase
+
+__all__ = ["TestOptionList"]
+
+
+class TestOptionList(TestCase):
+    def test_pick_multi(self):
+        result = OptionList("A  B  C").pick_multi(1000)
+
+        self.assertEqual(sum(result.values()), 1000)
+        self.assertTrue(set(result).issubset({"A", "B", "C"}))
+
+    def test_pick_multi_weighted(self):
+        result = OptionList("A 1  B 0").pick_multi(1000)
+
+        self.assertEqual(result, {"A": 1000})
+
+    def test_pick_multi_weighted_repeated(self):
+        option_list = OptionList("A 1  A 2  B 1")
+
+        self.assertEqual(option_list.elements, ["A", "A", "B"])
+
+        result = option_list.pick_multi(1000)
+
+        self.assertEqual(sum(result.values()), 1000)
+        self.assertTrue(set(result).issubset({"A", "B"}))
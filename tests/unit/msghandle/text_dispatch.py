@@ -0,0 +1,106 @@
+import time
+from types import SimpleNamespace
+
+from msghandle.models import HandledMessageEventText
+from msghandle.text.dispatch import TextHandler, TextHandlerDispatcher
+from tests.base import TestCase
+
+__all__ = ["TestTextHandlerDispatcher"]
+
+
+class TestTextHandlerDispatcher(TestCase):
+    @staticmethod
+    def _event(text: str, **config):
+        return SimpleNamespace(text=text, channel_model=SimpleNamespace(config=SimpleNamespace(**config)))
+
+    @staticmethod
+    def _reply(content: str, delay: float = 0):
+        def fn(_):
+            time.sleep(delay)
+            return [HandledMessageEventText(content=content)]
+
+        return fn
+
+    def test_precondition_skip(self):
+        called = []
+
+        def fn(e):
+            called.append(e.text)
+            return []
+
+        handler = TextHandler("A", fn, lambda e: e.text.startswith("A"))
+        dispatcher = TextHandlerDispatcher([handler], max_workers=2)
+
+        dispatcher.dispatch(self._event("ABC"))
+        dispatcher.dispatch(self._event("BCD"))
+
+        self.assertEqual(called, ["ABC"])
+
+        stats = dispatcher.stats["A"]
+        self.assertEqual(stats.considered, 2)
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.responded, 0)
+        self.assertAlmostEqual(stats.hit_rate, 0.5)
+
+    def test_disabled_in_config(self):
+        handler = TextHandler("A", self._reply("A"), lambda e: True, enabled=lambda config: config.enable_a)
+        dispatcher = TextHandlerDispatcher([handler], max_workers=2)
+
+        self.assertEqual(dispatcher.dispatch(self._event("A", enable_a=False)), [])
+        self.assertEqual(dispatcher.stats["A"].considered, 0)
+
+        self.assertEqual(len(dispatcher.dispatch(self._event("A", enable_a=True))), 1)
+        self.assertEqual(dispatcher.stats["A"].responded, 1)
+
+    def test_response_order(self):
+        dispatcher = TextHandlerDispatcher([
+            TextHandler("A", self._reply("A", 0.1), lambda e: True),
+            TextHandler("B", self._reply("B"), lambda e: True, concurrent=False),
+            TextHandler("C", self._reply("C"), lambda e: True)
+        ], max_workers=2)
+
+        self.assertEqual([resp.content for resp in dispatcher.dispatch(self._event("X"))], ["A", "B", "C"])
+
+    def test_concurrent(self):
+        dispatcher = TextHandlerDispatcher([
+            TextHandler("A", self._reply("A", 0.3), lambda e: True),
+            TextHandler("B", self._reply("B", 0.3), lambda e: True)
+        ], max_workers=2)
+
+        start = time.time()
+        dispatcher.dispatch(self._event("X"))
+        self.assertLess(time.time() - start, 0.55)
+
+        self.assertGreaterEqual(dispatcher.stats["A"].max_handle_ms, 300)
+
+    def test_non_concurrent_error(self):
+        called = []
+
+        def raise_error(_):
+            raise ValueError()
+
+        def fn(e):
+            called.append(e.text)
+            return []
+
+        dispatcher = TextHandlerDispatcher([
+            TextHandler("ERROR", raise_error, lambda e: True, concurrent=False),
+            TextHandler("A", fn, lambda e: True),
+            TextHandler("B", fn, lambda e: True)
+        ], max_workers=2)
+
+        with self.assertRaises(ValueError):
+            dispatcher.dispatch(self._event("X"))
+
+        self.assertEqual(called, [])
+
+    def test_reset_stats(self):
+        dispatcher = TextHandlerDispatcher([TextHandler("A", self._reply("A"), lambda e: True)], max_workers=2)
+        dispatcher.dispatch(self._event("X"))
+
+        dispatcher.reset_stats()
+
+        stats = dispatcher.stats["A"]
+        self.assertEqual(stats.considered, 0)
+        self.assertEqual(stats.hits, 0)
+        self.assertEqual(stats.handle_ms, 0)